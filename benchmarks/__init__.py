@@ -0,0 +1,20 @@
+"""
+Fantasy RPG - Benchmarks
+
+Micro and macro benchmarks for the game systems, timed with the standard
+library only and run headless.
+
+Usage:
+    python -m benchmarks                              # run all, write benchmark_results.json
+    python -m benchmarks -k saves                     # only benchmarks with "saves" in the name
+    python -m benchmarks -o baseline.json             # store a baseline
+    python -m benchmarks --compare baseline.json      # flag benchmarks slower than the baseline
+
+The exit status is 1 when a benchmark fails or, with --compare, when one is
+slower than the baseline by more than --threshold (default 25%).
+"""
+
+from .runner import (
+    Benchmark, BenchmarkResult, Comparison, benchmark, compare_results,
+    load_benchmarks, load_results, run_benchmark, run_benchmarks, write_results
+)
@@ -0,0 +1,9 @@
+"""Run the benchmark suite: python -m benchmarks --help"""
+
+import sys
+
+from .runner import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""Condition evaluation throughput"""
+
+from .common import new_game
+from .runner import benchmark
+
+from fantasy_rpg.game.conditions import get_conditions_manager
+
+
+EVALUATIONS = 500
+
+
+@benchmark("conditions.evaluate", group="conditions")
+def evaluate_conditions():
+    player_state = new_game().game_state.player_state
+    conditions = get_conditions_manager()
+
+    def run():
+        for _ in range(EVALUATIONS):
+            conditions.evaluate_conditions(player_state)
+        return EVALUATIONS
+    return run
+
+
+@benchmark("conditions.evaluate_exposed", group="conditions")
+def evaluate_exposed():
+    """Worst case: cold, wet, hungry and tired, so most triggers pass"""
+    player_state = new_game().game_state.player_state
+    player_state.survival.hunger = 50
+    player_state.survival.thirst = 50
+    player_state.survival.fatigue = 50
+    player_state.survival.body_temperature = 300
+    player_state.survival.wetness = 400
+    conditions = get_conditions_manager()
+
+    def run():
+        for _ in range(EVALUATIONS):
+            conditions.evaluate_conditions(player_state)
+        return EVALUATIONS
+    return run
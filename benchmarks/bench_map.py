@@ -0,0 +1,113 @@
+"""World map rendering and fog of war: viewport redraws over a 1000x1000 world from cached tiles"""
+
+from .runner import benchmark
+
+from fantasy_rpg.ui.world_map import ZOOM_LEVELS, WorldMapRenderer
+from fantasy_rpg.world.exploration_map import ExplorationMap
+
+
+WORLD_SIZE = 1000
+
+# A full-screen map viewport, in cells
+VIEW_COLUMNS = 100
+VIEW_ROWS = 40
+
+FRAMES = 200
+
+_BIOMES = ("temperate_forest", "temperate_grassland", "boreal_forest", "alpine_mountains", "hot_desert")
+
+
+class SyntheticWorld:
+    """Procedural stand-in for a WorldMapSource too large to generate"""
+
+    def __init__(self, size: int = WORLD_SIZE):
+        self.width = self.height = size
+        self.hours = 0.0
+        self._hexes = [{"biome": biome, "elevation_raw": 0.2 + 0.15 * i} for i, biome in enumerate(_BIOMES)]
+        self._river = {"biome": "temperate_grassland", "elevation_raw": 0.2, "river": "stream"}
+
+    def hex_info(self, x, y):
+        if abs(x - y) < 2:
+            return self._river
+        return self._hexes[(x // 7 * 31 + y // 5 * 17) % len(self._hexes)]
+
+    def is_explored(self, x, y):
+        return abs(x - self.width // 2) < 40 and abs(y - self.height // 2) < 40
+
+    def precipitation(self, x, y):
+        return ((x + y + int(self.hours) * 13) % 90) * 1.0
+
+    @property
+    def weather_version(self):
+        return self.hours
+
+
+def _draw(renderer, x0, y0, zoom, layer="terrain"):
+    for row in range(y0, y0 + VIEW_ROWS):
+        renderer.render_row(row, x0, VIEW_COLUMNS, zoom, layer, player=(500, 500))
+
+
+@benchmark("map.pan_1000", group="map")
+def pan():
+    """200 frames panning a full-screen viewport one cell right, tiles warm as they come"""
+    renderer = WorldMapRenderer(SyntheticWorld())
+    start = 500 - VIEW_COLUMNS // 2
+
+    def run():
+        for frame in range(FRAMES):
+            _draw(renderer, start + frame, 480, 1)
+        return FRAMES
+    return run
+
+
+@benchmark("map.zoom_1000_cold", group="map", per_round=True)
+def zoom_cold():
+    """First draw of the viewport at every zoom level, every tile rendered fresh"""
+    renderer = WorldMapRenderer(SyntheticWorld())
+
+    def run():
+        for zoom in ZOOM_LEVELS:
+            columns, rows = renderer.size(zoom)
+            _draw(renderer, columns // 2 - VIEW_COLUMNS // 2, rows // 2 - VIEW_ROWS // 2, zoom)
+        return len(ZOOM_LEVELS)
+    return run
+
+
+@benchmark("map.weather_refresh_1000", group="map")
+def weather_refresh():
+    """Weather moving on under a cached viewport: changed tiles re-rendered, then redrawn"""
+    world = SyntheticWorld()
+    renderer = WorldMapRenderer(world)
+    _draw(renderer, 450, 480, 1, "weather")
+
+    def run():
+        world.hours += 1.0
+        _draw(renderer, 450, 480, 1, "weather")
+        return 1
+    return run
+
+
+@benchmark("map.fog_walk_1000", group="map")
+def fog_walk():
+    """1000 moves across a 1000x1000 fog of war, sight radius 3"""
+    fog = ExplorationMap(WORLD_SIZE, WORLD_SIZE)
+
+    def run():
+        for step in range(1000):
+            fog.reveal(step, (step * 7) % WORLD_SIZE, 3)
+        return 1000
+    return run
+
+
+@benchmark("map.fog_save_1000", group="map")
+def fog_save():
+    """Run-length encode and restore the bitsets of a 1000x1000 world after a long walk"""
+    fog = ExplorationMap(WORLD_SIZE, WORLD_SIZE)
+    for step in range(1000):
+        fog.reveal(step, (step * 7) % WORLD_SIZE, 3)
+    restored = ExplorationMap(WORLD_SIZE, WORLD_SIZE)
+
+    def run():
+        restored.load_dict(fog.to_dict())
+        return 1
+    return run
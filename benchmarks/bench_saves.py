@@ -0,0 +1,59 @@
+"""Save and load benchmarks"""
+
+import os
+
+from .common import new_game, scratch_dir
+from .runner import benchmark
+
+from fantasy_rpg.game.game_engine import GameEngine
+
+
+@benchmark("saves.save", group="saves")
+def save():
+    """Full save of a game inside a location (hexes re-encoded every time)"""
+    game_engine = new_game()
+    save_name = os.path.join(scratch_dir(), "bench_save")
+
+    def run():
+        game_engine.saves._hex_cache.clear()
+        game_engine.save_game(save_name)
+    return run
+
+
+@benchmark("saves.resave", group="saves")
+def resave():
+    """Saving again with nothing changed (unchanged sections reused)"""
+    game_engine = new_game()
+    save_name = os.path.join(scratch_dir(), "bench_resave")
+    game_engine.save_game(save_name)
+
+    def run():
+        game_engine.save_game(save_name)
+    return run
+
+
+@benchmark("saves.round_trip", group="saves")
+def round_trip():
+    """Save, then load into a fresh engine"""
+    game_engine = new_game()
+    save_name = os.path.join(scratch_dir(), "bench_round_trip")
+
+    def run():
+        success, message = game_engine.save_game(save_name)
+        if not success:
+            raise RuntimeError(message)
+        success, message = GameEngine(skip_world_gen=True).load_game(save_name)
+        if not success:
+            raise RuntimeError(message)
+    return run
+
+
+@benchmark("saves.snapshot", group="saves")
+def snapshot():
+    """Autosave snapshot taken on the UI thread"""
+    game_engine = new_game()
+    game_engine.save_game(os.path.join(scratch_dir(), "bench_snapshot"))
+
+    def run():
+        game_engine.saves.snapshot_sections()
+    return run
@@ -0,0 +1,90 @@
+"""Survival needs for many actors: one batch step against per-actor PlayerState updates"""
+
+import contextlib
+import io
+
+from .runner import benchmark
+
+from fantasy_rpg.game.player_state import PlayerState, SurvivalNeeds
+from fantasy_rpg.game.survival_batch import SurvivalBatch
+from fantasy_rpg.world.weather_core import WeatherState
+
+
+ACTORS = 100
+STEPS = 24
+
+
+def _weather() -> WeatherState:
+    """Cold, windy rain, so every temperature and exposure rule runs"""
+    return WeatherState(temperature=40.0, wind_speed=15, wind_direction="N", precipitation=30,
+                        precipitation_type="rain", cloud_cover=90, visibility=1000, feels_like=0.0,
+                        is_storm=False, lightning_risk=0.0)
+
+
+def _players(count: int):
+    weather = _weather()
+    return [PlayerState(survival=SurvivalNeeds(wetness=(index * 4) % 400), current_weather=weather,
+                        debug_survival=False, active_conditions=["Natural Shelter"] if index % 3 == 0 else [])
+            for index in range(count)]
+
+
+def _batch(count: int) -> SurvivalBatch:
+    batch = SurvivalBatch()
+    for index in range(count):
+        batch.add(index, SurvivalNeeds(wetness=(index * 4) % 400))
+        if index % 3 == 0:
+            batch.set_environment(index, shelter="natural")
+    return batch
+
+
+def _player_steps(players):
+    # Fatigue updates always print; keep that out of the timings' output
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(STEPS):
+            for player in players:
+                player._update_hunger(1.0, "active")
+                player._update_thirst(1.0, "active")
+                player._update_fatigue(1.0, "active")
+                player._update_temperature_regulation(1.0)
+                player._update_environmental_exposure(1.0)
+    return STEPS * len(players)
+
+
+@benchmark("survival.player_state_100", group="survival")
+def player_state_actors():
+    """A day of hourly survival updates for 100 actors, one PlayerState each"""
+    players = _players(ACTORS)
+    return lambda: _player_steps(players)
+
+
+@benchmark("survival.batch_100", group="survival")
+def batch_actors():
+    """The same day for 100 actors in one SurvivalBatch"""
+    batch = _batch(ACTORS)
+    weather = _weather()
+
+    def run():
+        for _ in range(STEPS):
+            batch.advance(1.0, weather, "active")
+        return STEPS * ACTORS
+    return run
+
+
+@benchmark("survival.player_state_1", group="survival")
+def player_state_single():
+    """A day of hourly survival updates for the player alone"""
+    players = _players(1)
+    return lambda: _player_steps(players)
+
+
+@benchmark("survival.batch_1", group="survival")
+def batch_single():
+    """The same day for a batch of one"""
+    batch = _batch(1)
+    weather = _weather()
+
+    def run():
+        for _ in range(STEPS):
+            batch.advance(1.0, weather, "active")
+        return STEPS
+    return run
@@ -0,0 +1,27 @@
+"""Time system benchmarks: a day of survival ticks"""
+
+from .common import new_game
+from .runner import benchmark
+
+
+@benchmark("time.wait_24h", group="time", rounds=5, per_round=True)
+def wait_24_hours():
+    """One 24-hour wait in the starting hex (survival, weather and conditions every tick)"""
+    time_system = new_game(enter_location=False).time_system
+
+    def run():
+        time_system.perform_activity("wait", duration_override=24.0)
+        return 24
+    return run
+
+
+@benchmark("time.hourly_waits_24h", group="time", rounds=5, per_round=True)
+def hourly_waits():
+    """Twenty-four separate one-hour waits, as a player typing 'wait' would"""
+    time_system = new_game(enter_location=False).time_system
+
+    def run():
+        for _ in range(24):
+            time_system.perform_activity("wait", duration_override=1.0)
+        return 24
+    return run
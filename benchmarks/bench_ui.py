@@ -0,0 +1,52 @@
+"""Headless panel rendering: panel markup rendered to text with Rich"""
+
+import io
+
+from rich.console import Console
+from rich.text import Text
+
+from .common import new_game
+from .runner import benchmark
+
+from fantasy_rpg.ui.panels import CharacterPanel, POIPanel
+
+
+RENDERS = 50
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), width=60, color_system="truecolor", force_terminal=True)
+
+
+@benchmark("ui.character_panel", group="ui")
+def character_panel():
+    game_engine = new_game()
+    panel = CharacterPanel(game_engine.game_state.character)
+    panel.update_world_data(hex_id=game_engine.game_state.world_position.hex_id, refresh=False)
+    console = _console()
+
+    def run():
+        for _ in range(RENDERS):
+            console.print(Text.from_markup(panel._render_character_info()))
+        console.file.seek(0)
+        console.file.truncate()
+        return RENDERS
+    return run
+
+
+@benchmark("ui.poi_panel", group="ui")
+def poi_panel():
+    game_engine = new_game()
+    panel = POIPanel()
+    # Not mounted - the benchmark renders the markup itself
+    panel.refresh_display = lambda: None
+    console = _console()
+
+    def run():
+        for _ in range(RENDERS):
+            panel.update_with_game_engine(game_engine)
+            console.print(Text.from_markup(panel._render_poi_info()))
+        console.file.seek(0)
+        console.file.truncate()
+        return RENDERS
+    return run
@@ -0,0 +1,32 @@
+"""World generation benchmarks: terrain heightmaps and complete worlds"""
+
+from .common import BENCH_SEED
+from .runner import benchmark
+
+from fantasy_rpg.world.terrain_generation import TerrainGenerator
+from fantasy_rpg.world.world_coordinator import WorldCoordinator
+
+
+def _register_heightmap(size: int):
+    @benchmark(f"world.heightmap_{size}x{size}", group="world")
+    def heightmap():
+        def run():
+            TerrainGenerator(BENCH_SEED).generate_heightmap(size, size, scale=0.1, octaves=4)
+            return size * size
+        return run
+
+
+def _register_world(size: int, rounds: int):
+    @benchmark(f"world.generate_{size}x{size}", group="world", rounds=rounds, warmup=0)
+    def generate():
+        def run():
+            WorldCoordinator(world_size=(size, size), seed=BENCH_SEED)
+            return size * size
+        return run
+
+
+for _size in (16, 32, 64):
+    _register_heightmap(_size)
+
+for _size, _rounds in ((8, 5), (16, 3), (32, 1)):
+    _register_world(_size, _rounds)
@@ -0,0 +1,44 @@
+"""
+Fantasy RPG - Benchmark Fixtures
+
+Shared game setups for the benchmark modules.
+"""
+
+import atexit
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Benchmarks run from a checkout, like the tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game.game_engine import GameEngine
+
+
+# Seed for every generated world, so runs measure the same work
+BENCH_SEED = 4242
+
+_scratch_dir: Optional[str] = None
+
+
+def new_game(world_size: Tuple[int, int] = (8, 8), seed: int = BENCH_SEED,
+             enter_location: bool = True) -> GameEngine:
+    """Start a new game with a quick character, optionally inside a location"""
+    character, _, _ = create_character_quick("Bench", "Human", "Fighter")
+    game_engine = GameEngine(world_size=world_size)
+    game_engine.new_game(character, world_seed=seed)
+    if enter_location:
+        game_engine.enter_location()
+    return game_engine
+
+
+def scratch_dir() -> str:
+    """Temporary directory for benchmark files, removed at exit"""
+    global _scratch_dir
+    if _scratch_dir is None:
+        _scratch_dir = tempfile.mkdtemp(prefix="fantasy_rpg_bench_")
+        atexit.register(shutil.rmtree, _scratch_dir, True)
+    return _scratch_dir
@@ -0,0 +1,310 @@
+"""
+Fantasy RPG - Benchmark Runner
+
+Registry, timing, JSON results and baseline comparison for the benchmark suite.
+
+A benchmark is a setup function registered with @benchmark. Setup runs
+untimed and returns the function to time; that function may return how many
+operations it performed, which turns the timing into a throughput. Setup
+runs once per benchmark, or before every round with per_round=True for
+benchmarks that use up their state (e.g. a game that advances in time).
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Default results file, written in the current directory
+RESULTS_FILE = "benchmark_results.json"
+
+# A benchmark is flagged when its median is this much slower than the baseline
+DEFAULT_THRESHOLD = 0.25
+
+# Benchmark modules loaded by load_benchmarks()
+BENCHMARK_MODULES = ("bench_world", "bench_conditions", "bench_time", "bench_saves", "bench_ui", "bench_survival",
+                     "bench_map")
+
+
+@dataclass
+class Benchmark:
+    """One registered benchmark"""
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Optional[int]]]
+    rounds: int = 5
+    warmup: int = 1
+    per_round: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark, in seconds per round"""
+    name: str
+    group: str
+    times: List[float] = field(default_factory=list)
+    operations: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times) if self.times else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        if self.times:
+            data.update({
+                "min": min(self.times),
+                "median": self.median,
+                "mean": statistics.fmean(self.times),
+                "stdev": statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+            })
+            if self.operations:
+                data["ops_per_sec"] = self.operations / self.median if self.median > 0 else None
+        return data
+
+
+# Registered benchmarks, in registration order
+REGISTRY: List[Benchmark] = []
+
+
+def benchmark(name: str, group: str, rounds: int = 5, warmup: int = 1, per_round: bool = False):
+    """
+    Register a benchmark setup function.
+
+    Args:
+        name: Unique benchmark name ("group.case")
+        group: Area of the game being measured
+        rounds: Timed rounds
+        warmup: Untimed rounds run first
+        per_round: Run setup again before every round
+    """
+    def register(setup):
+        REGISTRY.append(Benchmark(name, group, setup, rounds, warmup, per_round))
+        return setup
+    return register
+
+
+def load_benchmarks() -> List[Benchmark]:
+    """Import every benchmark module and return the registry"""
+    import importlib
+
+    for module in BENCHMARK_MODULES:
+        importlib.import_module(f"{__package__}.{module}")
+    return REGISTRY
+
+
+def _time_once(func: Callable[[], Optional[int]]) -> Tuple[float, Optional[int]]:
+    """Time one call with the garbage collector paused, as timeit does"""
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        operations = func()
+        elapsed = time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return elapsed, operations
+
+
+def run_benchmark(bench: Benchmark, rounds: Optional[int] = None) -> BenchmarkResult:
+    """
+    Run one benchmark.
+
+    Game code prints progress freely, so stdout is discarded while it runs.
+
+    Args:
+        bench: Benchmark to run
+        rounds: Override the benchmark's number of timed rounds
+
+    Returns:
+        BenchmarkResult (with error set if setup or a round raised)
+    """
+    result = BenchmarkResult(bench.name, bench.group)
+    rounds = rounds or bench.rounds
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        try:
+            func = None
+            for index in range(bench.warmup + rounds):
+                if func is None or bench.per_round:
+                    func = bench.setup()
+                elapsed, operations = _time_once(func)
+                if index >= bench.warmup:
+                    result.times.append(elapsed)
+                    result.operations = operations
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_benchmarks(benchmarks: List[Benchmark], rounds: Optional[int] = None,
+                   progress: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+    """Run benchmarks in order, reporting each result to progress as it finishes"""
+    results = []
+    for bench in benchmarks:
+        result = run_benchmark(bench, rounds)
+        results.append(result)
+        if progress:
+            progress(result)
+    return results
+
+
+def results_to_json(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """Results file contents: environment info plus one entry per benchmark"""
+    return {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: result.to_dict() for result in results}
+    }
+
+
+def write_results(path: str, results: List[BenchmarkResult]):
+    """Write results to a JSON file"""
+    with open(path, "w") as f:
+        json.dump(results_to_json(results), f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """Read the per-benchmark entries of a results file"""
+    with open(path, "r") as f:
+        return json.load(f).get("results", {})
+
+
+@dataclass
+class Comparison:
+    """One benchmark compared with its baseline"""
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    ratio: Optional[float]
+    status: str  # "ok", "slower", "faster", "new", "missing" or "error"
+
+
+def compare_results(current: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Comparison]:
+    """
+    Compare median timings against a baseline.
+
+    Args:
+        current: Results entries of this run
+        baseline: Results entries of the baseline run
+        threshold: Relative slowdown (0.25 = 25%) that counts as a regression
+
+    Returns:
+        Comparisons for every benchmark in either run, current ones first
+    """
+    comparisons = []
+    for name, entry in current.items():
+        old = baseline.get(name)
+        median = entry.get("median")
+        if entry.get("error") or median is None:
+            comparisons.append(Comparison(name, old and old.get("median"), None, None, "error"))
+            continue
+        if not old or not old.get("median"):
+            comparisons.append(Comparison(name, None, median, None, "new"))
+            continue
+
+        ratio = median / old["median"]
+        if ratio > 1.0 + threshold:
+            status = "slower"
+        elif ratio < 1.0 / (1.0 + threshold):
+            status = "faster"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(name, old["median"], median, ratio, status))
+
+    for name, old in baseline.items():
+        if name not in current:
+            comparisons.append(Comparison(name, old.get("median"), None, None, "missing"))
+    return comparisons
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1.0:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """One line summary of a result"""
+    if result.error:
+        return f"{result.name:<36} ERROR {result.error}"
+    line = f"{result.name:<36} median {_format_seconds(result.median):>10}  min {_format_seconds(min(result.times)):>10}"
+    if result.operations and result.median > 0:
+        line += f"  {result.operations / result.median:,.0f} ops/s"
+    return line
+
+
+def format_comparison(comparison: Comparison) -> str:
+    """One line summary of a comparison"""
+    ratio = f"{comparison.ratio:.2f}x" if comparison.ratio is not None else "-"
+    marker = {"slower": "✗", "error": "✗", "faster": "✓"}.get(comparison.status, " ")
+    return (f"{marker} {comparison.name:<36} {_format_seconds(comparison.baseline):>10} -> "
+            f"{_format_seconds(comparison.current):>10}  {ratio:>6}  {comparison.status}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: run benchmarks, write results, optionally compare"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Run the Fantasy RPG benchmark suite")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, help="Timed rounds per benchmark (default: per benchmark)")
+    parser.add_argument("-o", "--output", default=RESULTS_FILE, help=f"Results file (default: {RESULTS_FILE})")
+    parser.add_argument("--compare", metavar="BASELINE", help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown that counts as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    benchmarks = [bench for bench in load_benchmarks() if args.filter in bench.name]
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name:<36} {bench.group}")
+        return 0
+    if not benchmarks:
+        print(f"No benchmarks match '{args.filter}'.")
+        return 1
+
+    baseline = None
+    if args.compare:
+        if not os.path.exists(args.compare):
+            print(f"Baseline file {args.compare} not found.")
+            return 1
+        baseline = load_results(args.compare)
+
+    results = run_benchmarks(benchmarks, args.rounds, progress=lambda result: print(format_result(result)))
+    write_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+    failed = any(result.error for result in results)
+    if baseline is not None:
+        current = {result.name: result.to_dict() for result in results}
+        if args.filter:
+            baseline = {name: entry for name, entry in baseline.items() if args.filter in name}
+        comparisons = compare_results(current, baseline, args.threshold)
+        print(f"\nCompared with {args.compare} (threshold {args.threshold:.0%}):")
+        for comparison in comparisons:
+            print(format_comparison(comparison))
+        regressions = [c for c in comparisons if c.status == "slower"]
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline.")
+            failed = True
+
+    return 1 if failed else 0
@@ -24,6 +24,12 @@ from .movement_handler import MovementHandler
 from .character_handler import CharacterHandler
 from .object_interaction_handler import ObjectInteractionHandler
 from .debug_handler import DebugHandler
+from .shortkey_manager import get_shortkey_manager
+
+try:
+    from ..utils.tracing import span
+except ImportError:
+    from fantasy_rpg.utils.tracing import span
 
 
 class ActionHandler:
@@ -53,6 +59,7 @@ class ActionHandler:
             "s": "handle_movement",
             "e": "handle_movement",
             "w": "handle_movement",
+            "travel": "handle_travel",
             "look": "handle_look",
             "l": "handle_look",
             "enter": "handle_enter_location",
@@ -67,6 +74,8 @@ class ActionHandler:
             "i": "handle_inventory",
             "character": "handle_character",
             "c": "handle_character",
+            "map": "handle_map",
+            "m": "handle_map",
             "rest": "handle_rest",
             "r": "handle_rest",
             "equip": "handle_equip",
@@ -108,9 +117,14 @@ class ActionHandler:
             "dump_world": "handle_dump_world",
             "save": "handle_save_game",
             "load": "handle_load_game",
+            "saves": "handle_list_saves",
             "dump_log": "handle_save_log",
+            "perf": "handle_perf",
         })
         
+        # Make the registered commands known to parsing and completion
+        get_shortkey_manager().add_commands(self.registry.get_all_commands())
+        
         # Store current command for direction detection in movement handler
         self._current_command = ''
     
@@ -137,11 +151,18 @@ class ActionHandler:
         self._current_command = command
         self.movement_handler._current_command = command
         
-        # Route through registry
-        result = self.registry.route_command(command, args)
+        # Route through registry (one span per known command, so typos don't add span names)
+        with span(f"action.{command}" if self.registry.has_command(command) else "action.unknown"):
+            result = self.registry.route_command(command, args)
         
         # Handle unknown commands
         if result is None:
+            suggestions = get_shortkey_manager().suggest_commands(command)
+            if suggestions:
+                return ActionResult(
+                    success=False,
+                    message=f"Unknown command: '{command}'. Did you mean: {', '.join(suggestions)}?"
+                )
             return ActionResult(
                 success=False,
                 message=f"Unknown command: '{command}'. Type 'help' for available commands."
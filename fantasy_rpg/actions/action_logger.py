@@ -17,6 +17,10 @@ class ActionLogger:
         self.last_weather = None
         self.message_queue = []  # Queue messages when game_log not available
         
+        # Event bus connection - condition changes arrive as events per command
+        self.event_bus = None
+        self._pending_condition_events = []
+        
         # Lazy import to avoid circular dependency issues
         try:
             from fantasy_rpg.dialogue.message_manager import MessageManager
@@ -35,6 +39,8 @@ class ActionLogger:
         
         # Flush any queued messages
         if self.message_queue and self.game_log:
+            if hasattr(self.game_log, 'begin_batch'):
+                self.game_log.begin_batch()
             for message_data in self.message_queue:
                 message_type = message_data.get('type', 'normal')
                 message = message_data.get('message', '')
@@ -49,10 +55,27 @@ class ActionLogger:
                     self.game_log.add_level_up_message(message)
                 else:
                     self.game_log.add_message(message, message_type)
+            if hasattr(self.game_log, 'end_batch'):
+                self.game_log.end_batch()
             
             self.message_queue.clear()
             print(f"ActionLogger: Flushed {len(self.message_queue)} messages")
     
+    def connect_event_bus(self, event_bus):
+        """Receive condition changes from the game engine's event bus"""
+        if self.event_bus is event_bus:
+            return
+        if self.event_bus:
+            self.event_bus.unsubscribe(self._on_condition_gained)
+        self.event_bus = event_bus
+        self._pending_condition_events = []
+        if event_bus:
+            event_bus.subscribe("ConditionGained", self._on_condition_gained)
+    
+    def _on_condition_gained(self, event):
+        """Hold a gained condition until the command's result is logged"""
+        self._pending_condition_events.append(event)
+    
     def log_action_result(self, action_result, character=None, **kwargs):
         """
         Log a complete action result with standardized formatting.
@@ -65,6 +88,17 @@ class ActionLogger:
         if not self.game_log:
             return
         
+        # Render the whole command output in one pass
+        if hasattr(self.game_log, 'begin_batch'):
+            self.game_log.begin_batch()
+        try:
+            self._log_action_result_entries(action_result, character, **kwargs)
+        finally:
+            if hasattr(self.game_log, 'end_batch'):
+                self.game_log.end_batch()
+    
+    def _log_action_result_entries(self, action_result, character=None, **kwargs):
+        """Log each part of an action result in display order"""
         # 1. Log the command that was executed
         command_text = kwargs.get('command_text', '')
         if command_text:
@@ -584,17 +618,26 @@ class ActionLogger:
             from ..game.conditions import get_conditions_manager
             conditions_manager = get_conditions_manager()
             
-            # Get previous and current conditions
-            previous_conditions = getattr(player_state, 'active_conditions', [])
-            current_conditions = conditions_manager.evaluate_conditions(player_state)
-            
-            # Update player state's active conditions
-            player_state.active_conditions = current_conditions
-            
-            # Get newly triggered conditions with their messages
-            newly_triggered = conditions_manager.get_newly_triggered_conditions(
-                previous_conditions, current_conditions
-            )
+            if self.event_bus:
+                # Condition deltas were delivered by the event bus for this command
+                newly_triggered = [
+                    {'name': event.condition, 'message': event.message}
+                    for event in self._pending_condition_events
+                    if event.message
+                ]
+                self._pending_condition_events = []
+            else:
+                # Get previous and current conditions
+                previous_conditions = getattr(player_state, 'active_conditions', [])
+                current_conditions = conditions_manager.evaluate_conditions(player_state)
+                
+                # Update player state's active conditions
+                player_state.active_conditions = current_conditions
+                
+                # Get newly triggered conditions with their messages
+                newly_triggered = conditions_manager.get_newly_triggered_conditions(
+                    previous_conditions, current_conditions
+                )
             
             # Log each newly triggered condition using NLP system
             for condition_info in newly_triggered:
@@ -646,7 +689,8 @@ class ActionLogger:
                     condition_data = conditions_manager.conditions_data.get(condition_name, {})
                     context = {
                         'condition_name': condition_name,
-                        'severity': condition_data.get('severity', 'moderate')
+                        'severity': condition_data.get('severity', 'moderate'),
+                        **self._surroundings_context(player_state)
                     }
                     self.log_survival_event(event_type, context)
                 
@@ -656,7 +700,8 @@ class ActionLogger:
                     condition_data = conditions_manager.conditions_data.get(condition_name, {})
                     context = {
                         'condition_name': condition_name,
-                        'severity': 'beneficial'
+                        'severity': 'beneficial',
+                        **self._surroundings_context(player_state)
                     }
                     # Use environmental_event for beneficial conditions
                     self.log_environmental_event(event_type, context)
@@ -677,6 +722,22 @@ class ActionLogger:
         except Exception as e:
             print(f"Error checking condition triggers: {e}")
     
+    @staticmethod
+    def _surroundings_context(player_state) -> dict:
+        """Temperature (°F, as felt) and biome around the player, for message selection"""
+        context = {}
+        weather = getattr(player_state, 'current_weather', None)
+        if weather is not None and getattr(weather, 'feels_like', None) is not None:
+            context['temperature'] = weather.feels_like
+        
+        game_engine = getattr(player_state, 'game_engine', None)
+        game_state = getattr(game_engine, 'game_state', None)
+        position = getattr(game_state, 'world_position', None)
+        hex_data = getattr(position, 'hex_data', None) or {}
+        if hex_data.get('biome'):
+            context['biome'] = hex_data['biome']
+        return context
+    
     def _check_survival_warnings(self, player_state):
         """Check and log survival warnings"""
         warnings = []
@@ -871,12 +932,12 @@ class ActionLogger:
         
         Args:
             event_type: Event identifier like 'COLD_triggered', 'HUNGER_triggered'
-            context: Optional context data (temperature, severity, etc) for future
-                    context-aware message selection
+            context: Optional context data (severity, temperature in °F, biome)
+                    used to pick variants that fit the situation
         
         Example:
             action_logger.log_survival_event("COLD_triggered", {
-                "current_temperature": 20,
+                "temperature": 20,
                 "severity": "moderate"
             })
         """
@@ -921,13 +982,14 @@ class ActionLogger:
         else:
             self.message_queue.append({'type': 'equipment', 'message': message})
     
-    def log_environmental_event(self, event_type: str):
+    def log_environmental_event(self, event_type: str, context: Optional[dict] = None):
         """Log environmental or weather change with message variance.
         
         Uses MessageManager for varied environmental transition messages.
         
         Args:
             event_type: Event like 'weather_change_to_rain', 'enter_cold_area'
+            context: Optional context data, as for log_survival_event
         
         Example:
             action_logger.log_environmental_event("weather_change_to_snow")
@@ -937,7 +999,7 @@ class ActionLogger:
             event_name = event_type.replace('_triggered', '').replace('weather_change_to_', '').replace('enter_', '').replace('_', ' ').title()
             message = f"Environmental change: {event_name}"
         else:
-            message = self.message_manager.get_environmental_message(event_type)
+            message = self.message_manager.get_environmental_message(event_type, context)
         
         if self.game_log:
             self.game_log.add_message(message, "environment")
@@ -4,6 +4,7 @@ Fantasy RPG - Character Handler
 Handles character-related commands:
 - Inventory management
 - Character sheet viewing
+- World map viewing
 - Rest and sleep
 """
 
@@ -33,6 +34,16 @@ class CharacterHandler(BaseActionHandler):
             modal_type="character"
         )
     
+    def handle_map(self, *args) -> ActionResult:
+        """Handle world map display"""
+        return ActionResult(
+            success=True,
+            message="Unfolding the world map...",
+            time_passed=0.0,
+            action_type="ui_modal",
+            modal_type="map"
+        )
+    
     def handle_rest(self, *args) -> ActionResult:
         """Handle resting/sleeping in current location"""
         if not self.game_engine:
@@ -235,8 +246,12 @@ class CharacterHandler(BaseActionHandler):
             
             # Heal HP based on rest quality
             heal_amount = rest_bonus
+            old_hp = character.hp
             character.hp = min(character.max_hp, character.hp + heal_amount)
             
+            from fantasy_rpg.game.events import HpChanged, publish_event
+            publish_event(self.game_engine, HpChanged(old_hp, character.hp, "rest"))
+            
             # Reduce fatigue if system exists
             if hasattr(player_state, 'fatigue'):
                 player_state.fatigue = max(0, player_state.fatigue - rest_bonus * 10)
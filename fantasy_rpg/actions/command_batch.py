@@ -0,0 +1,304 @@
+"""
+Fantasy RPG - Command Batches
+
+Runs many actions as one command:
+- "repeat N <command>" runs a command N times
+- "queue <command>; <command>; ..." runs commands in order
+- "macro <name> <command>; <command>; ..." defines a macro, run by typing
+  its name; "macro" lists macros and "macro delete <name>" removes one
+
+A batch is one engine transaction: state-change events are held until the
+last step and delivered as one coalesced batch, and the player gets a single
+summarized log entry and one UI refresh instead of one per action.
+
+A batch stops early when something needs the player's attention:
+- a step fails (nothing left to forage, a locked chest)
+- a critical or life-threatening condition starts
+- the character faints
+- HP falls to BATCH_HP_FRACTION of its maximum or below
+
+Macros are shared by every game and kept in a small JSON file next to the
+saves.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .base_handler import ActionResult
+
+
+MACRO_FILE = "macros.json"
+
+# Most actions one batch may expand to
+MAX_BATCH_STEPS = 50
+
+# Macros may run other macros this deep
+MAX_MACRO_DEPTH = 4
+
+# A batch stops once HP falls to this fraction of maximum
+BATCH_HP_FRACTION = 0.5
+
+# New conditions of these severities stop a batch
+INTERRUPT_SEVERITIES = ("critical", "life_threatening")
+
+# Command words handled by batches rather than by the action handlers
+BATCH_COMMANDS = ("repeat", "queue", "macro")
+
+
+def split_commands(text: str) -> List[str]:
+    """Split "a; b; c" into its non-empty commands"""
+    return [part.strip() for part in text.split(";") if part.strip()]
+
+
+class MacroBook:
+    """User-defined macros: name -> list of commands"""
+
+    def __init__(self, path: str = MACRO_FILE):
+        """
+        Args:
+            path: JSON file holding the macros
+        """
+        self.path = path
+        self._macros: Optional[Dict[str, List[str]]] = None
+
+    @property
+    def macros(self) -> Dict[str, List[str]]:
+        """Macros by name, loaded on first use"""
+        if self._macros is None:
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                self._macros = {str(name): [str(c) for c in commands]
+                                for name, commands in data.get("macros", {}).items()}
+            except (OSError, ValueError, AttributeError):
+                self._macros = {}
+        return self._macros
+
+    def get(self, name: str) -> Optional[List[str]]:
+        return self.macros.get(name.lower())
+
+    def define(self, name: str, commands: List[str]):
+        self.macros[name.lower()] = list(commands)
+        self._store()
+
+    def delete(self, name: str) -> bool:
+        if self.macros.pop(name.lower(), None) is None:
+            return False
+        self._store()
+        return True
+
+    def with_macro(self, name: str, commands: List[str]) -> "MacroBook":
+        """In-memory copy with one macro added, for checking it before it is saved"""
+        preview = MacroBook(self.path)
+        preview._macros = dict(self.macros, **{name.lower(): list(commands)})
+        return preview
+
+    def _store(self):
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump({"macros": self.macros}, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not save macros: {e}")
+
+
+def expand_batch(command_text: str, macros: MacroBook, reserved: Tuple[str, ...] = (),
+                 depth: int = 0) -> List[str]:
+    """
+    Expand a batch command into the plain commands it runs.
+
+    Args:
+        command_text: "repeat N ...", "queue ...", a macro name, or a plain command
+        macros: Macros to expand
+        reserved: Command words that cannot run inside a batch (save, quit...)
+        depth: Macro nesting depth so far
+
+    Returns:
+        Plain commands, in order
+
+    Raises:
+        ValueError: With a message for the player if the batch is malformed,
+            too long, recursive, or uses a reserved command
+    """
+    parts = command_text.strip().split(None, 1)
+    if not parts:
+        return []
+    word = parts[0].lower()
+    rest = parts[1] if len(parts) > 1 else ""
+
+    if word == "repeat":
+        count, _, repeated = rest.partition(" ")
+        if not count.isdecimal() or not count.strip("0") or not repeated.strip():
+            raise ValueError("Usage: repeat N <command> (e.g. 'repeat 5 forage bush')")
+        # Checked before multiplying, so a huge count is refused without building it
+        too_many = f"That batch would run more than {MAX_BATCH_STEPS} actions (the limit)."
+        if len(count.lstrip("0")) > len(str(MAX_BATCH_STEPS)) or int(count) > MAX_BATCH_STEPS:
+            raise ValueError(too_many)
+        repeated_steps = expand_batch(repeated, macros, reserved, depth)
+        if len(repeated_steps) * int(count) > MAX_BATCH_STEPS:
+            raise ValueError(too_many)
+        steps = repeated_steps * int(count)
+    elif word == "queue":
+        commands = split_commands(rest)
+        if not commands:
+            raise ValueError("Usage: queue <command>; <command>; ... (e.g. 'queue drink well; rest')")
+        steps = [step for command in commands for step in expand_batch(command, macros, reserved, depth)]
+    elif word == "macro":
+        raise ValueError("Macros cannot be defined inside a batch.")
+    elif macros.get(word) is not None:
+        if depth >= MAX_MACRO_DEPTH:
+            raise ValueError(f"Macro '{word}' nests too deeply (does it run itself?).")
+        steps = [step for command in macros.get(word)
+                 for step in expand_batch(command, macros, reserved, depth + 1)]
+    elif word in reserved:
+        raise ValueError(f"'{word}' cannot be used in a batch.")
+    else:
+        steps = [" ".join(command_text.split())]
+
+    if len(steps) > MAX_BATCH_STEPS:
+        raise ValueError(f"That batch would run {len(steps)} actions (the limit is {MAX_BATCH_STEPS}).")
+    return steps
+
+
+@dataclass
+class BatchSummary:
+    """What a batch did, for its single log entry"""
+    planned: int
+    results: List[Tuple[str, ActionResult]] = field(default_factory=list)
+    stop_reason: str = ""
+    items_gained: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def time_passed(self) -> float:
+        return sum(result.time_passed or 0.0 for _, result in self.results)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for _, result in self.results if result.success)
+
+    def message(self) -> str:
+        """One paragraph describing the whole batch"""
+        counts: Dict[str, int] = {}
+        for command, _ in self.results:
+            counts[command] = counts.get(command, 0) + 1
+        ran = ", ".join(command if n == 1 else f"{command} x{n}" for command, n in counts.items())
+
+        lines = [f"Batch: {ran or 'nothing'} ({len(self.results)} of {self.planned} actions, "
+                 f"{self.succeeded} succeeded)."]
+        if self.items_gained:
+            gained = ", ".join(f"{quantity}x {name}" for name, quantity in self.items_gained.items())
+            lines.append(f"Gained: {gained}.")
+        if self.stop_reason:
+            lines.append(f"Stopped early: {self.stop_reason}")
+        return "\n".join(lines)
+
+    def to_result(self) -> ActionResult:
+        """Summary ActionResult, logged like any single action"""
+        condition_messages = []
+        seen = set()
+        for _, result in self.results:
+            for condition in result.get('condition_messages', []) or []:
+                if condition.get('name') not in seen:
+                    seen.add(condition.get('name'))
+                    condition_messages.append(condition)
+        return ActionResult(
+            success=self.succeeded == len(self.results) and not self.stop_reason,
+            message=self.message(),
+            time_passed=self.time_passed,
+            action_type="batch",
+            condition_messages=condition_messages,
+            batch_steps=len(self.results),
+            batch_stop_reason=self.stop_reason
+        )
+
+
+class BatchMonitor:
+    """Watches a running batch for reasons to stop early"""
+
+    def __init__(self, game_engine):
+        self.game_engine = game_engine
+        self.events = getattr(game_engine, "events", None)
+        self._event_mark = 0
+        self._hp = 0
+
+    @property
+    def character(self):
+        return self.game_engine.game_state.character
+
+    def start_step(self):
+        """Remember where this step's events and HP start"""
+        self._event_mark = self.events.pending_count if self.events else 0
+        self._hp = self.character.hp
+
+    def check(self, command: str, result: ActionResult) -> str:
+        """
+        Check a finished step.
+
+        Returns:
+            Why the batch must stop, or "" to go on
+        """
+        if not result.success:
+            return f"'{command}' failed - {result.message}"
+
+        if self.events:
+            try:
+                from ..game.conditions import get_conditions_manager
+            except ImportError:
+                from fantasy_rpg.game.conditions import get_conditions_manager
+            conditions = get_conditions_manager().conditions_data
+            for event in self.events.pending_events(self._event_mark):
+                if event.event_type == "Fainted":
+                    return "you fainted."
+                if (event.event_type == "ConditionGained" and
+                        conditions.get(event.condition, {}).get("severity") in INTERRUPT_SEVERITIES):
+                    return f"you are now {event.condition}."
+
+        character = self.character
+        if character.hp < self._hp and character.hp <= character.max_hp * BATCH_HP_FRACTION:
+            return f"HP is down to {character.hp}/{character.max_hp}."
+        return ""
+
+
+def _item_counts(character) -> Dict[str, int]:
+    inventory = getattr(character, "inventory", None)
+    counts: Dict[str, int] = {}
+    for item in getattr(inventory, "items", None) or []:
+        counts[item.name] = counts.get(item.name, 0) + item.quantity
+    return counts
+
+
+def run_batch(steps: List[str], dispatch: Callable[[str], ActionResult], game_engine) -> BatchSummary:
+    """
+    Run a batch's steps until they finish or one of them must stop it.
+
+    The caller holds the engine's events for the whole batch.
+
+    Args:
+        steps: Plain commands from expand_batch()
+        dispatch: Runs one command and returns its ActionResult
+        game_engine: Initialized GameEngine
+
+    Returns:
+        BatchSummary of the steps that ran
+    """
+    summary = BatchSummary(planned=len(steps))
+    monitor = BatchMonitor(game_engine)
+    items_before = _item_counts(monitor.character)
+
+    for position, command in enumerate(steps, 1):
+        monitor.start_step()
+        result = dispatch(command)
+        summary.results.append((command, result))
+        stop_reason = monitor.check(command, result)
+        if stop_reason and position < len(steps):
+            summary.stop_reason = stop_reason
+            break
+
+    items_after = _item_counts(monitor.character)
+    summary.items_gained = {name: quantity - items_before.get(name, 0)
+                            for name, quantity in items_after.items()
+                            if quantity > items_before.get(name, 0)}
+    return summary
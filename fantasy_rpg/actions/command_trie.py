@@ -0,0 +1,102 @@
+"""
+Fantasy RPG - Command Trie
+
+Lookup over the words the command line understands: registered commands
+and their aliases. Object names in the current area are completed from
+that area's AreaIndex instead (see ShortkeyManager.complete).
+
+Each word maps to its expansion (an alias to its command). Completable
+words are kept in a word trie (utils/word_trie.py), so listing the
+completions of a prefix costs no more than reaching it, and its deletion
+neighbourhood gives "did you mean" suggestions within one typo.
+
+Words can be added and removed one at a time without rebuilding the trie.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from ..utils.word_trie import MAX_SUGGESTIONS, WordTrie
+except ImportError:
+    from fantasy_rpg.utils.word_trie import MAX_SUGGESTIONS, WordTrie
+
+
+# Words shorter than this (the one- and two-letter shortcuts) are expanded
+# but never offered as completions or suggestions
+MIN_COMPLETION_LENGTH = 3
+
+
+class CommandTrie:
+    """Prefix trie mapping typed words to their expansions"""
+
+    def __init__(self):
+        # word -> (expansion, completable)
+        self._entries: Dict[str, Tuple[str, bool]] = {}
+        self._words = WordTrie(MIN_COMPLETION_LENGTH)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self._entries
+
+    def add(self, word: str, value: Optional[str] = None, complete: bool = True):
+        """
+        Add a word, replacing its expansion if it is already present.
+
+        Args:
+            word: Word as typed (matched lowercase)
+            value: What the word expands to (defaults to the word itself)
+            complete: Offer the word in completions and suggestions
+                (never done for words shorter than MIN_COMPLETION_LENGTH)
+        """
+        word = word.lower()
+        if not word:
+            return
+        self.remove(word)
+
+        complete = complete and len(word) >= MIN_COMPLETION_LENGTH
+        self._entries[word] = (value if value is not None else word, complete)
+        if complete:
+            self._words.add(word, word)
+
+    def remove(self, word: str) -> bool:
+        """
+        Drop a word, pruning the branch it leaves empty.
+
+        Returns:
+            True if the word was present
+        """
+        word = word.lower()
+        entry = self._entries.pop(word, None)
+        if entry is None:
+            return False
+        if entry[1]:
+            self._words.discard(word, word)
+        return True
+
+    def get(self, word: str) -> Optional[str]:
+        """Expansion of a word, or None if the trie does not hold it"""
+        entry = self._entries.get(word.lower())
+        return entry[0] if entry is not None else None
+
+    def complete(self, prefix: str) -> List[str]:
+        """
+        Completable words starting with a prefix.
+
+        Returns:
+            Matching words, sorted (all of them for an empty prefix)
+        """
+        return sorted(self._words.prefix(prefix.lower()))
+
+    def suggest(self, word: str) -> List[str]:
+        """
+        Words a typo could have meant, for "did you mean" messages.
+
+        Returns:
+            Up to MAX_SUGGESTIONS completable words within one edit, sorted
+        """
+        word = word.lower()
+        words = self._words.fuzzy(word)
+        words.discard(word)
+        return sorted(words)[:MAX_SUGGESTIONS]
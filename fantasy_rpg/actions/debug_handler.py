@@ -5,6 +5,7 @@ Handles all debug and system commands:
 - Debug info display
 - World/location/hex data dumping
 - Save/load game
+- Latency tracing report
 - Help display
 - Game log saving
 """
@@ -57,15 +58,18 @@ Rest & Recovery (location only):
   
 Movement (overworld only):
   north/n, south/s, east/e, west/w - Move in that direction
+  travel to <hex> - Plan the fastest route to a hex and travel it (e.g. travel to 0512)
   
 Character:
   inventory/i - View your inventory
   character/c - View character sheet
   
 System:
-  save - Save game to save.json
-  load - Load game from save.json
+  save - Save game to save.sav
+  load - Load game from save.sav (or a legacy save.json)
+  saves [verify] - List save slots (verify checks each file's checksum)
   debug - Show debug information
+  perf [on|off|reset|profile [N]|dump] - Command latency per stage (p50/p95/p99)
   dump_location - Dump current location data to JSON file
   dump_hex - Dump current hex data to JSON file
   dump_world - Dump entire world data to JSON file
@@ -256,6 +260,41 @@ Example: 'f fp' lights the fireplace, 'b we' drinks from the well"""
         except Exception as e:
             return ActionResult(False, f"Failed to load game: {str(e)}")
     
+    def handle_list_saves(self, *args) -> ActionResult:
+        """Handle listing save slots: saves [verify]"""
+        if not self.game_engine:
+            return ActionResult(False, "Game engine not available.")
+        
+        verify = bool(args) and args[0] == "verify"
+        if args and not verify:
+            return ActionResult(False, "Usage: saves [verify]")
+        
+        try:
+            slots = self.game_engine.list_saves(verify=verify)
+        except Exception as e:
+            return ActionResult(False, f"Failed to list saves: {str(e)}")
+        
+        if not slots:
+            message = "No saved games found."
+        else:
+            lines = [f"Saved games ({len(slots)}):"]
+            for slot in slots:
+                line = f"  {slot.name}: {slot.headline}"
+                game_time = slot.summary.get("game_time")
+                if game_time:
+                    line += f", {game_time}"
+                if slot.status != "ok":
+                    line += f" [{slot.status.upper()}]"
+                lines.append(line)
+            message = "\n".join(lines)
+        
+        return ActionResult(
+            success=True,
+            message=message,
+            time_passed=0.0,
+            action_type="system"
+        )
+    
     def handle_save_log(self, *args) -> ActionResult:
         """Handle saving game log to text file"""
         # TODO: Implement save log functionality
@@ -265,3 +304,51 @@ Example: 'f fp' lights the fireplace, 'b we' drinks from the well"""
             time_passed=0.0,
             action_type="system"
         )
+    
+    def handle_perf(self, *args) -> ActionResult:
+        """Handle latency tracing: perf [on|off|reset|profile [N|off]|dump [file]]"""
+        try:
+            from ..utils.tracing import get_tracer, dump_report, DEFAULT_PROFILE_KEEP
+        except ImportError:
+            from fantasy_rpg.utils.tracing import get_tracer, dump_report, DEFAULT_PROFILE_KEEP
+        
+        tracer = get_tracer()
+        subcommand = args[0] if args else "report"
+        
+        if subcommand == "on":
+            tracer.enable()
+            message = "Tracing on - 'perf' shows latency per stage."
+        elif subcommand == "off":
+            tracer.disable()
+            message = "Tracing off (recorded spans kept)."
+        elif subcommand == "reset":
+            tracer.reset()
+            message = "Tracing data cleared."
+        elif subcommand == "profile":
+            if len(args) > 1 and args[1] == "off":
+                tracer.enable(profile_keep=0)
+                message = "Profiling off."
+            else:
+                try:
+                    keep = int(args[1]) if len(args) > 1 else DEFAULT_PROFILE_KEEP
+                except ValueError:
+                    return ActionResult(False, "Usage: perf profile [N|off]")
+                tracer.enable(profile_keep=keep)
+                message = f"Tracing on - profiling commands, keeping the {keep} slowest."
+        elif subcommand == "dump":
+            try:
+                path = dump_report(args[1]) if len(args) > 1 else dump_report()
+            except OSError as e:
+                return ActionResult(False, f"Failed to write perf report: {str(e)}")
+            message = f"Perf report written to {path}"
+        elif subcommand == "report":
+            message = tracer.report()
+        else:
+            return ActionResult(False, "Usage: perf [on|off|reset|profile [N|off]|dump [file]]")
+        
+        return ActionResult(
+            success=True,
+            message=message,
+            time_passed=0.0,
+            action_type="debug"
+        )
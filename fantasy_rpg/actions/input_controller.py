@@ -8,8 +8,16 @@ This separates input handling from UI presentation.
 from typing import Dict, Any, Optional, Callable
 from .action_handler import ActionHandler, ActionResult
 from .action_logger import get_action_logger
+from .command_batch import BATCH_COMMANDS, MacroBook, expand_batch, run_batch, split_commands
 from .shortkey_manager import get_shortkey_manager
 
+try:
+    from ..utils.rng import get_rng_service
+    from ..utils.tracing import get_tracer
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng_service
+    from fantasy_rpg.utils.tracing import get_tracer
+
 
 class InputController:
     """
@@ -25,6 +33,8 @@ class InputController:
         self.action_handler = None
         self.action_logger = get_action_logger()
         self.shortkey_manager = get_shortkey_manager()  # Add shortkey manager
+        self.journal = None  # CommandJournal, set by start_journal()
+        self.macros = MacroBook()
         
         # UI callbacks - set by the UI system
         self.ui_callbacks = {
@@ -59,6 +69,8 @@ class InputController:
             'quit': self._handle_quit
             # Note: 'exit' removed to allow GameEngine to handle location exits
         }
+        self.shortkey_manager.add_commands(self.debug_commands)
+        self.shortkey_manager.add_commands(BATCH_COMMANDS)
     
     def initialize(self, world_coordinator=None):
         """Initialize the input controller with game systems"""
@@ -68,39 +80,61 @@ class InputController:
         # Set up action logger
         self.action_logger = get_action_logger()
     
+    def start_journal(self, path: Optional[str] = None) -> bool:
+        """
+        Start recording commands to a replay journal.
+        
+        Args:
+            path: Journal file (defaults to the one named by the FRPG_JOURNAL
+                environment variable; without either, nothing is recorded)
+        
+        Returns:
+            True if recording started
+        """
+        try:
+            from ..game.command_journal import CommandJournal, journal_path_from_env
+        except ImportError:
+            from fantasy_rpg.game.command_journal import CommandJournal, journal_path_from_env
+        
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+        
+        path = path or journal_path_from_env()
+        if not path:
+            return False
+        journal = CommandJournal(path)
+        if not journal.start(self.game_engine):
+            return False
+        self.journal = journal
+        return True
+    
     def set_ui_callback(self, callback_name: str, callback_func: Callable):
         """Set a UI callback function"""
         if callback_name in self.ui_callbacks:
             self.ui_callbacks[callback_name] = callback_func
     
     def _update_current_location_shortcuts(self):
-        """Update object shortcuts for the current location"""
+        """Update object shortcuts for the current location (cleared outside locations)"""
         if not self.game_engine or not self.game_engine.is_initialized:
             return
         
+        objects = []
+        area_index = None
         try:
             gs = self.game_engine.game_state
             
-            # Only update if inside a location
-            if not gs.world_position.current_location_id:
-                return
-            
+            # Objects only exist inside a location
             location_data = gs.world_position.current_location_data
-            if not location_data:
-                return
-            
-            # Get objects from current area
-            areas = location_data.get("areas", {})
-            current_area_id = gs.world_position.current_area_id
-            
-            if current_area_id not in areas:
-                return
-            
-            area_data = areas[current_area_id]
-            objects = area_data.get("objects", [])
+            if gs.world_position.current_location_id and location_data:
+                area_data = location_data.get("areas", {}).get(gs.world_position.current_area_id)
+                if area_data:
+                    objects = area_data.get("objects", [])
+                    if self.game_engine.objects:
+                        area_index = self.game_engine.objects.get_area_index(area_data)
             
-            # Update shortkey manager
-            self.shortkey_manager.assign_object_shortcuts_from_data(objects)
+            # Update shortkey manager (names complete from the cached area index)
+            self.shortkey_manager.assign_object_shortcuts_from_data(objects, area_index)
         except Exception:
             # Silently fail - shortcuts just won't be updated
             pass
@@ -118,34 +152,52 @@ class InputController:
         if not command_text.strip():
             return {'type': 'error', 'message': 'Please enter a command.'}
         
-        # Update object shortcuts BEFORE parsing command
-        self._update_current_location_shortcuts()
-        
-        # Parse command with shortkey expansion
-        action, args = self.shortkey_manager.parse_command(command_text)
-        
-        # Reconstruct full command with expanded shortcuts
-        if args:
-            expanded_command = f"{action} {' '.join(args)}"
-        else:
-            expanded_command = action
-        
+        with get_tracer().command(command_text):
+            if not self.journal or not self.journal.active:
+                return self._process_input(command_text)
+            
+            # Record the command with the RNG positions it started from
+            rng_state = get_rng_service().get_state()
+            response = self._process_input(command_text)
+            if self.game_engine and self.game_engine.is_initialized:
+                # Batches are recorded as the plain commands they ran, so
+                # replays don't depend on the player's macros
+                self.journal.record(response.get('replay_command', command_text), self.game_engine, rng_state)
+            return response
+    
+    def _process_input(self, command_text: str) -> Dict[str, Any]:
+        """Parse and dispatch a non-empty command"""
         # Handle debug commands (check original command first)
         parts = command_text.split()
         cmd = parts[0].lower() if parts else ""
         if cmd in self.debug_commands:
             return self.debug_commands[cmd](command_text)
         
+        if cmd == "macro":
+            return self._handle_macro(command_text)
+        
         # Handle game actions through GameEngine
         if not self.game_engine or not self.game_engine.is_initialized:
             return {'type': 'error', 'message': 'Game system not initialized.'}
         
+        is_batch = cmd in BATCH_COMMANDS or (
+            self.macros.get(cmd) is not None and cmd not in self.shortkey_manager.commands
+        )
+        
+        # Hold state-change events until the command finishes so subscribers
+        # get one coalesced batch
+        events = getattr(self.game_engine, 'events', None)
+        if events:
+            events.begin_command()
+        
         try:
             # Get GameEngine's action handler
             action_handler = self.game_engine.get_action_handler()
             
-            # Process through GameEngine's action handler with expanded command
-            result = action_handler.process_command(expanded_command)
+            if is_batch:
+                return self._process_batch(command_text, action_handler)
+            
+            result = self._dispatch(command_text, action_handler)
             
             # Convert action result to UI response
             return self._convert_action_result_to_ui_response(result, command_text)
@@ -155,6 +207,85 @@ class InputController:
                 'type': 'error',
                 'message': f'Error processing command: {str(e)}'
             }
+        finally:
+            if events:
+                events.end_command()
+    
+    def _dispatch(self, command_text: str, action_handler: ActionHandler) -> ActionResult:
+        """Run one game action with shortcuts expanded"""
+        # Update object shortcuts BEFORE parsing command
+        self._update_current_location_shortcuts()
+        
+        # Parse command with shortkey expansion
+        action, args = self.shortkey_manager.parse_command(command_text)
+        
+        # Reconstruct full command with expanded shortcuts
+        if args:
+            expanded_command = f"{action} {' '.join(args)}"
+        else:
+            expanded_command = action
+        
+        # Process through GameEngine's action handler with expanded command
+        result = action_handler.process_command(expanded_command)
+        
+        # Pick up condition changes from direct survival changes (eating, drinking)
+        player_state = self.game_engine.game_state.player_state
+        if player_state and hasattr(player_state, 'refresh_conditions'):
+            player_state.refresh_conditions()
+        
+        return result
+    
+    def _process_batch(self, command_text: str, action_handler: ActionHandler) -> Dict[str, Any]:
+        """Run a repeat, queue or macro as one command with one summarized result"""
+        try:
+            steps = expand_batch(command_text, self.macros, reserved=tuple(self.debug_commands))
+        except ValueError as e:
+            return self._convert_action_result_to_ui_response(ActionResult(False, str(e)), command_text)
+        
+        summary = run_batch(steps, lambda step: self._dispatch(step, action_handler), self.game_engine)
+        response = self._convert_action_result_to_ui_response(summary.to_result(), command_text)
+        response['replay_command'] = "queue " + "; ".join(step for step, _ in summary.results)
+        return response
+    
+    def _handle_macro(self, command_text: str) -> Dict[str, Any]:
+        """List, show, define or delete macros"""
+        parts = command_text.split(None, 2)
+        name = parts[1].lower() if len(parts) > 1 else ""
+        
+        if not name:
+            if not self.macros.macros:
+                message = "No macros defined. Define one with 'macro <name> <command>; <command>'."
+            else:
+                message = "\n".join(["Macros:"] + [f"  {macro_name}: {'; '.join(commands)}"
+                                                   for macro_name, commands in sorted(self.macros.macros.items())])
+            return self._convert_action_result_to_ui_response(ActionResult(True, message), command_text)
+        
+        if name == "delete":
+            target = parts[2].strip().lower() if len(parts) > 2 else ""
+            if self.macros.delete(target):
+                return self._convert_action_result_to_ui_response(ActionResult(True, f"Macro '{target}' deleted."), command_text)
+            return self._convert_action_result_to_ui_response(ActionResult(False, f"No macro named '{target}'."), command_text)
+        
+        if len(parts) < 3:
+            commands = self.macros.get(name)
+            if commands is None:
+                return self._convert_action_result_to_ui_response(ActionResult(False, f"No macro named '{name}'."), command_text)
+            return self._convert_action_result_to_ui_response(ActionResult(True, f"{name}: {'; '.join(commands)}"), command_text)
+        
+        if name in self.shortkey_manager.commands or name in BATCH_COMMANDS:
+            return self._convert_action_result_to_ui_response(
+                ActionResult(False, f"'{name}' is already a command - pick another macro name."), command_text)
+        
+        commands = split_commands(parts[2])
+        try:
+            # Check the macro expands (no recursion, not too long, no reserved commands)
+            expand_batch(name, self.macros.with_macro(name, commands), reserved=tuple(self.debug_commands))
+        except ValueError as e:
+            return self._convert_action_result_to_ui_response(ActionResult(False, str(e)), command_text)
+        
+        self.macros.define(name, commands)
+        return self._convert_action_result_to_ui_response(
+            ActionResult(True, f"Macro '{name}' defined: {'; '.join(commands)}"), command_text)
     
     def _convert_action_result_to_ui_response(self, result: ActionResult, command_text: str) -> Dict[str, Any]:
         """Convert ActionResult to UI response format"""
@@ -90,6 +90,30 @@ class MovementHandler(BaseActionHandler):
             return ActionResult(False, f"Movement failed: {str(e)}")
 
     
+    def handle_travel(self, *args) -> ActionResult:
+        """Handle 'travel to <hex>' - plans a route and travels it in one go"""
+        if not self.game_engine:
+            return ActionResult(False, "Movement system not available.")
+        
+        parts = [arg for arg in args if arg]
+        if parts and parts[0] == "to":
+            parts = parts[1:]
+        if not parts:
+            return ActionResult(False, "Travel where? Usage: travel to <hex> (e.g. 'travel to 0512' or 'travel to 5,12')")
+        
+        try:
+            success, message = self.game_engine.movement.travel_to(" ".join(parts))
+            
+            return ActionResult(
+                success=success,
+                message=message,
+                time_passed=0.0,  # Time already handled by MovementCoordinator
+                action_type="movement",
+                movement_type="overworld"
+            )
+        except Exception as e:
+            return ActionResult(False, f"Travel failed: {str(e)}")
+    
     def _update_location_shortcuts(self):
         """Update shortkey manager with current location's objects"""
         if not self.game_engine or not self.game_engine.is_initialized:
@@ -118,7 +142,8 @@ class MovementHandler(BaseActionHandler):
         # Update shortkey manager
         from .shortkey_manager import get_shortkey_manager
         shortkey_manager = get_shortkey_manager()
-        shortkey_manager.assign_object_shortcuts_from_data(objects)
+        area_index = self.game_engine.objects.get_area_index(area_data) if self.game_engine.objects else None
+        shortkey_manager.assign_object_shortcuts_from_data(objects, area_index)
     
     def handle_look(self, *args) -> ActionResult:
         """Handle look command through GameEngine"""
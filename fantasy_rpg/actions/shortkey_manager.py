@@ -3,21 +3,22 @@ Fantasy RPG - Shortkey Manager
 
 Manages shortkeys for actions and dynamic object shortcuts in the current location.
 Provides a seamless UX where every action and object can be referenced with minimal typing.
+
+Commands and their aliases are kept in a prefix trie, so parsing a command
+costs O(length of the input) and the same trie drives tab completion and
+"did you mean" suggestions. Object names complete from the current area's
+AreaIndex, the index object interactions already look names up in.
 """
 
-from typing import Dict, List, Optional, Tuple
-import string
-import sys
-import os
+from os.path import commonprefix
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .command_trie import CommandTrie
 
-# Import debug utilities
 try:
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-    from tests.debug_utils import log_shortkey_debug
+    from ..game.area_index import AreaIndex
 except ImportError:
-    # Fallback if tests module not available
-    def log_shortkey_debug(message: str, mode: str = "a"):
-        pass  # No-op if debug utils not available
+    from fantasy_rpg.game.area_index import AreaIndex
 
 
 class ShortkeyManager:
@@ -36,6 +37,7 @@ class ShortkeyManager:
         # Character (first letter)
         'i': 'inventory',
         'c': 'character',
+        'm': 'map',
         
         # Core actions (first letter)
         'l': 'look',
@@ -73,28 +75,62 @@ class ShortkeyManager:
         # Object shortcuts (from JSON data, permanent per object type)
         self.object_shortcuts: Dict[str, str] = {}  # shortkey -> object_name
         self.object_reverse: Dict[str, str] = {}    # object_name -> shortkey
+        
+        # Command words and aliases; registered commands are added by add_commands()
+        self.commands = CommandTrie()
+        for shortkey, action in self.ACTION_SHORTCUTS.items():
+            self.commands.add(shortkey, action)
+        
+        # Index of the objects in the current area (None outside locations)
+        self.area_index: Optional[AreaIndex] = None
+    
+    def add_commands(self, commands: Iterable[str]):
+        """
+        Make commands known for parsing, completion and suggestions.
+        
+        Aliases from ACTION_SHORTCUTS keep their expansion.
+        
+        Args:
+            commands: Command words, e.g. an action registry's commands
+        """
+        for command in commands:
+            if command not in self.commands:
+                self.commands.add(command)
     
-    def assign_object_shortcuts_from_data(self, objects: List[Dict]) -> Dict[str, str]:
+    def assign_object_shortcuts_from_data(self, objects: List[Dict],
+                                          area_index: Optional[AreaIndex] = None) -> Dict[str, str]:
         """
         Build shortkey mappings from object data (with permanent shortkeys from JSON).
         
+        Object names complete from area_index, normally the cached index
+        from ObjectInteractionSystem.get_area_index(). Without one, an index
+        is built only when the object list differs from the last call's.
+        
         Args:
             objects: List of object dictionaries from location data
+            area_index: Index over the same objects, if the caller has one
             
         Returns:
             Dictionary mapping object_name -> shortkey
         """
-        self.object_shortcuts.clear()
-        self.object_reverse.clear()
-        
+        shortcuts: Dict[str, str] = {}
+        reverse: Dict[str, str] = {}
         for obj in objects:
             obj_name = obj.get("name", "Unknown")
             shortkey = obj.get("shortkey", "")
-            
             if shortkey:
-                self.object_shortcuts[shortkey] = obj_name
-                self.object_reverse[obj_name] = shortkey
+                shortcuts[shortkey] = obj_name
+                reverse[obj_name] = shortkey
+        
+        if area_index is None and objects:
+            area = {"objects": objects}
+            area_index = self.area_index
+            if area_index is None or not area_index.is_current(area):
+                area_index = AreaIndex(area)
+        self.area_index = area_index
         
+        self.object_shortcuts = shortcuts
+        self.object_reverse = reverse
         return self.object_reverse
     
     def get_object_shortkey(self, object_name: str) -> Optional[str]:
@@ -119,42 +155,61 @@ class ShortkeyManager:
         
         # Only lowercase the action part for matching
         first = parts[0].lower()
-        rest = parts[1:]
+        action = self.commands.get(first) or first
         
-        # Check if first part is an action shortkey
-        action = self.ACTION_SHORTCUTS.get(first, first)
+        # Expand object shortkeys (shortkeys are lowercase), keeping other arguments as typed
+        expanded_args = [self.object_shortcuts.get(arg.lower(), arg) for arg in parts[1:]]
         
-        # DEBUG: Write shortkey mappings to file (toggled in tests/debug_utils.py)
-        log_shortkey_debug(
-            f"\n=== PARSE COMMAND DEBUG ===\n"
-            f"Original command: '{command_str}'\n"
-            f"Action: '{first}' -> '{action}'\n"
-            f"Arguments: {rest}\n"
-            f"Current object_shortcuts: {self.object_shortcuts}\n",
-            mode="a"
-        )
+        return (action, expanded_args)
+    
+    def complete(self, text: str) -> List[str]:
+        """
+        Completions for a partly typed command line.
         
-        # Process arguments - expand object shortcuts (keep original case for lookup)
-        expanded_args = []
-        for arg in rest:
-            # Check if arg is an object shortkey (case-sensitive for shortkeys)
-            obj_name = self.object_shortcuts.get(arg.lower())  # Shortkeys are lowercase
-            
-            # DEBUG
-            log_shortkey_debug(f"  Arg '{arg}' -> lookup '{arg.lower()}' -> result: {obj_name}\n")
-            
-            if obj_name:
-                expanded_args.append(obj_name)
-            else:
-                expanded_args.append(arg)
+        The first word completes against the known commands; anything after
+        it against the names of the objects in the current area.
         
-        # DEBUG final result
-        log_shortkey_debug(
-            f"Final expanded: {action} {expanded_args}\n"
-            f"{'-' * 50}\n"
-        )
+        Returns:
+            Whole command lines (lowercase), sorted
+        """
+        text = text.lower().lstrip()
+        if not text:
+            return []
+        if " " not in text:
+            return self.commands.complete(text)
         
-        return (action, expanded_args)
+        if self.area_index is None:
+            return []
+        command, rest = text.split(" ", 1)
+        return [f"{command} {name}" for name in self.area_index.objects.complete(rest)]
+    
+    def tab_complete(self, text: str) -> Tuple[str, List[str]]:
+        """
+        Complete a command line as far as it is unambiguous.
+        
+        A single completion is taken whole (followed by a space after a
+        command, so an object name can be typed next); several are taken up
+        to their common prefix.
+        
+        Returns:
+            Tuple of (completed text, remaining choices) - choices is empty
+            when the completion was unique or nothing matched
+        """
+        completions = self.complete(text)
+        if not completions:
+            return text, []
+        if len(completions) == 1:
+            completion = completions[0]
+            return (completion if " " in completion else f"{completion} "), []
+        
+        common = commonprefix(completions)
+        if len(common) > len(text.lstrip()):
+            text = common
+        return text, completions
+    
+    def suggest_commands(self, word: str) -> List[str]:
+        """Commands a mistyped word could have meant"""
+        return self.commands.suggest(word)
     
     def format_object_with_shortkey(self, object_name: str) -> str:
         """
@@ -206,6 +261,13 @@ class ShortkeyManager:
         lines.append("  r - Rest")
         lines.append("  wa [time] - Wait (quick/short/medium/long/extended)")
         lines.append("")
+        lines.append("BATCHES:")
+        lines.append("  repeat N [cmd] - Run a command N times")
+        lines.append("  queue [cmd]; [cmd] - Run commands in order")
+        lines.append("  macro [name] [cmd]; [cmd] - Define a macro, run it by name")
+        lines.append("  macro / macro delete [name] - List or delete macros")
+        lines.append("  (batches stop early on failure, critical conditions or low HP)")
+        lines.append("")
         lines.append("OTHER:")
         lines.append("  h/? - This help")
         lines.append("  q - Quit")
@@ -62,6 +62,26 @@ def _generate_xp_thresholds():
 
 XP_THRESHOLDS = _generate_xp_thresholds()
 
+ABILITIES = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+
+
+@dataclass
+class EffectiveStats:
+    """
+    Character modifiers resolved together for one state version.
+    
+    Built once from the character's scores, equipment and active conditions
+    and reused until any of them change (see Character.get_effective_stats).
+    """
+    version: tuple
+    ability_modifiers: Dict[str, int]  # Score modifier plus condition effects
+    condition_modifiers: Dict[str, int]  # Condition part of ability_modifiers
+    saving_throws: Dict[str, int]  # Before class proficiency
+    skills: Dict[str, int]  # Ability modifier plus skill proficiency
+    armor_class: int
+    speed: int
+    condition_effects: Dict = field(default_factory=dict)  # Raw calculate_total_effects() output
+
 
 @dataclass
 class Character:
@@ -107,71 +127,136 @@ class Character:
     # Movement speed (in feet, D&D standard)
     base_speed: int = 30  # Standard human speed
     
+    # Cached effective-stat sheet (see get_effective_stats)
+    _effective_stats: Optional[EffectiveStats] = field(default=None, init=False, repr=False, compare=False)
+    
     def ability_modifier(self, ability: str) -> int:
-        """Calculate D&D ability modifier: (score - 10) // 2"""
-        base_score = getattr(self, ability)
-        base_modifier = (base_score - 10) // 2
-        
-        # Apply condition effects if available
-        condition_modifier = self.get_condition_modifier(ability)
-        
-        return base_modifier + condition_modifier
+        """Calculate D&D ability modifier: (score - 10) // 2, plus condition effects"""
+        stats = self.get_effective_stats()
+        if ability in stats.ability_modifiers:
+            return stats.ability_modifiers[ability]
+        return (getattr(self, ability) - 10) // 2
     
     def get_condition_modifier(self, ability: str) -> int:
         """Get condition-based modifier for an ability score"""
-        if not hasattr(self, 'player_state') or not self.player_state:
-            return 0
-        
-        try:
-            from ..game.conditions import get_conditions_manager
-            conditions_manager = get_conditions_manager()
-            active_conditions = conditions_manager.evaluate_conditions(self.player_state)
-            total_effects = conditions_manager.calculate_total_effects(active_conditions)
-            
-            return total_effects.get("ability_modifiers", {}).get(ability, 0)
-        except (ImportError, Exception):
-            return 0
+        return self.get_effective_stats().condition_modifiers.get(ability, 0)
     
     def get_effective_speed(self) -> int:
         """Calculate effective movement speed including condition penalties"""
-        base_speed = self.base_speed
-        
-        # Apply condition-based movement penalties
-        if not hasattr(self, 'player_state') or not self.player_state:
-            return base_speed
-        
-        try:
-            from ..game.conditions import get_conditions_manager
-            conditions_manager = get_conditions_manager()
-            active_conditions = conditions_manager.evaluate_conditions(self.player_state)
-            total_effects = conditions_manager.calculate_total_effects(active_conditions)
-            
-            movement_penalty = total_effects.get("movement_penalty", 0.0)
-            
-            # Apply penalty as a fraction (0.5 = half speed, 0.75 = quarter speed lost)
-            effective_speed = int(base_speed * (1.0 - movement_penalty))
-            
-            # Minimum speed of 5 feet (can't go below crawling speed)
-            return max(5, effective_speed)
-            
-        except (ImportError, Exception):
-            return base_speed
+        return self.get_effective_stats().speed
     
     def calculate_ac(self) -> int:
         """Calculate armor class from dexterity and equipment"""
-        # Use new equipment system if available
+        return self.get_effective_stats().armor_class
+    
+    def invalidate_effective_stats(self):
+        """Drop the cached stat sheet so the next accessor rebuilds it"""
+        self._effective_stats = None
+    
+    def get_effective_stats(self) -> EffectiveStats:
+        """
+        Get the effective-stat sheet, rebuilding it only when its inputs change.
+        
+        Conditions are evaluated once per sheet rather than once per
+        accessor call. The sheet's version covers ability scores, level,
+        player vitals, active conditions, equipment and skill proficiencies.
+        
+        Returns:
+            EffectiveStats for the current character state
+        """
+        version = self._effective_stats_version()
+        if self._effective_stats is None or self._effective_stats.version != version:
+            self._effective_stats = self._build_effective_stats(version)
+        return self._effective_stats
+    
+    def _effective_stats_version(self) -> tuple:
+        """Cheap fingerprint of everything the stat sheet depends on"""
+        vitals = None
+        conditions = None
+        player_state = getattr(self, 'player_state', None)
+        if player_state:
+            survival = getattr(player_state, 'survival', None)
+            if survival is not None:
+                vitals = (
+                    survival.hunger, survival.thirst, survival.fatigue,
+                    survival.body_temperature, survival.wetness, survival.wind_chill
+                )
+            conditions = tuple(getattr(player_state, 'active_conditions', ()) or ())
+        
+        equipment = None
+        if self.equipment and hasattr(self.equipment, 'get_slot_names'):
+            equipment = tuple(id(self.equipment.get_item_in_slot(slot)) for slot in self.equipment.get_slot_names())
+        
+        proficiencies = None
+        if self.skill_proficiencies is not None:
+            proficiencies = (
+                frozenset(getattr(self.skill_proficiencies, 'proficient_skills', ())),
+                frozenset(getattr(self.skill_proficiencies, 'expertise_skills', ()))
+            )
+        
+        return (
+            tuple(getattr(self, ability) for ability in ABILITIES),
+            self.level, self.proficiency_bonus, self.base_speed,
+            vitals, conditions, equipment, proficiencies
+        )
+    
+    def _build_effective_stats(self, version: tuple) -> EffectiveStats:
+        """Resolve all modifiers from a single condition evaluation"""
+        total_effects = {}
+        if getattr(self, 'player_state', None):
+            try:
+                from ..game.conditions import get_conditions_manager
+                conditions_manager = get_conditions_manager()
+                active_conditions = conditions_manager.evaluate_conditions(self.player_state)
+                total_effects = conditions_manager.calculate_total_effects(active_conditions)
+            except (ImportError, Exception):
+                total_effects = {}
+        
+        # Abilities
+        condition_modifiers = {}
+        ability_modifiers = {}
+        for ability in ABILITIES:
+            condition_modifiers[ability] = total_effects.get("ability_modifiers", {}).get(ability, 0)
+            ability_modifiers[ability] = (getattr(self, ability) - 10) // 2 + condition_modifiers[ability]
+        
+        # Saving throws (class proficiency is added by calculate_saving_throw_modifier)
+        saving_throws = dict(ability_modifiers)
+        
+        # Skills
+        skills = {}
+        try:
+            from .skills import SkillName
+        except ImportError:
+            from fantasy_rpg.core.skills import SkillName
+        for skill in SkillName:
+            multiplier = 0
+            if hasattr(self.skill_proficiencies, 'get_proficiency_multiplier'):
+                multiplier = self.skill_proficiencies.get_proficiency_multiplier(skill.display_name)
+            skills[skill.display_name] = ability_modifiers[skill.ability] + multiplier * self.proficiency_bonus
+        
+        # Armor class - equipment uses magical-item dexterity, the fallback
+        # uses the condition-adjusted modifier
         if self.equipment:
-            return self.equipment.calculate_total_ac_bonus(self)
-        
-        # Fallback to old inventory system for backward compatibility
-        base_ac = 10 + self.ability_modifier('dexterity')
-        shield_bonus = 0
-        
-        # Check for armor and shield in inventory (simplified for now)
-        # TODO: Implement proper equipment system for AC calculation
-        # For now, just use base AC calculation
+            armor_class = self.equipment.calculate_total_ac_bonus(self)
+        else:
+            armor_class = 10 + ability_modifiers['dexterity']
         
-        return base_ac + shield_bonus
+        # Speed - penalty is a fraction (0.5 = half speed), minimum 5 feet
+        speed = self.base_speed
+        if total_effects:
+            movement_penalty = total_effects.get("movement_penalty", 0.0)
+            speed = max(5, int(self.base_speed * (1.0 - movement_penalty)))
+        
+        return EffectiveStats(
+            version=version,
+            ability_modifiers=ability_modifiers,
+            condition_modifiers=condition_modifiers,
+            saving_throws=saving_throws,
+            skills=skills,
+            armor_class=armor_class,
+            speed=speed,
+            condition_effects=total_effects
+        )
     
     def calculate_hp(self, character_class=None) -> int:
         """Calculate hit points based on level, class, and constitution"""
@@ -332,6 +417,10 @@ class Character:
     
     def get_skill_modifier(self, skill_name: str) -> int:
         """Get the total modifier for a skill"""
+        stats = self.get_effective_stats()
+        if skill_name in stats.skills:
+            return stats.skills[skill_name]
+        
         try:
             from .skills import SkillSystem
         except ImportError:
@@ -340,7 +429,7 @@ class Character:
     
     def calculate_saving_throw_modifier(self, ability: str, character_class=None) -> int:
         """Calculate saving throw modifier for an ability"""
-        base_modifier = self.ability_modifier(ability)
+        base_modifier = self.get_effective_stats().saving_throws.get(ability, self.ability_modifier(ability))
         
         # Check if proficient in this saving throw
         if character_class and character_class.is_proficient_in_saving_throw(ability):
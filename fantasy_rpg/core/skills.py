@@ -7,7 +7,11 @@ D&D 5e skill system with proficiency bonuses and skill checks.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set
 from enum import Enum
-import random
+
+try:
+    from ..utils.rng import get_rng
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng
 
 
 class SkillName(Enum):
@@ -113,23 +117,25 @@ class SkillSystem:
         - success: whether the check succeeded
         - details: breakdown of the calculation
         """
+        rng = get_rng("checks")
+        
         # Roll d20 (with advantage/disadvantage)
         if advantage and disadvantage:
             # Advantage and disadvantage cancel out
-            roll = random.randint(1, 20)
+            roll = rng.randint(1, 20)
             roll_type = "normal"
         elif advantage:
-            roll1 = random.randint(1, 20)
-            roll2 = random.randint(1, 20)
+            roll1 = rng.randint(1, 20)
+            roll2 = rng.randint(1, 20)
             roll = max(roll1, roll2)
             roll_type = f"advantage ({roll1}, {roll2})"
         elif disadvantage:
-            roll1 = random.randint(1, 20)
-            roll2 = random.randint(1, 20)
+            roll1 = rng.randint(1, 20)
+            roll2 = rng.randint(1, 20)
             roll = min(roll1, roll2)
             roll_type = f"disadvantage ({roll1}, {roll2})"
         else:
-            roll = random.randint(1, 20)
+            roll = rng.randint(1, 20)
             roll_type = "normal"
         
         # Calculate modifier
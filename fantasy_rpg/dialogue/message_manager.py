@@ -3,12 +3,148 @@
 This module provides the MessageManager class which loads and manages
 natural language message variants for game events, ensuring varied and
 immersive text output without repetition.
+
+Messages are compiled once at load into MessageTemplate objects: the
+template's fields are parsed and checked against the variables declared
+for its category (event_messages.json "template_variables"), so a typo or
+malformed template is reported at startup instead of when it is shown.
+
+A message is either a plain string or an object with a "when" predicate
+on the event's context:
+
+    {"text": "The desert sun hammers down.", "when": {"biome": ["desert"]}}
+
+Predicates can test "severity", "temperature" (a band: freezing, cold,
+mild, warm or hot, taken from a temperature in °F or given directly as
+"temperature_band") and "biome" (the biome type or any word of it, so
+"forest" matches "boreal_forest"). Each event's templates are bucketed by
+predicate values, and the templates usable for a context - those whose
+predicates match and whose variables are all provided - are looked up once
+per distinct context and then reused.
 """
 
 import json
 import random
+import string
+from dataclasses import dataclass, field
+from itertools import product
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+
+# Context keys a template's "when" predicate can test, in bucket key order
+PREDICATE_KEYS = ("severity", "temperature", "biome")
+
+# Upper bounds (°F, inclusive) of the temperature bands; hotter is "hot"
+TEMPERATURE_BANDS = ((32, "freezing"), (50, "cold"), (75, "mild"), (90, "warm"))
+
+
+def temperature_band(temperature: Optional[float]) -> Optional[str]:
+    """Band name for a temperature in °F (None if unknown)"""
+    if temperature is None:
+        return None
+    for upper, band in TEMPERATURE_BANDS:
+        if temperature <= upper:
+            return band
+    return "hot"
+
+
+@dataclass(eq=False)
+class MessageTemplate:
+    """One compiled message variant"""
+    text: str
+    fields: FrozenSet[str] = frozenset()  # Variables the text needs
+    when: Dict[str, FrozenSet[str]] = field(default_factory=dict)  # Predicate key -> accepted values
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Text with variables substituted (missing ones are left as {name})"""
+        if not self.fields:
+            return self.text
+        return self.text.format_map(_KeepMissing(variables))
+
+
+class _KeepMissing(dict):
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+def compile_template(raw: Any, allowed_variables: Optional[FrozenSet[str]] = None) -> MessageTemplate:
+    """
+    Compile a message entry (a string, or {"text": ..., "when": {...}}).
+    
+    Args:
+        raw: Message entry from event_messages.json
+        allowed_variables: Variables the category may use (None: any)
+    
+    Raises:
+        ValueError: If the template is malformed or uses an undeclared variable
+    """
+    if isinstance(raw, str):
+        text, when = raw, {}
+    elif isinstance(raw, dict) and isinstance(raw.get("text"), str):
+        text, when = raw["text"], raw.get("when", {})
+    else:
+        raise ValueError(f"expected a string or an object with 'text', got {raw!r}")
+    
+    fields = set()
+    for _, name, _, _ in string.Formatter().parse(text):
+        if name is None:
+            continue
+        if not name.isidentifier():
+            raise ValueError(f"field {{{name}}} is not a variable name")
+        if allowed_variables is not None and name not in allowed_variables:
+            raise ValueError(f"undeclared variable {{{name}}}")
+        fields.add(name)
+    
+    if not isinstance(when, dict):
+        raise ValueError(f"'when' must be an object, got {when!r}")
+    predicates = {}
+    for key, values in when.items():
+        if key not in PREDICATE_KEYS:
+            raise ValueError(f"unknown predicate '{key}' (expected one of {', '.join(PREDICATE_KEYS)})")
+        values = [values] if isinstance(values, str) else values
+        if not values or not all(isinstance(value, str) for value in values):
+            raise ValueError(f"predicate '{key}' needs a string or a list of strings")
+        predicates[key] = frozenset(values)
+    
+    return MessageTemplate(text, frozenset(fields), predicates)
+
+
+class EventTemplates:
+    """An event's templates, bucketed by the predicate values they accept"""
+    
+    def __init__(self, templates: List[MessageTemplate]):
+        self.templates = templates
+        
+        # (severity, temperature band, biome) -> templates; None accepts any value
+        self.buckets: Dict[Tuple[Optional[str], ...], List[MessageTemplate]] = {}
+        for template in templates:
+            choices = [sorted(template.when[key]) if key in template.when else [None] for key in PREDICATE_KEYS]
+            for bucket_key in product(*choices):
+                self.buckets.setdefault(bucket_key, []).append(template)
+        
+        self._selections: Dict[tuple, List[MessageTemplate]] = {}
+    
+    def candidates(self, severity: Optional[str], band: Optional[str], biome_words: Tuple[str, ...],
+                   provided: FrozenSet[str]) -> List[MessageTemplate]:
+        """
+        Templates usable in a context.
+        
+        Templates whose variables are not all provided are only used when
+        no other template matches (their missing variables stay visible).
+        """
+        cache_key = (severity, band, biome_words, provided)
+        selection = self._selections.get(cache_key)
+        if selection is None:
+            matching = {}
+            for bucket_key in product((None, severity) if severity else (None,),
+                                      (None, band) if band else (None,),
+                                      (None,) + biome_words):
+                for template in self.buckets.get(bucket_key, ()):
+                    matching[template] = None
+            selection = [template for template in matching if template.fields <= provided] or list(matching)
+            self._selections[cache_key] = selection
+        return selection
 
 
 class MessageManager:
@@ -31,7 +167,14 @@ class MessageManager:
         """
         self.data_file = Path(__file__).parent / data_file
         self.messages = self._load_messages()
+        
+        # Variables each category's templates may use
+        self.template_variables = {category: frozenset(names) for category, names in
+                                   self.messages.pop('template_variables', {}).items()}
         self._validate_structure()
+        
+        # Category -> event -> compiled templates
+        self.templates: Dict[str, Dict[str, EventTemplates]] = self._compile_templates()
     
     def _load_messages(self) -> dict:
         """Load all messages from JSON file.
@@ -86,13 +229,61 @@ class MessageManager:
                 elif len(messages) == 0:
                     print(f"Warning: Empty message array for '{category}.{event_type}'")
     
+    def _compile_templates(self) -> Dict[str, Dict[str, EventTemplates]]:
+        """Compile every message, reporting (and skipping) broken templates."""
+        compiled = {}
+        for category, events in self.messages.items():
+            allowed = self.template_variables.get(category)
+            compiled[category] = {}
+            for event_type, messages in events.items():
+                if not isinstance(messages, list):
+                    continue
+                templates = []
+                for position, raw in enumerate(messages):
+                    try:
+                        templates.append(compile_template(raw, allowed))
+                    except ValueError as e:
+                        print(f"Warning: Skipping message {position} of '{category}.{event_type}': {e}")
+                compiled[category][event_type] = EventTemplates(templates)
+        return compiled
+    
+    def _select(self, category: str, event: str, values: Dict[str, Any]) -> Optional[str]:
+        """Pick and render a template for an event, or None if it has none.
+        
+        Args:
+            category: Message category
+            event: Event type
+            values: Context for predicates and variables for the template
+        """
+        event_templates = self.templates.get(category, {}).get(event)
+        if event_templates is None or not event_templates.templates:
+            return None
+        
+        biome = values.get('biome')
+        biome_words = (biome,) + tuple(biome.split('_')) if isinstance(biome, str) and biome else ()
+        band = values.get('temperature_band')
+        if band is None and isinstance(values.get('temperature'), (int, float)):
+            band = temperature_band(values['temperature'])
+        
+        candidates = event_templates.candidates(values.get('severity'), band, biome_words, frozenset(values))
+        if not candidates:
+            return None
+        template = random.choice(candidates)
+        
+        missing = template.fields - values.keys()
+        if missing:
+            # Handle missing template variable gracefully
+            print(f"Warning: Missing template variable(s) {', '.join(sorted(missing))} for event '{event}'")
+        return template.render(values)
+    
     def get_survival_message(self, event: str, context: Optional[dict] = None) -> str:
         """Returns random survival message variant.
         
         Args:
             event: Event type like 'COLD_triggered', 'HUNGER_triggered', etc
-            context: Optional dict with context data (temperature, severity, etc)
-                    Reserved for future context-aware selection
+            context: Optional dict with context data (severity, temperature
+                    in °F or temperature_band, biome) used to prefer fitting
+                    variants; also available to templates as variables
         
         Returns:
             Random message from pool, or fallback if event not found
@@ -104,14 +295,14 @@ class MessageManager:
             >>> manager.get_survival_message('HUNGER_triggered', {'hunger_level': 800})
             'Your stomach growls loudly, demanding sustenance.'
         """
-        messages = self.messages.get('survival_effects', {}).get(event, [])
+        message = self._select('survival_effects', event, context or {})
         
-        if not messages:
+        if message is None:
             # Fallback message if event not found
             event_name = event.replace('_triggered', '').replace('_', ' ').lower()
             return f"You experience {event_name}."
         
-        return random.choice(messages)
+        return message
     
     def get_equipment_message(self, event: str, **kwargs) -> str:
         """Returns random equipment message with template substitution.
@@ -131,30 +322,23 @@ class MessageManager:
             >>> manager.get_equipment_message('weapon_equipped', weapon_name='Longsword')
             'You draw the Longsword, feeling its weight in your hand.'
         """
-        messages = self.messages.get('equipment_effects', {}).get(event, [])
+        # Select random message and interpolate template variables
+        message = self._select('equipment_effects', event, kwargs)
         
-        if not messages:
+        if message is None:
             # Fallback message if event not found
             event_name = event.replace('_', ' ').lower()
             return f"You {event_name}."
         
-        # Select random message and interpolate template variables
-        message = random.choice(messages)
-        
-        try:
-            return message.format(**kwargs)
-        except KeyError as e:
-            # Handle missing template variable gracefully
-            print(f"Warning: Missing template variable {e} for event '{event}'")
-            # Return message with unsubstituted variables visible for debugging
-            return message
+        return message
     
-    def get_environmental_message(self, event: str) -> str:
+    def get_environmental_message(self, event: str, context: Optional[dict] = None) -> str:
         """Returns random environmental/weather message or beneficial condition message.
         
         Args:
             event: Event type like 'weather_change_to_rain', 'enter_cold_area',
                   'LIT_FIRE_triggered', 'NATURAL_SHELTER_triggered', etc
+            context: Optional dict with context data, as for get_survival_message
         
         Returns:
             Random message from pool, or fallback if event not found
@@ -167,14 +351,17 @@ class MessageManager:
             'The dancing flames warm your skin and lift your spirits.'
         """
         # Check environmental category first, then beneficial_effects category
-        messages = self.messages.get('environmental', {}).get(event, []) or self.messages.get('beneficial_effects', {}).get(event, [])
+        context = context or {}
+        message = self._select('environmental', event, context)
+        if message is None:
+            message = self._select('beneficial_effects', event, context)
         
-        if not messages:
+        if message is None:
             # Fallback message if event not found
             event_name = event.replace('weather_change_to_', '').replace('enter_', '').replace('_triggered', '').replace('_', ' ').lower()
             return f"The environment changes to {event_name}."
         
-        return random.choice(messages)
+        return message
     
     def get_action_message(self, event: str, **kwargs) -> str:
         """Returns random action result message with templates.
@@ -194,20 +381,12 @@ class MessageManager:
             >>> manager.get_action_message('hunt_success', prey_type='deer')
             'You successfully hunt deer. Fresh meat is yours.'
         """
-        messages = self.messages.get('actions', {}).get(event, [])
+        # Select random message and interpolate template variables
+        message = self._select('actions', event, kwargs)
         
-        if not messages:
+        if message is None:
             # Fallback message if event not found
             event_name = event.replace('_', ' ').lower()
             return f"Action result: {event_name}."
         
-        # Select random message and interpolate template variables
-        message = random.choice(messages)
-        
-        try:
-            return message.format(**kwargs)
-        except KeyError as e:
-            # Handle missing template variable gracefully
-            print(f"Warning: Missing template variable {e} for event '{event}'")
-            # Return message with unsubstituted variables visible for debugging
-            return message
+        return message
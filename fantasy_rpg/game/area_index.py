@@ -0,0 +1,225 @@
+"""
+Fantasy RPG - Area Index
+
+Lookup index over the objects in one location area.
+
+Each name index keeps:
+- normalized name -> records, in area order
+- aliases (shortkeys, template ids) -> records
+- id -> records
+- a word trie (utils/word_trie.py) over full names and each word of a
+  name, so "chest" or "trea" both reach "Treasure Chest", and typos
+  within one edit still match
+
+The same trie completes object names on the command line.
+
+Lookups cost O(length of the query) however many objects the area holds.
+Records are the area's own dicts, so state flags such as "searched" or
+"depleted" are always current (used-up objects stay in the area); call
+update() when a record's name or id changes.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from ..utils.word_trie import MAX_SUGGESTIONS, WordTrie
+except ImportError:
+    from fantasy_rpg.utils.word_trie import MAX_SUGGESTIONS, WordTrie
+
+
+# Words shorter than this get no typo-tolerant matching (too many false hits)
+MIN_FUZZY_LENGTH = 4
+
+
+def normalize_name(name: Any) -> str:
+    """Normalize a name for lookup: lowercase, underscores as spaces, single spaces"""
+    return " ".join(str(name or "").lower().replace("_", " ").split())
+
+
+class NameIndex:
+    """Name, alias, prefix and fuzzy lookup over one kind of record"""
+
+    def __init__(self):
+        self._by_name: Dict[str, List[Any]] = {}
+        self._by_alias: Dict[str, List[Any]] = {}
+        self._by_id: Dict[str, List[Any]] = {}
+        self._trie = WordTrie(MIN_FUZZY_LENGTH)
+        # id(record) -> (position in area, name, aliases, record id)
+        self._entries: Dict[int, Tuple[int, str, Tuple[str, ...], Optional[str]]] = {}
+        self._next_position = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, record: Dict[str, Any], aliases: Iterable[str] = (), position: Optional[int] = None):
+        """
+        Index a record.
+
+        Args:
+            record: Object dict with at least a "name"
+            aliases: Extra names the record answers to
+            position: Area order of the record (defaults to after all others)
+        """
+        if id(record) in self._entries:
+            self.remove(record)
+        if position is None:
+            position = self._next_position
+        self._next_position = max(self._next_position, position + 1)
+
+        name = normalize_name(record.get("name"))
+        aliases = tuple(a for a in (normalize_name(a) for a in aliases) if a and a != name)
+        record_id = record.get("id")
+        self._entries[id(record)] = (position, name, aliases, record_id)
+
+        self._insert(self._by_name, name, record, position)
+        for alias in aliases:
+            self._insert(self._by_alias, alias, record, position)
+        if record_id:
+            self._insert(self._by_id, normalize_name(record_id), record, position)
+
+        if len(self._by_name[name]) == 1:
+            # First record with this name - index the name itself
+            for key in self._search_keys(name):
+                self._trie.add(key, name)
+
+    def remove(self, record: Dict[str, Any]) -> bool:
+        """
+        Drop a record from the index.
+
+        Returns:
+            True if the record was indexed
+        """
+        entry = self._entries.pop(id(record), None)
+        if entry is None:
+            return False
+        _, name, aliases, record_id = entry
+
+        self._discard(self._by_name, name, record)
+        for alias in aliases:
+            self._discard(self._by_alias, alias, record)
+        if record_id:
+            self._discard(self._by_id, normalize_name(record_id), record)
+
+        if name not in self._by_name:
+            # Last record with this name - unindex the name
+            for key in self._search_keys(name):
+                self._trie.discard(key, name)
+        return True
+
+    def update(self, record: Dict[str, Any], aliases: Iterable[str] = ()):
+        """Re-index a record whose name or id changed, keeping its area order"""
+        entry = self._entries.get(id(record))
+        position = entry[0] if entry else None
+        self.add(record, aliases, position)
+
+    def find(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Find the records a query refers to.
+
+        Tries, in order: exact name, alias or id, unambiguous prefix of the
+        name or one of its words, then a unique name within one typo.
+
+        Returns:
+            Matching records in area order (all share one name), or [] if
+            nothing or more than one distinct name matches
+        """
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        for table in (self._by_name, self._by_alias, self._by_id):
+            if query in table:
+                return list(table[query])
+
+        names = self._trie.prefix(query)
+        if len(names) == 1:
+            return list(self._by_name[next(iter(names))])
+
+        if not names:
+            names = self._trie.fuzzy(query)
+            if len(names) == 1:
+                return list(self._by_name[next(iter(names))])
+        return []
+
+    def suggest(self, query: str) -> List[str]:
+        """
+        Names a query could have meant, for "did you mean" messages.
+
+        Returns:
+            Up to MAX_SUGGESTIONS normalized names, sorted
+        """
+        query = normalize_name(query)
+        if not query:
+            return []
+        names = self._trie.prefix(query)
+        if not names:
+            names = self._trie.fuzzy(query)
+        return sorted(names)[:MAX_SUGGESTIONS]
+
+    def complete(self, prefix: str) -> List[str]:
+        """
+        Names starting with a prefix, for tab completion.
+
+        Returns:
+            Matching normalized names, sorted (all of them for an empty prefix)
+        """
+        prefix = normalize_name(prefix)
+        return sorted(name for name in self._trie.prefix(prefix) if name.startswith(prefix))
+
+    @staticmethod
+    def _search_keys(name: str) -> List[str]:
+        """The full name plus every suffix starting at a word boundary"""
+        words = name.split(" ")
+        return [" ".join(words[i:]) for i in range(len(words))]
+
+    def _insert(self, table: Dict[str, List[Any]], key: str, record: Dict[str, Any], position: int):
+        """Add a record under a key, keeping area order"""
+        records = table.setdefault(key, [])
+        index = len(records)
+        while index > 0 and self._entries[id(records[index - 1])][0] > position:
+            index -= 1
+        records.insert(index, record)
+
+    @staticmethod
+    def _discard(table: Dict[str, List[Any]], key: str, record: Dict[str, Any]):
+        records = table.get(key)
+        if records is None:
+            return
+        table[key] = [r for r in records if r is not record]
+        if not table[key]:
+            del table[key]
+
+
+class AreaIndex:
+    """Object index for one area"""
+
+    def __init__(self, area_data: Dict[str, Any]):
+        """
+        Build the indexes for an area.
+
+        Args:
+            area_data: Area dict from the location data
+        """
+        self.objects = NameIndex()
+        self._objects_list = area_data.get("objects")
+
+        for obj in self._objects_list or []:
+            self.objects.add(obj, self.object_aliases(obj))
+
+    @staticmethod
+    def object_aliases(obj: Dict[str, Any]) -> Tuple[str, ...]:
+        """Extra names an object answers to"""
+        return (obj.get("shortkey", ""),)
+
+    def is_current(self, area_data: Dict[str, Any]) -> bool:
+        """Whether the index still matches the area's object list (same list, same size)"""
+        objects = area_data.get("objects")
+        return objects is self._objects_list and len(objects or []) == len(self.objects)
+
+    def find_objects(self, query: str) -> List[Dict[str, Any]]:
+        """Objects matching a query, in area order"""
+        return self.objects.find(query)
+
+    def update_object(self, obj: Dict[str, Any]):
+        """Re-index an object after its name or id changed"""
+        self.objects.update(obj, self.object_aliases(obj))
@@ -0,0 +1,214 @@
+"""
+Fantasy RPG - Autosave
+
+Background autosaves into a ring of rotating save slots.
+
+An autosave has two halves. The snapshot runs on the calling (UI) thread
+between commands: SaveManager.snapshot_sections() copies only the live parts
+of the game and reuses already-encoded bytes for everything else. A worker
+thread then encodes the snapshot, writes and fsyncs it under a temporary
+name and renames it into its slot. The caller never waits on the disk; if
+the worker is still busy when the next autosave is due, the waiting snapshot
+is replaced by the newer one.
+
+check() is called after every command and autosaves when the interval has
+passed since the last autosave or when the player moved to another hex.
+Slots are written in turn (autosave_1.sav, autosave_2.sav, ...), skipping a
+slot the current game was loaded from and still reads sections out of.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+try:
+    from .save_manager import SAVE_EXTENSION
+except ImportError:
+    from fantasy_rpg.game.save_manager import SAVE_EXTENSION
+
+
+AUTOSAVE_NAME = "autosave"
+
+# Real time between autosaves; None or 0 autosaves on hex changes only
+DEFAULT_INTERVAL_SECONDS = 300.0
+
+# Number of rotating autosave files
+DEFAULT_SLOTS = 3
+
+
+class AutosaveService:
+    """Takes snapshots between commands and writes them on a worker thread"""
+
+    def __init__(self, game_engine, interval_seconds: Optional[float] = DEFAULT_INTERVAL_SECONDS,
+                 slots: int = DEFAULT_SLOTS, on_hex_change: bool = True,
+                 save_name: str = AUTOSAVE_NAME, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the autosave service.
+
+        Args:
+            game_engine: GameEngine whose game is autosaved
+            interval_seconds: Real time between autosaves (None or 0 to disable)
+            slots: Number of rotating autosave files
+            on_hex_change: Autosave whenever the player enters another hex
+            save_name: Base name of the slot files (without extension)
+            clock: Monotonic time source in seconds
+        """
+        if slots < 1:
+            raise ValueError("Autosave needs at least one slot")
+
+        self.game_engine = game_engine
+        self.interval_seconds = interval_seconds
+        self.slots = slots
+        self.on_hex_change = on_hex_change
+        self.save_name = save_name
+        self._clock = clock
+
+        self._last_autosave = clock()
+        self._last_hex: Optional[str] = None
+        self._next_slot = self._first_slot()
+
+        # Worker state, guarded by the condition
+        self._condition = threading.Condition()
+        self._pending: Optional[Tuple[Any, str, list]] = None  # (save manager, filename, sections)
+        self._busy = False
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+        self._results: List[Tuple[bool, str]] = []
+
+    def slot_filename(self, slot: int) -> str:
+        """File name of an autosave slot (0-based)"""
+        return f"{self.save_name}_{slot + 1}{SAVE_EXTENSION}"
+
+    def _first_slot(self) -> int:
+        """Continue the rotation after the newest existing slot file"""
+        newest, newest_time = -1, None
+        for slot in range(self.slots):
+            try:
+                modified = os.path.getmtime(self.slot_filename(slot))
+            except OSError:
+                continue
+            if newest_time is None or modified > newest_time:
+                newest, newest_time = slot, modified
+        return (newest + 1) % self.slots
+
+    def check(self) -> bool:
+        """
+        Autosave if the interval has passed or the player changed hex.
+
+        Call after each command, once its changes are in place.
+
+        Returns:
+            True if an autosave was started
+        """
+        gs = self.game_engine.game_state
+        if not self.game_engine.is_initialized or gs is None:
+            return False
+
+        hex_id = gs.world_position.hex_id
+        moved = self._last_hex is not None and hex_id != self._last_hex
+        self._last_hex = hex_id
+
+        due = bool(self.interval_seconds) and self._clock() - self._last_autosave >= self.interval_seconds
+        if due or (moved and self.on_hex_change):
+            return self.autosave()
+        return False
+
+    def autosave(self) -> bool:
+        """
+        Snapshot the game now and hand it to the worker thread.
+
+        Returns:
+            True if the snapshot was queued for writing
+        """
+        if not self.game_engine.is_initialized or not self.game_engine.game_state:
+            return False
+
+        self.game_engine._ensure_save_manager()
+        saves = self.game_engine.saves
+        self._last_autosave = self._clock()
+        try:
+            sections = saves.snapshot_sections()
+        except Exception as e:
+            self._add_result(False, f"Autosave failed: {e}")
+            return False
+
+        with self._condition:
+            if self._pending is not None:
+                # The worker never started the older snapshot - replace it in its slot
+                filename = self._pending[1]
+            else:
+                filename = self._claim_slot(saves.files_in_use())
+                if filename is None:
+                    self._results.append((False, "Autosave skipped: every slot is in use"))
+                    return False
+            self._pending = (saves, filename, sections)
+            self._start_worker()
+            self._condition.notify_all()
+        return True
+
+    def _claim_slot(self, in_use) -> Optional[str]:
+        """Take the next slot whose file the game is not reading from"""
+        for _ in range(self.slots):
+            slot = self._next_slot
+            self._next_slot = (slot + 1) % self.slots
+            filename = self.slot_filename(slot)
+            if os.path.abspath(filename) not in in_use:
+                return filename
+        return None
+
+    def _start_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._stopping = False
+            self._worker = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """Worker loop: write snapshots until stopped and nothing is pending"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._stopping)
+                if self._pending is None:
+                    return
+                saves, filename, sections = self._pending
+                self._pending = None
+                self._busy = True
+
+            try:
+                saves.write_snapshot(filename, sections)
+                result = (True, f"Autosaved to {filename}")
+            except Exception as e:
+                result = (False, f"Autosave to {filename} failed: {e}")
+
+            with self._condition:
+                self._busy = False
+                self._results.append(result)
+                self._condition.notify_all()
+
+    def _add_result(self, success: bool, message: str):
+        with self._condition:
+            self._results.append((success, message))
+
+    def pop_results(self) -> List[Tuple[bool, str]]:
+        """Outcomes of finished autosaves since the last call, oldest first"""
+        with self._condition:
+            results, self._results = self._results, []
+        return results
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued autosave is written.
+
+        Returns:
+            True if the worker is idle, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """Finish any queued autosave and stop the worker thread"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
@@ -0,0 +1,426 @@
+"""
+Fantasy RPG - Command Journal
+
+Append-only journal of player commands for deterministic replay.
+
+When a session starts, the journal writes a snapshot of the game state (the
+binary save container, base64-encoded) and the RNG streams. Every command
+after that is appended with its game-time stamp and the RNG stream positions
+before it ran, plus a state hash at regular checkpoints. Because all
+randomness comes from the named RNG streams, feeding the same commands back
+through the action system from the same snapshot must reproduce the same
+state - replay_journal() does exactly that, headless and at full speed, and
+reports the first divergence.
+
+Journaling is off unless the FRPG_JOURNAL environment variable is set, to
+"1" for the default journal file or to a file path. The file is kept open
+(line-buffered, so a crash loses nothing), and a journal that has grown past
+MAX_JOURNAL_SIZE is moved to "<journal>.1" when the next session starts,
+replacing the previous one.
+
+Run a replay from the command line with:
+    python replay.py [journal_file] [--session N] [--perf] [--profile N]
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    from ..utils.rng import get_rng_service
+    from ..utils.tracing import get_tracer
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng_service
+    from fantasy_rpg.utils.tracing import get_tracer
+
+
+JOURNAL_VERSION = 1
+JOURNAL_FILE = "command_journal.jsonl"
+
+# Environment variable turning journaling on: "1" or a journal file path
+JOURNAL_ENV_VAR = "FRPG_JOURNAL"
+
+# Size past which the journal is rotated when a session starts
+MAX_JOURNAL_SIZE = 16 * 1024 * 1024
+
+# Commands between state-hash checkpoints
+CHECKPOINT_INTERVAL = 25
+
+# UI-only responses that do not change game state and are skipped on replay
+SKIPPED_RESPONSES = ("save_game", "save_log", "clear_log", "quit_game", "show_modal", "show_help")
+
+
+def compute_state_hash(game_engine) -> str:
+    """
+    Hash the replay-relevant game state.
+
+    Covers the character, survival vitals, position, time and weather.
+    Inventory items are compared by name and quantity because some item ids
+    are generated uniquely at runtime.
+
+    Args:
+        game_engine: Initialized GameEngine
+
+    Returns:
+        Short hex digest of the state
+    """
+    gs = game_engine.game_state
+    saves = game_engine.saves
+    character = gs.character
+
+    character_data = saves._serialize_character(character)
+    character_data.pop("inventory", None)
+    character_data.pop("equipment", None)
+
+    items = []
+    if getattr(character, "inventory", None) and hasattr(character.inventory, "items"):
+        items = sorted([item.name, item.quantity] for item in character.inventory.items)
+
+    equipped = {}
+    if getattr(character, "equipment", None):
+        # Only occupied slots, so a missing and an empty Equipment compare equal
+        for slot, item_data in character.equipment.to_dict().items():
+            if item_data:
+                equipped[slot] = item_data["name"]
+
+    position = gs.world_position
+    state = {
+        "character": character_data,
+        "inventory": items,
+        "equipment": equipped,
+        "player_state": saves._serialize_player_state(gs.player_state),
+        "conditions": sorted(getattr(gs.player_state, "active_conditions", []) or []),
+        "position": [position.hex_id, position.current_location_id, position.current_area_id],
+        "location_data": position.current_location_data,
+        "game_time": saves._serialize_game_time(gs.game_time),
+        "weather": saves._serialize_weather(gs.current_weather)
+    }
+
+    encoded = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def journal_path_from_env() -> Optional[str]:
+    """
+    Journal file requested by the FRPG_JOURNAL environment variable.
+
+    Returns:
+        JOURNAL_FILE for "1"/"true"/"yes", the value itself for anything else
+        non-empty, or None if journaling is off
+    """
+    value = os.environ.get(JOURNAL_ENV_VAR, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return JOURNAL_FILE
+    return value
+
+
+class CommandJournal:
+    """Records commands to an append-only JSON-lines journal"""
+
+    def __init__(self, path: str = JOURNAL_FILE, checkpoint_interval: int = CHECKPOINT_INTERVAL):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Journal file; sessions are appended to it
+            checkpoint_interval: Commands between state-hash checkpoints
+        """
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.sequence = 0
+        self.active = False
+        self._file = None
+
+    def start(self, game_engine) -> bool:
+        """
+        Begin a new journal session with a snapshot of the current state.
+
+        Args:
+            game_engine: Initialized GameEngine
+
+        Returns:
+            True if the session was started
+        """
+        if not game_engine or not game_engine.is_initialized:
+            return False
+
+        try:
+            game_engine._ensure_save_manager()
+            snapshot = game_engine.saves.build_snapshot()
+            self.close()
+            self._rotate()
+            self._file = open(self.path, "a", buffering=1)
+            self._append({
+                "type": "start",
+                "version": JOURNAL_VERSION,
+                "started_at": datetime.now().isoformat(),
+                "save": base64.b64encode(snapshot).decode("ascii"),
+                "rng": get_rng_service().snapshot(),
+                "state_hash": compute_state_hash(game_engine)
+            })
+        except Exception as e:
+            print(f"Warning: Could not start command journal: {e}")
+            self.close()
+            return False
+
+        self.sequence = 0
+        self.active = True
+        return True
+
+    def close(self):
+        """Close the journal file; recording stops until start()"""
+        self.active = False
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def _rotate(self):
+        """Move a journal past MAX_JOURNAL_SIZE aside before appending a session"""
+        try:
+            if os.path.getsize(self.path) >= MAX_JOURNAL_SIZE:
+                os.replace(self.path, f"{self.path}.1")
+        except OSError:
+            pass  # No journal yet
+
+    def record(self, command: str, game_engine, rng_state: Dict[str, Any]):
+        """
+        Append one command to the journal.
+
+        Args:
+            command: Raw command text as typed
+            game_engine: GameEngine after the command ran
+            rng_state: RngService.get_state() taken before the command ran
+        """
+        if not self.active:
+            return
+
+        gs = game_engine.game_state
+        self.sequence += 1
+        entry = {
+            "type": "command",
+            "seq": self.sequence,
+            "command": command,
+            "day": gs.game_time.day,
+            "hour": gs.game_time.hour,
+            "rng": rng_state["streams"]
+        }
+        if self.sequence % self.checkpoint_interval == 0:
+            entry["state_hash"] = compute_state_hash(game_engine)
+
+        try:
+            self._append(entry)
+        except Exception as e:
+            print(f"Warning: Command journal disabled: {e}")
+            self.close()
+
+    def _append(self, entry: Dict[str, Any]):
+        self._file.write(json.dumps(entry, default=str) + "\n")
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of replaying one journal session"""
+    commands: int = 0
+    checkpoints: int = 0
+    diverged_at: Optional[int] = None  # Sequence number of the first mismatch
+    reason: str = ""
+    final_hash: str = ""
+
+    @property
+    def success(self) -> bool:
+        return self.diverged_at is None
+
+
+def read_sessions(path: str) -> List[List[Dict[str, Any]]]:
+    """
+    Split a journal file into sessions.
+
+    Returns:
+        List of sessions; each starts with its "start" entry
+    """
+    sessions = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if entry.get("type") == "start":
+                sessions.append([entry])
+            elif sessions:
+                sessions[-1].append(entry)
+    return sessions
+
+
+def replay_session(session: List[Dict[str, Any]]) -> ReplayResult:
+    """
+    Replay one journal session headless and check it against the record.
+
+    Args:
+        session: Entries from read_sessions(), starting with a "start" entry
+
+    Returns:
+        ReplayResult describing the replay
+    """
+    from fantasy_rpg.game.game_engine import GameEngine
+
+    result = ReplayResult()
+    start = session[0]
+    if start.get("version") != JOURNAL_VERSION:
+        result.diverged_at = 0
+        result.reason = f"Incompatible journal version: {start.get('version', 'unknown')}"
+        return result
+
+    game_engine = GameEngine(skip_world_gen=True)
+    with tempfile.TemporaryDirectory() as directory:
+        # Lazily loaded sections are read from the snapshot file during the replay
+        if "save" in start:
+            save_name = os.path.join(directory, "snapshot")
+            with open(f"{save_name}.sav", "wb") as f:
+                f.write(base64.b64decode(start["save"]))
+            success, message = game_engine.load_game(save_name)
+        else:
+            # Journals from before snapshots were save containers
+            success, message = game_engine.load_snapshot(start["snapshot"])
+        if not success:
+            result.diverged_at = 0
+            result.reason = message
+            return result
+        return _replay_commands(game_engine, session, result)
+
+
+def _replay_commands(game_engine, session: List[Dict[str, Any]], result: ReplayResult) -> ReplayResult:
+    """Replay the commands of a session on the game restored from its snapshot"""
+    from fantasy_rpg.actions.input_controller import InputController
+
+    start = session[0]
+
+    rng_service = get_rng_service()
+    rng_service.restore(start["rng"])
+
+    if compute_state_hash(game_engine) != start["state_hash"]:
+        result.diverged_at = 0
+        result.reason = "Restored snapshot does not match the recorded state"
+        return result
+
+    gs = game_engine.game_state
+    controller = InputController(
+        character=gs.character,
+        player_state=gs.player_state,
+        time_system=gs.game_time,
+        game_engine=game_engine
+    )
+
+    for entry in session[1:]:
+        if entry.get("type") != "command":
+            continue
+
+        seq = entry["seq"]
+        streams = rng_service.get_state()["streams"]
+        for name, (seed, draws) in entry["rng"].items():
+            if streams.get(name, [seed, 0]) != [seed, draws]:
+                result.diverged_at = seq
+                result.reason = (f"RNG stream '{name}' at draw {streams.get(name, [seed, 0])[1]}, "
+                                 f"recorded {draws} before '{entry['command']}'")
+                return result
+
+        response = controller.process_input(entry["command"])
+        result.commands += 1
+
+        # Checkpoints are hashed when the command is recorded, before the
+        # UI applies its own changes for the response
+        if "state_hash" in entry:
+            result.checkpoints += 1
+            if compute_state_hash(game_engine) != entry["state_hash"]:
+                result.diverged_at = seq
+                result.reason = f"State hash mismatch after '{entry['command']}'"
+                return result
+
+        _apply_ui_response(game_engine, response)
+
+    result.final_hash = compute_state_hash(game_engine)
+    return result
+
+
+def _apply_ui_response(game_engine, response: Dict[str, Any]):
+    """Apply the state changes the UI makes for a response (mirrors FantasyRPGApp)"""
+    response_type = response.get("type")
+    character = game_engine.game_state.character
+
+    if response_type in SKIPPED_RESPONSES:
+        return
+    elif response_type == "heal_character":
+        amount = response.get("amount", 0)
+        if amount > 0:
+            character.hp = min(character.hp + amount, character.max_hp)
+    elif response_type == "debug_heal":
+        character.hp = min(character.hp + 10, character.max_hp)
+    elif response_type == "debug_damage":
+        character.hp = max(0, character.hp - 5)
+    elif response_type == "debug_xp":
+        try:
+            character.add_experience(100)
+        except Exception:
+            character.experience_points += 100
+
+
+def replay_journal(path: str = JOURNAL_FILE, session: int = -1) -> ReplayResult:
+    """
+    Replay a session from a journal file.
+
+    Args:
+        path: Journal file
+        session: Index of the session to replay (default: the latest)
+
+    Returns:
+        ReplayResult describing the replay
+    """
+    sessions = read_sessions(path)
+    if not sessions:
+        return ReplayResult(diverged_at=0, reason=f"No sessions in {path}")
+    return replay_session(sessions[session])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: replay a journal and report the result"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a Fantasy RPG command journal")
+    parser.add_argument("journal", nargs="?", default=JOURNAL_FILE, help="Journal file to replay")
+    parser.add_argument("--session", type=int, default=-1, help="Session index (default: latest)")
+    parser.add_argument("--perf", action="store_true", help="Print command latency per stage after the replay")
+    parser.add_argument("--profile", type=int, default=0, metavar="N",
+                        help="With --perf, also print cProfile output for the N slowest commands")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.journal):
+        print(f"Journal file {args.journal} not found.")
+        return 1
+
+    if args.perf:
+        get_tracer().enable(profile_keep=args.profile)
+
+    result = replay_journal(args.journal, args.session)
+    if args.perf:
+        print(get_tracer().report())
+    if result.success:
+        print(f"✓ Replayed {result.commands} commands, {result.checkpoints} checkpoints matched "
+              f"(final state {result.final_hash})")
+        return 0
+
+    print(f"✗ Replay diverged at command {result.diverged_at}: {result.reason}")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,13 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    from ..utils.rng import get_rng
+    from ..utils.tracing import traced
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng
+    from fantasy_rpg.utils.tracing import traced
+
 # DEBUG TOGGLE - Set to True to enable location entry debugging
 DEBUG_SHELTER = True
 
@@ -135,6 +142,7 @@ class ConditionsManager:
         except Exception as e:
             print(f"Error loading conditions: {e}")
     
+    @traced("conditions.evaluate")
     def evaluate_conditions(self, player_state) -> List[str]:
         """Evaluate which conditions apply to the current player state"""
         # First, get all potentially active conditions
@@ -627,8 +635,6 @@ class ConditionsManager:
 
     def check_for_fainting(self, player_state) -> bool:
         """Check if the character should faint based on active conditions"""
-        import random
-        
         active_conditions = self.evaluate_conditions(player_state)
         
         # Don't faint if already fainted
@@ -648,7 +654,7 @@ class ConditionsManager:
         
         # Roll for fainting
         if total_faint_chance > 0:
-            roll = random.random()
+            roll = get_rng("faint").random()
             if roll < total_faint_chance:
                 return True
         
@@ -656,10 +662,8 @@ class ConditionsManager:
     
     def apply_fainting(self, player_state):
         """Apply the Fainted condition to the character"""
-        import random
-        
         # Random duration between 30-180 minutes
-        duration_minutes = random.randint(30, 180)
+        duration_minutes = get_rng("faint").randint(30, 180)
         
         return {
             "condition": "Fainted",
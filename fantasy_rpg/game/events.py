@@ -0,0 +1,298 @@
+"""
+Fantasy RPG - Game Events
+
+Typed game-state change events and the bus that delivers them.
+
+Systems publish precise deltas (a condition was gained, HP changed, a hex was
+entered) instead of subscribers re-deriving them from the whole state. Events
+published while a command runs are coalesced and delivered to subscribers in
+a single batch when the command finishes.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class GameEvent:
+    """Base class for all game-state change events"""
+
+    @property
+    def event_type(self) -> str:
+        """Event type name used for subscriptions and serialization"""
+        return type(self).__name__
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize event for the save journal"""
+        return {"event": self.event_type, **asdict(self)}
+
+
+@dataclass
+class ConditionGained(GameEvent):
+    """A condition from conditions.json became active"""
+    condition: str
+    message: str = ""
+
+
+@dataclass
+class ConditionLost(GameEvent):
+    """A previously active condition ended"""
+    condition: str
+
+
+@dataclass
+class HpChanged(GameEvent):
+    """Character hit points changed"""
+    old_hp: int
+    new_hp: int
+    source: str = "unknown"
+
+    @property
+    def delta(self) -> int:
+        return self.new_hp - self.old_hp
+
+
+@dataclass
+class HexEntered(GameEvent):
+    """Player arrived in a new overworld hex"""
+    hex_id: str
+    from_hex_id: Optional[str] = None
+    coords: Optional[Tuple[int, int]] = None
+
+
+@dataclass
+class HexesRevealed(GameEvent):
+    """Hexes came into sight for the first time (the fog of war lifted)"""
+    hexes: List[Tuple[int, int]]
+
+
+@dataclass
+class ItemAdded(GameEvent):
+    """Items were added to the character's inventory"""
+    item_id: str
+    quantity: int = 1
+    source: str = ""
+
+
+@dataclass
+class WeatherChanged(GameEvent):
+    """Current weather was replaced"""
+    old_weather: Any = None
+    new_weather: Any = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Weather objects are summarized rather than stored whole"""
+        def summarize(weather):
+            if weather is None:
+                return None
+            return {
+                "temperature": getattr(weather, "temperature", None),
+                "precipitation": getattr(weather, "precipitation", None),
+                "wind_speed": getattr(weather, "wind_speed", None),
+            }
+        return {
+            "event": self.event_type,
+            "old_weather": summarize(self.old_weather),
+            "new_weather": summarize(self.new_weather),
+        }
+
+
+@dataclass
+class TimeAdvanced(GameEvent):
+    """Game time moved forward"""
+    hours: float
+    activity: str = ""
+
+
+@dataclass
+class Fainted(GameEvent):
+    """The character collapsed and lay unconscious"""
+    duration_minutes: int
+    message: str = ""
+
+
+def coalesce_events(events: List[GameEvent]) -> List[GameEvent]:
+    """
+    Merge a command's events into their net effect.
+
+    - TimeAdvanced events are summed into one
+    - HpChanged and WeatherChanged keep the first old and last new value
+    - ConditionGained/ConditionLost pairs for the same condition cancel out
+    - ItemAdded events for the same item are summed
+    - HexEntered, HexesRevealed and Fainted events are kept as-is (each is a
+      distinct occurrence)
+
+    Args:
+        events: Events in publish order
+
+    Returns:
+        Coalesced events in order of first occurrence
+    """
+    merged: Dict[Any, GameEvent] = {}
+    order: List[Any] = []
+    sequence = 0
+
+    for event in events:
+        kind = event.event_type
+
+        if kind in ("ConditionGained", "ConditionLost"):
+            key = ("condition", event.condition)
+            previous = merged.get(key)
+            if previous is not None and previous.event_type != kind:
+                # Gained then lost (or lost then gained) within one command
+                event = None
+            merged[key] = event
+        elif kind == "TimeAdvanced":
+            key = kind
+            previous = merged.get(key)
+            if previous is not None:
+                event = TimeAdvanced(previous.hours + event.hours, event.activity or previous.activity)
+            merged[key] = event
+        elif kind == "HpChanged":
+            key = kind
+            previous = merged.get(key)
+            if previous is not None:
+                event = HpChanged(previous.old_hp, event.new_hp, event.source)
+            merged[key] = event
+        elif kind == "WeatherChanged":
+            key = kind
+            previous = merged.get(key)
+            if previous is not None:
+                event = WeatherChanged(previous.old_weather, event.new_weather)
+            merged[key] = event
+        elif kind == "ItemAdded":
+            key = ("item", event.item_id)
+            previous = merged.get(key)
+            if previous is not None:
+                event = ItemAdded(event.item_id, previous.quantity + event.quantity, previous.source)
+            merged[key] = event
+        else:
+            sequence += 1
+            key = (kind, sequence)
+            merged[key] = event
+
+        if key not in order:
+            order.append(key)
+
+    result = []
+    for key in order:
+        event = merged.get(key)
+        if event is None:
+            continue
+        if event.event_type == "HpChanged" and event.old_hp == event.new_hp:
+            continue
+        result.append(event)
+    return result
+
+
+class EventBus:
+    """Collects game events and delivers them to subscribers in batches"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable[[GameEvent], None]]] = {}
+        self._batch_subscribers: List[Callable[[List[GameEvent]], None]] = []
+        self._pending: List[GameEvent] = []
+        self._command_depth = 0
+
+    def subscribe(self, event_type, handler: Callable[[GameEvent], None]):
+        """
+        Subscribe to one event type.
+
+        Args:
+            event_type: Event class or its name (e.g. ConditionGained)
+            handler: Called once per delivered event of that type
+        """
+        name = event_type if isinstance(event_type, str) else event_type.__name__
+        handlers = self._subscribers.setdefault(name, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def subscribe_batch(self, handler: Callable[[List[GameEvent]], None]):
+        """Subscribe to every delivered batch of coalesced events"""
+        if handler not in self._batch_subscribers:
+            self._batch_subscribers.append(handler)
+
+    def unsubscribe(self, handler):
+        """Remove a handler from all subscriptions"""
+        if handler in self._batch_subscribers:
+            self._batch_subscribers.remove(handler)
+        for handlers in self._subscribers.values():
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def publish(self, event: GameEvent):
+        """Queue an event - delivered immediately when no command is running"""
+        self._pending.append(event)
+        if self._command_depth == 0:
+            self.flush()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of events held for the running command"""
+        return len(self._pending)
+
+    def pending_events(self, start: int = 0) -> List[GameEvent]:
+        """
+        Events held for the running command, uncoalesced.
+
+        Args:
+            start: pending_count at the point to look from
+
+        Returns:
+            Events published since that point, in publish order
+        """
+        return self._pending[start:]
+
+    def begin_command(self):
+        """Start holding events until the current command finishes"""
+        self._command_depth += 1
+
+    def end_command(self):
+        """Finish a command and deliver its coalesced events"""
+        if self._command_depth == 0:
+            return
+        self._command_depth -= 1
+        if self._command_depth == 0:
+            self.flush()
+
+    @contextmanager
+    def command(self):
+        """Context manager wrapping begin_command()/end_command()"""
+        self.begin_command()
+        try:
+            yield self
+        finally:
+            self.end_command()
+
+    def flush(self) -> List[GameEvent]:
+        """Coalesce and deliver all pending events"""
+        if not self._pending:
+            return []
+
+        events = coalesce_events(self._pending)
+        self._pending = []
+        if not events:
+            return []
+
+        for handler in list(self._batch_subscribers):
+            try:
+                handler(events)
+            except Exception as e:
+                print(f"Error in event batch handler: {e}")
+
+        for event in events:
+            for handler in list(self._subscribers.get(event.event_type, [])):
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"Error in {event.event_type} handler: {e}")
+
+        return events
+
+
+def publish_event(game_engine, event: GameEvent):
+    """Publish an event on the engine's bus if one is available"""
+    bus = getattr(game_engine, "events", None)
+    if bus is not None:
+        bus.publish(event)
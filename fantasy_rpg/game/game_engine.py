@@ -6,7 +6,7 @@ for game state management, world interaction, and system integration.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 import random
 from datetime import datetime
 from enum import Enum
@@ -32,6 +32,8 @@ except ImportError:
 # Import only non-circular dependencies at module level
 from world.world_coordinator import WorldCoordinator
 from world.weather_core import WeatherState, generate_weather_state
+from game.events import EventBus
+from fantasy_rpg.utils.rng import get_rng_service
 
 # Import location generator with fallback
 try:
@@ -79,6 +81,37 @@ class GameTime:
         return f"Day {self.day}, Year {self.year} ({self.season.title()})"
 
 
+# Aspects of GameState tracked for UI refreshes
+STATE_ASPECTS = ("vitals", "position", "weather", "inventory", "conditions", "time")
+
+# Number of recent events kept in GameState.event_journal
+EVENT_JOURNAL_LIMIT = 500
+
+# Event types mapped to the GameState aspects they touch
+EVENT_ASPECTS = {
+    "ConditionGained": ("conditions",),
+    "ConditionLost": ("conditions",),
+    "HpChanged": ("vitals",),
+    "HexEntered": ("position",),
+    "HexesRevealed": ("position",),
+    "ItemAdded": ("inventory",),
+    "WeatherChanged": ("weather",),
+    "TimeAdvanced": ("time", "vitals"),
+    "Fainted": ("time", "vitals"),
+}
+
+# Engine change notifications mapped to the aspects they touch
+CHANGE_TYPE_ASPECTS = {
+    "location_change": ("position", "weather"),
+    "location_entry": ("position",),
+    "location_exit": ("position",),
+    "location_movement": ("position",),
+    "character_death": ("vitals",),
+    "inventory_change": ("inventory",),
+    "general": STATE_ASPECTS,
+}
+
+
 @dataclass
 class GameState:
     """Complete game state snapshot"""
@@ -93,6 +126,81 @@ class GameState:
     created_at: datetime = field(default_factory=datetime.now)
     last_saved: Optional[datetime] = None
     play_time_minutes: int = 0
+    
+    # Recent state-change events, saved with the game (oldest first)
+    event_journal: List[Dict[str, Any]] = field(default_factory=list, repr=False)
+    
+    # Change tracking for UI refreshes (not saved) - everything starts dirty
+    dirty_aspects: Set[str] = field(default_factory=lambda: set(STATE_ASPECTS), repr=False)
+    _aspect_fingerprints: Dict[str, Any] = field(default_factory=dict, repr=False)
+    
+    def mark_dirty(self, *aspects: str):
+        """Record that the given aspects changed (all aspects if none given)"""
+        self.dirty_aspects.update(aspects or STATE_ASPECTS)
+    
+    def collect_changes(self) -> Set[str]:
+        """
+        Return the aspects that changed since the last call and reset tracking.
+        
+        Combines explicit mark_dirty() calls with a cheap fingerprint of each
+        aspect, so direct mutations (eating, damage, equipping) are caught too.
+        
+        Returns:
+            Set of aspect names from STATE_ASPECTS
+        """
+        changed = set(self.dirty_aspects)
+        self.dirty_aspects.clear()
+        
+        for aspect, fingerprint in self._fingerprint_aspects().items():
+            if self._aspect_fingerprints.get(aspect) != fingerprint:
+                self._aspect_fingerprints[aspect] = fingerprint
+                changed.add(aspect)
+        
+        return changed
+    
+    def _fingerprint_aspects(self) -> Dict[str, Any]:
+        """Build small comparable snapshots of each tracked aspect"""
+        char = self.character
+        ps = self.player_state
+        wp = self.world_position
+        survival = getattr(ps, "survival", None)
+        
+        vitals = (
+            getattr(char, "hp", None), getattr(char, "max_hp", None),
+            getattr(char, "level", None), getattr(char, "experience_points", None),
+            getattr(char, "armor_class", None),
+        )
+        if survival is not None:
+            vitals += (
+                survival.hunger, survival.thirst, survival.fatigue,
+                survival.body_temperature, survival.wetness, survival.wind_chill,
+            )
+        
+        weather = self.current_weather
+        weather_key = None
+        if weather is not None:
+            weather_key = (
+                id(weather), getattr(weather, "temperature", None),
+                getattr(weather, "precipitation", None), getattr(weather, "wind_speed", None),
+            )
+        
+        inventory = getattr(char, "inventory", None)
+        items = tuple(
+            (item.item_id, item.quantity) for item in getattr(inventory, "items", None) or []
+        )
+        equipment = getattr(char, "equipment", None)
+        equipped = ()
+        if equipment is not None and hasattr(equipment, "_slots"):
+            equipped = tuple(id(getattr(equipment, slot, None)) for slot in equipment._slots)
+        
+        return {
+            "vitals": vitals,
+            "position": (wp.hex_id, wp.current_location_id, wp.current_area_id),
+            "weather": weather_key,
+            "inventory": (items, equipped),
+            "conditions": tuple(getattr(ps, "active_conditions", None) or ()),
+            "time": (getattr(ps, "game_day", None), int(getattr(ps, "game_hour", 0) or 0)),
+        }
 
 
 class GameEngine:
@@ -118,12 +226,19 @@ class GameEngine:
         # UI state change notification system
         self.ui_update_callbacks = []
         
+        # Typed state-change events, delivered once per command
+        self.events = EventBus()
+        self.events.subscribe_batch(self._on_game_events)
+        
         # Phase 3 coordinators - initialized after GameEngine is ready
         self.movement = None
         self.locations = None
         self.objects = None
         self.saves = None
         
+        # Background autosave (see enable_autosave)
+        self.autosave = None
+        
         # Phase 4 placeholders (not implemented yet)
         self.npcs = None
         self.quests = None
@@ -140,8 +255,25 @@ class GameEngine:
         if callback in self.ui_update_callbacks:
             self.ui_update_callbacks.remove(callback)
     
+    def _on_game_events(self, events: List[Any]):
+        """Mark changed aspects and append the batch to the save journal"""
+        gs = self.game_state
+        if not gs:
+            return
+        
+        for event in events:
+            gs.mark_dirty(*EVENT_ASPECTS.get(event.event_type, ()))
+        
+        stamp = {"day": gs.player_state.game_day, "hour": round(gs.player_state.game_hour, 2)}
+        gs.event_journal.extend({**stamp, **event.to_dict()} for event in events)
+        if len(gs.event_journal) > EVENT_JOURNAL_LIMIT:
+            del gs.event_journal[:-EVENT_JOURNAL_LIMIT]
+    
     def _notify_ui_state_change(self, change_type: str = "general"):
         """Notify all registered UI callbacks of state changes"""
+        if self.game_state:
+            self.game_state.mark_dirty(*CHANGE_TYPE_ASPECTS.get(change_type, STATE_ASPECTS))
+        
         for callback in self.ui_update_callbacks:
             try:
                 callback(change_type)
@@ -173,6 +305,9 @@ class GameEngine:
         if world_seed is None:
             world_seed = random.randint(1, 1000000)
         
+        # Derive every RNG stream (weather, loot, checks, ...) from the world seed
+        get_rng_service().reseed(world_seed)
+        
         # Debug logging for world generation
         try:
             from ..actions.action_logger import get_action_logger
@@ -217,6 +352,7 @@ class GameEngine:
         # Get hex data from the generated world
         hex_data = self.world_coordinator.get_hex_info(starting_hex_id)
         available_locations = self.world_coordinator.get_hex_locations(starting_hex_id)
+        self.world_coordinator.reveal_from(starting_coords)
         
         # Create world position with both coordinate formats
         world_position = WorldPosition(
@@ -235,20 +371,8 @@ class GameEngine:
             season=player_state.game_season
         )
         
-        # Generate initial weather
-        climate_info = self.world_coordinator.get_climate_info(starting_hex_id)
-        if climate_info:
-            base_temp = climate_info.get("base_temperature", 65.0)
-            climate_type = climate_info.get("zone_type", "temperate")
-        else:
-            base_temp = 65.0
-            climate_type = "temperate"
-        
-        current_weather = generate_weather_state(
-            base_temp, 
-            game_time.season, 
-            climate_type
-        )
+        # Initial weather from the world weather field
+        current_weather = self.get_weather_at(starting_hex_id, player_state)
         
         # Update PlayerState weather so survival effects work from the start
         player_state.update_weather(current_weather)
@@ -268,7 +392,7 @@ class GameEngine:
         )
         
         # Clear any persistent location data to ensure fresh generation
-        self.game_state.persistent_locations = {}
+        self.attach_location_memory()
         
         self.is_initialized = True
         
@@ -277,6 +401,30 @@ class GameEngine:
         
         return self.game_state
     
+    def attach_location_memory(self, visited=None):
+        """
+        Bound the memory held by locations for the current game.
+        
+        Visited locations and the locations generated for each hex are kept
+        in LRU caches that spill cold entries to disk, so memory stays flat
+        however far the player travels. The player's current location and
+        hex always stay in memory.
+        
+        Args:
+            visited: Visited locations to keep (dict or lazy map from a save)
+        """
+        from game.location_cache import HexLocationPager, LocationCache
+        
+        if self.world_coordinator is not None:
+            HexLocationPager(keep_hex=self._is_current_hex).attach(self.world_coordinator)
+        self.game_state.persistent_locations = LocationCache.wrap(visited or {}, keep=self._is_current_location)
+    
+    def _is_current_hex(self, hex_id: str) -> bool:
+        return self.game_state is not None and hex_id == self.game_state.world_position.hex_id
+    
+    def _is_current_location(self, location_data: Dict[str, Any]) -> bool:
+        return self.game_state is not None and location_data is self.game_state.world_position.current_location_data
+    
     def _initialize_coordinators(self):
         """Initialize Phase 3 coordinator systems"""
         # Late imports to avoid circular dependencies
@@ -288,7 +436,41 @@ class GameEngine:
         self.movement = MovementCoordinator(self)
         self.locations = LocationCoordinator(self)
         self.objects = ObjectInteractionSystem(self)
-        self.saves = SaveManager(self)
+        # Keep the save manager across loads - it remembers which hexes are unchanged
+        if self.saves is None:
+            self.saves = SaveManager(self)
+    
+    def get_weather_at(self, hex_id: str, player_state: Any = None) -> WeatherState:
+        """
+        Get the current weather at a hex.
+        
+        Reads the world weather field at the current game time, falling back
+        to generating weather from the hex's climate if there is no field.
+        
+        Args:
+            hex_id: Hex identifier string (e.g., "1010")
+            player_state: PlayerState for the game time (defaults to the current one)
+        
+        Returns:
+            WeatherState for the hex
+        """
+        if player_state is None:
+            player_state = self.game_state.player_state
+        season = player_state.game_season
+        
+        weather = self.world_coordinator.get_weather(hex_id, player_state.get_total_hours(), season)
+        if weather:
+            return weather
+        
+        climate_info = self.world_coordinator.get_climate_info(hex_id)
+        if climate_info:
+            base_temp = climate_info.get("base_temperature", 65.0)
+            climate_type = climate_info.get("zone_type", "temperate")
+        else:
+            base_temp = 65.0
+            climate_type = "temperate"
+        
+        return generate_weather_state(base_temp, season, climate_type)
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -429,6 +611,11 @@ class GameEngine:
         else:
             description_parts.append("There are no specific locations to explore in this hex.")
         
+        # Directions to nearby water, shelter and settlements (spatial index, no map scan)
+        hints = self.world_coordinator.get_direction_hints(current_hex_id)
+        if hints:
+            description_parts.append(" ".join(hints))
+        
         # Show current location status
         if gs.world_position.current_location_id:
             current_location = gs.world_position.current_location_data
@@ -531,7 +718,7 @@ class GameEngine:
         current_dc = base_dc
         
         # Rest loop - check each hour for wake up
-        import random
+        rng = get_rng_service().stream("checks")
         while hours_slept < 12:  # Maximum 12 hours of sleep
             hours_slept += 1
             
@@ -550,7 +737,7 @@ class GameEngine:
             
             # Roll wake-up check (d20 + constitution modifier)
             constitution_mod = (gs.character.constitution - 10) // 2
-            wake_roll = random.randint(1, 20) + constitution_mod
+            wake_roll = rng.randint(1, 20) + constitution_mod
             
             # DC decreases each hour to ensure eventual wake-up
             effective_dc = max(5, current_dc - (hours_slept - 1))
@@ -659,8 +846,7 @@ class GameEngine:
             return False, f"The {obj.get('name')} is already unlocked."
         
         # Make lockpicking check
-        import random
-        roll = random.randint(1, 20)
+        roll = get_rng_service().stream("checks").randint(1, 20)
         skill_bonus = self._get_skill_bonus("sleight_of_hand")
         dc = properties.get("dc_lockpick", 15)
         total = roll + skill_bonus
@@ -784,115 +970,6 @@ class GameEngine:
         else:                         # Poor performance
             return 0.5
     
-    def _generate_from_item_drops(self, item_drops: Dict, quality_multiplier: float = 1.0) -> Dict[str, int]:
-        """Generate items from item_drops configuration with quality scaling"""
-        import random
-        
-        items = {}
-        
-        # Get drop parameters
-        min_drops = item_drops.get("min_drops", 0)
-        max_drops = item_drops.get("max_drops", 1)
-        base_drop_chance = item_drops.get("drop_chance", 50)
-        
-        # Scale drop chance with quality (better rolls = higher chance)
-        scaled_drop_chance = min(95, int(base_drop_chance * quality_multiplier))
-        
-        # Check if we get any drops
-        if random.randint(1, 100) <= scaled_drop_chance:
-            base_num_drops = random.randint(min_drops, max_drops)
-            # Scale number of drops with quality
-            num_drops = max(1, int(base_num_drops * quality_multiplier))
-            
-            # For now, generate generic items based on pools
-            pools = item_drops.get("pools", [])
-            
-            for _ in range(num_drops):
-                if "food" in pools:
-                    items["wild_berries"] = items.get("wild_berries", 0) + 1
-                elif "treasure" in pools:
-                    base_coins = random.randint(1, 10)
-                    scaled_coins = max(1, int(base_coins * quality_multiplier))
-                    items["gold_coins"] = items.get("gold_coins", 0) + scaled_coins
-                elif "materials" in pools or "wood" in pools:
-                    items["firewood"] = items.get("firewood", 0) + 1
-                else:
-                    # Generic material
-                    items["bone_fragments"] = items.get("bone_fragments", 0) + 1
-        
-        return items
-    
-    def _create_location_graph(self, locations: List[Dict], current_index: int) -> Dict[str, Dict]:
-        """Create a persistent bidirectional graph of locations"""
-        gs = self.game_state
-        hex_id = gs.world_position.hex_id
-        
-        # Create unique key for this hex's location graph
-        graph_key = f"location_graph_{hex_id}"
-        
-        # Initialize persistent location graphs if not exists
-        if not hasattr(gs, 'persistent_location_graphs'):
-            gs.persistent_location_graphs = {}
-        
-        # If we already have a graph for this hex, use it
-        if graph_key in gs.persistent_location_graphs:
-            full_graph = gs.persistent_location_graphs[graph_key]
-            current_location_id = locations[current_index].get("id")
-            return full_graph.get(current_location_id, {})
-        
-        # Create new persistent bidirectional graph for this hex
-        full_graph = {}
-        
-        # Create a stable arrangement of locations in a grid pattern
-        # This ensures consistent directional relationships
-        location_positions = {}
-        
-        # Arrange locations in a simple grid pattern based on their IDs (for consistency)
-        sorted_locations = sorted(locations, key=lambda x: x.get("id", ""))
-        
-        # Calculate grid dimensions
-        num_locations = len(sorted_locations)
-        grid_size = max(2, int(num_locations ** 0.5) + 1)
-        
-        # Assign grid positions
-        for i, location in enumerate(sorted_locations):
-            row = i // grid_size
-            col = i % grid_size
-            location_positions[location.get("id")] = (row, col)
-        
-        # Build bidirectional connections based on grid positions
-        for location in sorted_locations:
-            location_id = location.get("id")
-            current_pos = location_positions[location_id]
-            connections = {}
-            
-            # Check all four directions
-            directions = {
-                "north": (-1, 0),
-                "south": (1, 0),
-                "east": (0, 1),
-                "west": (0, -1)
-            }
-            
-            for direction, (row_offset, col_offset) in directions.items():
-                target_pos = (current_pos[0] + row_offset, current_pos[1] + col_offset)
-                
-                # Find location at target position
-                for other_location in sorted_locations:
-                    other_id = other_location.get("id")
-                    if other_id != location_id and location_positions[other_id] == target_pos:
-                        connections[direction] = other_location
-                        break
-            
-            full_graph[location_id] = connections
-        
-        # Store the persistent graph
-        gs.persistent_location_graphs[graph_key] = full_graph
-        
-        # Return connections for current location
-        current_location_id = locations[current_index].get("id")
-        return full_graph.get(current_location_id, {})
-    
     def _get_or_generate_location_data(self, location_template: Dict[str, Any]) -> Dict[str, Any]:
         """Get persistent location data or generate it if first visit"""
         gs = self.game_state
@@ -1301,6 +1378,24 @@ class GameEngine:
         self._ensure_save_manager()
         return self.saves.save_game(save_name)
     
+    def enable_autosave(self, **settings):
+        """
+        Start autosaving in the background.
+        
+        Args:
+            **settings: AutosaveService options (interval_seconds, slots,
+                on_hex_change, save_name)
+        
+        Returns:
+            The AutosaveService; call its check() after each command
+        """
+        from game.autosave import AutosaveService
+        
+        if self.autosave:
+            self.autosave.shutdown()
+        self.autosave = AutosaveService(self, **settings)
+        return self.autosave
+    
     def load_game(self, save_name: str = "save") -> Tuple[bool, str]:
         """
         Load game state from JSON save file.
@@ -1319,6 +1414,42 @@ class GameEngine:
             self._initialize_coordinators()
         
         return success, message
+    
+    def load_snapshot(self, save_data: dict) -> Tuple[bool, str]:
+        """
+        Load game state from in-memory save data (e.g. a journal snapshot).
+        
+        Args:
+            save_data: Dictionary produced by SaveManager.build_save_data()
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        self._ensure_save_manager()
+        success, message = self.saves.restore_save_data(save_data)
+        
+        if success and self.is_initialized:
+            self._initialize_coordinators()
+        
+        return success, message
+    
+    def list_saves(self, verify: bool = False) -> list:
+        """
+        List saves in the working directory, newest first, from the save index.
+        
+        Args:
+            verify: Also check every save against its recorded checksum
+        
+        Returns:
+            List of SaveSlot (name, summary, status)
+        """
+        self._ensure_save_manager()
+        return self.saves.list_saves(verify)
+    
+    def describe_save(self, save_name: str = "save"):
+        """Slot metadata (SaveSlot) for one save without loading it, or None"""
+        self._ensure_save_manager()
+        return self.saves.describe_save(save_name)
 
 
     # SaveManager initialization helper
@@ -0,0 +1,382 @@
+"""
+Fantasy RPG - Location Cache
+
+Keeps the memory held by locations flat however far the player travels.
+
+Two caches share one idea: the most recently used entries stay in memory and
+colder ones are encoded into a temporary spill file, then decoded again the
+next time they are used. Changes made to an entry while it was in memory are
+part of what gets spilled, so nothing is lost by evicting it.
+
+- LocationCache holds visited locations (GameState.persistent_locations),
+  keyed by "<hex>_<location id>". It is a LazySectionMap, so locations a save
+  was loaded from stay in their save file until they are first used.
+- HexLocationPager bounds the location templates generated for each hex.
+  Their "areas" (almost all of a location's size) are spilled for hexes the
+  player has not looked at recently and restored when the hex is used again.
+
+Whatever is marked to keep (the location the player stands in, the player's
+hex) is never evicted.
+"""
+
+import itertools
+import os
+import tempfile
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .save_codec import LazySectionMap, RawSection, SaveFile, SaveFormatError, decode_section, encode_section
+except ImportError:
+    from fantasy_rpg.game.save_codec import LazySectionMap, RawSection, SaveFile, SaveFormatError, decode_section, encode_section
+
+
+# Visited locations kept in memory
+VISITED_LOCATION_CAPACITY = 32
+
+# Hexes whose location templates are kept in memory
+HEX_LOCATION_CAPACITY = 16
+
+# A spill file is rewritten once it holds this much dead data and more dead than live
+SPILL_COMPACT_MIN_BYTES = 1 << 20
+
+
+class SpillFile:
+    """
+    Append-only temporary file of encoded sections.
+
+    Records are never changed once written, so a SectionRef to one stays
+    valid for as long as the SpillFile object is alive; the file is deleted
+    when the object is closed or garbage collected.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Where to create the file (default: the system temp directory)
+        """
+        fd, self.path = tempfile.mkstemp(prefix="fantasy_rpg_", suffix=".spill", dir=directory)
+        self._file = os.fdopen(fd, "w+b")
+        self._lock = threading.Lock()
+        self._names = itertools.count(1)
+        self._size = 0
+
+        self.sections: Dict[str, Tuple[int, int, int, int]] = {}  # name -> (flags, offset, length, crc)
+        self._live: Dict[str, int] = {}  # name -> length of records still in use
+        self.live_bytes = 0
+        self.garbage_bytes = 0
+
+        self._finalizer = weakref.finalize(self, _remove_spill_file, self._file, self.path)
+
+    def write(self, raw: RawSection, name: Optional[str] = None) -> str:
+        """
+        Append an encoded section.
+
+        Returns:
+            Name of the new record
+        """
+        with self._lock:
+            if name is None:
+                name = f"r{next(self._names)}"
+            self._file.seek(self._size)
+            self._file.write(raw.data)
+            self.sections[name] = (raw.flags, self._size, len(raw.data), zlib.crc32(raw.data))
+            self._size += len(raw.data)
+        self._live[name] = len(raw.data)
+        self.live_bytes += len(raw.data)
+        return name
+
+    def read_raw(self, name: str) -> RawSection:
+        """
+        Read a record's stored bytes; safe to call from any thread.
+
+        Raises:
+            KeyError: If the record does not exist
+            SaveFormatError: If the bytes fail their checksum
+        """
+        with self._lock:
+            flags, offset, length, crc = self.sections[name]
+            self._file.seek(offset)
+            data = self._file.read(length)
+        if len(data) != length or zlib.crc32(data) != crc:
+            raise SaveFormatError(f"Spilled section '{name}' is corrupt")
+        return RawSection(data, flags)
+
+    def read(self, name: str) -> Any:
+        """Read and decode one record"""
+        return decode_section(self.read_raw(name))
+
+    def discard(self, name: str):
+        """Mark a record as no longer used (it stays readable until compaction)"""
+        length = self._live.pop(name, None)
+        if length is not None:
+            self.live_bytes -= length
+            self.garbage_bytes += length
+
+    def needs_compaction(self) -> bool:
+        return self.garbage_bytes >= SPILL_COMPACT_MIN_BYTES and self.garbage_bytes > self.live_bytes
+
+    def compacted(self) -> "SpillFile":
+        """
+        Copy the records still in use into a new spill file under the same names.
+
+        This file is left as it is for anything still referring to it.
+        """
+        spill = SpillFile(os.path.dirname(self.path))
+        for name in self._live:
+            spill.write(self.read_raw(name), name)
+        spill._names = self._names
+        return spill
+
+    def is_current(self) -> bool:
+        """Whether records can still be read (SaveFile interface for SectionRef)"""
+        return self._finalizer.alive
+
+    def close(self):
+        """Delete the file now"""
+        self._finalizer()
+
+
+def _remove_spill_file(file, path: str):
+    file.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class LocationCache(LazySectionMap):
+    """
+    Size-bounded mapping of visited locations.
+
+    Least recently used locations beyond the capacity are spilled to disk
+    and read back transparently on their next use.
+    """
+
+    def __init__(self, save_file: Optional[SaveFile] = None, section_names: Optional[Dict[str, str]] = None,
+                 loaded: Optional[Dict[str, Any]] = None, capacity: int = VISITED_LOCATION_CAPACITY,
+                 keep: Optional[Callable[[Any], bool]] = None):
+        """
+        Args:
+            save_file: File unloaded locations are read from
+            section_names: Key -> section name for locations not loaded yet
+            loaded: Locations already in memory
+            capacity: Locations kept in memory (at least 2)
+            keep: Predicate for values that must stay in memory
+        """
+        super().__init__(save_file, section_names or {}, loaded)
+        self._values: "OrderedDict[str, Any]" = OrderedDict(self._values)
+        self._spilled: Dict[str, str] = {}  # key -> record name in the spill file
+        self.spill: Optional[SpillFile] = None
+        self.capacity = max(2, capacity)
+        self.keep = keep
+        self._evict()
+
+    @classmethod
+    def wrap(cls, locations, capacity: int = VISITED_LOCATION_CAPACITY,
+             keep: Optional[Callable[[Any], bool]] = None) -> "LocationCache":
+        """Turn a plain dict or LazySectionMap of locations into a LocationCache"""
+        if isinstance(locations, LocationCache):
+            locations.capacity = max(2, capacity)
+            locations.keep = keep
+            locations._evict()
+            return locations
+        if isinstance(locations, LazySectionMap):
+            return cls(locations.save_file, locations.unloaded(), dict(locations.loaded_items()), capacity, keep)
+        return cls(None, {}, dict(locations or {}), capacity, keep)
+
+    def __getitem__(self, key):
+        if key in self._values:
+            self._values.move_to_end(key)
+            return self._values[key]
+        if key in self._spilled:
+            name = self._spilled.pop(key)
+            value = self.spill.read(name)
+            self.spill.discard(name)
+        elif key in self._pending:
+            value = self.save_file.read(self._pending.pop(key))
+        else:
+            raise KeyError(key)
+        self._values[key] = value
+        self._evict()
+        return value
+
+    def __setitem__(self, key, value):
+        self._forget_spilled(key)
+        self._pending.pop(key, None)
+        self._values[key] = value
+        self._values.move_to_end(key)
+        self._evict()
+
+    def __delitem__(self, key):
+        found = self._forget_spilled(key)
+        if self._pending.pop(key, None) is not None:
+            found = True
+        if key in self._values:
+            del self._values[key]
+            found = True
+        if not found:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._values or key in self._spilled or key in self._pending
+
+    def __iter__(self):
+        yield from list(self._values)
+        yield from list(self._spilled)
+        yield from list(self._pending)
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._spilled) + len(self._pending)
+
+    def spilled(self) -> Dict[str, str]:
+        """Key -> spill record name for locations evicted from memory"""
+        return dict(self._spilled)
+
+    def items_uncached(self) -> Iterator[Tuple[str, Any]]:
+        """All (key, value) pairs, decoding evicted and unloaded ones without caching them"""
+        yield from list(self._values.items())
+        for key, name in list(self._spilled.items()):
+            yield key, self.spill.read(name)
+        for key, name in list(self._pending.items()):
+            yield key, self.save_file.read(name)
+
+    def rebind(self, save_file: SaveFile, section_names: Dict[str, str]):
+        """Point unloaded and evicted locations at a newly written file"""
+        for key, name in self._spilled.items():
+            self._pending[key] = name
+        self._spilled = {}
+        self.spill = None  # Deleted once nothing refers to it
+        super().rebind(save_file, section_names)
+
+    def _forget_spilled(self, key) -> bool:
+        name = self._spilled.pop(key, None)
+        if name is None:
+            return False
+        self.spill.discard(name)
+        self._compact_spill()
+        return True
+
+    def _evict(self):
+        """Spill least recently used locations until the cache fits its capacity"""
+        while len(self._values) > self.capacity:
+            newest = next(reversed(self._values))
+            for key, value in self._values.items():
+                if key != newest and not (self.keep and self.keep(value)):
+                    break
+            else:
+                return  # Everything left must stay in memory
+
+            value = self._values.pop(key)
+            if self.spill is None:
+                self.spill = SpillFile()
+            self._spilled[key] = self.spill.write(encode_section(value))
+
+    def _compact_spill(self):
+        if self.spill is not None and self.spill.needs_compaction():
+            self.spill = self.spill.compacted()
+
+
+class HexLocationPager:
+    """
+    Keeps the location templates of the most recently used hexes in memory.
+
+    Attached to a WorldCoordinator, which calls touch() whenever a hex's
+    locations are used. The "areas" of every location in colder hexes are
+    spilled to disk and put back on the next touch().
+    """
+
+    def __init__(self, capacity: int = HEX_LOCATION_CAPACITY,
+                 keep_hex: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            capacity: Hexes whose locations are kept in memory (at least 1)
+            keep_hex: Predicate for hex ids that must stay in memory
+        """
+        self.capacity = max(1, capacity)
+        self.keep_hex = keep_hex
+        self.spill: Optional[SpillFile] = None
+        self._hot: "OrderedDict[str, dict]" = OrderedDict()  # hex id -> hex info
+        self._paged_out: Dict[str, Tuple[dict, Dict[int, str]]] = {}  # hex id -> (hex info, location index -> record)
+
+    def attach(self, world_coordinator):
+        """Page the coordinator's hexes and bound its loaded locations"""
+        world_coordinator.location_pager = self
+        world_coordinator.loaded_locations = LocationCache.wrap(world_coordinator.loaded_locations)
+        self.track(world_coordinator.hex_data)
+        return self
+
+    def track(self, hex_data: Dict[Any, dict]):
+        """Start paging hexes that already have locations (e.g. restored from a save)"""
+        for hex_id, hex_info in list(hex_data.items()):
+            if isinstance(hex_id, str) and hex_info.get("locations"):
+                self.touch(hex_id, hex_info)
+
+    def paged_out(self) -> List[str]:
+        """Hex ids whose location areas are on disk"""
+        return list(self._paged_out)
+
+    def touch(self, hex_id: str, hex_info: dict):
+        """Mark a hex as used, putting its locations' areas back in memory"""
+        paged = self._paged_out.pop(hex_id, None)
+        if paged is not None:
+            if paged[0] is hex_info:
+                self._page_in(hex_info, paged[1])
+            else:
+                # The hex was replaced since (e.g. regenerated); its records are stale
+                for name in paged[1].values():
+                    self.spill.discard(name)
+
+        if not hex_info.get("locations"):
+            return
+        self._hot[hex_id] = hex_info
+        self._hot.move_to_end(hex_id)
+        self._evict()
+
+    def complete_hex_info(self, hex_id: str, hex_info: dict) -> dict:
+        """
+        A hex as it would be in memory, for saving.
+
+        Returns:
+            hex_info itself, or for a paged-out hex a copy with its areas read back
+        """
+        paged = self._paged_out.get(hex_id)
+        if paged is None or paged[0] is not hex_info:
+            return hex_info
+        complete = dict(hex_info)
+        complete["locations"] = [dict(location) if isinstance(location, dict) else location
+                                 for location in hex_info.get("locations", [])]
+        for index, name in paged[1].items():
+            complete["locations"][index]["areas"] = self.spill.read(name)
+        return complete
+
+    def _evict(self):
+        while len(self._hot) > self.capacity:
+            newest = next(reversed(self._hot))
+            for hex_id in self._hot:
+                if hex_id != newest and not (self.keep_hex and self.keep_hex(hex_id)):
+                    break
+            else:
+                return  # Everything left must stay in memory
+            self._page_out(hex_id, self._hot.pop(hex_id))
+
+    def _page_out(self, hex_id: str, hex_info: dict):
+        if self.spill is None:
+            self.spill = SpillFile()
+        records = {}
+        for index, location in enumerate(hex_info.get("locations") or []):
+            if isinstance(location, dict) and "areas" in location:
+                records[index] = self.spill.write(encode_section(location.pop("areas")))
+        self._paged_out[hex_id] = (hex_info, records)
+
+    def _page_in(self, hex_info: dict, records: Dict[int, str]):
+        locations = hex_info.get("locations") or []
+        for index, name in records.items():
+            if index < len(locations) and isinstance(locations[index], dict):
+                locations[index]["areas"] = self.spill.read(name)
+            self.spill.discard(name)
+        if self.spill.needs_compaction():
+            self.spill = self.spill.compacted()
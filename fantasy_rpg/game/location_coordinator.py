@@ -199,8 +199,11 @@ class LocationCoordinator:
         if current_location_index is None:
             return False, "Current location not found in available locations."
         
-        # Create persistent location graph
-        location_graph = self._create_location_graph(available_locations, current_location_index)
+        # Look up neighbours in the hex's precomputed location graph
+        location_graph = self.game_engine.world_coordinator.get_location_neighbors(
+            gs.world_position.hex_id,
+            gs.world_position.current_location_id
+        )
         
         # Check if movement in requested direction is possible
         if direction not in location_graph:
@@ -323,89 +326,6 @@ class LocationCoordinator:
         
         return True, message
     
-    def _create_location_graph(self, locations: List[Dict], current_index: int) -> Dict[str, Dict]:
-        """
-        Create a persistent bidirectional graph of locations.
-        
-        Locations are arranged in a consistent grid pattern based on their IDs,
-        ensuring the same locations are always in the same directions.
-        
-        Args:
-            locations: List of available locations
-            current_index: Index of current location
-        
-        Returns:
-            Dictionary mapping directions to location objects
-        """
-        gs = self.game_engine.game_state
-        hex_id = gs.world_position.hex_id
-        
-        # Create unique key for this hex's location graph
-        graph_key = f"location_graph_{hex_id}"
-        
-        # Initialize persistent location graphs if not exists
-        if not hasattr(gs, 'persistent_location_graphs'):
-            gs.persistent_location_graphs = {}
-        
-        # If we already have a graph for this hex, use it
-        if graph_key in gs.persistent_location_graphs:
-            full_graph = gs.persistent_location_graphs[graph_key]
-            current_location_id = locations[current_index].get("id")
-            return full_graph.get(current_location_id, {})
-        
-        # Create new persistent bidirectional graph for this hex
-        full_graph = {}
-        
-        # Create a stable arrangement of locations in a grid pattern
-        # This ensures consistent directional relationships
-        location_positions = {}
-        
-        # Arrange locations in a simple grid pattern based on their IDs (for consistency)
-        sorted_locations = sorted(locations, key=lambda x: x.get("id", ""))
-        
-        # Calculate grid dimensions
-        num_locations = len(sorted_locations)
-        grid_size = max(2, int(num_locations ** 0.5) + 1)
-        
-        # Assign grid positions
-        for i, location in enumerate(sorted_locations):
-            row = i // grid_size
-            col = i % grid_size
-            location_positions[location.get("id")] = (row, col)
-        
-        # Build bidirectional connections based on grid positions
-        for location in sorted_locations:
-            location_id = location.get("id")
-            current_pos = location_positions[location_id]
-            connections = {}
-            
-            # Check all four directions
-            directions = {
-                "north": (-1, 0),
-                "south": (1, 0),
-                "east": (0, 1),
-                "west": (0, -1)
-            }
-            
-            for direction, (row_offset, col_offset) in directions.items():
-                target_pos = (current_pos[0] + row_offset, current_pos[1] + col_offset)
-                
-                # Find location at target position
-                for other_location in sorted_locations:
-                    other_id = other_location.get("id")
-                    if other_id != location_id and location_positions[other_id] == target_pos:
-                        connections[direction] = other_location
-                        break
-            
-            full_graph[location_id] = connections
-        
-        # Store the persistent graph
-        gs.persistent_location_graphs[graph_key] = full_graph
-        
-        # Return connections for current location
-        current_location_id = locations[current_index].get("id")
-        return full_graph.get(current_location_id, {})
-    
     def _calculate_location_travel_time(self) -> float:
         """
         Calculate travel time between locations (fixed 30 minutes).
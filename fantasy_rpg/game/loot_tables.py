@@ -0,0 +1,255 @@
+"""
+Fantasy RPG - Loot Tables
+
+Data-driven loot for object interactions.
+
+Objects in objects.json declare their loot per interaction under "loot":
+
+    "loot": {
+        "search": [
+            {"entries": [
+                {"item": "gold_coins", "count": [1, 5], "conditions": {"min_margin": 0}},
+                {"item": "gold_coins", "count": 1, "conditions": {"min_margin": -3, "max_margin": -1}}
+            ]},
+            {"chance": 40, "conditions": {"min_margin": 8}, "entries": [
+                {"table": "hidden_valuables"}
+            ]}
+        ]
+    }
+
+Each interaction lists one or more tables, all rolled independently. A table
+rolls "rolls" times (int or [min, max], default 1) with "chance" percent
+(default 100) of dropping at all, and picks one weighted entry per roll.
+An entry is an item with a "count" (int or [min, max]), optionally growing by
+one per "per_margin" points of success margin up to "max_count", or a nested
+"table" - either inline or the name of a shared table under the top-level
+"loot_tables" key. An entry with neither drops nothing.
+
+Conditions restrict a table or an entry to a range of success margins
+(skill check total minus DC). Tables marked "quality_scaled" scale their
+chance and rolls by the check's quality multiplier.
+
+Tables are compiled once into flat arrays. The margin thresholds used by a
+table's entries split the margin axis into bands, and each band gets its own
+precomputed cumulative weights, so a roll is two bisections and never scans
+the entries.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from ..utils.data_loader import DataLoader
+except ImportError:
+    from fantasy_rpg.utils.data_loader import DataLoader
+
+
+# Margin bounds used when a condition leaves one side open
+MIN_MARGIN = -1000
+MAX_MARGIN = 1000
+
+
+def _parse_range(value, default: int = 1) -> Tuple[int, int]:
+    """Parse an int or [min, max] into a (min, max) pair"""
+    if value is None:
+        return default, default
+    if isinstance(value, (list, tuple)):
+        low, high = int(value[0]), int(value[-1])
+        return min(low, high), max(low, high)
+    return int(value), int(value)
+
+
+def _parse_conditions(conditions: Optional[Dict[str, Any]]) -> Tuple[int, int]:
+    """Parse a conditions dict into an inclusive (min_margin, max_margin) range"""
+    conditions = conditions or {}
+    for key in conditions:
+        if key not in ("min_margin", "max_margin"):
+            print(f"Warning: Unknown loot condition '{key}' ignored")
+    return (int(conditions.get("min_margin", MIN_MARGIN)),
+            int(conditions.get("max_margin", MAX_MARGIN)))
+
+
+class LootTable:
+    """A weighted loot table compiled into flat arrays"""
+
+    def __init__(self, spec: Dict[str, Any], shared: Optional[Dict[str, Any]] = None,
+                 _compiling: Tuple[str, ...] = ()):
+        """
+        Compile a table from its JSON spec.
+
+        Args:
+            spec: Table definition (see module docstring)
+            shared: Named tables that entries may reference by name
+            _compiling: Names of shared tables being compiled (cycle guard)
+        """
+        shared = shared or {}
+        self.chance = int(spec.get("chance", 100))
+        self.rolls_min, self.rolls_max = _parse_range(spec.get("rolls"), 1)
+        self.min_margin, self.max_margin = _parse_conditions(spec.get("conditions"))
+        self.quality_scaled = bool(spec.get("quality_scaled", False))
+
+        # Entry columns
+        self.item_ids: List[Optional[str]] = []
+        self.subtables: List[Optional["LootTable"]] = []
+        self.weights = array("l")
+        self.count_min = array("l")
+        self.count_max = array("l")
+        self.per_margin = array("l")
+        self.max_count = array("l")  # 0 = no cap
+        self.entry_min_margin = array("l")
+        self.entry_max_margin = array("l")
+
+        for entry in spec.get("entries", []):
+            subtable = None
+            table_ref = entry.get("table")
+            if isinstance(table_ref, dict):
+                subtable = LootTable(table_ref, shared, _compiling)
+            elif isinstance(table_ref, str):
+                if table_ref in _compiling or table_ref not in shared:
+                    print(f"Warning: Loot table '{table_ref}' not found or recursive, entry skipped")
+                    continue
+                subtable = LootTable(shared[table_ref], shared, _compiling + (table_ref,))
+
+            count_min, count_max = _parse_range(entry.get("count"), 1)
+            min_margin, max_margin = _parse_conditions(entry.get("conditions"))
+
+            self.item_ids.append(entry.get("item"))
+            self.subtables.append(subtable)
+            self.weights.append(max(0, int(entry.get("weight", 1))))
+            self.count_min.append(count_min)
+            self.count_max.append(count_max)
+            self.per_margin.append(int(entry.get("per_margin", 0)))
+            self.max_count.append(int(entry.get("max_count", 0)))
+            self.entry_min_margin.append(min_margin)
+            self.entry_max_margin.append(max_margin)
+
+        self._compile_bands()
+
+    def _compile_bands(self):
+        """Precompute cumulative weights for every band of the margin axis"""
+        # Every margin where some entry switches on or off starts a new band
+        bounds = set()
+        for min_margin, max_margin in zip(self.entry_min_margin, self.entry_max_margin):
+            if min_margin > MIN_MARGIN:
+                bounds.add(min_margin)
+            if max_margin < MAX_MARGIN:
+                bounds.add(max_margin + 1)
+        self.band_bounds = sorted(bounds)
+
+        self.band_cumulative: List[array] = []
+        for band in range(len(self.band_bounds) + 1):
+            margin = self.band_bounds[band - 1] if band else MIN_MARGIN
+            cumulative = array("l")
+            total = 0
+            for i, weight in enumerate(self.weights):
+                if self.entry_min_margin[i] <= margin <= self.entry_max_margin[i]:
+                    total += weight
+                cumulative.append(total)
+            self.band_cumulative.append(cumulative)
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    def roll(self, rng, margin: int = 0, quality: float = 1.0,
+             into: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """
+        Roll the table.
+
+        Args:
+            rng: Random source
+            margin: Success margin of the skill check (total - DC)
+            quality: Quality multiplier for quality-scaled tables
+            into: Existing item_id -> quantity dict to add drops to
+
+        Returns:
+            Dictionary mapping item_id -> quantity
+        """
+        items = into if into is not None else {}
+        if not self.min_margin <= margin <= self.max_margin:
+            return items
+
+        chance = self.chance
+        if self.quality_scaled:
+            chance = min(95, int(chance * quality))
+        if chance < 100 and rng.randint(1, 100) > chance:
+            return items
+
+        rolls = rng.randint(self.rolls_min, self.rolls_max)
+        if self.quality_scaled:
+            rolls = max(1, int(rolls * quality))
+
+        cumulative = self.band_cumulative[bisect_right(self.band_bounds, margin)]
+        total = cumulative[-1] if cumulative else 0
+        if total <= 0:
+            return items
+
+        for _ in range(rolls):
+            index = bisect_left(cumulative, rng.randint(1, total))
+            subtable = self.subtables[index]
+            if subtable is not None:
+                subtable.roll(rng, margin, quality, items)
+                continue
+
+            item_id = self.item_ids[index]
+            if not item_id:
+                continue
+
+            count = rng.randint(self.count_min[index], self.count_max[index])
+            if self.per_margin[index] > 0 and margin > 0:
+                count += margin // self.per_margin[index]
+            if self.max_count[index] > 0:
+                count = min(count, self.max_count[index])
+            if count > 0:
+                items[item_id] = items.get(item_id, 0) + count
+
+        return items
+
+
+def compile_loot(objects_data: Dict[str, Any]) -> Dict[str, Dict[str, Tuple[LootTable, ...]]]:
+    """
+    Compile the loot declared in objects.json.
+
+    Args:
+        objects_data: Parsed objects.json
+
+    Returns:
+        Dictionary mapping object_id -> interaction -> tuple of tables
+    """
+    shared = objects_data.get("loot_tables", {})
+    compiled = {}
+    for object_id, object_data in objects_data.get("objects", {}).items():
+        for interaction, specs in object_data.get("loot", {}).items():
+            if isinstance(specs, dict):
+                specs = [specs]
+            try:
+                tables = tuple(LootTable(spec, shared) for spec in specs)
+            except (TypeError, ValueError, AttributeError) as e:
+                print(f"Warning: Invalid loot for {object_id}.{interaction}: {e}")
+                continue
+            compiled.setdefault(object_id, {})[interaction] = tables
+    return compiled
+
+
+def roll_loot(tables: Tuple[LootTable, ...], rng, margin: int = 0, quality: float = 1.0) -> Dict[str, int]:
+    """Roll every table of an interaction and merge the drops"""
+    items = {}
+    for table in tables:
+        table.roll(rng, margin, quality, items)
+    return items
+
+
+# Compiled loot from objects.json, built on first use
+_object_loot: Optional[Dict[str, Dict[str, Tuple[LootTable, ...]]]] = None
+
+
+def get_object_loot() -> Dict[str, Dict[str, Tuple[LootTable, ...]]]:
+    """Get the compiled loot for all objects in objects.json"""
+    global _object_loot
+    if _object_loot is None:
+        try:
+            _object_loot = compile_loot(DataLoader().load_json("objects.json"))
+        except Exception as e:
+            print(f"Warning: Could not compile object loot: {e}")
+            _object_loot = {}
+    return _object_loot
@@ -6,6 +6,7 @@ Handles all player movement between hexes in the overworld, including:
 - Exposure and survival effects during travel
 - Weather updates on location change
 - Travel time calculations
+- Planned multi-hex travel ("travel to <hex>")
 """
 
 from typing import Tuple, Optional, Dict, Any
@@ -23,6 +24,8 @@ class MovementCoordinator:
             game_engine: Reference to main GameEngine for accessing game state
         """
         self.game_engine = game_engine
+        self._route_planner = None  # Built on first travel request, per season
+        self._route_planner_season = None
     
     def move_player(self, direction: str) -> Tuple[bool, str]:
         """
@@ -70,39 +73,65 @@ class MovementCoordinator:
         # Calculate travel time based on terrain and conditions
         travel_time = self._calculate_travel_time(current_hex_id, target_hex_id)
         
+        error = self._enter_hex(current_hex_id, target_hex_id, target_coords, travel_time)
+        if error:
+            return False, error
+        
+        new_hex_data = gs.world_position.hex_data
+        gs.world_position.available_locations = self.game_engine.world_coordinator.get_hex_locations(target_hex_id)
+        
+        # Build natural language response
+        travel_desc = self._get_travel_description(direction, new_hex_data, travel_time)
+        
+        # Check if character died during travel
+        if gs.character.hp <= 0:
+            self.game_engine._notify_ui_state_change("character_death")
+            return False, f"{travel_desc}\n\n💀 You collapsed and died during the journey!"
+        
+        # Notify UI of location change
+        self.game_engine._notify_ui_state_change("location_change")
+        
+        return True, travel_desc
+    
+    def _enter_hex(self, current_hex_id: str, target_hex_id: str, target_coords: Tuple[int, int],
+                   travel_time: float) -> Optional[str]:
+        """
+        Advance time for one hex of travel and place the player in the target hex.
+        
+        Locations for the new hex are not generated here - callers fetch them
+        once they know the player stops in this hex.
+        
+        Args:
+            current_hex_id: Hex being left
+            target_hex_id: Hex being entered
+            target_coords: (x, y) coordinates of the target hex
+            travel_time: Hours spent travelling
+        
+        Returns:
+            Error message if travel failed, otherwise None
+        """
+        gs = self.game_engine.game_state
+        
         # Use existing time system to advance time (which handles survival effects)
         if self.game_engine.time_system:
             time_result = self.game_engine.time_system.perform_activity("travel", duration_override=travel_time)
             if not time_result.get("success", True):
-                return False, time_result.get("message", "Travel failed.")
+                return time_result.get("message", "Travel failed.")
         else:
             # Fallback: just advance game time
             self._advance_game_time(travel_time)
         
         # Move to new hex
         new_hex_data = self.game_engine.world_coordinator.get_hex_info(target_hex_id)
-        new_locations = self.game_engine.world_coordinator.get_hex_locations(target_hex_id)
         
         gs.world_position.hex_id = target_hex_id
         gs.world_position.coords = target_coords
         gs.world_position.hex_data = new_hex_data
-        gs.world_position.available_locations = new_locations
+        gs.world_position.available_locations = []
         
-        # Generate new weather for the new location
-        climate_info = self.game_engine.world_coordinator.get_climate_info(target_hex_id)
-        if climate_info:
-            base_temp = climate_info.get("base_temperature", 65.0)
-            climate_type = climate_info.get("zone_type", "temperate")
-        else:
-            base_temp = 65.0
-            climate_type = "temperate"
-        
-        from world.weather_core import generate_weather_state
-        new_weather = generate_weather_state(
-            base_temp, 
-            gs.game_time.season, 
-            climate_type
-        )
+        # Read the new hex's weather from the world weather field
+        new_weather = self.game_engine.get_weather_at(target_hex_id)
+        old_weather = gs.current_weather
         gs.current_weather = new_weather
         
         # Update PlayerState weather so survival effects work properly
@@ -118,19 +147,167 @@ class MovementCoordinator:
         gs.game_time.minute = int((gs.player_state.game_hour % 1) * 60)
         gs.game_time.season = gs.player_state.game_season
         
-        # Build natural language response
-        travel_desc = self._get_travel_description(direction, new_hex_data, travel_time)
+        # Lift the fog of war around the new hex
+        revealed = self.game_engine.world_coordinator.reveal_from(target_coords)
+        
+        from game.events import HexEntered, HexesRevealed, WeatherChanged, publish_event
+        publish_event(self.game_engine, HexEntered(target_hex_id, current_hex_id, target_coords))
+        if revealed:
+            publish_event(self.game_engine, HexesRevealed(revealed))
+        publish_event(self.game_engine, WeatherChanged(old_weather, new_weather))
+        
+        return None
+    
+    def travel_to(self, target: str) -> Tuple[bool, str]:
+        """
+        Plan the fastest route to a hex and travel it in one batch.
+        
+        Each hex along the route advances time and publishes its own
+        HexEntered event; the UI is refreshed once when travel ends. Travel
+        stops early if the character faints or dies on the way.
+        
+        Args:
+            target: Destination hex ID ("0512") or coordinates ("5,12")
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not self.game_engine.is_initialized or not self.game_engine.game_state:
+            return False, "Game not initialized."
+        
+        gs = self.game_engine.game_state
+        start_coords = gs.world_position.coords
+        if not start_coords:
+            return False, "Invalid current position."
+        start_coords = tuple(start_coords)
+        
+        goal_coords = self._parse_hex_target(target)
+        if goal_coords is None:
+            return False, f"Unknown destination '{target}'. Use a hex ID like 0512 or coordinates like 5,12."
+        
+        if goal_coords == start_coords:
+            return False, "You are already there."
+        
+        if gs.character.hp <= 0:
+            return False, "You are unconscious and cannot move."
+        
+        route = self.plan_route(start_coords, goal_coords)
+        if not route:
+            return False, f"There is no known route to hex {self._hex_id(goal_coords)}."
+        
+        # Exit current location if in one
+        if gs.world_position.current_location_id:
+            gs.world_position.current_location_id = None
+            gs.world_position.current_location_data = None
+            gs.world_position.current_area_id = "entrance"
+        
+        hours_travelled = 0.0
+        hexes_travelled = 0
+        error = None
+        fainted = False
+        events = self.game_engine.events
+        # Hold the journey's events so a faint during a step can be seen
+        with events.command():
+            for previous, coords in zip(route.path, route.path[1:]):
+                previous_hex_id = self._hex_id(previous)
+                hex_id = self._hex_id(coords)
+                travel_time = self._calculate_travel_time(previous_hex_id, hex_id)
+                
+                mark = events.pending_count
+                error = self._enter_hex(previous_hex_id, hex_id, coords, travel_time)
+                if error:
+                    break
+                hours_travelled += travel_time
+                hexes_travelled += 1
+                
+                fainted = any(event.event_type == "Fainted" for event in events.pending_events(mark))
+                if fainted or gs.character.hp <= 0:
+                    break
+        
+        # Only the hex the journey ends in needs its locations generated
+        gs.world_position.available_locations = self.game_engine.world_coordinator.get_hex_locations(
+            gs.world_position.hex_id
+        )
+        
+        if hexes_travelled == 0:
+            return False, error or "Travel failed."
+        
+        travel_desc = self._get_route_description(
+            hexes_travelled, route.steps, gs.world_position.hex_data, hours_travelled
+        )
         
-        # Check if character died during travel
         if gs.character.hp <= 0:
             self.game_engine._notify_ui_state_change("character_death")
             return False, f"{travel_desc}\n\n💀 You collapsed and died during the journey!"
         
-        # Notify UI of location change
         self.game_engine._notify_ui_state_change("location_change")
         
+        if fainted:
+            return True, f"{travel_desc}\n\nYou collapsed on the way and came to here."
+        if error:
+            return True, f"{travel_desc}\n\nYour journey was cut short: {error}"
         return True, travel_desc
     
+    def plan_route(self, start_coords: Tuple[int, int], goal_coords: Tuple[int, int]):
+        """
+        Plan the fastest overworld route using current season and weather.
+        
+        Args:
+            start_coords: Starting (x, y) coordinates
+            goal_coords: Destination (x, y) coordinates
+        
+        Returns:
+            Route with path and estimated hours, or None if unreachable
+        """
+        planner = self._get_route_planner()
+        return planner.plan(start_coords, goal_coords, cost_multiplier=self._get_weather_modifier())
+    
+    def _get_route_planner(self):
+        """Return the route planner for the current season, rebuilding it if needed"""
+        season = self.game_engine.game_state.game_time.season
+        if self._route_planner is None or self._route_planner_season != season:
+            from world.route_planner import RoutePlanner
+            world_size = self.game_engine.world_coordinator.world_size
+            if isinstance(world_size, tuple):
+                width, height = world_size
+            else:
+                width = height = world_size
+            
+            hex_data = self.game_engine.world_coordinator.hex_data
+            self._route_planner = RoutePlanner(
+                width, height,
+                lambda x, y: self._get_base_travel_time(hex_data.get(self._hex_id((x, y)), {}), season)
+            )
+            self._route_planner_season = season
+        return self._route_planner
+    
+    def _parse_hex_target(self, target: str) -> Optional[Tuple[int, int]]:
+        """Parse a hex ID ("0512") or coordinate pair ("5,12") into in-bounds coordinates"""
+        target = target.strip().replace(" ", ",")
+        try:
+            if "," in target:
+                x, y = (int(part) for part in target.split(",") if part)
+            elif len(target) == 4 and target.isdigit():
+                x, y = int(target[:2]), int(target[2:])
+            else:
+                return None
+        except ValueError:
+            return None
+        
+        world_size = self.game_engine.world_coordinator.world_size
+        if isinstance(world_size, tuple):
+            max_x, max_y = world_size
+        else:
+            max_x = max_y = world_size
+        
+        if 0 <= x < max_x and 0 <= y < max_y:
+            return (x, y)
+        return None
+    
+    @staticmethod
+    def _hex_id(coords: Tuple[int, int]) -> str:
+        return f"{coords[0]:02d}{coords[1]:02d}"
+    
     def _calculate_target_coords(self, current_coords: Tuple[int, int], direction: str) -> Optional[Tuple[int, int]]:
         """
         Calculate target coordinates based on direction.
@@ -187,7 +364,7 @@ class MovementCoordinator:
     
     def _calculate_travel_time(self, current_hex_id: str, target_hex_id: str) -> float:
         """
-        Calculate travel time between hexes based on terrain.
+        Calculate travel time between hexes based on terrain, biome and weather.
         
         Args:
             current_hex_id: Starting hex ID
@@ -196,9 +373,23 @@ class MovementCoordinator:
         Returns:
             Travel time in hours
         """
-        # Get terrain info for both hexes
         target_hex = self.game_engine.world_coordinator.get_hex_info(target_hex_id)
-        terrain = target_hex.get("terrain", "plains")
+        season = self.game_engine.game_state.game_time.season
+        
+        return self._get_base_travel_time(target_hex, season) * self._get_weather_modifier()
+    
+    def _get_base_travel_time(self, hex_data: Dict[str, Any], season: str) -> float:
+        """
+        Hours needed to enter a hex in fair weather.
+        
+        Args:
+            hex_data: Data about the hex being entered
+            season: Current season, for biome travel modifiers
+        
+        Returns:
+            Travel time in hours
+        """
+        terrain = hex_data.get("terrain", "plains")
         
         # Base travel times by terrain (in hours)
         terrain_times = {
@@ -215,9 +406,18 @@ class MovementCoordinator:
         
         base_time = terrain_times.get(terrain, 2.0)
         
-        # Weather modifiers
-        gs = self.game_engine.game_state
-        weather = gs.current_weather
+        # Biome travel speed (dense forest, swamps and mountains are slower)
+        enhanced_biomes = getattr(self.game_engine.world_coordinator, "enhanced_biomes", None)
+        if enhanced_biomes and hasattr(enhanced_biomes, "get_biome"):
+            biome = enhanced_biomes.get_biome(hex_data.get("biome", ""))
+            if biome:
+                base_time = biome.calculate_travel_time(int(base_time * 60), season) / 60
+        
+        return base_time
+    
+    def _get_weather_modifier(self) -> float:
+        """Multiplier applied to travel time by the current weather"""
+        weather = self.game_engine.game_state.current_weather
         
         weather_modifier = 1.0
         if hasattr(weather, 'precipitation'):
@@ -230,7 +430,7 @@ class MovementCoordinator:
         if hasattr(weather, 'wind_speed') and weather.wind_speed > 30:
             weather_modifier *= 1.2
         
-        return base_time * weather_modifier
+        return weather_modifier
     
     def _get_travel_description(self, direction: str, hex_data: Dict[str, Any], travel_time: float) -> str:
         """
@@ -244,24 +444,49 @@ class MovementCoordinator:
         Returns:
             Formatted travel description
         """
-        terrain = hex_data.get("terrain", "plains")
-        biome = hex_data.get("biome", "temperate")
-        hex_name = hex_data.get("name", "Unknown Area")
+        description = f"You travel {direction} for {self._format_travel_time(travel_time)}.\n\n"
+        return description + self._get_arrival_description(hex_data)
+    
+    def _get_route_description(self, hexes_travelled: int, planned_steps: int,
+                               hex_data: Dict[str, Any], travel_time: float) -> str:
+        """
+        Generate natural language description of a multi-hex journey.
         
-        # Convert travel time to readable format
+        Args:
+            hexes_travelled: Number of hexes actually crossed
+            planned_steps: Number of hexes on the planned route
+            hex_data: Data about the hex the journey ended in
+            travel_time: Total hours spent travelling
+        
+        Returns:
+            Formatted travel description
+        """
+        description = f"You travel across {hexes_travelled} hex{'es' if hexes_travelled != 1 else ''}"
+        if hexes_travelled < planned_steps:
+            description += f" of your {planned_steps}-hex route"
+        description += f" for {self._format_travel_time(travel_time)}.\n\n"
+        return description + self._get_arrival_description(hex_data)
+    
+    @staticmethod
+    def _format_travel_time(travel_time: float) -> str:
+        """Hours as readable text, e.g. 2 hours and 30 minutes"""
         hours = int(travel_time)
         minutes = int((travel_time - hours) * 60)
         
         if hours > 0 and minutes > 0:
-            time_str = f"{hours} hour{'s' if hours != 1 else ''} and {minutes} minutes"
+            return f"{hours} hour{'s' if hours != 1 else ''} and {minutes} minutes"
         elif hours > 0:
-            time_str = f"{hours} hour{'s' if hours != 1 else ''}"
-        else:
-            time_str = f"{minutes} minutes"
+            return f"{hours} hour{'s' if hours != 1 else ''}"
+        return f"{minutes} minutes"
+    
+    @staticmethod
+    def _get_arrival_description(hex_data: Dict[str, Any]) -> str:
+        """Describe the hex arrived in and how many locations can be seen from it"""
+        terrain = hex_data.get("terrain", "plains")
+        biome = hex_data.get("biome", "temperate")
+        hex_name = hex_data.get("name", "Unknown Area")
         
-        # Build description
-        description = f"You travel {direction} for {time_str}.\n\n"
-        description += f"You arrive at {hex_name} - a {biome} {terrain} region."
+        description = f"You arrive at {hex_name} - a {biome} {terrain} region."
         
         # Add location count if available
         num_locations = len(hex_data.get("locations", []))
@@ -11,14 +11,50 @@ Handles all object interactions within locations including:
 - Drinking water
 - Generic 'use' interactions
 
+Items found by interactions are rolled against the compiled loot tables
+declared in objects.json (see loot_tables.py).
+
 ARCHITECTURE: Returns structured dicts instead of tuples for proper message ordering.
 Uses _make_result() helper to create consistent return values.
 
 All methods use Dict[str, Any] pattern with event_type metadata.
 """
 
-from typing import Dict, Any, Optional
-import random
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    from .area_index import AreaIndex
+except ImportError:
+    from fantasy_rpg.game.area_index import AreaIndex
+
+try:
+    from .events import HpChanged, ItemAdded, publish_event
+except ImportError:
+    from fantasy_rpg.game.events import HpChanged, ItemAdded, publish_event
+
+try:
+    from .loot_tables import get_object_loot, roll_loot
+except ImportError:
+    from fantasy_rpg.game.loot_tables import get_object_loot, roll_loot
+
+try:
+    from ..utils.rng import get_rng
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng
+
+
+# Areas whose lookup indexes are kept (most recently used)
+AREA_INDEX_CACHE_SIZE = 32
+
+# Object flag that marks an object as used up for an action
+ACTION_DEPLETION_FLAGS = {
+    "forage": "depleted",
+    "harvest": "depleted",
+    "search": "searched",
+    "chop": "chopped",
+    "light": "lit"
+}
 
 
 class ObjectInteractionSystem:
@@ -32,6 +68,23 @@ class ObjectInteractionSystem:
             game_engine: Reference to main GameEngine for accessing game state
         """
         self.game_engine = game_engine
+        
+        # id(area dict) -> (area dict, AreaIndex)
+        self._area_indexes: "OrderedDict[int, Tuple[Dict, AreaIndex]]" = OrderedDict()
+        
+        # Action name -> handler
+        self._handlers = {
+            "forage": self._handle_forage,
+            "harvest": self._handle_harvest,
+            "search": self._handle_search,
+            "examine": self._handle_examine,
+            "unlock": self._handle_unlock,
+            "chop": self._handle_chop,
+            "drink": self._handle_drink,
+            "light": self._handle_light,
+            "use": self._handle_use,
+            "disarm": self._handle_disarm
+        }
     
     @staticmethod
     def _make_result(success: bool, message: str = "", **kwargs) -> Dict[str, Any]:
@@ -89,43 +142,59 @@ class ObjectInteractionSystem:
             return self._make_result(False, "Current area not found.")
         
         area_data = areas[current_area_id]
-        objects = area_data.get("objects", [])
-        
-        # Find the target object
-        target_object = None
-        for obj in objects:
-            if obj.get("name", "").lower() == object_name.lower():
-                target_object = obj
-                break
-        
-        if not target_object:
+        index = self.get_area_index(area_data)
+        
+        # Find the target object, preferring one not yet used up for this action
+        matches = index.find_objects(object_name)
+        if not matches:
+            suggestions = index.objects.suggest(object_name)
+            if suggestions:
+                return self._make_result(False, f"You don't see any '{object_name}' here. Did you mean: {', '.join(suggestions)}?")
             return self._make_result(False, f"You don't see any '{object_name}' here.")
         
+        flag = ACTION_DEPLETION_FLAGS.get(action)
+        target_object = next((obj for obj in matches if not (flag and obj.get(flag, False))), matches[0])
+        
         # Route to appropriate handler based on action and object properties
-        properties = target_object.get("properties", {})
-        
-        if action == "forage":
-            return self._handle_forage(target_object, properties)
-        elif action == "harvest":
-            return self._handle_harvest(target_object, properties)
-        elif action == "search":
-            return self._handle_search(target_object, properties)
-        elif action == "examine":
-            return self._handle_examine(target_object, properties)
-        elif action == "unlock":
-            return self._handle_unlock(target_object, properties)
-        elif action == "chop":
-            return self._handle_chop(target_object, properties)
-        elif action == "drink":
-            return self._handle_drink(target_object, properties)
-        elif action == "light":
-            return self._handle_light(target_object, properties)
-        elif action == "use":
-            return self._handle_use(target_object, properties)
-        elif action == "disarm":
-            return self._handle_disarm(target_object, properties)
-        else:
+        handler = self._handlers.get(action)
+        if handler is None:
             return self._make_result(False, f"You can't {action} the {target_object.get('name', 'object')}.")
+        return handler(target_object, target_object.get("properties", {}))
+    
+    def get_area_index(self, area_data: Dict) -> AreaIndex:
+        """
+        Get the lookup index for an area, building it on first use.
+        
+        The index is rebuilt if the area's object list was replaced or
+        changed size outside of the index.
+        
+        Args:
+            area_data: Area dict from the current location data
+        
+        Returns:
+            AreaIndex for the area
+        """
+        key = id(area_data)
+        cached = self._area_indexes.get(key)
+        if cached is not None and cached[0] is area_data and cached[1].is_current(area_data):
+            self._area_indexes.move_to_end(key)
+            return cached[1]
+        
+        index = AreaIndex(area_data)
+        self._area_indexes[key] = (area_data, index)
+        self._area_indexes.move_to_end(key)
+        while len(self._area_indexes) > AREA_INDEX_CACHE_SIZE:
+            self._area_indexes.popitem(last=False)
+        return index
+    
+    def _get_current_area_index(self) -> Optional[AreaIndex]:
+        """Get the index for the player's current area, if inside a location"""
+        gs = self.game_engine.game_state
+        location_data = gs.world_position.current_location_data
+        if not location_data:
+            return None
+        area_data = location_data.get("areas", {}).get(gs.world_position.current_area_id)
+        return self.get_area_index(area_data) if area_data is not None else None
     
     def _handle_forage(self, obj: Dict, properties: Dict) -> Dict[str, Any]:
         """Handle foraging from objects using Survival skill"""
@@ -143,13 +212,14 @@ class ObjectInteractionSystem:
         
         # Simple success for now - ActionHandler will implement the multi-skill system
         obj["depleted"] = True
+        items_found, _ = self._add_items(obj, self._roll_loot(obj, ("forage",)))
         
         return self._make_result(
             True,
             "",
             event_type='forage_success',
             object_name=obj.get('name', 'object'),
-            items_found=["1x Berries"]
+            items_found=items_found
         )
     
     def _handle_harvest(self, obj: Dict, properties: Dict) -> Dict[str, Any]:
@@ -168,13 +238,14 @@ class ObjectInteractionSystem:
         
         # Simple success for now - ActionHandler will implement the multi-skill system
         obj["depleted"] = True
+        items_found, _ = self._add_items(obj, self._roll_loot(obj, ("harvest", "forage")))
         
         return self._make_result(
             True,
             "",
             event_type='harvest_success',
             object_name=obj.get('name', 'object'),
-            items_found=["1x Materials"]
+            items_found=items_found
         )
     
     def _handle_search(self, obj: Dict, properties: Dict) -> Dict[str, Any]:
@@ -187,7 +258,7 @@ class ObjectInteractionSystem:
             return {'success': False, 'message': f"You have already searched the {obj.get('name')}."}
         
         # Make skill check
-        roll = random.randint(1, 20)
+        roll = get_rng("checks").randint(1, 20)
         primary_skill = "perception"
         secondary_skill = "investigation"
         dc = properties.get("dc_search", 10)
@@ -198,20 +269,12 @@ class ObjectInteractionSystem:
         obj["searched"] = True
         
         if total >= dc:
-            # Success - generate items based on object's item_drops
-            items_generated = self._generate_items_from_object(obj, "search", total, dc)
+            # Success - roll the object's search loot
+            items_generated = self._roll_loot(obj, ("search",), total - dc)
             
             if items_generated:
                 # Add items to inventory
-                success_items = []
-                failed_items = []
-                
-                gs = self.game_engine.game_state
-                for item_id, quantity in items_generated.items():
-                    if gs.character.add_item_to_inventory(item_id, quantity):
-                        success_items.append(f"{quantity}x {item_id.replace('_', ' ').title()}")
-                    else:
-                        failed_items.append(f"{quantity}x {item_id.replace('_', ' ').title()}")
+                success_items, failed_items = self._add_items(obj, items_generated)
                 
                 # Build factual message about items found
                 result_msg = ""
@@ -253,14 +316,10 @@ class ObjectInteractionSystem:
                     }
                 }
         else:
-            # Forgiving failure - still might find something with failed roll
-            items_generated = self._generate_items_from_object(obj, "search", total, dc)
+            # Forgiving failure - near-miss conditions in the loot tables may still drop something
+            items_generated = self._roll_loot(obj, ("search",), total - dc)
             if items_generated:
-                success_items = []
-                gs = self.game_engine.game_state
-                for item_id, quantity in items_generated.items():
-                    if gs.character.add_item_to_inventory(item_id, quantity):
-                        success_items.append(f"{quantity}x {item_id.replace('_', ' ').title()}")
+                success_items, _ = self._add_items(obj, items_generated)
                 
                 if success_items:
                     return {
@@ -317,7 +376,7 @@ class ObjectInteractionSystem:
             return self._make_result(False, f"The {obj.get('name')} is already unlocked.")
         
         # Make lockpicking check
-        roll = random.randint(1, 20)
+        roll = get_rng("checks").randint(1, 20)
         skill_bonus = self._get_skill_bonus("sleight_of_hand")
         dc = properties.get("dc_lockpick", 15)
         total = roll + skill_bonus
@@ -355,7 +414,7 @@ class ObjectInteractionSystem:
             return self._make_result(False, f"The trap on the {obj.get('name')} has already been disarmed.")
         
         # Make sleight of hand check for trap disarming
-        roll = random.randint(1, 20)
+        roll = get_rng("checks").randint(1, 20)
         skill_bonus = self._get_skill_bonus("sleight_of_hand")
         dc = properties.get("dc_disarm", 15)
         total = roll + skill_bonus
@@ -380,7 +439,9 @@ class ObjectInteractionSystem:
             trigger_damage = properties.get("trap_damage", 0)
             if trigger_damage > 0:
                 gs = self.game_engine.game_state
+                old_hp = gs.character.hp
                 gs.character.hp = max(0, gs.character.hp - trigger_damage)
+                publish_event(self.game_engine, HpChanged(old_hp, gs.character.hp, obj.get('name', 'trap')))
                 return self._make_result(
                     False,
                     f"You take {trigger_damage} damage.",
@@ -413,11 +474,13 @@ class ObjectInteractionSystem:
         
         # Simple success for now - ActionHandler implements the multi-skill system
         obj["chopped"] = True
+        items_found, _ = self._add_items(obj, self._roll_loot(obj, ("chop",)))
         return self._make_result(
             True,
             "",
             event_type='chop_success',
-            object_name=obj.get('name', 'object')
+            object_name=obj.get('name', 'object'),
+            items_found=items_found
         )
     
     def _handle_drink(self, obj: Dict, properties: Dict) -> Dict[str, Any]:
@@ -445,7 +508,9 @@ class ObjectInteractionSystem:
         if water_quality == "excellent":
             # Small HP bonus for excellent water
             character = gs.character
+            old_hp = character.hp
             character.hp = min(character.max_hp, character.hp + 1)
+            publish_event(self.game_engine, HpChanged(old_hp, character.hp, "excellent water"))
         
         return self._make_result(
             True,
@@ -488,7 +553,7 @@ class ObjectInteractionSystem:
                 return self._make_result(False, f"You need firewood to light a fire in the {obj.get('name')}.")
         
         # Make survival check to light fire
-        roll = random.randint(1, 20)
+        roll = get_rng("checks").randint(1, 20)
         skill_bonus = self._get_skill_bonus("survival")
         dc = 12
         total = roll + skill_bonus
@@ -550,11 +615,11 @@ class ObjectInteractionSystem:
             name_data = new_object_data['name']
             if isinstance(name_data, list):
                 # Randomly select one name from the list
-                import random
-                selected_name = random.choice(name_data)
+                selected_name = get_rng("loot").choice(name_data)
             else:
                 selected_name = name_data
             
+            target_object['id'] = new_object_id
             target_object['name'] = selected_name
             target_object['description'] = new_object_data['description']
             target_object['properties'] = new_object_data['properties'].copy()
@@ -564,6 +629,10 @@ class ObjectInteractionSystem:
             if 'item_drops' in new_object_data:
                 target_object['item_drops'] = new_object_data['item_drops']
             
+            # Name and id changed - keep the area index in sync
+            if index := self._get_current_area_index():
+                index.update_object(target_object)
+            
             return True
         except Exception as e:
             print(f"Error transforming object: {e}")
@@ -611,42 +680,6 @@ class ObjectInteractionSystem:
         else:
             return 0.5
     
-    def _generate_from_item_drops(self, item_drops: Dict, quality_multiplier: float = 1.0) -> Dict[str, int]:
-        """Generate items from item_drops configuration with quality scaling"""
-        items = {}
-        
-        # Get drop parameters
-        min_drops = item_drops.get("min_drops", 0)
-        max_drops = item_drops.get("max_drops", 1)
-        base_drop_chance = item_drops.get("drop_chance", 50)
-        
-        # Scale drop chance with quality (better rolls = higher chance)
-        scaled_drop_chance = min(95, int(base_drop_chance * quality_multiplier))
-        
-        # Check if we get any drops
-        if random.randint(1, 100) <= scaled_drop_chance:
-            base_num_drops = random.randint(min_drops, max_drops)
-            # Scale number of drops with quality
-            num_drops = max(1, int(base_num_drops * quality_multiplier))
-            
-            # Generate items based on pools
-            pools = item_drops.get("pools", [])
-            
-            for _ in range(num_drops):
-                if "food" in pools:
-                    items["wild_berries"] = items.get("wild_berries", 0) + 1
-                elif "treasure" in pools:
-                    base_coins = random.randint(1, 10)
-                    scaled_coins = max(1, int(base_coins * quality_multiplier))
-                    items["gold_coins"] = items.get("gold_coins", 0) + scaled_coins
-                elif "materials" in pools or "wood" in pools:
-                    items["firewood"] = items.get("firewood", 0) + 1
-                else:
-                    # Generic material
-                    items["bone_fragments"] = items.get("bone_fragments", 0) + 1
-        
-        return items
-    
     def _get_multi_skill_bonus(self, primary_skill: str, secondary_skill: str = None) -> int:
         """Get combined skill bonus for multi-skill checks"""
         primary_bonus = self._get_skill_bonus(primary_skill)
@@ -656,108 +689,40 @@ class ObjectInteractionSystem:
             return primary_bonus + (secondary_bonus // 2)
         return primary_bonus
     
-    def _generate_items_from_object(self, obj: Dict, interaction_type: str, skill_roll: int = 10, dc: int = 10) -> Dict[str, int]:
+    def _roll_loot(self, obj: Dict, interactions: Tuple[str, ...], success_margin: int = 0) -> Dict[str, int]:
         """
-        Generate items based on multi-skill risk/reward system.
-        Implements the complete item generation logic from the old ActionHandler.
+        Roll the object's compiled loot for the first interaction it declares.
+        
+        Args:
+            obj: Object dict from the current area
+            interactions: Interaction names to try in order (e.g. ("harvest", "forage"))
+            success_margin: Skill check total minus DC
         
         Returns:
             Dictionary mapping item_id -> quantity
         """
-        properties = obj.get("properties", {})
-        items_to_generate = {}
-        
-        # Calculate success quality based on how much the roll exceeded DC
-        success_margin = skill_roll - dc
-        
-        # Determine what items to generate based on object type and interaction
-        object_name = obj.get("name", "").lower()
-        
-        # Berry Bush -> Multi-skill approach
-        if "berry" in object_name:
-            if interaction_type in ["forage", "harvest", "gather", "pick"]:
-                # HIGH RISK/HIGH REWARD
-                if success_margin >= 0:
-                    quantity = 2 + max(0, success_margin // 3)
-                    items_to_generate["wild_berries"] = min(5, quantity)
-                    
-            elif interaction_type in ["search"]:
-                # MEDIUM RISK/MEDIUM REWARD
-                if success_margin >= 0:
-                    quantity = 1 + max(0, success_margin // 5)
-                    items_to_generate["wild_berries"] = min(3, quantity)
-                else:
-                    # Forgiving failure
-                    if success_margin >= -3:
-                        items_to_generate["wild_berries"] = 1
-                        
-            elif interaction_type in ["examine"]:
-                # LOW RISK/LOW REWARD
-                if success_margin >= 0:
-                    quantity = 1 + (1 if success_margin >= 8 else 0)
-                    items_to_generate["wild_berries"] = quantity
-                else:
-                    if success_margin >= -5:
-                        items_to_generate["wild_berries"] = 1
-        
-        # Trees/Wood -> Multi-skill approach  
-        elif any(wood_type in object_name for wood_type in ["tree", "log", "wood", "pile"]):
-            if interaction_type in ["chop", "cut"]:
-                # HIGH RISK/HIGH REWARD
-                if success_margin >= 0:
-                    quantity = 3 + max(0, success_margin // 3)
-                    items_to_generate["firewood"] = min(6, quantity)
-                else:
-                    if success_margin >= -2:
-                        items_to_generate["firewood"] = 1
-                        
-            elif interaction_type in ["search"]:
-                # MEDIUM RISK/DIVERSE REWARD
-                if success_margin >= 0:
-                    firewood_qty = 1 + (1 if success_margin >= 6 else 0)
-                    items_to_generate["firewood"] = firewood_qty
-                    
-                    if success_margin >= 10:
-                        items_to_generate["wild_berries"] = 1
-                    if success_margin >= 15:
-                        items_to_generate["gold_coins"] = random.randint(1, 3)
-                else:
-                    if success_margin >= -4:
-                        items_to_generate["firewood"] = 1
-                        
-            elif interaction_type in ["take"]:
-                # NO RISK/LOW REWARD
-                items_to_generate["firewood"] = 1 + (1 if random.randint(1, 100) <= 50 else 0)
-        
-        # Tables/Containers -> Search-based loot
-        elif any(container in object_name for container in ["table", "chest", "crate", "barrel"]):
-            if interaction_type in ["search"]:
-                if success_margin >= 0:
-                    # Base loot
-                    items_to_generate["gold_coins"] = random.randint(1, 5)
-                    
-                    # Bonus items based on success
-                    if success_margin >= 8:
-                        items_to_generate["firewood"] = 1
-                    if success_margin >= 12:
-                        items_to_generate["wild_berries"] = random.randint(1, 2)
-                else:
-                    # Small chance on failure
-                    if success_margin >= -3:
-                        items_to_generate["gold_coins"] = 1
-        
-        # Generic fallback
-        else:
-            # Check for specific item generation in properties
-            if properties.get("generates_items"):
-                generated_item = properties.get("generated_item_id")
-                base_quantity = properties.get("generated_quantity", 1)
-                if generated_item:
-                    if success_margin >= 0:
-                        final_quantity = base_quantity + max(0, success_margin // 5)
-                        items_to_generate[generated_item] = final_quantity
-                    else:
-                        if success_margin >= -3:
-                            items_to_generate[generated_item] = max(1, base_quantity // 2)
-        
-        return items_to_generate
+        object_loot = get_object_loot().get(obj.get("id"), {})
+        for interaction in interactions:
+            if interaction in object_loot:
+                quality = self._calculate_quality_multiplier(success_margin)
+                return roll_loot(object_loot[interaction], get_rng("loot"), success_margin, quality)
+        return {}
+    
+    def _add_items(self, obj: Dict, items: Dict[str, int]) -> Tuple[List[str], List[str]]:
+        """
+        Add rolled items to the player's inventory.
+        
+        Returns:
+            Tuple of (added, failed) lists of "quantity x Item Name" strings
+        """
+        gs = self.game_engine.game_state
+        added = []
+        failed = []
+        for item_id, quantity in items.items():
+            label = f"{quantity}x {item_id.replace('_', ' ').title()}"
+            if gs.character.add_item_to_inventory(item_id, quantity):
+                publish_event(self.game_engine, ItemAdded(item_id, quantity, obj.get('name', 'object')))
+                added.append(label)
+            else:
+                failed.append(label)
+        return added, failed
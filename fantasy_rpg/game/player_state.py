@@ -36,6 +36,35 @@ except ImportError:
                 pass
 
 
+# Survival rates shared with SurvivalBatch (survival_batch.py), which applies
+# the same rules to many actors at once
+HUNGER_BASE_RATE = 2  # Points per hour - was 8, now 2 (4x slower)
+HUNGER_ACTIVITY_MODIFIERS = {
+    "resting": 0.5,
+    "normal": 1.0,
+    "active": 1.5,
+    "strenuous": 2.5
+}
+
+THIRST_BASE_RATE = 6  # Points per hour - was 12, now 6 (3x hunger rate of 2)
+THIRST_ACTIVITY_MODIFIERS = {
+    "resting": 0.7,
+    "normal": 1.0,
+    "active": 1.8,
+    "strenuous": 3.0
+}
+
+# Fatigue lost per hour while awake (resting and unconscious recover instead)
+FATIGUE_ACTIVITY_RATES = {
+    "normal": 10,      # 10 points per hour (mild tiredness)
+    "active": 20,      # 20 points per hour (moderate tiredness)
+    "strenuous": 40    # 40 points per hour (high tiredness)
+}
+
+# Used when the character has no weather resistance of their own
+DEFAULT_WEATHER_RESISTANCE = CharacterWeatherResistance()
+
+
 class SurvivalLevel(Enum):
     """Survival status levels for various needs"""
     EXCELLENT = 5
@@ -275,15 +304,10 @@ class PlayerState:
         old_hunger = self.survival.hunger
         
         # Base hunger rate (points per hour) - GREATLY reduced for balance
-        base_rate = 2  # Was 8, now 2 (4x slower)
+        base_rate = HUNGER_BASE_RATE
         
         # Activity modifiers
-        activity_modifiers = {
-            "resting": 0.5,
-            "normal": 1.0,
-            "active": 1.5,
-            "strenuous": 2.5
-        }
+        activity_modifiers = HUNGER_ACTIVITY_MODIFIERS
         
         rate = base_rate * activity_modifiers.get(activity, 1.0)
         hunger_loss = int(rate * hours)
@@ -307,15 +331,10 @@ class PlayerState:
     def _update_thirst(self, hours: float, activity: str):
         """Update thirst based on time, activity, and environment - 3x faster than hunger"""
         # Base thirst rate (points per hour) - 3x hunger rate for realism
-        base_rate = 6  # Was 12, now 6 (3x hunger rate of 2)
+        base_rate = THIRST_BASE_RATE
         
         # Activity modifiers
-        activity_modifiers = {
-            "resting": 0.7,
-            "normal": 1.0,
-            "active": 1.8,
-            "strenuous": 3.0
-        }
+        activity_modifiers = THIRST_ACTIVITY_MODIFIERS
         
         rate = base_rate * activity_modifiers.get(activity, 1.0)
         
@@ -363,13 +382,7 @@ class PlayerState:
             
         else:
             # Activity DECREASES fatigue (gets more tired) - LOW fatigue = exhausted
-            activity_rates = {
-                "normal": 10,      # 10 points per hour (mild tiredness)
-                "active": 20,      # 20 points per hour (moderate tiredness)
-                "strenuous": 40    # 40 points per hour (high tiredness)
-            }
-            
-            rate = activity_rates.get(activity, 10)
+            rate = FATIGUE_ACTIVITY_RATES.get(activity, 10)
             fatigue_loss = int(rate * hours)
             self.survival.fatigue = max(0, self.survival.fatigue - fatigue_loss)
             print(f"  Fatigue: {activity.upper()} for {hours:.1f}h, -{fatigue_loss} rest, {old_fatigue} → {self.survival.fatigue}")
@@ -383,8 +396,8 @@ class PlayerState:
         if hasattr(self.character, 'weather_resistance'):
             resistance = self.character.weather_resistance
         else:
-            # Create basic resistance
-            resistance = CharacterWeatherResistance()
+            # Basic resistance
+            resistance = DEFAULT_WEATHER_RESISTANCE
         
         # Calculate target temperature based on weather
         ambient_temp = self.current_weather.feels_like
@@ -627,9 +640,11 @@ class PlayerState:
             
             # Get newly triggered conditions with their messages
             newly_triggered = conditions_manager.get_newly_triggered_conditions(
-                previous_conditions, current_conditions, self
+                previous_conditions, current_conditions
             )
             
+            self._publish_condition_changes(previous_conditions, current_conditions, newly_triggered)
+            
         except Exception as e:
             print(f"Error evaluating conditions: {e}")
             self.active_conditions = []
@@ -639,6 +654,24 @@ class PlayerState:
         
         return newly_triggered
     
+    def _publish_condition_changes(self, previous: set, current: set, newly_triggered: list):
+        """Publish ConditionGained/ConditionLost events for the condition delta"""
+        try:
+            from .events import ConditionGained, ConditionLost, publish_event
+        except ImportError:
+            from events import ConditionGained, ConditionLost, publish_event
+        
+        messages = {info["name"]: info["message"] for info in newly_triggered}
+        for condition in self.active_conditions:
+            if condition not in previous:
+                publish_event(self.game_engine, ConditionGained(condition, messages.get(condition, "")))
+        for condition in previous - current:
+            publish_event(self.game_engine, ConditionLost(condition))
+    
+    def refresh_conditions(self) -> list[dict]:
+        """Re-evaluate conditions after a direct change to survival values"""
+        return self._update_status_effects()
+    
     def eat_food(self, nutrition_value: int):
         """Consume food to reduce hunger"""
         self.survival.hunger = min(1000, self.survival.hunger + nutrition_value)
@@ -727,6 +760,10 @@ Wetness: {wetness_level.name.title()}"""
         
         return f"{time_desc}, Day {self.game_day}"
     
+    def get_total_hours(self) -> float:
+        """Game hours elapsed since midnight of day 1"""
+        return (self.game_day - 1) * 24 + self.game_hour
+    
     def update_weather(self, weather: WeatherState):
         """Update current weather conditions"""
         old_weather = self.current_weather
@@ -0,0 +1,599 @@
+"""
+Fantasy RPG - Save Codec
+
+Binary save container with a section table and lazy section loading.
+
+File layout:
+    magic            8 bytes  b"FRPGSAVE"
+    format version   uint16
+    section count    uint16
+    table size       uint32
+    section table    per section: name length (uint8), name (UTF-8),
+                     flags (uint8), offset (uint32), length (uint32),
+                     CRC-32 of the stored bytes (uint32)
+    section payloads
+
+Each payload is one value in a msgpack-compatible encoding, zlib-compressed
+when that makes it smaller. Opening a file reads only the header; sections
+are read, checked and decoded one at a time, and a section that was never
+decoded can be copied into the next save byte for byte (SectionRef).
+
+Files are written to a temporary name and renamed into place, so a save is
+either the old file or the new one, never a mix. Durable writes also fsync
+the file and its directory before returning.
+
+The encoding accepts what json.dump(..., default=str) accepts and decodes to
+what json.load() would return: tuples become lists, non-string dict keys
+become strings the way JSON writes them, and unknown objects are stored as
+str(obj).
+"""
+
+import os
+import struct
+import zlib
+from collections.abc import MutableMapping
+from collections import UserList
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+MAGIC = b"FRPGSAVE"
+FORMAT_VERSION = 1
+
+# Section flags
+FLAG_ZLIB = 0x01
+
+# Payloads smaller than this are stored uncompressed
+COMPRESS_MIN_SIZE = 256
+
+_HEADER = struct.Struct(">8sHHI")
+_ENTRY = struct.Struct(">BIII")
+
+
+class SaveFormatError(Exception):
+    """Raised for corrupt or incompatible save files"""
+
+
+# Encoding
+
+def _json_key(key: Any) -> str:
+    """Convert a dict key the way json.dumps does"""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return repr(float(key)) if isinstance(key, float) else str(key)
+    return str(key)
+
+
+def pack(value: Any) -> bytes:
+    """
+    Encode a value in msgpack format.
+
+    Args:
+        value: JSON-compatible value (other objects are stored as str())
+
+    Returns:
+        Encoded bytes
+    """
+    out = bytearray()
+    _pack_into(value, out)
+    return bytes(out)
+
+
+def _pack_into(value: Any, out: bytearray):
+    if value is None:
+        out.append(0xc0)
+    elif value is True:
+        out.append(0xc3)
+    elif value is False:
+        out.append(0xc2)
+    elif isinstance(value, int):
+        _pack_int(value, out)
+    elif isinstance(value, float):
+        out.append(0xcb)
+        out += struct.pack(">d", value)
+    elif isinstance(value, str):
+        _pack_str(value, out)
+    elif isinstance(value, (list, tuple)):
+        _pack_length(len(value), out, 0x90, 0xdc, 0xdd, fix_max=15)
+        for item in value:
+            _pack_into(item, out)
+    elif isinstance(value, dict):
+        _pack_length(len(value), out, 0x80, 0xde, 0xdf, fix_max=15)
+        for key, item in value.items():
+            _pack_str(_json_key(key), out)
+            _pack_into(item, out)
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+        if size <= 0xff:
+            out += struct.pack(">BB", 0xc4, size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xc5, size)
+        else:
+            out += struct.pack(">BI", 0xc6, size)
+        out += value
+    elif isinstance(value, (MutableMapping, UserList)):
+        # Lazy containers - encode their (loaded) contents
+        _pack_into(dict(value) if isinstance(value, MutableMapping) else list(value), out)
+    else:
+        _pack_str(str(value), out)
+
+
+def _pack_int(value: int, out: bytearray):
+    if 0 <= value <= 0x7f:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xff)
+    elif 0 <= value <= 0xff:
+        out += struct.pack(">BB", 0xcc, value)
+    elif 0 <= value <= 0xffff:
+        out += struct.pack(">BH", 0xcd, value)
+    elif 0 <= value <= 0xffffffff:
+        out += struct.pack(">BI", 0xce, value)
+    elif 0 <= value <= 0xffffffffffffffff:
+        out += struct.pack(">BQ", 0xcf, value)
+    elif -0x80 <= value:
+        out += struct.pack(">Bb", 0xd0, value)
+    elif -0x8000 <= value:
+        out += struct.pack(">Bh", 0xd1, value)
+    elif -0x80000000 <= value:
+        out += struct.pack(">Bi", 0xd2, value)
+    elif -0x8000000000000000 <= value:
+        out += struct.pack(">Bq", 0xd3, value)
+    else:
+        # Outside 64 bits - keep the digits
+        _pack_str(str(value), out)
+
+
+def _pack_str(value: str, out: bytearray):
+    data = value.encode("utf-8")
+    size = len(data)
+    if size <= 31:
+        out.append(0xa0 | size)
+    elif size <= 0xff:
+        out += struct.pack(">BB", 0xd9, size)
+    elif size <= 0xffff:
+        out += struct.pack(">BH", 0xda, size)
+    else:
+        out += struct.pack(">BI", 0xdb, size)
+    out += data
+
+
+def _pack_length(size: int, out: bytearray, fix: int, code16: int, code32: int, fix_max: int):
+    if size <= fix_max:
+        out.append(fix | size)
+    elif size <= 0xffff:
+        out += struct.pack(">BH", code16, size)
+    else:
+        out += struct.pack(">BI", code32, size)
+
+
+# Decoding
+
+def unpack(data: bytes) -> Any:
+    """
+    Decode a msgpack-encoded value.
+
+    Raises:
+        SaveFormatError: If the data is truncated or malformed
+    """
+    try:
+        value, position = _unpack_from(memoryview(data), 0)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise SaveFormatError(f"Malformed section data: {e}")
+    if position != len(data):
+        raise SaveFormatError("Trailing bytes after section data")
+    return value
+
+
+def _unpack_from(data: memoryview, pos: int) -> Tuple[Any, int]:
+    code = data[pos]
+    pos += 1
+
+    if code <= 0x7f:
+        return code, pos
+    if code >= 0xe0:
+        return code - 0x100, pos
+    if 0xa0 <= code <= 0xbf:
+        size = code & 0x1f
+        return str(data[pos:pos + size], "utf-8"), pos + size
+    if 0x90 <= code <= 0x9f:
+        return _unpack_array(data, pos, code & 0x0f)
+    if 0x80 <= code <= 0x8f:
+        return _unpack_map(data, pos, code & 0x0f)
+
+    if code == 0xc0:
+        return None, pos
+    if code == 0xc2:
+        return False, pos
+    if code == 0xc3:
+        return True, pos
+    if code == 0xcb:
+        return struct.unpack_from(">d", data, pos)[0], pos + 8
+    if code == 0xca:
+        return struct.unpack_from(">f", data, pos)[0], pos + 4
+
+    fixed = _FIXED_INTS.get(code)
+    if fixed is not None:
+        fmt, size = fixed
+        return struct.unpack_from(fmt, data, pos)[0], pos + size
+
+    sized = _SIZED.get(code)
+    if sized is not None:
+        kind, fmt, width = sized
+        size = struct.unpack_from(fmt, data, pos)[0]
+        pos += width
+        if kind == "str":
+            if pos + size > len(data):
+                raise IndexError("string past end of data")
+            return str(data[pos:pos + size], "utf-8"), pos + size
+        if kind == "bin":
+            if pos + size > len(data):
+                raise IndexError("bytes past end of data")
+            return bytes(data[pos:pos + size]), pos + size
+        if kind == "array":
+            return _unpack_array(data, pos, size)
+        return _unpack_map(data, pos, size)
+
+    raise SaveFormatError(f"Unsupported type code 0x{code:02x}")
+
+
+_FIXED_INTS = {
+    0xcc: (">B", 1), 0xcd: (">H", 2), 0xce: (">I", 4), 0xcf: (">Q", 8),
+    0xd0: (">b", 1), 0xd1: (">h", 2), 0xd2: (">i", 4), 0xd3: (">q", 8)
+}
+
+_SIZED = {
+    0xd9: ("str", ">B", 1), 0xda: ("str", ">H", 2), 0xdb: ("str", ">I", 4),
+    0xc4: ("bin", ">B", 1), 0xc5: ("bin", ">H", 2), 0xc6: ("bin", ">I", 4),
+    0xdc: ("array", ">H", 2), 0xdd: ("array", ">I", 4),
+    0xde: ("map", ">H", 2), 0xdf: ("map", ">I", 4)
+}
+
+
+def _unpack_array(data: memoryview, pos: int, size: int) -> Tuple[List[Any], int]:
+    items = []
+    for _ in range(size):
+        item, pos = _unpack_from(data, pos)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(data: memoryview, pos: int, size: int) -> Tuple[Dict[Any, Any], int]:
+    result = {}
+    for _ in range(size):
+        key, pos = _unpack_from(data, pos)
+        value, pos = _unpack_from(data, pos)
+        result[key] = value
+    return result, pos
+
+
+# Container
+
+def copy_tree(value: Any) -> Any:
+    """
+    Copy a value the way it will be encoded, sharing nothing mutable with it.
+
+    Used to snapshot live game data so it can be encoded later, e.g. on
+    another thread, while the game keeps changing the original.
+    """
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    if isinstance(value, dict):
+        return {key: copy_tree(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [copy_tree(item) for item in value]
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if isinstance(value, MutableMapping):
+        return {key: copy_tree(item) for key, item in value.items()}
+    if isinstance(value, UserList):
+        return [copy_tree(item) for item in value]
+    return str(value)
+
+
+class RawSection:
+    """A section's stored bytes, copied into a new file without decoding"""
+
+    def __init__(self, data: bytes, flags: int):
+        self.data = data
+        self.flags = flags
+
+
+def encode_section(value: Any) -> RawSection:
+    """Encode (and compress if worthwhile) one section value"""
+    data = pack(value)
+    if len(data) >= COMPRESS_MIN_SIZE:
+        compressed = zlib.compress(data, 6)
+        if len(compressed) < len(data):
+            return RawSection(compressed, FLAG_ZLIB)
+    return RawSection(data, 0)
+
+
+class SectionRef:
+    """A section of an existing save file, copied byte for byte when written"""
+
+    def __init__(self, save_file: "SaveFile", name: str):
+        self.save_file = save_file
+        self.name = name
+
+    def read_raw(self) -> RawSection:
+        return self.save_file.read_raw(self.name)
+
+
+def _container_chunks(sections: Iterable[Tuple[str, Any]]) -> List[bytes]:
+    """Header, section table and payloads of a save container, in file order"""
+    entries = []
+    for name, value in sections:
+        if isinstance(value, RawSection):
+            raw = value
+        elif isinstance(value, SectionRef):
+            raw = value.read_raw()
+        else:
+            raw = encode_section(value)
+        entries.append((name.encode("utf-8"), raw))
+
+    table_size = sum(1 + len(name) + _ENTRY.size for name, _ in entries)
+    offset = _HEADER.size + table_size
+
+    table = bytearray()
+    for name, raw in entries:
+        table.append(len(name))
+        table += name
+        table += _ENTRY.pack(raw.flags, offset, len(raw.data), zlib.crc32(raw.data))
+        offset += len(raw.data)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), table_size)
+    return [header, bytes(table)] + [raw.data for _, raw in entries]
+
+
+def pack_save_container(sections: Iterable[Tuple[str, Any]]) -> bytes:
+    """The bytes write_save_file() would write, built in memory (for snapshots)"""
+    return b"".join(_container_chunks(sections))
+
+
+def write_save_file(path: str, sections: Iterable[Tuple[str, Any]], durable: bool = False) -> int:
+    """
+    Write a save container atomically.
+
+    Args:
+        path: Destination file
+        sections: (name, value) pairs in file order; RawSection values are
+            written as stored and SectionRef values copied from their file
+        durable: fsync the file and its directory so the save survives a crash
+
+    Returns:
+        CRC-32 of the whole file, as file_checksum() computes it
+    """
+    chunks = _container_chunks(sections)
+    checksum = 0
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+            checksum = zlib.crc32(chunk, checksum)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    if durable:
+        _fsync_directory(os.path.dirname(os.path.abspath(path)))
+    return checksum
+
+
+def file_checksum(path: str, chunk_size: int = 1 << 16) -> int:
+    """CRC-32 of a file's bytes, read in chunks without decoding anything"""
+    checksum = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            checksum = zlib.crc32(chunk, checksum)
+    return checksum
+
+
+def _fsync_directory(directory: str):
+    """Flush a directory entry (the rename) to disk where the OS allows it"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on Windows
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SaveFile:
+    """Read access to a save container; sections are read on demand"""
+
+    def __init__(self, path: str):
+        """
+        Open a save file and read its section table.
+
+        Raises:
+            SaveFormatError: If the file is not a compatible save
+        """
+        self.path = path
+        self.sections: Dict[str, Tuple[int, int, int, int]] = {}  # name -> (flags, offset, length, crc)
+
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise SaveFormatError("File too short for a save header")
+            magic, version, count, table_size = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise SaveFormatError("Not a Fantasy RPG save file")
+            if version != FORMAT_VERSION:
+                raise SaveFormatError(f"Unsupported save format version {version}")
+            table = f.read(table_size)
+            self._identity = _file_identity(os.fstat(f.fileno()))
+
+        if len(table) < table_size:
+            raise SaveFormatError("Truncated section table")
+        pos = 0
+        for _ in range(count):
+            name_size = table[pos]
+            name = table[pos + 1:pos + 1 + name_size].decode("utf-8")
+            pos += 1 + name_size
+            self.sections[name] = _ENTRY.unpack_from(table, pos)
+            pos += _ENTRY.size
+
+    def names(self, prefix: str = "") -> List[str]:
+        """Section names in file order, optionally only those with a prefix"""
+        return [name for name in self.sections if name.startswith(prefix)]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sections
+
+    def is_current(self) -> bool:
+        """Whether the path still holds the file that was opened (not replaced since)"""
+        try:
+            return _file_identity(os.stat(self.path)) == self._identity
+        except OSError:
+            return False
+
+    def read_raw(self, name: str) -> RawSection:
+        """
+        Read a section's stored bytes and check them.
+
+        Raises:
+            KeyError: If the section does not exist
+            SaveFormatError: If the bytes fail their checksum
+        """
+        flags, offset, length, crc = self.sections[name]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+        if len(data) != length or zlib.crc32(data) != crc:
+            raise SaveFormatError(f"Section '{name}' is corrupt")
+        return RawSection(data, flags)
+
+    def read(self, name: str) -> Any:
+        """Read and decode one section"""
+        return decode_section(self.read_raw(name))
+
+    def verify(self):
+        """
+        Check every section against its CRC-32 without decoding any.
+
+        Raises:
+            SaveFormatError: If a section is truncated or fails its checksum
+        """
+        with open(self.path, "rb") as f:
+            for name, (flags, offset, length, crc) in self.sections.items():
+                f.seek(offset)
+                data = f.read(length)
+                if len(data) != length or zlib.crc32(data) != crc:
+                    raise SaveFormatError(f"Section '{name}' is corrupt")
+
+
+def _file_identity(stat: os.stat_result) -> Tuple[int, int, int]:
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def decode_section(raw: RawSection) -> Any:
+    """Decode a section's stored bytes"""
+    data = raw.data
+    if raw.flags & FLAG_ZLIB:
+        try:
+            data = zlib.decompress(data)
+        except zlib.error as e:
+            raise SaveFormatError(f"Section data does not decompress: {e}")
+    return unpack(data)
+
+
+# Lazy containers
+
+class LazySectionMap(MutableMapping):
+    """
+    Mapping whose values live in their own sections and are decoded on first access.
+
+    Keys are known up front from the section table. Values set in memory
+    always win over stored ones.
+    """
+
+    def __init__(self, save_file: Optional[SaveFile], section_names: Dict[str, str],
+                 loaded: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            save_file: File the sections are read from
+            section_names: Key -> section name for values not loaded yet
+            loaded: Values already in memory
+        """
+        self.save_file = save_file
+        self._pending = {key: name for key, name in section_names.items() if key not in (loaded or {})}
+        self._values: Dict[str, Any] = dict(loaded or {})
+
+    def __getitem__(self, key):
+        if key not in self._values and key in self._pending:
+            self._values[key] = self.save_file.read(self._pending.pop(key))
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        self._pending.pop(key, None)
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        found = self._pending.pop(key, None) is not None
+        if key in self._values:
+            del self._values[key]
+            found = True
+        if not found:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._values or key in self._pending
+
+    def __iter__(self):
+        yield from list(self._values)
+        yield from [key for key in list(self._pending) if key not in self._values]
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._pending)
+
+    def unloaded(self) -> Dict[str, str]:
+        """Key -> section name for values never decoded"""
+        return dict(self._pending)
+
+    def loaded_items(self) -> List[Tuple[str, Any]]:
+        """(key, value) pairs that are in memory"""
+        return list(self._values.items())
+
+    def rebind(self, save_file: SaveFile, section_names: Dict[str, str]):
+        """Point unloaded values at a newly written file"""
+        self.save_file = save_file
+        self._pending = {key: section_names[key] for key in self._pending if key in section_names}
+
+
+class LazySectionList(UserList):
+    """List decoded from a section the first time it is used"""
+
+    def __init__(self, save_file: Optional[SaveFile], section_name: str):
+        self.save_file = save_file
+        self.section_name = section_name
+        self._data: Optional[list] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def data(self) -> list:
+        if self._data is None:
+            self._data = list(self.save_file.read(self.section_name))
+        return self._data
+
+    @data.setter
+    def data(self, value: list):
+        self._data = value
+
+    def rebind(self, save_file: SaveFile):
+        """Point an unloaded list at a newly written file"""
+        self.save_file = save_file
@@ -0,0 +1,307 @@
+"""
+Fantasy RPG - Save Index
+
+Slot metadata for every save in a directory, kept in one small JSON file.
+
+Each save also stores its metadata in its own "summary" section, but listing
+saves from the index needs nothing but one directory scan: a slot whose
+file size and modification time still match its index entry is shown from
+the entry without opening the save. Slots the index does not know (or that
+changed behind its back) have just their summary section read, and the
+index is updated so the next listing is instant again.
+
+Entries also hold the CRC-32 of the whole file as it was written, so a save
+damaged on disk is detected before any of its sections is decoded. A file
+that no longer matches that checksum is not necessarily damaged: another
+slot's save may have been copied over it, or the game may have stopped
+between writing a save and recording it. Such a file is checked section by
+section against the CRCs in its own section table, and re-indexed if every
+section passes; only a file whose container fails is reported as damaged.
+
+The index is rewritten atomically (temporary file and rename) and guarded
+by a lock, since autosaves record their slots from a worker thread.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .save_codec import SaveFile, SaveFormatError, file_checksum
+except ImportError:
+    from fantasy_rpg.game.save_codec import SaveFile, SaveFormatError, file_checksum
+
+
+SAVE_INDEX_FILE = "save_index.json"
+INDEX_VERSION = 1
+
+# Save files listed in the index
+INDEXED_EXTENSION = ".sav"
+
+# Serializes read-modify-write of index files across SaveIndex instances
+_index_lock = threading.Lock()
+
+
+@dataclass
+class SaveSlot:
+    """One save as shown on a load screen"""
+    name: str  # Save name without extension
+    filename: str
+    summary: Dict[str, Any] = field(default_factory=dict)
+    size: int = 0
+    checksum: Optional[int] = None
+    status: str = "ok"  # "ok" or "damaged"
+
+    @property
+    def headline(self) -> str:
+        return self.summary.get("headline", self.name)
+
+
+class SaveIndex:
+    """Index of the save slots in one directory"""
+
+    def __init__(self, directory: str = ".", index_file: str = SAVE_INDEX_FILE):
+        """
+        Args:
+            directory: Directory holding the saves and the index file
+            index_file: Name of the index file inside the directory
+        """
+        self.directory = directory
+        self.index_file = index_file
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, self.index_file)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Index entries by file name (empty if the index is missing or unreadable)"""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("slots", {})
+
+    def _store(self, slots: Dict[str, Dict[str, Any]]):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"version": INDEX_VERSION, "slots": slots}, f, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+
+    def record(self, path: str, summary: Dict[str, Any], checksum: Optional[int]):
+        """
+        Add or replace a slot's entry after its file was written.
+
+        Args:
+            path: Save file that was written
+            summary: Slot metadata (the save's summary section)
+            checksum: CRC-32 of the whole file
+        """
+        entry = dict(_file_fields(path), summary=summary, checksum=checksum)
+        with _index_lock:
+            slots = self._load()
+            slots[os.path.basename(path)] = entry
+            self._store(slots)
+
+    def forget(self, path: str):
+        """Drop a slot's entry"""
+        with _index_lock:
+            slots = self._load()
+            if slots.pop(os.path.basename(path), None) is not None:
+                self._store(slots)
+
+    def verify(self, path: str) -> Tuple[bool, str]:
+        """
+        Check a save file against its recorded checksum without decoding it.
+
+        Returns:
+            Tuple of (False, reason) if the file is damaged; (True, message)
+            otherwise, including when no checksum is known for the file
+        """
+        entry = self._load().get(os.path.basename(path))
+        if entry is None or entry.get("checksum") is None:
+            return True, "No checksum recorded"
+        try:
+            checksum = file_checksum(path)
+        except OSError as e:
+            return False, f"cannot be read ({e})"
+        if checksum == entry["checksum"]:
+            return True, "Checksum matches"
+
+        entry = _verified_entry(path)
+        if entry is None:
+            return False, "checksum mismatch"
+        try:
+            with _index_lock:
+                slots = self._load()
+                slots[os.path.basename(path)] = entry
+                self._store(slots)
+        except OSError as e:
+            print(f"Warning: Could not update save index: {e}")
+        return True, "Sections intact, re-indexed"
+
+    def slot(self, path: str) -> Optional[SaveSlot]:
+        """
+        Describe one save, from the index when its entry is current.
+
+        Returns:
+            SaveSlot, or None if the file does not exist
+        """
+        if not os.path.exists(path):
+            return None
+        with _index_lock:
+            slots = self._load()
+            slot, entry = self._slot_for(os.path.basename(path), slots)
+            if entry is not None:
+                slots[slot.filename] = entry
+                self._store(slots)
+        return slot
+
+    def _slot_for(self, filename: str, slots: Dict[str, Dict[str, Any]]) -> Tuple[SaveSlot, Optional[Dict[str, Any]]]:
+        """
+        SaveSlot for a file, plus a new index entry if the old one was missing or stale.
+        """
+        name = filename[:-len(INDEXED_EXTENSION)] if filename.endswith(INDEXED_EXTENSION) else filename
+        path = os.path.join(self.directory, filename)
+        entry = slots.get(filename)
+        new_entry = None
+        if entry is not None and not _matches(entry, path):
+            if entry.get("checksum") is None:
+                entry = None
+            elif _checksum_or_none(path) == entry["checksum"]:
+                # Same bytes under a new timestamp (copied or touched)
+                entry = new_entry = dict(entry, **_file_fields(path))
+            else:
+                # Different bytes: another save, unless its sections fail
+                new_entry = _verified_entry(path)
+                if new_entry is None:
+                    return SaveSlot(name, filename, entry.get("summary", {}), entry.get("size", 0),
+                                    entry["checksum"], status="damaged"), None
+                entry = new_entry
+        if entry is None:
+            # Unknown to the index: read only its summary section
+            entry = new_entry = _entry_from_file(path)
+            if entry is None:
+                return SaveSlot(name, filename, status="damaged"), None
+        return SaveSlot(name, filename, entry.get("summary", {}), entry.get("size", 0), entry.get("checksum")), new_entry
+
+    def list_slots(self, verify: bool = False) -> List[SaveSlot]:
+        """
+        List every save in the directory, newest first.
+
+        Args:
+            verify: Also check every indexed file against its checksum
+
+        Returns:
+            SaveSlot per save file
+        """
+        with _index_lock:
+            slots = self._load()
+            known = set()
+            changed = False
+            result = []
+
+            try:
+                names = sorted(os.listdir(self.directory or "."))
+            except OSError:
+                names = []
+
+            for filename in names:
+                if not filename.endswith(INDEXED_EXTENSION):
+                    continue
+                known.add(filename)
+                slot, entry = self._slot_for(filename, slots)
+                if entry is not None:
+                    slots[filename] = entry
+                    changed = True
+
+                if verify and slot.status == "ok" and slot.checksum is not None:
+                    path = os.path.join(self.directory, filename)
+                    if _checksum_or_none(path) != slot.checksum:
+                        entry = _verified_entry(path)
+                        if entry is None:
+                            slot.status = "damaged"
+                        else:
+                            slot = SaveSlot(slot.name, filename, entry["summary"], entry["size"], entry["checksum"])
+                            slots[filename] = entry
+                            changed = True
+                result.append(slot)
+
+            # Forget slots whose files are gone
+            for filename in [name for name in slots if name not in known]:
+                del slots[filename]
+                changed = True
+            if changed:
+                try:
+                    self._store(slots)
+                except OSError as e:
+                    print(f"Warning: Could not update save index: {e}")
+
+        result.sort(key=lambda slot: slot.summary.get("saved_at", ""), reverse=True)
+        return result
+
+
+def _matches(entry: Dict[str, Any], path: str) -> bool:
+    """Whether an index entry was recorded for the file as it is now"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+
+def _file_fields(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _checksum_or_none(path: str) -> Optional[int]:
+    try:
+        return file_checksum(path)
+    except OSError:
+        return None
+
+
+def _verified_entry(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Index entry for a file that no longer matches its recorded checksum.
+
+    Returns:
+        Entry with the file's current checksum if every section passes its
+        own CRC, or None if the container is damaged
+    """
+    try:
+        SaveFile(path).verify()
+        checksum = file_checksum(path)
+    except (OSError, SaveFormatError):
+        return None
+    entry = _entry_from_file(path)
+    if entry is None:
+        return None
+    entry["checksum"] = checksum
+    return entry
+
+
+def _entry_from_file(path: str) -> Optional[Dict[str, Any]]:
+    """Index entry built from a save's summary section (no checksum: the file is unverified)"""
+    try:
+        save_file = SaveFile(path)
+        if "summary" in save_file:
+            summary = save_file.read("summary")
+        else:
+            # Saved before slots had summaries: name the character at least
+            character = save_file.read("character")
+            summary = {
+                "character": character.get("name"),
+                "level": character.get("level"),
+                "headline": f"{character.get('name', 'Unknown')}, level {character.get('level', '?')}",
+                "saved_at": save_file.read("meta").get("saved_at", "")
+            }
+        fields = _file_fields(path)
+    except (OSError, SaveFormatError, KeyError, ValueError, AttributeError):
+        return None
+    return dict(fields, summary=summary, checksum=None)
@@ -2,17 +2,77 @@
 Fantasy RPG - Save Manager
 
 Handles all game save/load operations including:
-- Saving complete game state to JSON
-- Loading game state from JSON
+- Saving complete game state to a binary save container (see save_codec.py)
+- Loading game state from save containers and legacy JSON saves
 - Serializing/deserializing all game components
 - World data persistence
+
+Save files are split into sections: one each for the character, player
+state, position, time, weather and world settings, one per world hex, one
+per visited location and one for the event log. Loading decodes the header
+and the sections needed to play; visited locations and the log are decoded
+when first used. Saving re-encodes only what may have changed - hexes whose
+entry was replaced or had its locations generated, locations that were
+loaded - and copies every other section from the previous file unchanged.
+
+Every save also gets a small "summary" section (who, where, when and a
+mini-map thumbnail), and each write is recorded with the file's checksum in
+the directory's save index (see save_index.py), so saves can be listed
+without opening them and damaged files are refused before decoding.
+
+snapshot_sections() captures the same sections without sharing anything
+mutable with the game, so write_snapshot() can write them from a worker
+thread (see autosave.py) while play continues.
 """
 
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List, Optional, Set
 import json
 import os
+import threading
 from datetime import datetime
 
+try:
+    from .save_codec import (
+        LazySectionList, LazySectionMap, RawSection, SaveFile, SaveFormatError, SectionRef,
+        copy_tree, decode_section, encode_section, pack_save_container, write_save_file
+    )
+    from .location_cache import LocationCache
+    from .save_index import SaveIndex, SaveSlot
+except ImportError:
+    from fantasy_rpg.game.save_codec import (
+        LazySectionList, LazySectionMap, RawSection, SaveFile, SaveFormatError, SectionRef,
+        copy_tree, decode_section, encode_section, pack_save_container, write_save_file
+    )
+    from fantasy_rpg.game.location_cache import LocationCache
+    from fantasy_rpg.game.save_index import SaveIndex, SaveSlot
+
+
+SAVE_EXTENSION = ".sav"
+LEGACY_SAVE_EXTENSION = ".json"
+
+# Save data schema version (the dict layout, independent of the container format)
+SAVE_DATA_VERSION = "1.0"
+
+# Held while a save file is written, so a background write never copies
+# sections out of a file that is being replaced
+_save_io_lock = threading.Lock()
+
+# Hexes around the player shown in a save's thumbnail (radius 2 = 5x5)
+THUMBNAIL_RADIUS = 2
+
+# Thumbnail characters by biome keyword, first match wins
+THUMBNAIL_GLYPHS = (
+    ("mountain", "^"), ("alpine", "^"), ("forest", "T"), ("taiga", "T"), ("jungle", "T"),
+    ("swamp", "%"), ("marsh", "%"), ("desert", "."), ("tundra", "*"), ("ice", "*"),
+    ("coast", "~"), ("ocean", "~"), ("grassland", '"'), ("plains", '"'), ("hills", "n")
+)
+
+
+def save_file_exists(save_name: str = "save") -> bool:
+    """Check whether a save (binary or legacy JSON) exists under a name"""
+    return (os.path.exists(f"{save_name}{SAVE_EXTENSION}") or
+            os.path.exists(f"{save_name}{LEGACY_SAVE_EXTENSION}"))
+
 
 class SaveManager:
     """Manages game save and load operations"""
@@ -25,10 +85,19 @@ class SaveManager:
             game_engine: Reference to main GameEngine for accessing game state
         """
         self.game_engine = game_engine
+        
+        # File the current game was last loaded from or saved to
+        self._source: Optional[SaveFile] = None
+        
+        # Hex key -> (signature, encoded section) for hexes known to be unchanged
+        self._hex_cache: Dict[str, Tuple[tuple, RawSection]] = {}
+        
+        # Slot metadata for saves in the working directory
+        self.index = SaveIndex()
     
     def save_game(self, save_name: str = "save") -> Tuple[bool, str]:
         """
-        Save current game state to JSON file.
+        Save current game state to a binary save file.
         
         Args:
             save_name: Name for the save file (without extension)
@@ -42,27 +111,8 @@ class SaveManager:
         try:
             gs = self.game_engine.game_state
             
-            # Create save data structure
-            save_data = {
-                "version": "1.0",
-                "saved_at": datetime.now().isoformat(),
-                "game_info": {
-                    "world_seed": gs.world_seed,
-                    "created_at": gs.created_at.isoformat(),
-                    "play_time_minutes": gs.play_time_minutes
-                },
-                "character": self._serialize_character(gs.character),
-                "player_state": self._serialize_player_state(gs.player_state),
-                "world_position": self._serialize_world_position(gs.world_position),
-                "game_time": self._serialize_game_time(gs.game_time),
-                "weather": self._serialize_weather(gs.current_weather),
-                "world_data": self._serialize_world_data()
-            }
-            
-            # Save to JSON file
-            filename = f"{save_name}.json"
-            with open(filename, 'w') as f:
-                json.dump(save_data, f, indent=2, default=str)
+            filename = f"{save_name}{SAVE_EXTENSION}"
+            self._write_save_file(filename)
             
             # Update last saved time
             gs.last_saved = datetime.now()
@@ -72,9 +122,61 @@ class SaveManager:
         except Exception as e:
             return False, f"Failed to save game: {str(e)}"
     
+    def build_snapshot(self) -> bytes:
+        """
+        The current game as save container bytes, without writing a file.
+        
+        Built like a save: unchanged hexes and never-loaded locations are
+        copied as stored rather than decoded, so a snapshot right after a
+        load stays cheap. Load it by writing it to a .sav file.
+        """
+        sections = self._build_sections()
+        with _save_io_lock:
+            return pack_save_container(sections)
+    
+    def build_save_data(self) -> dict:
+        """
+        Serialize the complete current game state.
+        
+        Returns:
+            JSON-serializable save data dictionary
+        """
+        gs = self.game_engine.game_state
+        
+        world_data = self._serialize_world_data(text=True)
+        pager = self._location_pager()
+        if pager is not None:
+            world_data["hex_data"] = {key: pager.complete_hex_info(key, info)
+                                      for key, info in world_data.get("hex_data", {}).items()}
+        
+        visited = getattr(gs, 'persistent_locations', None) or {}
+        if isinstance(visited, LocationCache):
+            # Read evicted locations without pulling them all back into memory
+            visited_locations = dict(visited.items_uncached())
+        else:
+            visited_locations = dict(visited)
+        
+        return {
+            "version": SAVE_DATA_VERSION,
+            "saved_at": datetime.now().isoformat(),
+            "game_info": {
+                "world_seed": gs.world_seed,
+                "created_at": gs.created_at.isoformat(),
+                "play_time_minutes": gs.play_time_minutes
+            },
+            "character": self._serialize_character(gs.character),
+            "player_state": self._serialize_player_state(gs.player_state),
+            "world_position": self._serialize_world_position(gs.world_position),
+            "game_time": self._serialize_game_time(gs.game_time),
+            "weather": self._serialize_weather(gs.current_weather),
+            "world_data": world_data,
+            "visited_locations": visited_locations,
+            "event_journal": list(gs.event_journal)
+        }
+    
     def load_game(self, save_name: str = "save") -> Tuple[bool, str]:
         """
-        Load game state from JSON save file.
+        Load game state from a save file (binary, or legacy JSON).
         
         Args:
             save_name: Name of save file to load (without extension)
@@ -83,70 +185,401 @@ class SaveManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            filename = f"{save_name}.json"
-            
-            # Check if save file exists
-            if not os.path.exists(filename):
-                return False, f"Save file {filename} not found."
+            filename = f"{save_name}{SAVE_EXTENSION}"
+            legacy_filename = f"{save_name}{LEGACY_SAVE_EXTENSION}"
             
             # Load save data
-            with open(filename, 'r') as f:
-                save_data = json.load(f)
-            
-            # Validate save file version
-            if save_data.get("version") != "1.0":
-                return False, f"Incompatible save file version: {save_data.get('version', 'unknown')}"
-            
-            # Create world coordinator without generating new world
-            world_seed = save_data["game_info"]["world_seed"]
-            
-            # Import WorldCoordinator
-            from world.world_coordinator import WorldCoordinator
-            
-            # Create WorldCoordinator with skip_generation flag
-            self.game_engine.world_coordinator = WorldCoordinator(
-                world_size=self.game_engine.world_size,
-                seed=world_seed,
-                skip_generation=True  # Don't generate - we'll restore from save
-            )
-            
-            # Deserialize game state components
-            character = self._deserialize_character(save_data["character"])
-            player_state = self._deserialize_player_state(save_data["player_state"], character)
-            world_position = self._deserialize_world_position(save_data["world_position"])
-            game_time = self._deserialize_game_time(save_data["game_time"])
-            weather = self._deserialize_weather(save_data["weather"])
-            
-            # Initialize time system
-            from game.time_system import TimeSystem
-            self.game_engine.time_system = TimeSystem(player_state)
-            
-            # Restore world data from save file
-            self._deserialize_world_data(save_data["world_data"])
-            
-            # Import GameState
-            from game.game_engine import GameState
-            
-            # Create game state
-            self.game_engine.game_state = GameState(
-                character=character,
-                player_state=player_state,
-                world_position=world_position,
-                game_time=game_time,
-                current_weather=weather,
-                world_seed=world_seed,
-                created_at=datetime.fromisoformat(save_data["game_info"]["created_at"]),
-                last_saved=datetime.fromisoformat(save_data["saved_at"]),
-                play_time_minutes=save_data["game_info"]["play_time_minutes"]
-            )
+            if os.path.exists(filename):
+                # Checked against the index before anything is decoded
+                intact, reason = self._index_for(filename).verify(filename)
+                if not intact:
+                    return False, f"Failed to load game: save file is damaged ({reason})"
+                save_data = self._read_save_file(filename)
+            elif os.path.exists(legacy_filename):
+                filename = legacy_filename
+                with open(filename, 'r') as f:
+                    save_data = json.load(f)
+                self._source = None
+            else:
+                return False, f"Save file {filename} not found."
             
-            self.game_engine.is_initialized = True
+            success, message = self.restore_save_data(save_data)
+            if not success:
+                return False, message
             
             return True, f"Game loaded from {filename}"
             
+        except SaveFormatError as e:
+            return False, f"Failed to load game: save file is damaged ({e})"
         except Exception as e:
             return False, f"Failed to load game: {str(e)}"
     
+    def _write_save_file(self, filename: str):
+        """Write the current game to a save container"""
+        gs = self.game_engine.game_state
+        sections = self._build_sections()
+        with _save_io_lock:
+            checksum = write_save_file(filename, sections)
+            self._record_slot(filename, sections, checksum)
+            
+            # Unloaded sections now live in the new file
+            self._source = SaveFile(filename)
+        visited = getattr(gs, 'persistent_locations', None)
+        if isinstance(visited, LazySectionMap):
+            visited.rebind(self._source, {key: f"loc:{key}" for key in visited})
+        if isinstance(gs.event_journal, LazySectionList):
+            gs.event_journal.rebind(self._source)
+    
+    def _build_sections(self) -> List[Tuple[str, Any]]:
+        """Build the (name, value) section list for the current game"""
+        gs = self.game_engine.game_state
+        
+        world_data = self._serialize_world_data()
+        hex_data = world_data.pop("hex_data", {})
+        world_data.pop("persistent_locations", None)
+        
+        visited = getattr(gs, 'persistent_locations', None) or {}
+        position = self._serialize_world_position(gs.world_position)
+        
+        # Refer to the world's copy of the hex and the visited location
+        # instead of storing them twice
+        hex_id = position["hex_id"]
+        hex_info = hex_data.get(hex_id)
+        if hex_info is not None and (position["hex_data"] is hex_info or position["hex_data"] == hex_info):
+            position["hex_data"] = None
+            position["hex_data_ref"] = hex_id
+            locations = hex_info.get("locations")
+            if locations is not None and (position["available_locations"] is locations or
+                                          position["available_locations"] == locations):
+                position["available_locations"] = None
+                position["available_locations_ref"] = True
+        
+        location_key = f"{hex_id}_{position['current_location_id']}"
+        if position["current_location_data"] is not None and location_key in visited and \
+                visited[location_key] is position["current_location_data"]:
+            position["current_location_data"] = None
+            position["current_location_key"] = location_key
+        
+        sections = [
+            ("meta", {
+                "version": SAVE_DATA_VERSION,
+                "saved_at": datetime.now().isoformat(),
+                "game_info": {
+                    "world_seed": gs.world_seed,
+                    "created_at": gs.created_at.isoformat(),
+                    "play_time_minutes": gs.play_time_minutes
+                }
+            }),
+            ("summary", self._build_summary(position)),
+            ("character", self._serialize_character(gs.character)),
+            ("player_state", self._serialize_player_state(gs.player_state)),
+            ("world_position", position),
+            ("game_time", self._serialize_game_time(gs.game_time)),
+            ("weather", self._serialize_weather(gs.current_weather)),
+            ("world", world_data)
+        ]
+        
+        # One section per hex, reused while the hex is unchanged
+        pager = self._location_pager()
+        hex_cache = {}
+        for key, info in hex_data.items():
+            signature = self._hex_signature(info)
+            cached = self._hex_cache.get(key)
+            if cached and cached[0] == signature:
+                raw = cached[1]
+            else:
+                raw = encode_section(pager.complete_hex_info(key, info) if pager is not None else info)
+            hex_cache[key] = (signature, raw)
+            sections.append((f"hex:{key}", raw))
+        self._hex_cache = hex_cache
+        
+        # One section per visited location; never-loaded and evicted ones are copied as stored
+        if isinstance(visited, LazySectionMap):
+            for key, value in visited.loaded_items():
+                sections.append((f"loc:{key}", value))
+            if isinstance(visited, LocationCache):
+                for key, name in visited.spilled().items():
+                    sections.append((f"loc:{key}", SectionRef(visited.spill, name)))
+            for key, name in visited.unloaded().items():
+                sections.append((f"loc:{key}", SectionRef(visited.save_file, name)))
+        else:
+            for key, value in visited.items():
+                sections.append((f"loc:{key}", value))
+        
+        journal = gs.event_journal
+        if isinstance(journal, LazySectionList) and not journal.loaded:
+            sections.append(("log", SectionRef(journal.save_file, journal.section_name)))
+        else:
+            sections.append(("log", list(journal)))
+        
+        return sections
+    
+    def _build_summary(self, position: dict) -> dict:
+        """Slot metadata shown when listing saves (the "summary" section)"""
+        gs = self.game_engine.game_state
+        character = gs.character
+        hex_id = position["hex_id"]
+        hex_info = self.game_engine.world_coordinator.hex_data.get(hex_id) or gs.world_position.hex_data or {}
+        
+        location = hex_info.get("name", f"Hex {hex_id}")
+        location_data = gs.world_position.current_location_data
+        if location_data:
+            location += f" ({location_data.get('name', 'Unknown')})"
+        
+        game_time = gs.game_time
+        summary = {
+            "character": character.name,
+            "race": character.race,
+            "character_class": character.character_class,
+            "level": character.level,
+            "hp": character.hp,
+            "max_hp": character.max_hp,
+            "location": location,
+            "hex_id": hex_id,
+            "game_time": f"Year {game_time.year}, day {game_time.day}, "
+                         f"{game_time.hour:02d}:{game_time.minute:02d} ({game_time.season})",
+            "play_time_minutes": gs.play_time_minutes,
+            "saved_at": datetime.now().isoformat(),
+            "thumbnail": self._build_thumbnail(hex_id)
+        }
+        summary["headline"] = (f"{character.name}, level {character.level} {character.race} "
+                               f"{character.character_class} - {location}")
+        return summary
+    
+    def _build_thumbnail(self, hex_id: str) -> List[str]:
+        """Rows of a small map around the player ('@'), one character per hex"""
+        world = self.game_engine.world_coordinator
+        if not isinstance(hex_id, str) or len(hex_id) != 4 or not hex_id.isdigit():
+            return []
+        x, y = int(hex_id[:2]), int(hex_id[2:])
+        
+        rows = []
+        for dy in range(-THUMBNAIL_RADIUS, THUMBNAIL_RADIUS + 1):
+            row = ""
+            for dx in range(-THUMBNAIL_RADIUS, THUMBNAIL_RADIUS + 1):
+                info = world.hex_data.get(f"{x + dx:02d}{y + dy:02d}") if x + dx >= 0 and y + dy >= 0 else None
+                if dx == 0 and dy == 0:
+                    row += "@"
+                elif info is None:
+                    row += " "
+                elif info.get("river") or info.get("lake"):
+                    row += "~"
+                else:
+                    biome = str(info.get("biome", ""))
+                    row += next((glyph for keyword, glyph in THUMBNAIL_GLYPHS if keyword in biome), "?")
+            rows.append(row)
+        return rows
+    
+    def _index_for(self, filename: str) -> SaveIndex:
+        """Save index of the directory a save file is in"""
+        directory = os.path.dirname(filename)
+        return SaveIndex(directory) if directory else self.index
+    
+    def _record_slot(self, filename: str, sections: List[Tuple[str, Any]], checksum: int):
+        """Record a freshly written save in its directory's index"""
+        summary = next((value for name, value in sections if name == "summary"), None)
+        if summary is None:
+            return
+        try:
+            self._index_for(filename).record(filename, summary, checksum)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not update save index: {e}")
+    
+    def list_saves(self, verify: bool = False) -> List[SaveSlot]:
+        """
+        List saves in the working directory, newest first, from the save index.
+        
+        Args:
+            verify: Also check every save against its recorded checksum
+        """
+        return self.index.list_slots(verify=verify)
+    
+    def describe_save(self, save_name: str = "save") -> Optional[SaveSlot]:
+        """Slot metadata for one save, or None if it has no binary save file"""
+        filename = f"{save_name}{SAVE_EXTENSION}"
+        try:
+            return self._index_for(filename).slot(filename)
+        except OSError:
+            return None
+    
+    def snapshot_sections(self) -> List[Tuple[str, Any]]:
+        """
+        Capture the current game as save sections that share nothing mutable with it.
+        
+        Cheap enough to run between commands: unchanged hexes are reused
+        encoded bytes and never-loaded sections are references into their
+        save file, so only the live parts of the state are copied.
+        
+        Returns:
+            Section list for write_snapshot()
+        """
+        return [(name, value if isinstance(value, (RawSection, SectionRef)) else copy_tree(value))
+                for name, value in self._build_sections()]
+    
+    def write_snapshot(self, filename: str, sections: List[Tuple[str, Any]]):
+        """
+        Write snapshot sections durably (fsync and atomic rename).
+        
+        Safe to call from a worker thread.
+        
+        Raises:
+            SaveFormatError: If a save file the snapshot copies from was
+                replaced after the snapshot was taken
+        """
+        with _save_io_lock:
+            sources = {id(value.save_file): value.save_file
+                       for _, value in sections if isinstance(value, SectionRef)}
+            for save_file in sources.values():
+                if not save_file.is_current():
+                    raise SaveFormatError(f"{save_file.path} was replaced after the snapshot")
+            checksum = write_save_file(filename, sections, durable=True)
+            self._record_slot(filename, sections, checksum)
+    
+    def files_in_use(self) -> Set[str]:
+        """Absolute paths of save files the current game still reads sections from"""
+        gs = self.game_engine.game_state
+        paths = set()
+        for container in (getattr(gs, 'persistent_locations', None), getattr(gs, 'event_journal', None)):
+            save_file = getattr(container, 'save_file', None)
+            if save_file is not None:
+                paths.add(os.path.abspath(save_file.path))
+        return paths
+    
+    def _read_save_file(self, filename: str) -> dict:
+        """
+        Read a save container into save data for restore_save_data().
+        
+        Visited locations and the event log are returned as lazy containers
+        that decode their sections on first use.
+        """
+        save_file = SaveFile(filename)
+        save_data = save_file.read("meta")
+        
+        # Hexes are needed to play; remember their encoding for the next save
+        hex_data = {}
+        self._hex_cache = {}
+        for name in save_file.names("hex:"):
+            raw = save_file.read_raw(name)
+            info = decode_section(raw)
+            key = name[len("hex:"):]
+            hex_data[key] = info
+            self._hex_cache[key] = (self._hex_signature(info), raw)
+        
+        world_data = save_file.read("world")
+        world_data["hex_data"] = hex_data
+        
+        visited = LazySectionMap(save_file, {name[len("loc:"):]: name for name in save_file.names("loc:")})
+        
+        position = save_file.read("world_position")
+        if position.pop("hex_data_ref", None) is not None:
+            position["hex_data"] = hex_data.get(position["hex_id"], {})
+            if position.pop("available_locations_ref", False):
+                position["available_locations"] = position["hex_data"].get("locations", [])
+        location_key = position.pop("current_location_key", None)
+        if location_key is not None:
+            position["current_location_data"] = visited[location_key]
+        
+        save_data.update({
+            "character": save_file.read("character"),
+            "player_state": save_file.read("player_state"),
+            "world_position": position,
+            "game_time": save_file.read("game_time"),
+            "weather": save_file.read("weather"),
+            "world_data": world_data,
+            "visited_locations": visited,
+            "event_journal": LazySectionList(save_file, "log") if "log" in save_file else []
+        })
+        
+        self._source = save_file
+        return save_data
+    
+    def _location_pager(self):
+        """The world's HexLocationPager, if hex locations are paged to disk"""
+        return getattr(self.game_engine.world_coordinator, 'location_pager', None)
+    
+    @staticmethod
+    def _hex_signature(hex_info: dict) -> tuple:
+        """Cheap fingerprint of the hex fields that change during play"""
+        return (id(hex_info), hex_info.get("locations_generated"),
+                len(hex_info.get("locations") or ()), "location_graph" in hex_info)
+    
+    def restore_save_data(self, save_data: dict) -> Tuple[bool, str]:
+        """
+        Replace the current game state with serialized save data.
+        
+        Args:
+            save_data: Dictionary produced by build_save_data()
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        # Validate save file version
+        if save_data.get("version") != SAVE_DATA_VERSION:
+            return False, f"Incompatible save file version: {save_data.get('version', 'unknown')}"
+        
+        # Create world coordinator without generating new world
+        world_seed = save_data["game_info"]["world_seed"]
+        world_size = save_data.get("world_data", {}).get("world_size")
+        if world_size:
+            self.game_engine.world_size = tuple(world_size)
+        
+        # Import WorldCoordinator
+        from world.world_coordinator import WorldCoordinator
+        
+        # Create WorldCoordinator with skip_generation flag
+        self.game_engine.world_coordinator = WorldCoordinator(
+            world_size=self.game_engine.world_size,
+            seed=world_seed,
+            skip_generation=True  # Don't generate - we'll restore from save
+        )
+        
+        # Deserialize game state components
+        character = self._deserialize_character(save_data["character"])
+        player_state = self._deserialize_player_state(save_data["player_state"], character)
+        world_position = self._deserialize_world_position(save_data["world_position"])
+        game_time = self._deserialize_game_time(save_data["game_time"])
+        weather = self._deserialize_weather(save_data["weather"])
+        
+        # Survival effects read the weather from PlayerState (set directly to
+        # skip the on-entry wetness update, which was applied before saving)
+        player_state.current_weather = weather
+        
+        # Initialize time system
+        from game.time_system import TimeSystem
+        self.game_engine.time_system = TimeSystem(player_state)
+        
+        # Restore world data from save file
+        self._deserialize_world_data(save_data["world_data"], world_position.coords)
+        
+        # Import GameState
+        from game.game_engine import GameState
+        
+        # Create game state
+        self.game_engine.game_state = GameState(
+            character=character,
+            player_state=player_state,
+            world_position=world_position,
+            game_time=game_time,
+            current_weather=weather,
+            world_seed=world_seed,
+            created_at=datetime.fromisoformat(save_data["game_info"]["created_at"]),
+            last_saved=datetime.fromisoformat(save_data["saved_at"]),
+            play_time_minutes=save_data["game_info"]["play_time_minutes"],
+            event_journal=save_data.get("event_journal", [])
+        )
+        
+        # Visited locations; the current one must be the same object the
+        # position refers to so changes made inside it are kept
+        visited = save_data.get("visited_locations") or {}
+        if world_position.current_location_id and world_position.current_location_data is not None:
+            location_key = f"{world_position.hex_id}_{world_position.current_location_id}"
+            visited[location_key] = world_position.current_location_data
+        self.game_engine.attach_location_memory(visited)
+        
+        self.game_engine.is_initialized = True
+        
+        return True, "Game state restored."
+    
     # Serialization helper methods
     
     def _serialize_character(self, character) -> dict:
@@ -392,8 +825,14 @@ class SaveManager:
             lightning_risk=data.get("lightning_risk", 0.0)
         )
     
-    def _serialize_world_data(self) -> dict:
-        """Serialize world coordinator data"""
+    def _serialize_world_data(self, text: bool = False) -> dict:
+        """
+        Serialize world coordinator data
+        
+        Args:
+            text: Keep the data JSON-serializable (binary saves store the
+                fog of war bitsets as raw bytes)
+        """
         if not self.game_engine.world_coordinator:
             return {}
         
@@ -413,15 +852,30 @@ class SaveManager:
         if hasattr(self.game_engine.world_coordinator, 'persistent_locations'):
             persistent_locations = self.game_engine.world_coordinator.persistent_locations
         
+        # Get weather field state
+        weather_field = getattr(self.game_engine.world_coordinator, 'weather_field', None)
+        
+        # Fog of war bitsets, run-length encoded
+        exploration = getattr(self.game_engine.world_coordinator, 'exploration', None)
+        
         return {
             "hex_data": world_data,
             "persistent_locations": persistent_locations,
+            "weather_field": weather_field.to_dict() if weather_field else None,
+            "exploration": exploration.to_dict(text=text) if exploration else None,
             "world_size": self.game_engine.world_size,
             "world_seed": self.game_engine.game_state.world_seed if self.game_engine.game_state else None
         }
     
-    def _deserialize_world_data(self, data: dict):
-        """Deserialize world coordinator data"""
+    def _deserialize_world_data(self, data: dict, position: Optional[Tuple[int, int]] = None):
+        """
+        Deserialize world coordinator data
+        
+        Args:
+            data: Output of _serialize_world_data()
+            position: Player's hex, seen from when rebuilding the fog of war
+                of a save made before it was tracked
+        """
         if not self.game_engine.world_coordinator:
             return
         
@@ -443,3 +897,19 @@ class SaveManager:
             if not hasattr(self.game_engine.world_coordinator, 'persistent_locations'):
                 self.game_engine.world_coordinator.persistent_locations = {}
             self.game_engine.world_coordinator.persistent_locations.update(data["persistent_locations"])
+        
+        # Restore weather field state
+        weather_field = getattr(self.game_engine.world_coordinator, 'weather_field', None)
+        if weather_field and data.get("weather_field"):
+            weather_field.load_dict(data["weather_field"])
+        
+        # Restore the fog of war; saves from before it existed get it from
+        # the hexes whose locations were generated (the ones stopped in)
+        world = self.game_engine.world_coordinator
+        exploration = getattr(world, 'exploration', None)
+        if exploration and not (data.get("exploration") and exploration.load_dict(data["exploration"])):
+            for hex_id, hex_info in data.get("hex_data", {}).items():
+                if hex_info.get("locations_generated") and hex_info.get("coords"):
+                    world.reveal_from(tuple(hex_info["coords"]))
+            if position:
+                world.reveal_from(tuple(position))
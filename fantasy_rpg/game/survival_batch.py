@@ -0,0 +1,318 @@
+"""
+Fantasy RPG - Survival Batch
+
+Survival needs for many actors at once - party members, companions, animals.
+
+PlayerState tracks one character: every step re-derives the same weather,
+activity and shelter terms and updates one need at a time through several
+method calls. SurvivalBatch stores each need as one contiguous array with
+an entry per actor (hunger, thirst, fatigue, body temperature, wetness,
+wind chill). A step works out every term that does not depend on the actor
+once - a loss per activity, a drying rate per shelter level, a cooling per
+condition - and then updates each array in a single pass over all actors.
+
+The rules are PlayerState's: for the same needs, activity, weather and
+conditions a batch step gives exactly the numbers PlayerState does.
+Conditions are not evaluated here. Shelter, a lit fire and wind chill are
+set per actor (set_environment() or set_conditions()), and Wet/Soaked come
+from the actor's wetness with the thresholds read from their conditions.json
+triggers (wetness_thresholds()).
+"""
+
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .player_state import (
+        DEFAULT_WEATHER_RESISTANCE, FATIGUE_ACTIVITY_RATES, HUNGER_ACTIVITY_MODIFIERS, HUNGER_BASE_RATE,
+        THIRST_ACTIVITY_MODIFIERS, THIRST_BASE_RATE, SurvivalNeeds
+    )
+except ImportError:
+    from fantasy_rpg.game.player_state import (
+        DEFAULT_WEATHER_RESISTANCE, FATIGUE_ACTIVITY_RATES, HUNGER_ACTIVITY_MODIFIERS, HUNGER_BASE_RATE,
+        THIRST_ACTIVITY_MODIFIERS, THIRST_BASE_RATE, SurvivalNeeds
+    )
+
+
+# Activities by code; anything else is treated as "normal", as PlayerState does
+ACTIVITIES = ("normal", "resting", "active", "strenuous", "unconscious")
+_ACTIVITY_CODES = {name: code for code, name in enumerate(ACTIVITIES)}
+
+# Shelter levels by code, with the condition that grants each
+SHELTER_LEVELS = (None, "natural", "good", "excellent")
+SHELTER_CONDITIONS = {"Natural Shelter": 1, "Good Shelter": 2, "Excellent Shelter": 3}
+
+# Per shelter level: extra fatigue recovered per hour of rest, fraction of
+# temperature change let through, fraction of rain and wind kept out and
+# extra drying per hour (a lit fire dries instead of shelter)
+SHELTER_REST_BONUS = (0, 2, 3, 5)
+SHELTER_STABILIZATION = (1.0, 0.65, 0.35, 0.15)
+SHELTER_EXPOSURE_REDUCTION = (0.0, 0.5, 0.75, 1.0)
+SHELTER_DRYING_BONUS = (0, 3, 5, 8)
+FIRE_DRYING_BONUS = 15
+
+# Condition flags
+LIT_FIRE = 1
+WIND_CHILLED = 2
+
+# Wetness at which the Wet and Soaked conditions trigger, used only if
+# their conditions.json triggers cannot be read
+WET_THRESHOLD = 200
+SOAKED_THRESHOLD = 350
+
+_WETNESS_TRIGGER = re.compile(r"\bwetness\s*>=\s*(\d+)")
+
+_thresholds: Optional[Tuple[int, int]] = None
+
+# Columns holding survival needs, named as in SurvivalNeeds
+NEED_COLUMNS = ("hunger", "thirst", "fatigue", "body_temperature", "warmth", "wetness", "wind_chill")
+
+
+def wetness_thresholds() -> Tuple[int, int]:
+    """
+    Wetness at which the Wet and Soaked conditions trigger.
+
+    Read once from the "wetness >= N" part of their triggers in the loaded
+    conditions data, so the batch follows conditions.json.
+
+    Returns:
+        Tuple of (wet threshold, soaked threshold)
+    """
+    global _thresholds
+    if _thresholds is None:
+        try:
+            from .conditions import get_conditions_manager
+        except ImportError:
+            from fantasy_rpg.game.conditions import get_conditions_manager
+
+        conditions = get_conditions_manager().conditions_data
+        thresholds = []
+        for name, default in (("Wet", WET_THRESHOLD), ("Soaked", SOAKED_THRESHOLD)):
+            match = _WETNESS_TRIGGER.search(conditions.get(name, {}).get("trigger", ""))
+            if match is None:
+                print(f"Warning: No wetness threshold in the {name} trigger, using {default}")
+            thresholds.append(int(match.group(1)) if match else default)
+        _thresholds = tuple(thresholds)
+    return _thresholds
+
+
+class SurvivalBatch:
+    """Survival needs of many actors, stored as one array per need"""
+
+    def __init__(self):
+        self.actors: List[Any] = []
+
+        # One entry per actor in every array
+        self.hunger = array("i")
+        self.thirst = array("i")
+        self.fatigue = array("i")
+        self.body_temperature = array("i")
+        self.warmth = array("i")
+        self.wetness = array("i")
+        self.wind_chill = array("i")
+        self.cold_resistance = array("i")
+        self.activity = array("b")
+        self.shelter = array("b")
+        self.flags = array("b")
+
+    def __len__(self) -> int:
+        return len(self.actors)
+
+    def _columns(self) -> List[array]:
+        return [getattr(self, name) for name in NEED_COLUMNS] + [
+            self.cold_resistance, self.activity, self.shelter, self.flags]
+
+    def add(self, actor: Any, survival: Optional[SurvivalNeeds] = None, activity: str = "normal",
+            cold_resistance: Optional[int] = None) -> int:
+        """
+        Add an actor.
+
+        Args:
+            actor: Anything identifying the actor (a character, an animal, a name)
+            survival: Starting needs (default: SurvivalNeeds())
+            activity: Activity used by advance() when none is given for the step
+            cold_resistance: Effective cold resistance (default: the actor's
+                weather_resistance, as PlayerState uses it)
+
+        Returns:
+            The actor's index in the arrays
+        """
+        survival = survival or SurvivalNeeds()
+        if cold_resistance is None:
+            resistance = getattr(actor, 'weather_resistance', None) or DEFAULT_WEATHER_RESISTANCE
+            cold_resistance = resistance.get_effective_resistance("cold")
+
+        self.actors.append(actor)
+        for name in NEED_COLUMNS:
+            getattr(self, name).append(getattr(survival, name))
+        self.cold_resistance.append(cold_resistance)
+        self.activity.append(_ACTIVITY_CODES.get(activity, 0))
+        self.shelter.append(0)
+        self.flags.append(0)
+        return len(self.actors) - 1
+
+    def remove(self, index: int):
+        """Remove an actor; later actors move down one index"""
+        del self.actors[index]
+        for column in self._columns():
+            del column[index]
+
+    def index_of(self, actor: Any) -> int:
+        """Index of an actor (ValueError if not in the batch)"""
+        for index, candidate in enumerate(self.actors):
+            if candidate is actor:
+                return index
+        raise ValueError(f"{actor!r} is not in the batch")
+
+    def needs(self, index: int) -> SurvivalNeeds:
+        """An actor's needs as a SurvivalNeeds"""
+        return SurvivalNeeds(**{name: getattr(self, name)[index] for name in NEED_COLUMNS})
+
+    def store(self, index: int, survival: SurvivalNeeds):
+        """Overwrite an actor's needs (after eating, drinking, healing...)"""
+        for name in NEED_COLUMNS:
+            getattr(self, name)[index] = getattr(survival, name)
+
+    def set_activity(self, index: int, activity: str):
+        self.activity[index] = _ACTIVITY_CODES.get(activity, 0)
+
+    def set_environment(self, index: int, shelter: Optional[str] = None, lit_fire: bool = False,
+                        wind_chilled: bool = False):
+        """
+        Set what an actor is exposed to.
+
+        Args:
+            shelter: None, "natural", "good" or "excellent"
+            lit_fire: Whether a fire warms the actor
+            wind_chilled: Whether the actor has the Wind Chilled condition
+        """
+        self.shelter[index] = SHELTER_LEVELS.index(shelter)
+        self.flags[index] = (LIT_FIRE if lit_fire else 0) | (WIND_CHILLED if wind_chilled else 0)
+
+    def set_conditions(self, index: int, conditions: Iterable[str]):
+        """Set an actor's shelter, fire and wind chill from active condition names"""
+        conditions = set(conditions)
+        self.shelter[index] = max((SHELTER_CONDITIONS[name] for name in conditions & SHELTER_CONDITIONS.keys()),
+                                  default=0)
+        self.flags[index] = (LIT_FIRE if "Lit Fire" in conditions else 0) | \
+                            (WIND_CHILLED if "Wind Chilled" in conditions else 0)
+
+    def advance(self, hours: float, weather: Any = None, activity: Optional[str] = None):
+        """
+        Advance every actor's needs.
+
+        Args:
+            hours: Hours that passed
+            weather: WeatherState shared by the actors (None: no temperature
+                or exposure changes, as for PlayerState without weather)
+            activity: Activity for every actor this step (default: each
+                actor's own activity)
+        """
+        if not self.actors:
+            return
+        if activity is None:
+            activities = self.activity
+        else:
+            activities = array("b", [_ACTIVITY_CODES.get(activity, 0)]) * len(self.actors)
+
+        self._advance_needs(hours, weather, activities)
+        if weather is not None:
+            self._advance_temperature(hours, weather)
+            self._advance_exposure(hours, weather)
+
+    def _advance_needs(self, hours: float, weather: Any, activities: array):
+        """Hunger, thirst and fatigue"""
+        hunger_loss = [int(HUNGER_BASE_RATE * HUNGER_ACTIVITY_MODIFIERS.get(name, 1.0) * hours)
+                       for name in ACTIVITIES]
+
+        thirst_loss = []
+        for name in ACTIVITIES:
+            rate = THIRST_BASE_RATE * THIRST_ACTIVITY_MODIFIERS.get(name, 1.0)
+            if weather is not None:
+                if weather.temperature > 80:
+                    rate *= 1.5
+                if weather.precipitation == 0 and weather.cloud_cover < 30:
+                    rate *= 1.2
+            thirst_loss.append(int(rate * hours))
+
+        # Change per activity and shelter level (positive recovers)
+        fatigue_change = []
+        for name in ACTIVITIES:
+            if name == "resting":
+                fatigue_change.append([int(30 * hours) + int(bonus * hours) for bonus in SHELTER_REST_BONUS])
+            elif name == "unconscious":
+                fatigue_change.append([int(20 * hours)] * len(SHELTER_LEVELS))
+            else:
+                fatigue_change.append([-int(FATIGUE_ACTIVITY_RATES.get(name, 10) * hours)] * len(SHELTER_LEVELS))
+
+        self.hunger = array("i", [value - loss if value > loss else 0
+                                  for value, loss in zip(self.hunger, map(hunger_loss.__getitem__, activities))])
+        self.thirst = array("i", [value - loss if value > loss else 0
+                                  for value, loss in zip(self.thirst, map(thirst_loss.__getitem__, activities))])
+        self.fatigue = array("i", [min(1000, max(0, value + fatigue_change[code][shelter]))
+                                   for value, code, shelter in zip(self.fatigue, activities, self.shelter)])
+
+    def _advance_temperature(self, hours: float, weather: Any):
+        """Body temperature towards the weather, then wetness, wind and fire"""
+        ambient = weather.feels_like
+        base_target = max(0, min(1000, 200 + (ambient - 32) * 4.5))
+        uses_clothing = ambient < 70
+        change_rates = [0.3 * stabilization * hours for stabilization in SHELTER_STABILIZATION]
+
+        # Active heating and cooling: (normal rate, rate past the emergency threshold)
+        soaked = (int(20 * hours), int(35 * hours))
+        wet = (int(10 * hours), int(18 * hours))
+        wind = (int(15 * hours), int(25 * hours))
+        fire = (int(15 * hours), int(25 * hours))
+
+        wet_threshold, soaked_threshold = wetness_thresholds()
+        result = array("i")
+        for body, resistance, shelter, flags, wetness in zip(self.body_temperature, self.cold_resistance,
+                                                             self.shelter, self.flags, self.wetness):
+            target = base_target + resistance * 15 if uses_clothing else base_target
+            body += int((target - body) * change_rates[shelter])
+
+            if wetness >= soaked_threshold:
+                body -= soaked[body > 900]
+            elif wetness >= wet_threshold:
+                body -= wet[body > 900]
+            if flags & WIND_CHILLED:
+                body -= wind[body > 900]
+            if flags & LIT_FIRE:
+                body += fire[body < 100]
+
+            result.append(0 if body < 0 else 1000 if body > 1000 else body)
+        self.body_temperature = result
+
+    def _advance_exposure(self, hours: float, weather: Any):
+        """Wetness from rain or drying, and wind chill"""
+        precipitation = weather.precipitation
+        if precipitation > 0:
+            gain = [int(precipitation * (1.0 - reduction) / 10 * hours) for reduction in SHELTER_EXPOSURE_REDUCTION]
+            self.wetness = array("i", [min(400, value + gain[shelter])
+                                       for value, shelter in zip(self.wetness, self.shelter)])
+        else:
+            dry_rate = 5
+            if weather.wind_speed > 10:
+                dry_rate += weather.wind_speed // 5
+            if weather.temperature > 70:
+                dry_rate += 5
+            loss = [int((dry_rate + bonus) * hours) for bonus in SHELTER_DRYING_BONUS]
+            fire_loss = int((dry_rate + FIRE_DRYING_BONUS) * hours)
+            self.wetness = array("i", [max(0, value - (fire_loss if flags & LIT_FIRE else loss[shelter]))
+                                       for value, shelter, flags in zip(self.wetness, self.shelter, self.flags)])
+
+        if weather.wind_speed > 5 and weather.temperature < 60:
+            gain = [int(weather.wind_speed * (1.0 - reduction) * 2 * hours) for reduction in SHELTER_EXPOSURE_REDUCTION]
+            self.wind_chill = array("i", [min(200, value + gain[shelter])
+                                          for value, shelter in zip(self.wind_chill, self.shelter)])
+        else:
+            fade = int(hours * 10)
+            self.wind_chill = array("i", [value - fade if value > fade else 0 for value in self.wind_chill])
+
+    def summary(self) -> Dict[str, float]:
+        """Average of each need over the batch (empty if there are no actors)"""
+        if not self.actors:
+            return {}
+        return {name: sum(getattr(self, name)) / len(self.actors) for name in NEED_COLUMNS}
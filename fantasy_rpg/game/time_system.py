@@ -20,6 +20,18 @@ except ImportError:
         from fantasy_rpg.game.player_state import PlayerState
         from fantasy_rpg.world.weather_core import WeatherState, generate_weather_state
 
+try:
+    from .events import Fainted, HpChanged, TimeAdvanced, WeatherChanged, publish_event
+except ImportError:
+    from fantasy_rpg.game.events import Fainted, HpChanged, TimeAdvanced, WeatherChanged, publish_event
+
+try:
+    from ..utils.rng import get_rng
+    from ..utils.tracing import traced
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng
+    from fantasy_rpg.utils.tracing import traced
+
 
 class ActivityType(Enum):
     """Types of activities that take time"""
@@ -200,6 +212,7 @@ class TimeSystem:
         
         return activities
     
+    @traced("time.perform_activity")
     def perform_activity(self, activity_name: str, **kwargs) -> Dict[str, any]:
         """
         Perform an activity and advance time accordingly.
@@ -452,30 +465,45 @@ class TimeSystem:
             self._update_weather()
             self.hours_since_weather_update = 0
         
+        self._publish(TimeAdvanced(hours, exertion_level))
+        
         # Notify callbacks
         for callback in self.on_time_advance:
             callback(old_time, self.player_state.get_time_string(), hours)
     
+    def _publish(self, event):
+        """Publish a state-change event on the game engine's event bus"""
+        publish_event(getattr(self.player_state, 'game_engine', None), event)
+    
     def _update_weather(self):
         """Update weather conditions"""
-        # Generate new weather based on current conditions
-        if self.player_state.current_weather:
-            base_temp = self.player_state.current_weather.temperature
-        else:
-            base_temp = 60.0  # Default temperature
-        
-        # Add some variation
-        import random
-        base_temp += random.uniform(-5, 5)
+        game_engine = getattr(self.player_state, 'game_engine', None)
+        world_coordinator = getattr(game_engine, 'world_coordinator', None)
         
-        new_weather = generate_weather_state(
-            base_temp, 
-            self.player_state.game_season, 
-            "temperate"  # Default climate
-        )
+        if world_coordinator and hasattr(game_engine, 'get_weather_at') and self.player_state.current_hex:
+            # Catch the world weather field up to now and read the current hex
+            new_weather = game_engine.get_weather_at(self.player_state.current_hex, self.player_state)
+        else:
+            # Generate new weather based on current conditions
+            if self.player_state.current_weather:
+                base_temp = self.player_state.current_weather.temperature
+            else:
+                base_temp = 60.0  # Default temperature
+            
+            # Add some variation
+            base_temp += get_rng("weather").uniform(-5, 5)
+            
+            new_weather = generate_weather_state(
+                base_temp, 
+                self.player_state.game_season, 
+                "temperate"  # Default climate
+            )
         
         old_weather = self.player_state.current_weather
         self.player_state.update_weather(new_weather)
+        if game_engine and getattr(game_engine, 'game_state', None):
+            game_engine.game_state.current_weather = new_weather
+        self._publish(WeatherChanged(old_weather, new_weather))
         
         # Notify callbacks
         for callback in self.on_weather_change:
@@ -516,6 +544,7 @@ class TimeSystem:
                                 character = self.player_state.character
                                 old_hp = character.hp
                                 character.hp = max(0, character.hp - total_damage)
+                                self._publish(HpChanged(old_hp, character.hp, condition_name))
                                 
                                 # Log the damage using action logger
                                 try:
@@ -582,6 +611,7 @@ class TimeSystem:
                 
                 # Apply the unconscious time (unconscious activity provides some fatigue recovery)
                 self.player_state.advance_time(faint_hours, "unconscious")
+                self._publish(Fainted(faint_result["duration_minutes"], faint_result["message"]))
                 
                 # Notify callbacks about fainting
                 for callback in self.on_status_change:
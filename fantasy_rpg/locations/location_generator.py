@@ -6,11 +6,12 @@ Uses the unified Item class from core.item.
 """
 
 import os
-import random
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from fantasy_rpg.utils.data_loader import DataLoader
+from fantasy_rpg.utils.rng import get_rng, get_rng_service
+from fantasy_rpg.utils.alias_table import AliasTable
 
 # Import unified Item class
 try:
@@ -155,19 +156,23 @@ class LocationGenerator(DataLoader):
     
     def __init__(self, seed: int = None, data_dir=None):
         super().__init__(data_dir)
-        self.seed = seed or random.randint(1, 1000000)
-        self.rng = random.Random(self.seed)
+        self.seed = seed or get_rng("worldgen").randint(1, 1000000)
+        self.rng = get_rng_service().seeded_stream("worldgen.locations", self.seed)
         
         # Initialize pool storage
         self.object_pools = {}
         self.entity_pools = {}
         self.item_pools = {}
+        self._pool_tables = {}  # (content_type, pool names) -> (entry count, AliasTable)
         
         # Load location templates
         self.templates = self._load_location_templates()
         self.locations = self.templates.get("locations", {})
         self.type_mapping = self.templates.get("type_mapping", {})
         
+        # Index templates by type once instead of scanning on every hex
+        self._build_location_index()
+        
         print(f"LocationGenerator initialized with seed {self.seed}")
         print(f"Loaded {len(self.locations)} location templates")
         print(f"Loaded {len(self.object_pools)} object pools")
@@ -220,6 +225,48 @@ class LocationGenerator(DataLoader):
             print(f"Warning: items.json not found in {self.data_dir}")
         except Exception as e:
             print(f"Warning: Could not load items.json: {e}")
+        
+        # Precompute a sampling table for every single pool
+        self._pool_tables = {}
+        for content_type, pool_data in (("objects", self.object_pools),
+                                        ("entities", self.entity_pools),
+                                        ("items", self.item_pools)):
+            for pool_name in pool_data:
+                self._get_pool_table(content_type, [pool_name])
+    
+    def _get_pool_table(self, content_type: str, pools: List[str]) -> Tuple[int, AliasTable]:
+        """
+        Get the sampling table for a combination of pools.
+        
+        Entries are combined in pool order, so an entry listed in two of the
+        pools is twice as likely, as with a plain weighted walk. Tables for
+        combinations are built on first use and cached.
+        
+        Args:
+            content_type: "objects", "entities" or "items"
+            pools: Pool names
+        
+        Returns:
+            Tuple of (number of entries, AliasTable over the entries)
+        """
+        key = (content_type, tuple(pools))
+        cached = self._pool_tables.get(key)
+        if cached is not None:
+            return cached
+        
+        pool_data = {
+            "objects": self.object_pools,
+            "entities": self.entity_pools,
+            "items": self.item_pools
+        }.get(content_type, {})
+        
+        entries = []
+        for pool_name in pools:
+            entries.extend(pool_data.get(pool_name, []))
+        
+        table = (len(entries), AliasTable(entries, [entry["weight"] for entry in entries]))
+        self._pool_tables[key] = table
+        return table
     
     def _build_object_pools(self, objects_data: Dict[str, Any]):
         """Build object pools from objects data"""
@@ -311,29 +358,26 @@ class LocationGenerator(DataLoader):
         location_type = self._get_location_type(biome, terrain_type)
         
         # Get all locations of this type
-        available_locations = self._get_locations_by_type(location_type)
-        
-        if not available_locations:
+        if location_type not in self._locations_by_type:
             # Fallback to forest type
-            available_locations = self._get_locations_by_type("forest")
-        
-        # Ensure we have at least one exit location
-        exit_locations = [loc for loc in available_locations if loc.get("exit_flag", False)]
-        non_exit_locations = [loc for loc in available_locations if not loc.get("exit_flag", False)]
+            location_type = "forest"
+        available_locations = self._locations_by_type.get(location_type, [])
+        exit_table = self._location_tables.get((location_type, True))
+        all_table = self._location_tables.get((location_type, False))
         
         # Generate 1-3 locations
         num_locations = self.rng.randint(1, 3)
         selected_locations = []
         
         # Always include at least one exit location
-        if exit_locations:
-            exit_location = self._select_weighted_location(exit_locations)
+        if exit_table:
+            exit_location = self._select_weighted_location(exit_table.items, exit_table)
             selected_locations.append(self._create_location_from_template(exit_location, hex_coords, len(selected_locations)))
         
         # Fill remaining slots with any type
         remaining_slots = num_locations - len(selected_locations)
         for _ in range(remaining_slots):
-            location_template = self._select_weighted_location(available_locations)
+            location_template = self._select_weighted_location(available_locations, all_table)
             selected_locations.append(self._create_location_from_template(location_template, hex_coords, len(selected_locations)))
         
         return selected_locations
@@ -362,19 +406,30 @@ class LocationGenerator(DataLoader):
         else:
             return "forest"
     
+    def _build_location_index(self):
+        """Build the type -> templates index and per-type sampling tables"""
+        self._locations_by_type = {}
+        for location_id, location_data in self.locations.items():
+            # Add the ID to the data for reference
+            location_with_id = location_data.copy()
+            location_with_id["id"] = location_id
+            self._locations_by_type.setdefault(location_data.get("type"), []).append(location_with_id)
+        
+        # Tables for all templates of a type and for its exit templates only
+        self._location_tables = {}
+        for location_type, locations in self._locations_by_type.items():
+            exits = [loc for loc in locations if loc.get("exit_flag", False)]
+            self._location_tables[(location_type, False)] = AliasTable(
+                locations, [loc.get("spawn_weight", 1) for loc in locations])
+            self._location_tables[(location_type, True)] = AliasTable(
+                exits, [loc.get("spawn_weight", 1) for loc in exits])
+    
     def _get_locations_by_type(self, location_type: str) -> List[Dict]:
         """Get all location templates of a specific type"""
-        locations = []
-        for location_id, location_data in self.locations.items():
-            if location_data.get("type") == location_type:
-                # Add the ID to the data for reference
-                location_with_id = location_data.copy()
-                location_with_id["id"] = location_id
-                locations.append(location_with_id)
-        return locations
+        return list(self._locations_by_type.get(location_type, []))
     
-    def _select_weighted_location(self, locations: List[Dict]) -> Dict:
-        """Select location based on spawn_weight"""
+    def _select_weighted_location(self, locations: List[Dict], table: AliasTable = None) -> Dict:
+        """Select location based on spawn_weight (O(1) when a prebuilt table is given)"""
         if not locations:
             # Return a minimal fallback location
             return {
@@ -389,19 +444,11 @@ class LocationGenerator(DataLoader):
                 "content_pools": {"objects": [], "entities": []}
             }
         
-        total_weight = sum(loc.get("spawn_weight", 1) for loc in locations)
-        if total_weight == 0:
-            return locations[0]
-            
-        roll = self.rng.randint(1, total_weight)
-        
-        current = 0
-        for location in locations:
-            current += location.get("spawn_weight", 1)
-            if roll <= current:
-                return location
+        if table is None:
+            table = AliasTable(locations, [loc.get("spawn_weight", 1) for loc in locations])
         
-        return locations[0]  # Fallback
+        location = table.pick(self.rng)
+        return location if location is not None else locations[0]
     
     def _create_location_from_template(self, template: Dict, hex_coords: Tuple[int, int], index: int) -> Location:
         """Create a single-area Location from flat template"""
@@ -452,46 +499,31 @@ class LocationGenerator(DataLoader):
         if not pools:
             return []
         
-        # Get appropriate pool data
+        # Get appropriate content class
         if content_type == "objects":
-            pool_data = self.object_pools
             item_class = GameObject
         elif content_type == "entities":
-            pool_data = self.entity_pools
             item_class = GameEntity
         else:
             return []
         
-        # Collect all possible spawns from pools
-        possible_spawns = []
-        for pool_name in pools:
-            if pool_name in pool_data:
-                possible_spawns.extend(pool_data[pool_name])
+        # Sampling table over all possible spawns from pools
+        spawn_count, table = self._get_pool_table(content_type, pools)
         
-        if not possible_spawns:
+        if not spawn_count:
             return []
         
         # Simple spawning: MIN_OBJECTS_PER_LOCATION-MAX_OBJECTS_PER_LOCATION items based on pool availability
-        min_spawns = min(MIN_OBJECTS_PER_LOCATION, len(possible_spawns))
-        max_spawns = min(MAX_OBJECTS_PER_LOCATION, len(possible_spawns))
+        min_spawns = min(MIN_OBJECTS_PER_LOCATION, spawn_count)
+        max_spawns = min(MAX_OBJECTS_PER_LOCATION, spawn_count)
         num_spawns = self.rng.randint(min_spawns, max_spawns)
         
         # Spawn items
         spawned = []
+        if not table:
+            return spawned
         for _ in range(num_spawns):
-            # Weighted selection
-            total_weight = sum(item["weight"] for item in possible_spawns)
-            if total_weight == 0:
-                continue
-                
-            roll = self.rng.randint(1, total_weight)
-            current = 0
-            
-            for spawn_item in possible_spawns:
-                current += spawn_item["weight"]
-                if roll <= current:
-                    spawned.append(self._create_from_pool_data(spawn_item, item_class))
-                    break
+            spawned.append(self._create_from_pool_data(table.pick(self.rng), item_class))
         
         return spawned
     
@@ -582,32 +614,19 @@ class LocationGenerator(DataLoader):
         if self.rng.randint(1, 100) > drop_chance:
             return []
         
-        # Collect possible items from pools
-        possible_items = []
-        for pool_name in pools:
-            if pool_name in self.item_pools:
-                possible_items.extend(self.item_pools[pool_name])
+        # Sampling table over possible items from pools
+        item_count, table = self._get_pool_table("items", pools)
         
-        if not possible_items:
+        if not item_count:
             return []
         
         # Generate drops
         num_drops = self.rng.randint(min_drops, max_drops)
         drops = []
+        if not table:
+            return drops
         
         for _ in range(num_drops):
-            # Weighted selection
-            total_weight = sum(item["weight"] for item in possible_items)
-            if total_weight == 0:
-                continue
-                
-            roll = self.rng.randint(1, total_weight)
-            current = 0
-            
-            for item_data in possible_items:
-                current += item_data["weight"]
-                if roll <= current:
-                    drops.append(self._create_from_pool_data(item_data, Item))
-                    break
+            drops.append(self._create_from_pool_data(table.pick(self.rng), Item))
         
         return drops
@@ -15,16 +15,20 @@ except ImportError:
     exit(1)
 
 try:
-    from .screens import MainGameScreen, InventoryScreen, CharacterScreen, QuitConfirmationScreen, LoadGameConfirmationScreen
+    from .screens import MainGameScreen, InventoryScreen, CharacterScreen, QuitConfirmationScreen, LoadGameConfirmationScreen, WorldMapScreen
+    from .world_map import WorldMapRenderer, WorldMapSource
     from ..actions.input_controller import InputController
     from ..actions.action_logger import get_action_logger
     from ..actions.action_handler import ActionResult
+    from ..utils.tracing import traced
     from .colors import THEME_COLORS
 except ImportError:
-    from screens import MainGameScreen, InventoryScreen, CharacterScreen, QuitConfirmationScreen, LoadGameConfirmationScreen
+    from screens import MainGameScreen, InventoryScreen, CharacterScreen, QuitConfirmationScreen, LoadGameConfirmationScreen, WorldMapScreen
+    from world_map import WorldMapRenderer, WorldMapSource
     from fantasy_rpg.actions.input_controller import InputController
     from fantasy_rpg.actions.action_logger import get_action_logger
     from fantasy_rpg.actions.action_handler import ActionResult
+    from fantasy_rpg.utils.tracing import traced
     from fantasy_rpg.ui.colors import THEME_COLORS
 
 
@@ -63,6 +67,18 @@ class FantasyRPGApp(App):
         border: solid {border};
         padding: 1;
         background: {background};
+    }}
+    
+    #game-log-header {{
+        height: auto;
+        margin-bottom: 1;
+    }}
+    
+    #game-log {{
+        height: 1fr;
+        border: none;
+        padding: 0;
+        background: {background};
         scrollbar-size: 1 0;
         scrollbar-color: transparent;
         scrollbar-color-hover: $background 50%;
@@ -205,6 +221,34 @@ class FantasyRPGApp(App):
         color: $text-muted;
         margin-top: 1;
     }}
+    
+    /* World map screen styles */
+    WorldMapScreen {{
+        align: center middle;
+    }}
+    
+    #map-dialog {{
+        background: {dialog_bg};
+        border: solid {border};
+        width: 90%;
+        height: 90%;
+        padding: 0 1;
+    }}
+    
+    #map-title {{
+        text-align: center;
+        margin-bottom: 1;
+    }}
+    
+    #world-map {{
+        height: 1fr;
+        background: {background};
+    }}
+    
+    #map-status {{
+        text-align: center;
+        color: $text-muted;
+    }}
     """.format(**THEME_COLORS)
     
     def __init__(self):
@@ -217,6 +261,8 @@ class FantasyRPGApp(App):
         self.time_system = None
         self.input_controller = None
         self.game_engine = None  # Add GameEngine alongside InputController
+        self.map_renderer = None  # Kept between openings of the map so its tiles stay cached
+        self._ui_refresh_pending = False  # Coalesces panel refreshes to one per frame
     
     def on_mount(self) -> None:
         """Initialize the app"""
@@ -245,6 +291,24 @@ class FantasyRPGApp(App):
         
         # Handle the response based on type
         self._handle_input_response(response)
+        
+        # Autosave once the command's changes are in place (written off-thread)
+        self._check_autosave()
+    
+    def _check_autosave(self):
+        """Report failed background autosaves and start a new one if due"""
+        autosave = self.game_engine.autosave if self.game_engine else None
+        if not autosave:
+            return
+        for success, message in autosave.pop_results():
+            if not success:
+                self.log_message(f"[yellow]⚠ {message}[/yellow]")
+        autosave.check()
+    
+    def on_unmount(self) -> None:
+        """Let a running autosave finish before exiting"""
+        if self.game_engine and self.game_engine.autosave:
+            self.game_engine.autosave.shutdown(timeout=5.0)
     
     def _handle_input_response(self, response: Dict[str, Any]):
         """Handle response from input controller"""
@@ -284,6 +348,8 @@ class FantasyRPGApp(App):
                 self.push_screen(InventoryScreen(self.character))
             elif modal_type == 'character':
                 self.push_screen(CharacterScreen(self.character))
+            elif modal_type == 'map':
+                self.show_world_map()
                 
         elif response_type == 'show_help':
             self.show_help()
@@ -349,6 +415,8 @@ class FantasyRPGApp(App):
                 success, message = self.game_engine.load_game("save")
                 self.log_message(message)
                 if success:
+                    # Start a new journal session from the loaded state
+                    self.input_controller.start_journal()
                     # Update UI with loaded game state
                     self._refresh_ui_from_game_state()
             else:
@@ -357,9 +425,8 @@ class FantasyRPGApp(App):
         elif response_type == 'quit_game':
             self.push_screen(QuitConfirmationScreen())
         
-        # Always refresh display after processing input
-        if self.character_panel:
-            self.character_panel.refresh_display()
+        # Always refresh display after processing input (coalesced per frame)
+        self._refresh_ui_from_game_state()
 
     def _handle_action_result(self, result):
         """Handle result from GameEngine action handler"""
@@ -376,6 +443,8 @@ class FantasyRPGApp(App):
                     self.push_screen(InventoryScreen(self.character))
                 elif modal_type == 'character':
                     self.push_screen(CharacterScreen(self.character))
+                elif modal_type == 'map':
+                    self.show_world_map()
             
             elif action_type == 'help':
                 # Help message already logged above
@@ -417,6 +486,7 @@ class FantasyRPGApp(App):
             old_hp = self.character.hp
             self.character.hp = min(self.character.hp + amount, self.character.max_hp)
             healed = self.character.hp - old_hp
+            self._publish_hp_change(old_hp, source)
             if healed > 0:
                 # Use action logger for consistent healing logging
                 action_logger = get_action_logger()
@@ -435,7 +505,7 @@ class FantasyRPGApp(App):
             
             action_logger = get_action_logger()
             action_logger.log_separator()  # Add separator
-            self.character_panel.refresh_display()
+            self._refresh_ui_from_game_state()
     
     def damage_character(self, amount: int, source: str = "unknown"):
         """Damage character by amount"""
@@ -443,6 +513,7 @@ class FantasyRPGApp(App):
             old_hp = self.character.hp
             self.character.hp = max(0, self.character.hp - amount)
             damage_taken = old_hp - self.character.hp
+            self._publish_hp_change(old_hp, source)
             if damage_taken > 0:
                 # Use action logger for consistent damage logging
                 action_logger = get_action_logger()
@@ -461,7 +532,13 @@ class FantasyRPGApp(App):
             
             action_logger = get_action_logger()
             action_logger.log_separator()  # Add separator
-            self.character_panel.refresh_display()
+            self._refresh_ui_from_game_state()
+    
+    def _publish_hp_change(self, old_hp: int, source: str):
+        """Publish an HpChanged event for UI-driven HP changes"""
+        if self.game_engine and self.character.hp != old_hp:
+            from ..game.events import HpChanged
+            self.game_engine.events.publish(HpChanged(old_hp, self.character.hp, source))
     
     def add_experience(self, xp: int):
         """Add experience points to character"""
@@ -482,12 +559,12 @@ class FantasyRPGApp(App):
                     except:
                         pass
                 action_logger.log_separator()  # Add separator
-                self.character_panel.refresh_display()
+                self._refresh_ui_from_game_state()
             except:
                 self.character.experience_points += xp
                 action_logger.log_message(f"[*] {self.character.name} gains {xp} XP")
                 action_logger.log_separator()  # Add separator
-                self.character_panel.refresh_display()
+                self._refresh_ui_from_game_state()
     
     # rest_character is now handled by ActionHandler
     
@@ -577,15 +654,21 @@ class FantasyRPGApp(App):
             # Create GameEngine
             self.game_engine = GameEngine()
             
+            # Autosave in the background between commands
+            self.game_engine.enable_autosave()
+            
             # Register for UI state change notifications
             self.game_engine.register_ui_update_callback(self._on_game_state_change)
             
+            # Subscribe UI and logger to per-command state-change events
+            self.game_engine.events.subscribe_batch(self._on_game_events)
+            action_logger.connect_event_bus(self.game_engine.events)
+            
             # Check for existing save file first
-            import os
-            save_file_exists = os.path.exists("save.json")
+            from ..game.save_manager import save_file_exists
             
-            if save_file_exists:
-                action_logger.log_system_message("Found save.json - asking player...")
+            if save_file_exists("save"):
+                action_logger.log_system_message("Found saved game - asking player...")
                 
                 # Show load confirmation modal and wait for response
                 def handle_load_response(load_confirmed):
@@ -606,8 +689,8 @@ class FantasyRPGApp(App):
                         action_logger.log_system_message("Player chose to start new game...")
                         self._continue_initialization(None, None, action_logger, False)
                 
-                # Show the load confirmation modal
-                load_modal = LoadGameConfirmationScreen()
+                # Show the load confirmation modal, previewing the save from its index entry
+                load_modal = LoadGameConfirmationScreen(self.game_engine.describe_save("save"))
                 self.push_screen(load_modal, handle_load_response)
                 return  # Exit early, continuation happens in callback
             else:
@@ -648,6 +731,9 @@ class FantasyRPGApp(App):
             # Set up UI callbacks for the input controller
             self._setup_input_controller_callbacks()
             
+            # Record commands for deterministic replay (if FRPG_JOURNAL is set)
+            self.input_controller.start_journal()
+            
             # Update UI with initial game state
             self._update_ui_from_game_state()
             
@@ -815,6 +901,9 @@ class FantasyRPGApp(App):
             # Set up UI callbacks for the input controller
             self._setup_input_controller_callbacks()
             
+            # Record commands for deterministic replay (if FRPG_JOURNAL is set)
+            self.input_controller.start_journal()
+            
             # Update UI with initial game state
             self._update_ui_from_game_state()
             
@@ -884,8 +973,7 @@ class FantasyRPGApp(App):
             lambda: self.push_screen(QuitConfirmationScreen()))
         self.input_controller.set_ui_callback('log_message', self.log_message)
         self.input_controller.set_ui_callback('log_command', self.log_command)
-        self.input_controller.set_ui_callback('refresh_display', 
-            lambda: self.character_panel.refresh_display() if self.character_panel else None)
+        self.input_controller.set_ui_callback('refresh_display', self._refresh_ui_from_game_state)
     
     # Survival system callbacks
     def _on_time_advance(self, old_time: str, new_time: str, hours_passed: float):
@@ -911,15 +999,22 @@ class FantasyRPGApp(App):
             self.update_weather(weather_desc)
             # Weather change logging is now handled by ActionLogger
     
-    def _update_ui_from_game_state(self):
-        """Update UI panels from current GameEngine state"""
+    def _update_ui_from_game_state(self, changes=None):
+        """Update UI panels from current GameEngine state
+        
+        Args:
+            changes: Set of changed GameState aspects, or None to update everything
+        """
         if not self.game_engine or not self.game_engine.is_initialized:
             return
             
         gs = self.game_engine.game_state
+        if changes is None:
+            from ..game.game_engine import STATE_ASPECTS
+            changes = set(STATE_ASPECTS)
         
-        # Update character panel
-        if self.character_panel:
+        # Character panel shows vitals, conditions, location and weather
+        if self.character_panel and changes:
             # Update location info
             hex_name = gs.world_position.hex_data.get('name', 'Unknown')
             location_name = hex_name
@@ -931,19 +1026,46 @@ class FantasyRPGApp(App):
             self.character_panel.update_world_data(
                 hex_id=gs.world_position.hex_id,
                 location=location_name,
-                weather=gs.current_weather.get_description().split('\n')[0]
+                weather=gs.current_weather.get_description().split('\n')[0],
+                refresh=False
             )
             self.character_panel.refresh_display()
         
-        # Update POI panel with GameEngine data
-        if self.poi_panel:
+        # POI panel only depends on where the player is
+        if self.poi_panel and "position" in changes:
             self.poi_panel.update_with_game_engine(self.game_engine)
         
         # Update title bar
         current_screen = self.screen
-        if hasattr(current_screen, 'update_title_bar') and self.player_state:
+        if "time" in changes and hasattr(current_screen, 'update_title_bar') and self.player_state:
             current_screen.update_title_bar(self.player_state)
     
+    def show_world_map(self):
+        """Open the world map, centred on the player"""
+        if not self.game_engine or not self.game_engine.is_initialized:
+            self.log_message("No world to map yet.")
+            return
+
+        world = self.game_engine.world_coordinator
+        if self.map_renderer is None or self.map_renderer.source.world is not world:
+            # New or loaded world - start a fresh tile cache
+            self.map_renderer = WorldMapRenderer(WorldMapSource(world))
+            self.game_engine.events.subscribe("HexesRevealed", self._on_hexes_revealed)
+
+        position = self.game_engine.game_state.world_position
+        player = tuple(position.coords) if position.coords else None
+        explored = world.exploration.stats()
+        title = (f"World Map - {position.hex_data.get('name', 'Unknown')} (hex {position.hex_id}) - "
+                 f"explored {explored['explored']} of {explored['total']} hexes "
+                 f"({explored['explored_percent']:.1f}%)")
+        self.push_screen(WorldMapScreen(self.map_renderer, player, title))
+
+    def _on_hexes_revealed(self, event):
+        """Redraw the map tiles over hexes the player has just seen"""
+        if self.map_renderer is not None:
+            for x, y in event.hexes:
+                self.map_renderer.invalidate_hex(x, y)
+
     def _update_location_from_game_state(self):
         """Update location display from GameEngine state"""
         if not self.game_engine or not self.game_engine.is_initialized:
@@ -963,13 +1085,33 @@ class FantasyRPGApp(App):
         
         self.update_location(gs.world_position.hex_id, location_name)
     
+    @traced("ui.refresh")
     def _refresh_ui_from_game_state(self):
-        """Refresh all UI elements from GameEngine state"""
-        self._update_ui_from_game_state()
+        """Schedule a UI refresh from GameEngine state, at most once per frame"""
+        if self._ui_refresh_pending:
+            return
+        self._ui_refresh_pending = True
+        self.call_after_refresh(self._flush_ui_refresh)
+    
+    @traced("ui.flush")
+    def _flush_ui_refresh(self):
+        """Re-render only the panels whose GameState inputs changed"""
+        self._ui_refresh_pending = False
         
-        # Refresh character panel
-        if self.character_panel:
-            self.character_panel.refresh_display()
+        if not self.game_engine or not self.game_engine.is_initialized:
+            # No change tracking without GameEngine - just redraw the character
+            if self.character_panel:
+                self.character_panel.refresh_display()
+            return
+        
+        changes = self.game_engine.game_state.collect_changes()
+        if changes:
+            self._update_ui_from_game_state(changes)
+    
+    def _on_game_events(self, events):
+        """Handle a coalesced batch of GameEngine events for one command"""
+        # GameEngine has already marked the changed aspects dirty
+        self._refresh_ui_from_game_state()
     
     def _on_game_state_change(self, change_type: str):
         """Handle GameEngine state change notifications"""
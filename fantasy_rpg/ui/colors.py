@@ -73,6 +73,28 @@ ENVIRONMENT_COLORS = {
     "time": "#FFD700"           # Gold for time
 }
 
+# World Map Colors (biome ids, water, weather bands and markers)
+MAP_COLORS = {
+    "arctic_tundra": "#D0E0F0",        # Pale blue-white - tundra
+    "boreal_forest": "#2E7D5B",        # Blue-green - taiga
+    "temperate_grassland": "#A8C060",  # Yellow-green - grassland
+    "temperate_forest": "#3A9A3A",     # Green - forest
+    "mediterranean_scrub": "#B0A050",  # Olive - scrubland
+    "hot_desert": "#E0C070",           # Sand - desert
+    "tropical_rainforest": "#1E8C3A",  # Deep green - jungle
+    "alpine_mountains": "#A0A0A0",     # Gray - mountains
+    "unknown": "#808080",              # Gray - unclassified hexes
+    "river": "#3A8FFF",                # Blue - rivers
+    "lake": "#2060D0",                 # Deep blue - lakes
+    "rain_1": "#88CCFF",               # Light blue - light rain
+    "rain_2": "#4488FF",               # Blue - rain
+    "rain_3": "#AA66FF",               # Violet - heavy rain and storms
+    "player": "#FFD700",               # Gold - player marker
+    "lowland": "#0A0A0A",              # Background shades by elevation band
+    "upland": "#161616",
+    "highland": "#242424"
+}
+
 
 def get_survival_color(level_name: str) -> str:
     """Get color for survival status level"""
@@ -4,10 +4,14 @@ Fantasy RPG - UI Panels
 Visual display components for the main game interface.
 """
 
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+
 try:
     from textual.app import ComposeResult
-    from textual.containers import ScrollableContainer
-    from textual.widgets import Static
+    from textual.containers import Vertical
+    from textual.widgets import RichLog, Static
     from textual import events
 except ImportError:
     import sys
@@ -137,8 +141,8 @@ class CharacterPanel(Static):
         self.character = character
         self.refresh_display()
     
-    def update_world_data(self, weather=None, hex_id=None, location=None, elevation=None):
-        """Update world/location data and refresh display"""
+    def update_world_data(self, weather=None, hex_id=None, location=None, elevation=None, refresh=True):
+        """Update world/location data and optionally refresh display"""
         if weather is not None:
             self.world_data["weather"] = weather
         if hex_id is not None:
@@ -147,7 +151,8 @@ class CharacterPanel(Static):
             self.world_data["location"] = location
         if elevation is not None:
             self.world_data["elevation"] = elevation
-        self.refresh_display()
+        if refresh:
+            self.refresh_display()
     
     def refresh_display(self):
         """Refresh the character panel display"""
@@ -570,20 +575,45 @@ Elevation: {self._get_elevation_description()}"""
             return "Arid"
 
 
-class GameLogPanel(ScrollableContainer):
-    """Center panel showing game events and messages with scrolling"""
+class GameLogPanel(Vertical):
+    """Center panel showing game events and messages with scrolling
+    
+    Messages are kept in an append-only ring buffer and only new lines are
+    rendered into a virtualized RichLog, so adding a message costs the same
+    no matter how long the history is. Messages logged between begin_batch()
+    and end_batch() are written to the view in a single pass.
+    """
     
     def __init__(self):
         super().__init__()
-        self.messages = []
-        self.max_messages = 1000  # Keep last 1000 messages
+        self.max_messages = 100000  # Ring buffer size for log history
+        self.max_rendered_lines = 2000  # Scrollback kept in the view itself
+        self.messages = deque(maxlen=self.max_messages)
         self.player_state = None  # Will be set by app
         
+        # Batching state - messages wait here until the batch closes
+        self._batch_depth = 0
+        self._pending_lines = []
+        self._log_view = None
+        self._header = None
+        
         # Add some initial messages
         self._add_initial_messages()
     
     def compose(self) -> ComposeResult:
-        yield Static(self._render_log(), id="game-log", markup=False)
+        yield Static("", id="game-log-header", markup=False)
+        log_view = RichLog(id="game-log", markup=False, wrap=True, max_lines=self.max_rendered_lines)
+        log_view.can_focus = False  # Keep focus on the command input
+        yield log_view
+    
+    def on_mount(self):
+        """Attach to the log view and replay any messages logged before mount"""
+        self._header = self.query_one("#game-log-header", Static)
+        self._log_view = self.query_one("#game-log", RichLog)
+        if self.messages:
+            backlog = list(self.messages)[-self.max_rendered_lines:]
+            self._write_lines(backlog)
+        self._update_header()
     
     def _add_initial_messages(self):
         """Add initial messages - now handled by GameEngine initialization"""
@@ -600,17 +630,55 @@ class GameLogPanel(ScrollableContainer):
         else:
             formatted_message = message
         
+        # Ring buffer drops the oldest message once full
         self.messages.append(formatted_message)
         
-        # Keep only the last max_messages
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages:]
-        
-        # Refresh the display
-        self.refresh_log()
-        
-        # Auto-scroll to bottom to show new message
-        self.scroll_end()
+        if self._batch_depth > 0:
+            self._pending_lines.append(formatted_message)
+        else:
+            self._write_lines([formatted_message])
+            self._update_header()
+    
+    def begin_batch(self):
+        """Start collecting messages so they are rendered together"""
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """Close a batch and render every message collected since begin_batch()"""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._pending_lines:
+            pending = self._pending_lines
+            self._pending_lines = []
+            self._write_lines(pending)
+            self._update_header()
+    
+    @contextmanager
+    def batch(self):
+        """Context manager wrapping begin_batch()/end_batch()"""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+    
+    def _write_lines(self, lines: list):
+        """Append lines to the log view and keep it scrolled to the bottom"""
+        if self._log_view is None:
+            # Widget not mounted yet - messages are replayed from the buffer on mount
+            return
+        self._log_view.write("\n".join(lines), scroll_end=True)
+    
+    def _update_header(self):
+        """Update the time header above the log"""
+        if self._header is None:
+            return
+        if self.player_state:
+            self._header.update(self._get_natural_time_description())
+            self._header.display = True
+        else:
+            self._header.display = False
     
     def add_command(self, command: str):
         """Add a player command to the log"""
@@ -634,37 +702,18 @@ class GameLogPanel(ScrollableContainer):
     
     def clear_log(self):
         """Clear all messages from the log"""
-        self.messages = []
+        self.messages.clear()
+        self._pending_lines = []
         self.refresh_log()
     
     def refresh_log(self):
-        """Refresh the log display"""
-        try:
-            log_widget = self.query_one("#game-log")
-            log_widget.update(self._render_log())
-        except:
-            # Widget not mounted yet, ignore
-            pass
-    
-    def _render_log(self) -> str:
-        """Render game log messages"""
-        if not self.messages:
-            return "No messages yet..."
-        
-        # Get current time from player state if available
-        if self.player_state:
-            time_str = self._get_natural_time_description()
-            header = f"{time_str}\n\n"
-        else:
-            header = ""  # No header when no player state
-        
-        # Join all messages
-        content = "\n".join(self.messages)
-        
-        # Add subtle scroll indicator at the bottom
-        footer = "\n\n~"
-        
-        return header + content + footer
+        """Rebuild the log view from the message buffer"""
+        if self._log_view is None:
+            return
+        self._log_view.clear()
+        if self.messages:
+            self._write_lines(list(self.messages)[-self.max_rendered_lines:])
+        self._update_header()
     
     def get_message_count(self) -> int:
         """Get the current number of messages"""
@@ -672,7 +721,9 @@ class GameLogPanel(ScrollableContainer):
     
     def get_recent_messages(self, count: int = 10) -> list:
         """Get the most recent messages"""
-        return self.messages[-count:] if self.messages else []
+        recent = list(islice(reversed(self.messages), count))
+        recent.reverse()
+        return recent
     
     def advance_turn(self):
         """Advance the turn counter (legacy method, no longer used)"""
@@ -933,21 +984,15 @@ class POIPanel(Static):
             for loc in hex_locations:
                 self.available_locations.append(loc.get('name', 'Unknown Location'))
             
-            # If player is inside a location, get connections from GameEngine
+            # If player is inside a location, read connections from the hex's location graph
             if self.current_location_id and len(hex_locations) > 1:
-                current_index = None
-                for i, loc in enumerate(hex_locations):
-                    if loc.get("id") == self.current_location_id:
-                        current_index = i
-                        break
+                location_graph = game_engine.world_coordinator.get_location_neighbors(
+                    self.current_hex, self.current_location_id
+                )
                 
-                if current_index is not None:
-                    # Use GameEngine's location graph logic for consistency
-                    location_graph = game_engine._create_location_graph(hex_locations, current_index)
-                    
-                    # Convert to display format
-                    for direction, location_data in location_graph.items():
-                        self.location_connections[direction] = location_data.get('name', 'Unknown Location')
+                # Convert to display format
+                for direction, location_data in location_graph.items():
+                    self.location_connections[direction] = location_data.get('name', 'Unknown Location')
         except:
             self.available_locations = []
         
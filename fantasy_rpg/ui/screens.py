@@ -9,6 +9,11 @@ try:
     from textual.containers import Horizontal, Vertical
     from textual.widgets import Static, Input
     from textual.screen import Screen, ModalScreen
+    from textual.binding import Binding
+    from textual.suggester import Suggester
+    from textual.scroll_view import ScrollView
+    from textual.strip import Strip
+    from textual.geometry import Size
     from textual import events
 except ImportError:
     import sys
@@ -20,6 +25,16 @@ try:
 except ImportError:
     from panels import CharacterPanel, GameLogPanel, POIPanel
 
+try:
+    from .world_map import CELL_WIDTH, MAP_LAYERS, ZOOM_LEVELS
+except ImportError:
+    from world_map import CELL_WIDTH, MAP_LAYERS, ZOOM_LEVELS
+
+try:
+    from ..actions.shortkey_manager import get_shortkey_manager
+except ImportError:
+    from fantasy_rpg.actions.shortkey_manager import get_shortkey_manager
+
 
 class CharacterScreen(ModalScreen):
     """Modal screen to display full character stats and information"""
@@ -667,8 +682,13 @@ class InventoryScreen(ModalScreen):
 class LoadGameConfirmationScreen(ModalScreen):
     """Modal screen to confirm loading saved game"""
     
-    def __init__(self):
+    def __init__(self, slot=None):
+        """
+        Args:
+            slot: Optional SaveSlot from the save index, shown as a preview
+        """
         super().__init__()
+        self.slot = slot
         self.selected_option = 0  # 0 = No (default), 1 = Yes
         self.options = ["No", "Yes"]
         self.load_confirmed = False
@@ -676,11 +696,31 @@ class LoadGameConfirmationScreen(ModalScreen):
     def compose(self) -> ComposeResult:
         with Vertical(id="load-dialog"):
             yield Static("Save file found! Load saved game?", id="load-message", markup=False)
+            if self.slot is not None:
+                yield Static(self._render_slot(), id="load-summary", markup=False)
             yield Static("", id="load-spacer")
             yield Static(self._render_options(), id="load-options", markup=False)
             yield Static("", id="load-spacer2")
             yield Static("Use TAB/Left/Right to select, ENTER to confirm, ESC to cancel", id="load-instruction", markup=False)
     
+    def _render_slot(self) -> str:
+        """Render the save's headline, time, play time and map thumbnail"""
+        summary = self.slot.summary
+        lines = [self.slot.headline]
+        if summary.get("game_time"):
+            lines.append(summary["game_time"])
+        if summary.get("play_time_minutes") is not None:
+            hours, minutes = divmod(int(summary["play_time_minutes"]), 60)
+            lines.append(f"Played {hours}h {minutes:02d}m")
+        thumbnail = summary.get("thumbnail") or []
+        if thumbnail:
+            lines.append("")
+            lines.extend(thumbnail)
+        if self.slot.status != "ok":
+            lines.append("")
+            lines.append("Warning: this save appears to be damaged.")
+        return "\n".join(lines)
+    
     def _render_options(self) -> str:
         """Render the checkbox options with current selection side by side"""
         no_option = ""
@@ -803,6 +843,192 @@ class QuitConfirmationScreen(ModalScreen):
             self.dismiss()
 
 
+class WorldMapView(ScrollView, can_focus=True):
+    """Scrollable world map, drawn a line at a time from cached tiles"""
+    
+    def __init__(self, renderer, player=None, **kwargs):
+        """
+        Args:
+            renderer: WorldMapRenderer of the current world
+            player: Player's hex coordinates (x, y), marked and centred on
+        """
+        super().__init__(**kwargs)
+        self.renderer = renderer
+        self.player = player
+        self.zoom_index = 0
+        self.map_layer = MAP_LAYERS[0]
+        self._centred = False
+    
+    @property
+    def zoom(self) -> int:
+        return ZOOM_LEVELS[self.zoom_index]
+    
+    def on_mount(self) -> None:
+        self._resize_map()
+    
+    def _resize_map(self):
+        columns, rows = self.renderer.size(self.zoom)
+        self.virtual_size = Size(columns * CELL_WIDTH, rows)
+    
+    def render_line(self, y: int) -> Strip:
+        """Render one visible line: only the cells in view are looked up"""
+        if not self._centred:
+            # Centre on the first draw, once the view knows its size, so the
+            # tiles at the map's corner are never rendered
+            self._centred = True
+            self.centre_on_player()
+        scroll_x, scroll_y = self.scroll_offset
+        width, height = self.size
+        # A map smaller than the view is drawn in its middle
+        left = scroll_x - max(0, (width - self.virtual_size.width) // 2)
+        top = scroll_y - max(0, (height - self.virtual_size.height) // 2)
+        x0 = left // CELL_WIDTH
+        segments = self.renderer.render_row(top + y, x0, width // CELL_WIDTH + 2,
+                                            self.zoom, self.map_layer, self.player)
+        start = left - x0 * CELL_WIDTH
+        return Strip(segments).crop(start, start + width)
+    
+    def centre_on(self, x: int, y: int):
+        """Scroll a hex to the middle of the view"""
+        self.scroll_to(x // self.zoom * CELL_WIDTH - self.size.width // 2,
+                       y // self.zoom - self.size.height // 2, animate=False, immediate=True)
+    
+    def centre_on_player(self):
+        if self.player:
+            self.centre_on(*self.player)
+    
+    def change_zoom(self, step: int) -> bool:
+        """Zoom out (step > 0) or in, keeping the hex in the middle of the view"""
+        index = max(0, min(len(ZOOM_LEVELS) - 1, self.zoom_index + step))
+        if index == self.zoom_index:
+            return False
+        scroll_x, scroll_y = self.scroll_offset
+        centre = ((scroll_x + self.size.width // 2) // CELL_WIDTH * self.zoom,
+                  (scroll_y + self.size.height // 2) * self.zoom)
+        self.zoom_index = index
+        self._resize_map()
+        self.centre_on(*centre)
+        self.refresh()
+        return True
+    
+    def toggle_layer(self):
+        self.map_layer = MAP_LAYERS[(MAP_LAYERS.index(self.map_layer) + 1) % len(MAP_LAYERS)]
+        self.refresh()
+
+
+class WorldMapScreen(ModalScreen):
+    """Modal screen showing the world map around the player"""
+    
+    BINDINGS = [
+        Binding("escape,m", "close", "Close map", show=False),
+        Binding("plus,equals_sign", "zoom(-1)", "Zoom in", show=False),
+        Binding("minus", "zoom(1)", "Zoom out", show=False),
+        Binding("w", "toggle_layer", "Weather layer", show=False),
+        Binding("c", "centre", "Centre on player", show=False),
+    ]
+    
+    def __init__(self, renderer, player=None, title: str = "World Map"):
+        """
+        Args:
+            renderer: WorldMapRenderer of the current world
+            player: Player's hex coordinates (x, y)
+            title: Heading shown above the map
+        """
+        super().__init__()
+        self.renderer = renderer
+        self.player = player
+        self.title_text = title
+    
+    def compose(self) -> ComposeResult:
+        with Vertical(id="map-dialog"):
+            yield Static(self.title_text, id="map-title", markup=False)
+            yield WorldMapView(self.renderer, self.player, id="world-map")
+            yield Static("", id="map-status", markup=False)
+    
+    def on_mount(self) -> None:
+        self.query_one(WorldMapView).focus()
+        self._update_status()
+    
+    def _update_status(self):
+        view = self.query_one(WorldMapView)
+        scale = "1 hex per cell" if view.zoom == 1 else f"{view.zoom}x{view.zoom} hexes per cell"
+        self.query_one("#map-status").update(
+            f"{scale} | {view.map_layer} | arrows pan, +/- zoom, W weather, C centre, ESC close")
+    
+    def action_zoom(self, step: int) -> None:
+        if self.query_one(WorldMapView).change_zoom(step):
+            self._update_status()
+    
+    def action_toggle_layer(self) -> None:
+        self.query_one(WorldMapView).toggle_layer()
+        self._update_status()
+    
+    def action_centre(self) -> None:
+        self.query_one(WorldMapView).centre_on_player()
+    
+    def action_close(self) -> None:
+        self.dismiss()
+
+
+class CommandSuggester(Suggester):
+    """Inline completion of the command being typed"""
+    
+    def __init__(self):
+        # Object names change with the area, so nothing is cached
+        super().__init__(use_cache=False, case_sensitive=False)
+    
+    async def get_suggestion(self, value: str):
+        completions = get_shortkey_manager().complete(value)
+        if completions and completions[0].startswith(value):
+            return completions[0]
+        return None
+
+
+class CommandInput(Input):
+    """Command line with inline completion, tab completion and "did you mean" hints"""
+    
+    BINDINGS = [
+        Binding("tab", "complete", "Complete command", show=False),
+    ]
+    
+    # Choices listed at most in the hint under the input
+    MAX_HINT_CHOICES = 6
+    
+    def __init__(self, **kwargs):
+        super().__init__(suggester=CommandSuggester(), **kwargs)
+    
+    def watch_value(self, value: str) -> None:
+        """Hint at the command a mistyped first word could have meant"""
+        self.border_subtitle = ""
+        word = value.strip().lower()
+        if not word or " " in word or get_shortkey_manager().complete(word):
+            return
+        suggestions = get_shortkey_manager().suggest_commands(word)
+        if suggestions:
+            self.border_subtitle = f"did you mean: {', '.join(suggestions)}?"
+    
+    def action_complete(self) -> None:
+        """Complete as far as unambiguous, list the choices, or fix a mistyped command"""
+        manager = get_shortkey_manager()
+        value, choices = manager.tab_complete(self.value)
+        
+        if value == self.value and not choices:
+            # Nothing completes - take the correction if there is only one
+            word = value.strip().lower()
+            suggestions = manager.suggest_commands(word) if " " not in word else []
+            if len(suggestions) != 1:
+                return
+            value = f"{suggestions[0]} "
+        
+        self.value = value
+        self.cursor_position = len(value)
+        if choices:
+            # Show just the word being completed (object names after a command)
+            shown = [choice.split(" ", 1)[-1] for choice in choices[:self.MAX_HINT_CHOICES]]
+            more = "" if len(choices) <= self.MAX_HINT_CHOICES else f" (+{len(choices) - self.MAX_HINT_CHOICES})"
+            self.border_subtitle = " | ".join(shown) + more
+
+
 class MainGameScreen(Screen):
     """Main game screen with three-panel layout"""
     
@@ -811,7 +1037,7 @@ class MainGameScreen(Screen):
         self.character_panel = CharacterPanel()
         self.game_log_panel = GameLogPanel()
         self.poi_panel = POIPanel()
-        self.command_input = Input(placeholder="> Enter command (help for list)", id="command-input")
+        self.command_input = CommandInput(placeholder="> Enter command (help for list, tab completes)", id="command-input")
     
     def compose(self) -> ComposeResult:
         """Create the three-panel layout"""
@@ -0,0 +1,292 @@
+"""
+Fantasy RPG - World Map Rendering
+
+Renders the overworld for the map screen as rows of Rich segments: biomes,
+terrain height, rivers and lakes, explored hexes, the player, and an
+optional weather layer.
+
+The map is drawn from tiles. A tile is a CHUNK_SIZE x CHUNK_SIZE block of
+map cells at one zoom level and layer, rendered once and kept in an LRU
+cache keyed by (chunk x, chunk y, zoom, layer). Drawing a line of the
+viewport only slices the cached rows of the tiles it crosses, so panning and
+zooming cost a few lookups per line however large the world is, and tiles
+are rendered only when they first scroll into view. Zoomed out, a cell shows
+its centre hex's biome and any water or explored hex found on a grid of at
+most MAX_CELL_SAMPLES x MAX_CELL_SAMPLES of its hexes.
+
+Tiles are dropped only when what they show changes:
+- hexes seen for the first time drop the tiles over them, at every zoom and
+  layer
+- when the weather moves on, weather tiles are re-rendered only if the
+  rain band of one of their cells changed
+
+The player marker is drawn over the cached rows, so moving never touches
+the cache. Kept free of Textual so maps can be rendered headless.
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.segment import Segment
+from rich.style import Style
+
+try:
+    from .colors import MAP_COLORS
+except ImportError:
+    from colors import MAP_COLORS
+
+
+# Map cells per tile edge
+CHUNK_SIZE = 16
+
+# Hexes per map cell edge at each zoom level, closest first
+ZOOM_LEVELS = (1, 2, 4, 8)
+
+# Characters per map cell (two keep cells roughly square in a terminal)
+CELL_WIDTH = 2
+
+# Hexes per cell edge checked for water and exploration when zoomed out
+MAX_CELL_SAMPLES = 4
+
+# Layers the map can show
+MAP_LAYERS = ("terrain", "weather")
+
+# Tiles kept in the cache (a full-screen viewport needs about 20)
+MAX_CACHED_TILES = 256
+
+# Precipitation (0-100) at which light rain, rain and heavy rain start
+WEATHER_BANDS = (5.0, 25.0, 60.0)
+
+# Raw elevation (0-1) at which the upland and highland shades start
+ELEVATION_BANDS = (0.45, 0.7)
+
+BIOME_GLYPHS = {
+    "arctic_tundra": "*",
+    "boreal_forest": "T",
+    "temperate_grassland": '"',
+    "temperate_forest": "T",
+    "mediterranean_scrub": ";",
+    "hot_desert": ".",
+    "tropical_rainforest": "&",
+    "alpine_mountains": "^"
+}
+
+WATER_GLYPHS = {"river": "~", "lake": "="}
+
+# Glyphs of the light, moderate and heavy rain bands
+WEATHER_GLYPHS = (",", ":", "#")
+
+PLAYER_GLYPH = "@"
+
+_SHADES = ("lowland", "upland", "highland")
+
+
+class WorldMapSource:
+    """What the map shows of a WorldCoordinator's world"""
+
+    def __init__(self, world_coordinator):
+        self.world = world_coordinator
+        self.width, self.height = world_coordinator.world_size
+
+    def hex_info(self, x: int, y: int) -> Optional[Dict[str, Any]]:
+        return self.world.hex_data.get(f"{x:02d}{y:02d}")
+
+    def is_explored(self, x: int, y: int) -> bool:
+        """Hexes the player has seen (see exploration_map.py)"""
+        return self.world.exploration.is_explored(x, y)
+
+    def precipitation(self, x: int, y: int) -> float:
+        field = self.world.weather_field
+        if field is None:
+            return 0.0
+        return field.precipitation[y * field.width + x]
+
+    @property
+    def weather_version(self) -> Any:
+        """Changes whenever the weather field is simulated further"""
+        field = self.world.weather_field
+        return field.hours if field is not None else None
+
+
+def weather_band(precipitation: float) -> int:
+    """0 for dry, then 1-3 for light, moderate and heavy rain"""
+    return bisect_right(WEATHER_BANDS, precipitation)
+
+
+class WorldMapRenderer:
+    """Tile-cached renderer of map rows"""
+
+    def __init__(self, source, max_tiles: int = MAX_CACHED_TILES):
+        """
+        Args:
+            source: WorldMapSource, or anything with the same methods
+            max_tiles: Tiles kept in the LRU cache
+        """
+        self.source = source
+        self.max_tiles = max_tiles
+        # (tx, ty, zoom, layer) -> (rows of per-cell segments, weather bands)
+        self.tiles: "OrderedDict[Tuple[int, int, int, str], Tuple[List[List[Segment]], Optional[tuple]]]" = OrderedDict()
+        self.tiles_rendered = 0
+        self._weather_version = source.weather_version
+        self._segments: Dict[tuple, Segment] = {}
+        self._blank = Segment(" " * CELL_WIDTH)
+
+    def size(self, zoom: int) -> Tuple[int, int]:
+        """Map size in cells (columns, rows) at a zoom level"""
+        return (-(-self.source.width // zoom), -(-self.source.height // zoom))
+
+    def render_row(self, row: int, x0: int, ncells: int, zoom: int, layer: str = "terrain",
+                   player: Optional[Tuple[int, int]] = None) -> List[Segment]:
+        """
+        Render part of one row of map cells.
+
+        Args:
+            row: Cell row
+            x0: First cell column
+            ncells: Cells to render
+            zoom: Hexes per cell edge (one of ZOOM_LEVELS)
+            layer: One of MAP_LAYERS
+            player: Player's hex (x, y), marked on the map
+
+        Returns:
+            ncells segments of CELL_WIDTH characters each
+        """
+        if layer == "weather" and self.source.weather_version != self._weather_version:
+            self.refresh_weather()
+
+        columns, rows = self.size(zoom)
+        ty, ry = divmod(row, CHUNK_SIZE)
+        segments: List[Segment] = []
+        cx, end = x0, x0 + ncells
+        while cx < end:
+            if not 0 <= row < rows or not 0 <= cx < columns:
+                segments.append(self._blank)
+                cx += 1
+                continue
+            tx, offset = divmod(cx, CHUNK_SIZE)
+            take = min(CHUNK_SIZE - offset, end - cx, columns - cx)
+            segments.extend(self.tile(tx, ty, zoom, layer)[ry][offset:offset + take])
+            cx += take
+
+        if player is not None:
+            px, py = player[0] // zoom, player[1] // zoom
+            if py == row and x0 <= px < end:
+                segments[px - x0] = self._segment(PLAYER_GLYPH, "player", None, bold=True)
+        return segments
+
+    def tile(self, tx: int, ty: int, zoom: int, layer: str) -> List[List[Segment]]:
+        """Rows of one tile, from the cache or freshly rendered"""
+        key = (tx, ty, zoom, layer)
+        cached = self.tiles.get(key)
+        if cached is not None:
+            self.tiles.move_to_end(key)
+            return cached[0]
+
+        cached = self._render_tile(tx, ty, zoom, layer)
+        self.tiles[key] = cached
+        if len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+        return cached[0]
+
+    def invalidate_hex(self, x: int, y: int) -> int:
+        """
+        Drop the tiles showing a hex, at every zoom and layer.
+
+        Returns:
+            Number of tiles dropped
+        """
+        dropped = 0
+        for zoom in ZOOM_LEVELS:
+            tx, ty = x // zoom // CHUNK_SIZE, y // zoom // CHUNK_SIZE
+            for layer in MAP_LAYERS:
+                if self.tiles.pop((tx, ty, zoom, layer), None) is not None:
+                    dropped += 1
+        return dropped
+
+    def refresh_weather(self) -> int:
+        """
+        Catch up with the weather, dropping weather tiles whose rain bands changed.
+
+        Returns:
+            Number of tiles dropped
+        """
+        self._weather_version = self.source.weather_version
+        stale = [key for key, (_, bands) in self.tiles.items()
+                 if key[3] == "weather" and self._weather_bands(*key[:3]) != bands]
+        for key in stale:
+            del self.tiles[key]
+        return len(stale)
+
+    def _cells(self, tx: int, ty: int, zoom: int):
+        """Cell coordinates of a tile, row by row, clipped to the map"""
+        columns, rows = self.size(zoom)
+        xs = range(tx * CHUNK_SIZE, min((tx + 1) * CHUNK_SIZE, columns))
+        return [(cx, cy) for cy in range(ty * CHUNK_SIZE, min((ty + 1) * CHUNK_SIZE, rows)) for cx in xs]
+
+    def _centre(self, cx: int, cy: int, zoom: int) -> Tuple[int, int]:
+        """The hex a cell takes its biome and weather from"""
+        return (min(cx * zoom + zoom // 2, self.source.width - 1),
+                min(cy * zoom + zoom // 2, self.source.height - 1))
+
+    def _weather_bands(self, tx: int, ty: int, zoom: int) -> tuple:
+        precipitation = self.source.precipitation
+        return tuple(weather_band(precipitation(*self._centre(cx, cy, zoom)))
+                     for cx, cy in self._cells(tx, ty, zoom))
+
+    def _render_tile(self, tx: int, ty: int, zoom: int, layer: str):
+        self.tiles_rendered += 1
+        cells = self._cells(tx, ty, zoom)
+        bands = self._weather_bands(tx, ty, zoom) if layer == "weather" else None
+
+        rows: List[List[Segment]] = []
+        last_row = None
+        for i, (cx, cy) in enumerate(cells):
+            if cy != last_row:
+                rows.append([])
+                last_row = cy
+            rows[-1].append(self._render_cell(cx, cy, zoom, bands[i] if bands else 0))
+        return rows, bands
+
+    def _render_cell(self, cx: int, cy: int, zoom: int, band: int) -> Segment:
+        """Segment of one cell: its centre hex's biome, with any water or exploration in it"""
+        source = self.source
+        hex_info = source.hex_info
+        is_explored = source.is_explored
+        info = hex_info(*self._centre(cx, cy, zoom)) or {}
+
+        # Zoomed out, a cell looks at an evenly spaced grid of its hexes
+        step = -(-zoom // MAX_CELL_SAMPLES)
+        xs = range(cx * zoom, min(cx * zoom + zoom, source.width), step)
+        water = None
+        explored = False
+        for y in range(cy * zoom, min(cy * zoom + zoom, source.height), step):
+            for x in xs:
+                if water is None:
+                    sample = hex_info(x, y)
+                    if sample:
+                        water = "lake" if sample.get("lake") else "river" if sample.get("river") else None
+                if not explored:
+                    explored = is_explored(x, y)
+            if explored and water is not None:
+                break
+
+        shade = _SHADES[bisect_right(ELEVATION_BANDS, info.get("elevation_raw", 0.0))]
+        if band:
+            return self._segment(WEATHER_GLYPHS[band - 1], f"rain_{band}", shade, dim=not explored)
+        if water is not None:
+            return self._segment(WATER_GLYPHS[water], water, shade, dim=not explored)
+        biome = info.get("biome", "unknown")
+        return self._segment(BIOME_GLYPHS.get(biome, "?"), biome if biome in MAP_COLORS else "unknown",
+                             shade, dim=not explored)
+
+    def _segment(self, glyph: str, color: str, shade: Optional[str], dim: bool = False,
+                 bold: bool = False) -> Segment:
+        """Shared segment per glyph and style (tiles hold thousands of cells)"""
+        key = (glyph, color, shade, dim, bold)
+        segment = self._segments.get(key)
+        if segment is None:
+            style = Style(color=MAP_COLORS[color], bgcolor=MAP_COLORS[shade] if shade else None,
+                          dim=dim, bold=bold)
+            segment = self._segments[key] = Segment(glyph.ljust(CELL_WIDTH), style)
+        return segment
@@ -6,9 +6,14 @@ This package contains utility functions and helper classes used throughout the g
 
 # Import utility functions for easy access
 from .utils import *
+from .rng import RngService, RngStream, get_rng, get_rng_service
+from .alias_table import AliasTable
+from .word_trie import WordTrie
 
 __all__ = [
     'roll_d20', 'roll_dice', 'format_modifier', 'calculate_distance',
     'Coordinates', 'Dice',
+    'RngService', 'RngStream', 'get_rng', 'get_rng_service', 'AliasTable',
+    'WordTrie',
     'HexCoords', 'Direction'  # Type aliases for coordinate representations
 ]
\ No newline at end of file
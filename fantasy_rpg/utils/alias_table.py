@@ -0,0 +1,82 @@
+"""
+Fantasy RPG - Alias Table
+
+Constant-time weighted random selection (Vose's alias method).
+
+Building a table is O(n); every pick afterwards costs one random draw and
+one array lookup, however many entries the table has. Use it for spawn and
+drop tables that are sampled far more often than they change.
+"""
+
+import random
+from array import array
+from typing import Any, List, Optional, Sequence
+
+
+class AliasTable:
+    """Weighted table of items sampled in O(1) per pick"""
+
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]):
+        """
+        Build the alias table.
+
+        Args:
+            items: Entries to pick from
+            weights: Relative weight of each entry; entries with weight <= 0
+                can never be picked
+        """
+        pairs = [(item, float(weight)) for item, weight in zip(items, weights) if weight > 0]
+        self.items: List[Any] = [item for item, _ in pairs]
+        self.total_weight = sum(weight for _, weight in pairs)
+
+        count = len(self.items)
+        self._probability = array("d", [1.0]) * count
+        self._alias = array("l", range(count))
+        if count == 0:
+            return
+
+        # Scale weights so the average is 1, then pair each under-full slot
+        # with an over-full one that tops it up
+        scaled = [weight * count / self.total_weight for _, weight in pairs]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Whatever is left is full up to rounding error
+        for i in small + large:
+            self._probability[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def pick(self, rng: random.Random) -> Optional[Any]:
+        """
+        Pick one entry with probability proportional to its weight.
+
+        Args:
+            rng: Random source (a single random() draw is used)
+
+        Returns:
+            The picked entry, or None if the table is empty
+        """
+        count = len(self.items)
+        if count == 0:
+            return None
+
+        # One draw supplies both the slot and the coin flip within it
+        position = rng.random() * count
+        slot = int(position)
+        if slot >= count:
+            slot = count - 1
+        if position - slot < self._probability[slot]:
+            return self.items[slot]
+        return self.items[self._alias[slot]]
@@ -0,0 +1,267 @@
+"""
+Fantasy RPG - RNG Service
+
+Central source of randomness with named, independently seeded streams.
+
+Each system draws from its own stream (weather, loot, combat, faint,
+worldgen, ...) so that changing how often one system rolls never shifts the
+results of another. Stream seeds are derived from one master seed, which
+makes a whole session reproducible from that seed.
+
+The service can record every draw to a compact log. Loading that log back
+with replay() makes each stream return exactly the recorded values, so a bug
+report can be reproduced without re-running the whole session.
+"""
+
+import hashlib
+import random
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+# Streams used by the game systems
+STREAM_NAMES = ("weather", "loot", "combat", "checks", "faint", "worldgen")
+
+RNG_LOG_VERSION = 1
+
+
+def derive_seed(master_seed: int, name: str) -> int:
+    """Derive a stable 64-bit seed for a named stream from the master seed"""
+    digest = hashlib.sha256(f"{master_seed}:{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class RngStream(random.Random):
+    """
+    A random.Random that can record and replay its draws.
+
+    Every higher-level method (randint, choice, uniform, shuffle, ...) is
+    built on random() and getrandbits(), so hooking those two captures all
+    draws. Floats and ints are kept apart by type in the draw log.
+    """
+
+    def __init__(self, name: str, seed: int):
+        self.name = name
+        self.initial_seed = seed
+        self.draw_count = 0
+        self.recorded: Optional[List] = None  # Draw log while recording
+        self._replay: Optional[deque] = None  # Pending draws while replaying
+        super().__init__(seed)
+
+    def restart(self, seed: int):
+        """Reseed the stream and reset its draw count"""
+        self.initial_seed = seed
+        self.draw_count = 0
+        self._replay = None
+        self.seed(seed)
+        if self.recorded is not None:
+            self.recorded = []
+
+    def state_dict(self) -> Dict[str, Any]:
+        """JSON-serializable position of the stream, including the generator's internal state"""
+        version, internal, gauss_next = self.getstate()
+        return {
+            "seed": self.initial_seed,
+            "draw_count": self.draw_count,
+            "state": [version, list(internal), gauss_next]
+        }
+
+    def load_state_dict(self, data: Dict[str, Any]):
+        """Continue from a position saved with state_dict()"""
+        version, internal, gauss_next = data["state"]
+        self.setstate((version, tuple(internal), gauss_next))
+        self.initial_seed = data.get("seed", self.initial_seed)
+        self.draw_count = data.get("draw_count", 0)
+        self._replay = None
+
+    def random(self) -> float:
+        if self._replay:
+            value = self._replay.popleft()
+        else:
+            value = super().random()
+        self.draw_count += 1
+        if self.recorded is not None:
+            self.recorded.append(value)
+        return value
+
+    def getrandbits(self, k: int) -> int:
+        if self._replay:
+            value = self._replay.popleft()
+        else:
+            value = super().getrandbits(k)
+        self.draw_count += 1
+        if self.recorded is not None:
+            self.recorded.append(value)
+        return value
+
+
+class RngService:
+    """Hands out named random streams and records or replays their draws"""
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the service.
+
+        Args:
+            seed: Master seed; a random one is chosen if not given
+        """
+        self.seed = seed if seed is not None else random.SystemRandom().randint(1, 2**31 - 1)
+        self.streams: Dict[str, RngStream] = {}
+        self.recording = False
+        self._restored: Dict[str, Dict[str, Any]] = {}  # States for streams not created yet
+
+    def stream(self, name: str) -> RngStream:
+        """
+        Get the stream for a name, creating it from the master seed if needed.
+
+        Args:
+            name: Stream name (see STREAM_NAMES)
+
+        Returns:
+            RngStream seeded from the master seed and the name
+        """
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = self._register(RngStream(name, derive_seed(self.seed, name)))
+        return rng
+
+    def seeded_stream(self, name: str, seed: int) -> RngStream:
+        """
+        Replace a named stream with one using an explicit seed.
+
+        Used where results must depend only on a known seed, such as world
+        generation from the world seed.
+
+        Args:
+            name: Stream name
+            seed: Seed for the new stream
+
+        Returns:
+            The new RngStream
+        """
+        return self._register(RngStream(name, seed))
+
+    def _register(self, rng: RngStream) -> RngStream:
+        if self.recording:
+            rng.recorded = []
+        restored = self._restored.get(rng.name)
+        if restored and restored["seed"] == rng.initial_seed:
+            # A snapshot was restored before this stream was created
+            rng.load_state_dict(self._restored.pop(rng.name))
+        self.streams[rng.name] = rng
+        return rng
+
+    def reseed(self, seed: int):
+        """
+        Set a new master seed and restart all streams from it.
+
+        Streams are reseeded in place so references held by other systems
+        (e.g. Dice) stay valid.
+        """
+        self.seed = seed
+        self._restored = {}
+        for name, rng in self.streams.items():
+            rng.restart(derive_seed(seed, name))
+
+    def start_recording(self):
+        """Record every draw from now on"""
+        self.recording = True
+        for rng in self.streams.values():
+            if rng.recorded is None:
+                rng.recorded = []
+
+    def stop_recording(self):
+        """Stop recording and discard the draw log"""
+        self.recording = False
+        for rng in self.streams.values():
+            rng.recorded = None
+
+    def get_log(self) -> Dict[str, Any]:
+        """
+        Get the recorded draws as a JSON-serializable log.
+
+        Returns:
+            Dict with the master seed and, per stream, its seed and draws
+        """
+        return {
+            "version": RNG_LOG_VERSION,
+            "seed": self.seed,
+            "streams": {
+                name: {"seed": rng.initial_seed, "draws": list(rng.recorded or [])}
+                for name, rng in self.streams.items()
+            }
+        }
+
+    def replay(self, log: Dict[str, Any]):
+        """
+        Make streams return the draws recorded in a log.
+
+        Streams are restarted from their recorded seeds; once a stream's
+        recorded draws run out it keeps generating from its own state.
+
+        Args:
+            log: Log produced by get_log()
+        """
+        self.seed = log.get("seed", self.seed)
+        for name, data in log.get("streams", {}).items():
+            rng = self.stream(name)
+            rng.restart(data.get("seed", derive_seed(self.seed, name)))
+            rng._replay = deque(data.get("draws", []))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Full JSON-serializable state of every stream.
+
+        Unlike get_state(), this includes the generator's internal state so
+        restore() continues each stream exactly where it was.
+        """
+        streams = {name: rng.state_dict() for name, rng in self.streams.items()}
+        return {"seed": self.seed, "streams": streams}
+
+    def restore(self, snapshot: Dict[str, Any]):
+        """
+        Restore stream states saved with snapshot().
+
+        Streams created after this with the same seed (e.g. by a lazily
+        built or rebuilt generator) pick up their saved state once.
+
+        Args:
+            snapshot: Data produced by snapshot()
+        """
+        self.seed = snapshot.get("seed", self.seed)
+        saved = snapshot.get("streams", {})
+        self._restored = dict(saved)
+        for name, rng in self.streams.items():
+            if name in saved:
+                rng.load_state_dict(saved[name])
+            else:
+                # Not drawn from before the snapshot - start fresh as it would have
+                rng.restart(derive_seed(self.seed, name))
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Compact state of all streams: master seed plus per-stream seed and draw count.
+
+        Streams restored from a snapshot but not created again yet report
+        their saved position.
+        """
+        streams = {name: [data["seed"], data.get("draw_count", 0)] for name, data in self._restored.items()}
+        streams.update((name, [rng.initial_seed, rng.draw_count]) for name, rng in self.streams.items())
+        return {"seed": self.seed, "streams": streams}
+
+
+# Global RNG service instance
+_rng_service = None
+
+
+def get_rng_service() -> RngService:
+    """Get the global RNG service instance"""
+    global _rng_service
+    if _rng_service is None:
+        _rng_service = RngService()
+    return _rng_service
+
+
+def get_rng(name: str) -> RngStream:
+    """Get a named stream from the global RNG service"""
+    return get_rng_service().stream(name)
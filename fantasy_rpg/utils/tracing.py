@@ -0,0 +1,291 @@
+"""
+Fantasy RPG - Tracing
+
+Per-command latency tracing.
+
+Spans time named stages of the command pipeline: input, action dispatch,
+time advance, condition checks, world lookups and UI refresh. Each finished
+span is written into a fixed-size ring buffer of parallel arrays, so memory
+stays constant however long a session runs. Tracing is off by default, and
+while it is off span() and @traced cost a single flag check.
+
+With profiling on, every command also runs under cProfile and the profiles
+of the slowest N commands are kept for the report.
+"""
+
+import cProfile
+import functools
+import heapq
+import io
+import math
+import pstats
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Spans kept in the ring buffer
+DEFAULT_CAPACITY = 4096
+
+# Slowest commands whose profiles are kept
+DEFAULT_PROFILE_KEEP = 5
+
+# Functions listed per profiled command in the report
+PROFILE_LINES = 12
+
+# Root span around each command
+COMMAND_SPAN = "command"
+
+# Default file for dump_report()
+REPORT_FILE = "perf_report.txt"
+
+
+class _NullSpan:
+    """Span used while tracing is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _CommandSpan(_Span):
+    """Root span of a command; runs the command under cProfile when profiling"""
+    __slots__ = ("text", "profiler")
+
+    def __init__(self, tracer: "Tracer", text: str):
+        super().__init__(tracer, COMMAND_SPAN)
+        self.text = text
+        self.profiler = None
+
+    def __enter__(self):
+        self.tracer.command_count += 1
+        if self.tracer.profile_keep > 0:
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+            except ValueError:
+                self.profiler = None  # Another profiler is already running
+        return super().__enter__()
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.tracer._keep_profile(duration, self.text, self.profiler)
+        self.tracer.record(self.name, duration)
+        return False
+
+
+class Tracer:
+    """Ring buffer of timed spans with percentile reporting"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Number of most recent spans kept
+        """
+        self.enabled = False
+        self.capacity = capacity
+        self.profile_keep = 0
+        self.command_count = 0
+
+        self._name_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._span_names = array("H", [0]) * capacity
+        self._durations = array("d", [0.0]) * capacity
+        self._commands = array("L", [0]) * capacity
+        self._next = 0
+        self._count = 0
+
+        # Min-heap of (duration, command number, text, profiler) for the slowest commands
+        self._profiles: List[Tuple[float, int, str, cProfile.Profile]] = []
+
+    def enable(self, profile_keep: Optional[int] = None):
+        """
+        Start tracing.
+
+        Args:
+            profile_keep: Keep cProfile captures of this many slowest commands
+                (0 turns profiling off, None leaves it as it is)
+        """
+        self.enabled = True
+        if profile_keep is not None:
+            self.profile_keep = max(0, profile_keep)
+            self._profiles = heapq.nlargest(self.profile_keep, self._profiles)
+            heapq.heapify(self._profiles)
+
+    def disable(self):
+        """Stop tracing (recorded spans are kept)"""
+        self.enabled = False
+
+    def reset(self):
+        """Drop all recorded spans and profiles"""
+        self._next = 0
+        self._count = 0
+        self.command_count = 0
+        self._profiles = []
+
+    def span(self, name: str):
+        """Context manager timing a named span"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def command(self, text: str):
+        """Context manager around one whole command"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _CommandSpan(self, text)
+
+    def record(self, name: str, duration: float):
+        """Store a finished span"""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+
+        index = self._next
+        self._span_names[index] = name_id
+        self._durations[index] = duration
+        self._commands[index] = self.command_count
+        self._next = (index + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _keep_profile(self, duration: float, text: str, profiler: cProfile.Profile):
+        entry = (duration, self.command_count, text, profiler)
+        if len(self._profiles) < self.profile_keep:
+            heapq.heappush(self._profiles, entry)
+        elif self._profiles and duration > self._profiles[0][0]:
+            heapq.heapreplace(self._profiles, entry)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def spans(self) -> List[Tuple[str, float, int]]:
+        """Recorded (name, seconds, command number) spans, oldest first"""
+        start = (self._next - self._count) % self.capacity
+        result = []
+        for offset in range(self._count):
+            index = (start + offset) % self.capacity
+            result.append((self._names[self._span_names[index]], self._durations[index], self._commands[index]))
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Latency statistics per span name over the ring buffer.
+
+        Returns:
+            Dictionary mapping span name -> count, total, p50, p95, p99 and max (seconds)
+        """
+        by_name: Dict[str, List[float]] = {}
+        for name, duration, _ in self.spans():
+            by_name.setdefault(name, []).append(duration)
+
+        stats = {}
+        for name, durations in by_name.items():
+            durations.sort()
+            stats[name] = {
+                "count": len(durations),
+                "total": sum(durations),
+                "p50": _percentile(durations, 50),
+                "p95": _percentile(durations, 95),
+                "p99": _percentile(durations, 99),
+                "max": durations[-1]
+            }
+        return stats
+
+    def slowest_commands(self) -> List[Tuple[float, int, str, cProfile.Profile]]:
+        """Profiled commands, slowest first"""
+        return sorted(self._profiles, key=lambda entry: entry[0], reverse=True)
+
+    def report(self, profile_lines: int = PROFILE_LINES) -> str:
+        """Text report: percentiles per span and the profiles of the slowest commands"""
+        stats = self.stats()
+        if not stats:
+            return "No spans recorded." if self.enabled else "Tracing is off - use 'perf on' to start it."
+
+        lines = [f"=== PERF ({self.command_count} commands, {len(self)} spans) ===",
+                 f"{'span':<28} {'count':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"]
+        for name, entry in sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True):
+            lines.append(f"{name:<28} {entry['count']:>6} {_ms(entry['p50'])} {_ms(entry['p95'])} "
+                         f"{_ms(entry['p99'])} {_ms(entry['max'])}")
+
+        for duration, number, text, profiler in self.slowest_commands():
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(profile_lines)
+            lines.append("")
+            lines.append(f"--- Command #{number} '{text}' took {duration * 1000:.1f}ms ---")
+            lines.extend(line for line in out.getvalue().splitlines() if line.strip())
+        return "\n".join(lines)
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    rank = max(1, math.ceil(percent / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:>7.2f}ms"
+
+
+# Global tracer instance
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer"""
+    return _tracer
+
+
+def span(name: str):
+    """Time a block as a named span of the global tracer"""
+    return _tracer.span(name)
+
+
+def traced(name: str) -> Callable:
+    """Decorator timing every call of a function as a named span"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(_tracer, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def dump_report(path: str = REPORT_FILE) -> str:
+    """
+    Write the global tracer's report to a file.
+
+    Returns:
+        The path written
+    """
+    with open(path, "w") as f:
+        f.write(_tracer.report() + "\n")
+    return path
@@ -31,10 +31,14 @@ This codebase uses three different coordinate representations for different purp
 - Direction → HexCoords: When translating user movement commands to world positions
 """
 
-import random
 from dataclasses import dataclass
 from typing import Tuple, Literal
 
+try:
+    from .rng import RngStream, get_rng
+except ImportError:
+    from fantasy_rpg.utils.rng import RngStream, get_rng
+
 # Type aliases for coordinate representations
 HexCoords = Tuple[int, int]
 """
@@ -63,9 +67,10 @@ class Dice:
     def __init__(self, seed: int = None):
         """Initialize dice roller with optional seed for deterministic results."""
         if seed is not None:
-            self.rng = random.Random(seed)
+            self.rng = RngStream("dice", seed)
         else:
-            self.rng = random.Random()
+            # Unseeded dice share the RNG service's combat stream
+            self.rng = get_rng("combat")
     
     def roll(self, sides: int, count: int = 1, modifier: int = 0) -> int:
         """
@@ -167,20 +172,21 @@ def roll_d20(advantage: bool = False, disadvantage: bool = False) -> int:
         advantage = False
         disadvantage = False
     
+    rng = get_rng("checks")
     if advantage:
-        roll1 = random.randint(1, 20)
-        roll2 = random.randint(1, 20)
+        roll1 = rng.randint(1, 20)
+        roll2 = rng.randint(1, 20)
         result = max(roll1, roll2)
         print(f"d20 with advantage: {roll1}, {roll2} -> {result}")
         return result
     elif disadvantage:
-        roll1 = random.randint(1, 20)
-        roll2 = random.randint(1, 20)
+        roll1 = rng.randint(1, 20)
+        roll2 = rng.randint(1, 20)
         result = min(roll1, roll2)
         print(f"d20 with disadvantage: {roll1}, {roll2} -> {result}")
         return result
     else:
-        result = random.randint(1, 20)
+        result = rng.randint(1, 20)
         print(f"d20: {result}")
         return result
 
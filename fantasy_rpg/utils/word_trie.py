@@ -0,0 +1,116 @@
+"""
+Fantasy RPG - Word Trie
+
+Prefix trie plus deletion neighbourhood, shared by the command line's trie
+and the per-area object index.
+
+Each key (a word or name) is stored with a value; a key can hold several
+values and a value can sit under several keys. Every trie node keeps the
+values of the keys below it, so listing the values under a prefix costs
+O(length of the prefix). The deletion neighbourhood (every key with one
+character removed) finds the keys within one typo of a word.
+
+Keys can be added and removed one at a time; branches and variants left
+empty are pruned.
+"""
+
+from typing import Any, Dict, List, Set, Tuple
+
+
+# Entries listed at most in "did you mean" suggestions
+MAX_SUGGESTIONS = 5
+
+# Trie node key holding the values below a node
+_VALUES = "\0"
+
+
+def deletions(word: str) -> Set[str]:
+    """All variants of a word with at most one character removed"""
+    variants = {word}
+    for i in range(len(word)):
+        variants.add(word[:i] + word[i + 1:])
+    return variants
+
+
+class WordTrie:
+    """Prefix and one-typo lookup from keys to the values stored under them"""
+
+    def __init__(self, min_fuzzy_length: int = 0):
+        """
+        Create an empty trie.
+
+        Args:
+            min_fuzzy_length: Keys and words shorter than this get no
+                typo-tolerant matching (too many false hits)
+        """
+        self.min_fuzzy_length = min_fuzzy_length
+        self._root: Dict[str, Any] = {}
+        self._fuzzy: Dict[str, Set[str]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._root or self._fuzzy)
+
+    def add(self, key: str, value: str):
+        """Store a value under a key"""
+        node = self._root
+        node.setdefault(_VALUES, set()).add(value)
+        for char in key:
+            node = node.setdefault(char, {})
+            node.setdefault(_VALUES, set()).add(value)
+        if len(key) >= self.min_fuzzy_length:
+            for variant in deletions(key):
+                self._fuzzy.setdefault(variant, set()).add(value)
+
+    def discard(self, key: str, value: str):
+        """Drop a value from under a key, pruning what it leaves empty"""
+        # A value stored under several keys sharing a prefix may already be
+        # gone from part of this path, so walk as far as it still goes
+        path: List[Tuple[Dict[str, Any], str]] = []
+        node = self._root
+        for char in key:
+            child = node.get(char)
+            if child is None:
+                break
+            path.append((node, char))
+            node = child
+
+        self._discard_value(self._root, value)
+        for parent, char in path:
+            self._discard_value(parent[char], value)
+        for parent, char in reversed(path):
+            if not parent[char]:
+                del parent[char]
+
+        if len(key) >= self.min_fuzzy_length:
+            for variant in deletions(key):
+                values = self._fuzzy.get(variant)
+                if values is not None:
+                    values.discard(value)
+                    if not values:
+                        del self._fuzzy[variant]
+
+    def prefix(self, prefix: str) -> Set[str]:
+        """Values under keys starting with a prefix (all of them for ""); do not modify"""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+        return node.get(_VALUES, set())
+
+    def fuzzy(self, word: str) -> Set[str]:
+        """Values under keys within one edit of a word"""
+        values = set()
+        if len(word) < self.min_fuzzy_length:
+            return values
+        for variant in deletions(word):
+            values |= self._fuzzy.get(variant, set())
+        return values
+
+    @staticmethod
+    def _discard_value(node: Dict[str, Any], value: str):
+        values = node.get(_VALUES)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del node[_VALUES]
@@ -20,6 +20,7 @@ from .enhanced_biomes import EnhancedBiomeSystem
 
 # Weather system components
 from .weather_core import WeatherState, generate_weather_state
+from .weather_field import WeatherField
 from .character_weather import CharacterWeatherResistance, create_character_archetypes
 from .travel_system import TravelMethod, BiomeWeatherModifier, create_travel_methods, create_biome_weather_modifiers
 
@@ -37,7 +38,7 @@ __all__ = [
     'TerrainGenerator', 'NoiseGenerator', 'BiomeClassifier', 'EnhancedBiomeSystem',
     
     # Weather system
-    'WeatherState', 'generate_weather_state',
+    'WeatherState', 'generate_weather_state', 'WeatherField',
     'CharacterWeatherResistance', 'create_character_archetypes',
     'TravelMethod', 'BiomeWeatherModifier', 'create_travel_methods', 'create_biome_weather_modifiers',
     
@@ -0,0 +1,221 @@
+"""
+Fantasy RPG - Exploration Map
+
+Fog of war over the overworld: which hexes the player has explored (ever
+seen), visited (stood in) and can see right now.
+
+Each of the three is a packed bitset over the world grid, one bit per hex
+at index y * width + x, so "has the player seen this hex" is one byte
+lookup and a 1000x1000 world costs 125 KB per bitset. The explored and
+visited hexes are counted as they are set, so exploration stats are O(1)
+too.
+
+Moving reveals the hexes within sight of the new hex. Sight reaches
+further from higher ground: BASE_SIGHT_RADIUS hexes from lowland, more from
+hills and mountains (see SIGHT_RADII). Distances are in hex moves, as in
+spatial_index.py.
+
+In a save each bitset is stored run-length encoded: a sequence of
+(run length, byte) pairs, the run length as an unsigned LEB128 varint.
+Long stretches of unexplored world shrink to a few bytes.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Sight radius from low ground, in hex moves
+BASE_SIGHT_RADIUS = 1
+
+# (raw elevation, sight radius) from the highest band down; first match wins
+SIGHT_RADII = ((0.7, 3), (0.45, 2))
+
+# Bitsets kept per hex
+EXPLORATION_LAYERS = ("explored", "visited", "visible")
+
+_RUNS = re.compile(rb"(.)\1*", re.DOTALL)
+
+
+def sight_radius(elevation: float) -> int:
+    """Hexes visible in every direction from a hex of this raw elevation (0-1)"""
+    for threshold, radius in SIGHT_RADII:
+        if elevation >= threshold:
+            return radius
+    return BASE_SIGHT_RADIUS
+
+
+def rle_encode(data: bytes) -> bytes:
+    """Run-length encode bytes as (varint run length, byte) pairs"""
+    out = bytearray()
+    for match in _RUNS.finditer(data):
+        run = match.end() - match.start()
+        while run >= 0x80:
+            out.append((run & 0x7F) | 0x80)
+            run >>= 7
+        out.append(run)
+        out.append(data[match.start()])
+    return bytes(out)
+
+
+def rle_decode(data: bytes, size: int) -> bytearray:
+    """
+    Decode rle_encode() output.
+
+    Raises:
+        ValueError: If the data is truncated or does not decode to size bytes
+    """
+    out = bytearray()
+    pos = 0
+    while pos < len(data):
+        run = shift = 0
+        while True:
+            if pos >= len(data):
+                raise ValueError("Truncated run length")
+            byte = data[pos]
+            pos += 1
+            run |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        if pos >= len(data):
+            raise ValueError("Run without a value")
+        out += bytes((data[pos],)) * run
+        pos += 1
+        if len(out) > size:
+            break
+    if len(out) != size:
+        raise ValueError(f"Decoded {len(out)} bytes, expected {size}")
+    return out
+
+
+def _popcount(bits: bytearray) -> int:
+    return bin(int.from_bytes(bits, "little")).count("1")
+
+
+class ExplorationMap:
+    """Explored, visited and visible bitsets over the world grid"""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        nbytes = (self.size + 7) // 8
+        self.explored = bytearray(nbytes)
+        self.visited = bytearray(nbytes)
+        self.visible = bytearray(nbytes)
+        self.explored_count = 0
+        self.visited_count = 0
+        self._visible_indices: List[int] = []
+
+    def _index(self, x: int, y: int) -> Optional[int]:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+    @staticmethod
+    def _test(bits: bytearray, index: Optional[int]) -> bool:
+        return index is not None and bool(bits[index >> 3] & (1 << (index & 7)))
+
+    def is_explored(self, x: int, y: int) -> bool:
+        return self._test(self.explored, self._index(x, y))
+
+    def is_visited(self, x: int, y: int) -> bool:
+        return self._test(self.visited, self._index(x, y))
+
+    def is_visible(self, x: int, y: int) -> bool:
+        return self._test(self.visible, self._index(x, y))
+
+    def reveal(self, x: int, y: int, radius: int = BASE_SIGHT_RADIUS) -> List[Tuple[int, int]]:
+        """
+        Put the player at a hex: visit it and see everything within radius.
+
+        What was visible from the previous hex is no longer visible, but
+        stays explored.
+
+        Args:
+            x, y: Hex the player is in
+            radius: Sight radius in hex moves (see sight_radius())
+
+        Returns:
+            Hexes explored for the first time, as (x, y)
+        """
+        index = self._index(x, y)
+        if index is None:
+            return []
+
+        visible = self.visible
+        for old in self._visible_indices:
+            visible[old >> 3] &= ~(1 << (old & 7))
+        self._visible_indices = []
+
+        if not self._test(self.visited, index):
+            self.visited[index >> 3] |= 1 << (index & 7)
+            self.visited_count += 1
+
+        explored = self.explored
+        newly_explored = []
+        for hy in range(max(0, y - radius), min(self.height, y + radius + 1)):
+            row = hy * self.width
+            for hx in range(max(0, x - radius), min(self.width, x + radius + 1)):
+                i = row + hx
+                byte, bit = i >> 3, 1 << (i & 7)
+                visible[byte] |= bit
+                self._visible_indices.append(i)
+                if not explored[byte] & bit:
+                    explored[byte] |= bit
+                    self.explored_count += 1
+                    newly_explored.append((hx, hy))
+        return newly_explored
+
+    def stats(self) -> Dict[str, Any]:
+        """Explored and visited hex counts, and the share of the world explored"""
+        return {
+            "explored": self.explored_count,
+            "visited": self.visited_count,
+            "total": self.size,
+            "explored_percent": 100.0 * self.explored_count / self.size if self.size else 0.0
+        }
+
+    def to_dict(self, text: bool = False) -> Dict[str, Any]:
+        """
+        Serialize the bitsets run-length encoded.
+
+        Args:
+            text: Store the encoded bitsets as hex strings, for JSON saves
+                (binary save files keep them as bytes)
+        """
+        data: Dict[str, Any] = {"width": self.width, "height": self.height}
+        for name in EXPLORATION_LAYERS:
+            encoded = rle_encode(getattr(self, name))
+            data[name] = encoded.hex() if text else encoded
+        return data
+
+    def load_dict(self, data: Dict[str, Any]) -> bool:
+        """
+        Restore bitsets saved with to_dict().
+
+        Returns:
+            False (leaving the map unchanged) if the grid size differs or the
+            data does not decode
+        """
+        if data.get("width") != self.width or data.get("height") != self.height:
+            return False
+        nbytes = len(self.explored)
+        try:
+            planes = {}
+            for name in EXPLORATION_LAYERS:
+                encoded = data.get(name) or b""
+                if isinstance(encoded, str):
+                    encoded = bytes.fromhex(encoded)
+                planes[name] = rle_decode(encoded, nbytes)
+        except (TypeError, ValueError):
+            return False
+
+        self.explored = planes["explored"]
+        self.visited = planes["visited"]
+        self.visible = planes["visible"]
+        self.explored_count = _popcount(self.explored)
+        self.visited_count = _popcount(self.visited)
+        self._visible_indices = [byte * 8 + bit for byte, value in enumerate(self.visible) if value
+                                 for bit in range(8) if value & (1 << bit)]
+        return True
@@ -0,0 +1,228 @@
+"""
+Fantasy RPG - Route Planner
+
+Plans overworld routes between hexes using A* over travel-time costs.
+
+The grid is stored as a flat array of per-hex entry costs (hours to travel
+into a hex). A small set of landmarks is precomputed once per cost grid and
+used for ALT (A*, Landmarks, Triangle inequality) lower bounds, which keeps
+the search focused even on very large worlds.
+"""
+
+import heapq
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+
+# Eight-way neighbourhood, matching the overworld movement directions
+NEIGHBOR_OFFSETS = (
+    (0, -1), (0, 1), (1, 0), (-1, 0),
+    (1, -1), (-1, -1), (1, 1), (-1, 1),
+)
+
+INFINITY = float("inf")
+
+
+@dataclass
+class Route:
+    """A planned overworld route"""
+    path: List[Tuple[int, int]] = field(default_factory=list)  # Includes start and goal
+    total_hours: float = 0.0
+    nodes_expanded: int = 0
+
+    @property
+    def steps(self) -> int:
+        """Number of hex-to-hex moves along the route"""
+        return max(0, len(self.path) - 1)
+
+
+class RoutePlanner:
+    """A* route planner with precomputed landmark heuristics"""
+
+    def __init__(self, width: int, height: int, cost_fn: Callable[[int, int], float],
+                 landmark_count: int = 8):
+        """
+        Build the cost grid and landmark tables.
+
+        Args:
+            width: World width in hexes
+            height: World height in hexes
+            cost_fn: Returns hours to enter hex (x, y); inf for impassable hexes
+            landmark_count: Number of landmarks to precompute
+        """
+        self.width = width
+        self.height = height
+        self.costs = array("d", [0.0]) * (width * height)
+        for y in range(height):
+            row = y * width
+            for x in range(width):
+                self.costs[row + x] = cost_fn(x, y)
+
+        passable = [c for c in self.costs if c != INFINITY]
+        self.min_cost = min(passable) if passable else 0.0
+
+        # For each landmark L: distances from L (forward) and to L (backward).
+        # Entry costs make the graph directed, so both are needed for bounds.
+        self.landmarks: List[int] = []
+        self._from_landmark: List[array] = []
+        self._to_landmark: List[array] = []
+        self._select_landmarks(min(landmark_count, width * height))
+
+    def _index(self, coords: Tuple[int, int]) -> int:
+        return coords[1] * self.width + coords[0]
+
+    def _coords(self, index: int) -> Tuple[int, int]:
+        return (index % self.width, index // self.width)
+
+    def in_bounds(self, coords: Tuple[int, int]) -> bool:
+        """Check whether coordinates lie inside the grid"""
+        return 0 <= coords[0] < self.width and 0 <= coords[1] < self.height
+
+    def _dijkstra(self, source: int, reverse: bool = False) -> array:
+        """
+        Single-source shortest travel times over the whole grid.
+
+        Args:
+            source: Flat index of the source hex
+            reverse: If True, compute distances *to* source instead of from it
+
+        Returns:
+            Flat array of travel times (inf where unreachable)
+        """
+        width, height, costs = self.width, self.height, self.costs
+        dist = array("d", [INFINITY]) * (width * height)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+
+        while heap:
+            d, index = heapq.heappop(heap)
+            if d > dist[index]:
+                continue
+            x, y = index % width, index // width
+            # Forward edges cost the entry of the neighbour; reversed edges
+            # cost the entry of the hex we are expanding from
+            step_out = costs[index]
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbor = ny * width + nx
+                step = step_out if reverse else costs[neighbor]
+                if step == INFINITY:
+                    continue
+                nd = d + step
+                if nd < dist[neighbor]:
+                    dist[neighbor] = nd
+                    heapq.heappush(heap, (nd, neighbor))
+        return dist
+
+    def _select_landmarks(self, count: int):
+        """Pick landmarks by farthest-point selection, starting at a corner"""
+        if count <= 0:
+            return
+
+        candidate = 0
+        closest = None
+        for _ in range(count):
+            if candidate in self.landmarks:
+                break
+            forward = self._dijkstra(candidate)
+            self.landmarks.append(candidate)
+            self._from_landmark.append(forward)
+            self._to_landmark.append(self._dijkstra(candidate, reverse=True))
+
+            # Track each hex's distance to its nearest landmark and pick the
+            # reachable hex farthest from all landmarks chosen so far
+            if closest is None:
+                closest = array("d", forward)
+            else:
+                for i, d in enumerate(forward):
+                    if d < closest[i]:
+                        closest[i] = d
+            best, best_distance = candidate, -1.0
+            for i, d in enumerate(closest):
+                if d != INFINITY and d > best_distance:
+                    best, best_distance = i, d
+            candidate = best
+
+    def heuristic(self, index: int, goal: int) -> float:
+        """Admissible lower bound on travel time from index to goal"""
+        x, y = index % self.width, index // self.width
+        gx, gy = goal % self.width, goal // self.width
+        bound = self.min_cost * max(abs(gx - x), abs(gy - y))
+
+        for forward, backward in zip(self._from_landmark, self._to_landmark):
+            # d(v,t) >= d(L,t) - d(L,v)  and  d(v,t) >= d(v,L) - d(t,L)
+            a, b = forward[goal], forward[index]
+            if a != INFINITY and b != INFINITY and a - b > bound:
+                bound = a - b
+            a, b = backward[index], backward[goal]
+            if a != INFINITY and b != INFINITY and a - b > bound:
+                bound = a - b
+        return bound
+
+    def plan(self, start: Tuple[int, int], goal: Tuple[int, int],
+             cost_multiplier: float = 1.0) -> Optional[Route]:
+        """
+        Find the fastest route between two hexes.
+
+        Args:
+            start: Starting (x, y) coordinates
+            goal: Destination (x, y) coordinates
+            cost_multiplier: Uniform multiplier applied to every step (e.g. weather)
+
+        Returns:
+            Route, or None if the goal is unreachable or out of bounds
+        """
+        if not self.in_bounds(start) or not self.in_bounds(goal):
+            return None
+
+        source, target = self._index(start), self._index(goal)
+        if source == target:
+            return Route(path=[start], total_hours=0.0)
+        if self.costs[target] == INFINITY:
+            return None
+
+        width, height, costs = self.width, self.height, self.costs
+        g_score = {source: 0.0}
+        came_from = {}
+        closed = set()
+        heap = [(self.heuristic(source, target), 0.0, source)]
+        expanded = 0
+
+        while heap:
+            _, g, index = heapq.heappop(heap)
+            if index in closed:
+                continue
+            if index == target:
+                break
+            closed.add(index)
+            expanded += 1
+
+            x, y = index % width, index // width
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbor = ny * width + nx
+                step = costs[neighbor]
+                if step == INFINITY or neighbor in closed:
+                    continue
+                tentative = g + step
+                if tentative < g_score.get(neighbor, INFINITY):
+                    g_score[neighbor] = tentative
+                    came_from[neighbor] = index
+                    heapq.heappush(heap, (tentative + self.heuristic(neighbor, target), tentative, neighbor))
+        else:
+            return None
+
+        path = [goal]
+        index = target
+        while index != source:
+            index = came_from[index]
+            path.append(self._coords(index))
+        path.reverse()
+
+        return Route(path=path, total_hours=g_score[target] * cost_multiplier,
+                     nodes_expanded=expanded)
@@ -0,0 +1,222 @@
+"""
+Fantasy RPG - Spatial Index
+
+Nearest-feature queries over the overworld (water, shelter, settlements,
+landmarks and biomes).
+
+Features are bucketed into square grid cells, one grid per feature kind.
+A k-nearest query searches rings of cells outwards from the query point and
+stops as soon as no unsearched cell can hold anything closer, so it touches
+only the neighbourhood of the answer instead of the whole map.
+
+Distances are in hex moves: diagonal steps are allowed, so the distance
+between two hexes is the larger of the x and y differences.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Hexes per side of a grid cell
+DEFAULT_CELL_SIZE = 4
+
+# Compass names by octant, counter-clockwise from east (north is -y)
+COMPASS_DIRECTIONS = ("east", "northeast", "north", "northwest",
+                      "west", "southwest", "south", "southeast")
+
+
+@dataclass(frozen=True)
+class Feature:
+    """Something on the map that can be searched for"""
+    kind: str  # "river", "lake", "shelter", "settlement", "landmark" or "biome"
+    coords: Tuple[int, int]
+    name: str
+    detail: str = ""  # Kind-specific (river width, lake type, biome type, location id)
+
+
+def hex_distance(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+    """Moves between two hexes when diagonal steps are allowed"""
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+
+def compass_direction(origin: Tuple[int, int], target: Tuple[int, int]) -> str:
+    """Eight-way compass direction from origin to target ("here" if equal)"""
+    dx = target[0] - origin[0]
+    dy = origin[1] - target[1]  # North is up
+    if dx == 0 and dy == 0:
+        return "here"
+    octant = round(math.atan2(dy, dx) / (math.pi / 4)) % 8
+    return COMPASS_DIRECTIONS[octant]
+
+
+def _sort_key(entry: Tuple[int, int, Tuple[int, int], Feature]):
+    return entry[0], entry[1], entry[2], entry[3].kind, entry[3].name
+
+
+class SpatialIndex:
+    """Grid-bucket index of map features with k-nearest and radius queries"""
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        """
+        Args:
+            cell_size: Hexes per side of a grid cell
+        """
+        self.cell_size = max(1, cell_size)
+        self._grids: Dict[str, Dict[Tuple[int, int], List[Feature]]] = {}
+        self._bounds: Dict[str, Tuple[int, int, int, int]] = {}  # kind -> min/max cell x, min/max cell y
+        self._counts: Dict[str, int] = {}
+
+    def _cell(self, coords: Tuple[int, int]) -> Tuple[int, int]:
+        return (coords[0] // self.cell_size, coords[1] // self.cell_size)
+
+    def add(self, feature: Feature):
+        """Add a feature"""
+        cell = self._cell(feature.coords)
+        self._grids.setdefault(feature.kind, {}).setdefault(cell, []).append(feature)
+        self._counts[feature.kind] = self._counts.get(feature.kind, 0) + 1
+
+        bounds = self._bounds.get(feature.kind)
+        if bounds is None:
+            self._bounds[feature.kind] = (cell[0], cell[0], cell[1], cell[1])
+        else:
+            self._bounds[feature.kind] = (min(bounds[0], cell[0]), max(bounds[1], cell[0]),
+                                          min(bounds[2], cell[1]), max(bounds[3], cell[1]))
+
+    def remove(self, kind: str, coords: Tuple[int, int], where: Optional[Callable[[Feature], bool]] = None) -> int:
+        """
+        Remove features of a kind at a hex.
+
+        Returns:
+            Number of features removed
+        """
+        cell = self._grids.get(kind, {}).get(self._cell(coords))
+        if not cell:
+            return 0
+        keep = [f for f in cell if f.coords != tuple(coords) or (where is not None and not where(f))]
+        removed = len(cell) - len(keep)
+        cell[:] = keep
+        self._counts[kind] -= removed
+        return removed
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Number of features (of one kind, or in total)"""
+        if kind is None:
+            return sum(self._counts.values())
+        return self._counts.get(kind, 0)
+
+    def kinds(self) -> List[str]:
+        """Kinds that have features"""
+        return [kind for kind, count in self._counts.items() if count]
+
+    def nearest(self, coords: Tuple[int, int], kinds: Iterable[str], k: int = 1,
+                max_distance: Optional[int] = None,
+                where: Optional[Callable[[Feature], bool]] = None) -> List[Tuple[int, Feature]]:
+        """
+        Find the k nearest features.
+
+        Args:
+            coords: Query hex (x, y)
+            kinds: Feature kinds to search (a single kind or several)
+            k: Number of features to return
+            max_distance: Ignore features further away than this many moves
+            where: Optional filter on candidate features
+
+        Returns:
+            (distance, feature) pairs, nearest first; ties are broken by
+            straight-line distance, position, kind and name
+        """
+        kinds = [kinds] if isinstance(kinds, str) else [kind for kind in kinds]
+        kinds = [kind for kind in kinds if self._counts.get(kind)]
+        if k <= 0 or not kinds:
+            return []
+
+        x, y = coords
+        cx, cy = self._cell(coords)
+        max_ring = self._max_ring((cx, cy), kinds)
+        if max_distance is not None:
+            max_ring = min(max_ring, max_distance // self.cell_size + 1)
+
+        found: List[Tuple[int, int, Tuple[int, int], Feature]] = []
+        for ring in range(max_ring + 1):
+            for cell in self._ring_cells(cx, cy, ring):
+                for kind in kinds:
+                    for feature in self._grids[kind].get(cell, ()):
+                        distance = hex_distance(coords, feature.coords)
+                        if max_distance is not None and distance > max_distance:
+                            continue
+                        if where is not None and not where(feature):
+                            continue
+                        fx, fy = feature.coords
+                        found.append((distance, (fx - x) ** 2 + (fy - y) ** 2, (fx, fy), feature))
+
+            # Everything outside the searched block is at least this far away;
+            # stop once the k-th match is strictly closer, so ties are all seen
+            reach = min(x - (cx - ring) * self.cell_size, (cx + ring + 1) * self.cell_size - 1 - x,
+                        y - (cy - ring) * self.cell_size, (cy + ring + 1) * self.cell_size - 1 - y) + 1
+            if len(found) >= k:
+                found.sort(key=_sort_key)
+                if found[k - 1][0] < reach:
+                    break
+
+        found.sort(key=_sort_key)
+        return [(entry[0], entry[3]) for entry in found[:k]]
+
+    def within(self, coords: Tuple[int, int], radius: int, kinds: Optional[Iterable[str]] = None,
+               where: Optional[Callable[[Feature], bool]] = None) -> List[Tuple[int, Feature]]:
+        """
+        Find every feature within a number of moves.
+
+        Args:
+            coords: Query hex (x, y)
+            radius: Maximum distance in moves
+            kinds: Feature kinds to search (default: all)
+            where: Optional filter on candidate features
+
+        Returns:
+            (distance, feature) pairs, nearest first
+        """
+        if kinds is None:
+            kinds = self.kinds()
+        elif isinstance(kinds, str):
+            kinds = [kinds]
+
+        x, y = coords
+        found = []
+        for kind in kinds:
+            grid = self._grids.get(kind)
+            if not grid:
+                continue
+            low_x, low_y = self._cell((x - radius, y - radius))
+            high_x, high_y = self._cell((x + radius, y + radius))
+            for cell_x in range(low_x, high_x + 1):
+                for cell_y in range(low_y, high_y + 1):
+                    for feature in grid.get((cell_x, cell_y), ()):
+                        distance = hex_distance(coords, feature.coords)
+                        if distance <= radius and (where is None or where(feature)):
+                            fx, fy = feature.coords
+                            found.append((distance, (fx - x) ** 2 + (fy - y) ** 2, (fx, fy), feature))
+
+        found.sort(key=_sort_key)
+        return [(entry[0], entry[3]) for entry in found]
+
+    def _max_ring(self, cell: Tuple[int, int], kinds: List[str]) -> int:
+        """Ring that covers every cell holding features of these kinds"""
+        ring = 0
+        for kind in kinds:
+            low_x, high_x, low_y, high_y = self._bounds[kind]
+            ring = max(ring, cell[0] - low_x, high_x - cell[0], cell[1] - low_y, high_y - cell[1])
+        return ring
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int) -> Iterable[Tuple[int, int]]:
+        """Cells at exactly this Chebyshev distance from (cx, cy)"""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for offset in range(-ring, ring + 1):
+            yield (cx + offset, cy - ring)
+            yield (cx + offset, cy + ring)
+        for offset in range(-ring + 1, ring):
+            yield (cx - ring, cy + offset)
+            yield (cx + ring, cy + offset)
@@ -6,9 +6,13 @@ This module provides the foundational noise functions needed for geographic worl
 """
 
 import math
-import random
 from typing import Tuple, List, Dict
 
+try:
+    from ..utils.rng import get_rng_service
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng_service
+
 
 class NoiseGenerator:
     """
@@ -21,11 +25,12 @@ class NoiseGenerator:
     def __init__(self, seed: int = 12345):
         """Initialize noise generator with a seed for reproducible results."""
         self.seed = seed
-        random.seed(seed)
+        # World generation depends only on the world seed
+        self.rng = get_rng_service().seeded_stream("worldgen", seed)
         
         # Generate permutation table for noise
         self.perm = list(range(256))
-        random.shuffle(self.perm)
+        self.rng.shuffle(self.perm)
         self.perm = self.perm + self.perm  # Duplicate for easier indexing
         
         print(f"Initialized noise generator with seed {seed}")
@@ -179,8 +184,8 @@ class TerrainGenerator:
         # Generate random plate centers
         plate_centers = []
         for i in range(num_plates):
-            center_x = random.randint(0, width - 1)
-            center_y = random.randint(0, height - 1)
+            center_x = self.noise.rng.randint(0, width - 1)
+            center_y = self.noise.rng.randint(0, height - 1)
             plate_centers.append((center_x, center_y, i))
         
         print(f"Plate centers: {[(x, y) for x, y, _ in plate_centers]}")
@@ -268,7 +273,7 @@ class TerrainGenerator:
         
         for plate_id in range(num_plates):
             # Each plate has a base elevation tendency
-            base_elevation = random.uniform(0.2, 0.8)  # Ocean to continental
+            base_elevation = self.noise.rng.uniform(0.2, 0.8)  # Ocean to continental
             plate_type = "oceanic" if base_elevation < 0.4 else "continental"
             plate_elevations[plate_id] = {
                 "base": base_elevation,
@@ -580,12 +585,7 @@ class TerrainGenerator:
                     sink_coords = path[-1] if path else start_coords
                     
                     # Find or create watershed ID for this sink
-                    sink_watershed = None
-                    for coords, ws_id in watersheds.items():
-                        if coords == sink_coords:
-                            sink_watershed = ws_id
-                            break
-                    
+                    sink_watershed = watersheds.get(sink_coords)
                     if sink_watershed is None:
                         sink_watershed = watershed_id
                         watershed_id += 1
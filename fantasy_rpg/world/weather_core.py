@@ -6,9 +6,38 @@ Core weather data structures and basic weather generation functionality.
 
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
-import random
 import math
 
+try:
+    from ..utils.rng import get_rng
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng
+
+
+# Seasonal temperature adjustment (°F)
+SEASONAL_TEMPERATURE_ADJUSTMENTS = {
+    "winter": -15,
+    "spring": -5,
+    "summer": 10,
+    "autumn": 0
+}
+
+# Climate-specific temperature adjustment (°F)
+CLIMATE_TEMPERATURE_ADJUSTMENTS = {
+    "arctic": -20,
+    "temperate": 0,
+    "desert": 15,
+    "tropical": 20
+}
+
+# Chance of precipitation by climate type
+PRECIPITATION_CHANCE = {
+    "arctic": 0.3,
+    "temperate": 0.4,
+    "desert": 0.1,
+    "tropical": 0.6
+}
+
 
 @dataclass
 class WeatherState:
@@ -276,29 +305,15 @@ def generate_weather_state(base_temperature: float, season: str = "spring",
     Returns:
         WeatherState object with realistic weather conditions
     """
-    # Seasonal temperature adjustment
-    seasonal_adjustments = {
-        "winter": -15,
-        "spring": -5,
-        "summer": 10,
-        "autumn": 0
-    }
-    
-    # Climate-specific adjustments
-    climate_adjustments = {
-        "arctic": -20,
-        "temperate": 0,
-        "desert": 15,
-        "tropical": 20
-    }
+    rng = get_rng("weather")
     
     # Calculate actual temperature with random variation
-    temp_adjustment = seasonal_adjustments.get(season, 0) + climate_adjustments.get(climate_type, 0)
-    temperature = base_temperature + temp_adjustment + random.uniform(-10, 10)
+    temp_adjustment = SEASONAL_TEMPERATURE_ADJUSTMENTS.get(season, 0) + CLIMATE_TEMPERATURE_ADJUSTMENTS.get(climate_type, 0)
+    temperature = base_temperature + temp_adjustment + rng.uniform(-10, 10)
     
     # Generate wind conditions
     wind_directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-    wind_direction = random.choice(wind_directions)
+    wind_direction = rng.choice(wind_directions)
     
     # Wind speed varies by climate and season
     base_wind = 5
@@ -307,18 +322,13 @@ def generate_weather_state(base_temperature: float, season: str = "spring",
     elif climate_type == "desert":
         base_wind = 8
     
-    wind_speed = max(0, int(random.normalvariate(base_wind, 8)))
+    wind_speed = max(0, int(rng.normalvariate(base_wind, 8)))
     
     # Generate precipitation
-    precipitation_chance = {
-        "arctic": 0.3,
-        "temperate": 0.4,
-        "desert": 0.1,
-        "tropical": 0.6
-    }.get(climate_type, 0.4)
-    
-    if random.random() < precipitation_chance:
-        precipitation = int(random.uniform(10, 80))
+    precipitation_chance = PRECIPITATION_CHANCE.get(climate_type, 0.4)
+    
+    if rng.random() < precipitation_chance:
+        precipitation = int(rng.uniform(10, 80))
         
         # Determine precipitation type based on temperature
         if temperature < 32:
@@ -326,7 +336,7 @@ def generate_weather_state(base_temperature: float, season: str = "spring",
         elif temperature < 35 and wind_speed > 15:
             precipitation_type = "sleet"
         elif temperature > 80 and precipitation > 60:
-            precipitation_type = "hail" if random.random() < 0.1 else "rain"
+            precipitation_type = "hail" if rng.random() < 0.1 else "rain"
         else:
             precipitation_type = "rain"
     else:
@@ -335,18 +345,18 @@ def generate_weather_state(base_temperature: float, season: str = "spring",
     
     # Cloud cover correlates with precipitation
     if precipitation > 0:
-        cloud_cover = max(50, int(random.uniform(60, 100)))
+        cloud_cover = max(50, int(rng.uniform(60, 100)))
     else:
-        cloud_cover = int(random.uniform(0, 60))
+        cloud_cover = int(rng.uniform(0, 60))
     
     # Visibility affected by precipitation and cloud cover
     base_visibility = 5000  # feet
     if precipitation > 50:
-        visibility = int(random.uniform(200, 800))
+        visibility = int(rng.uniform(200, 800))
     elif precipitation > 20:
-        visibility = int(random.uniform(800, 2000))
+        visibility = int(rng.uniform(800, 2000))
     elif cloud_cover > 80:
-        visibility = int(random.uniform(2000, 4000))
+        visibility = int(rng.uniform(2000, 4000))
     else:
         visibility = base_visibility
     
@@ -0,0 +1,308 @@
+"""
+Fantasy RPG - Weather Field
+
+World-level weather simulation stored as flat per-hex arrays.
+
+Pressure, temperature, humidity, wind and precipitation live in one array
+per quantity, indexed like the hex grid. The field advances in fixed
+one-hour steps: low-pressure fronts drift across the map, winds blow from
+high to low pressure on top of the prevailing westerlies, temperature and
+humidity are carried downwind (semi-Lagrangian advection) and relax toward
+each hex's climate, and rain falls where moist air is lifted by a front.
+
+Neighbouring hexes therefore share their weather, and a storm seen to the
+west arrives a few hours later. Reading the weather for a hex is a constant-
+time array lookup; the simulation only runs when the game clock is ahead of
+the field, in one catch-up batch (e.g. after resting).
+"""
+
+import math
+from array import array
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .weather_core import (
+    WeatherState, SEASONAL_TEMPERATURE_ADJUSTMENTS,
+    CLIMATE_TEMPERATURE_ADJUSTMENTS, PRECIPITATION_CHANCE
+)
+
+try:
+    from ..utils.rng import get_rng_service
+except ImportError:
+    from fantasy_rpg.utils.rng import get_rng_service
+
+
+STEP_HOURS = 1.0            # Simulation time step
+MAX_CATCHUP_STEPS = 72      # Longer gaps only simulate the most recent steps
+HEX_MILES = 6.0             # Distance between hex centres
+
+BASE_PRESSURE = 1013.0      # hPa
+PREVAILING_WIND = 6.0       # mph, blowing from the west
+WIND_GAIN = 4.0             # mph per hPa/hex of pressure gradient
+TEMPERATURE_RELAX = 0.1     # Fraction of the gap to the climate closed per step
+HUMIDITY_RELAX = 0.05
+DIURNAL_SWING = 8.0         # °F above/below the daily mean
+
+MAX_FRONTS = 3
+FRONT_SPAWN_CHANCE = 0.05   # Per step, while below MAX_FRONTS
+
+WIND_DIRECTIONS = ["E", "NE", "N", "NW", "W", "SW", "S", "SE"]  # Counter-clockwise from east
+
+# Arrays stored per hex; all are saved with the field
+FIELD_ARRAYS = ("pressure", "temperature", "humidity", "wind_u", "wind_v", "precipitation")
+
+
+@dataclass
+class WeatherFront:
+    """A low-pressure system drifting across the map"""
+    x: float
+    y: float
+    dx: float      # Hexes per hour
+    dy: float
+    radius: float  # Hexes
+    depth: float   # Pressure drop at the centre (hPa)
+
+
+class WeatherField:
+    """Grid-wide weather simulation with constant-time per-hex reads"""
+
+    def __init__(self, width: int, height: int, seed: int,
+                 climate: Optional[Dict[Tuple[int, int], Tuple[float, str]]] = None):
+        """
+        Initialize the field at climate equilibrium.
+
+        Args:
+            width: World width in hexes
+            height: World height in hexes
+            seed: Seed for front generation
+            climate: (x, y) -> (base temperature °F, climate type); missing
+                hexes default to 65°F temperate
+        """
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.hours = 0.0  # Game hours the field has been simulated to
+        self.fronts: List[WeatherFront] = []
+        self.rng = get_rng_service().seeded_stream("weather.field", seed)
+
+        # Per-hex climate: annual mean temperature plus climate adjustment,
+        # and the humidity the air relaxes toward
+        self.climate_temperature = array("d", [65.0]) * self.size
+        self.climate_humidity = array("d", [0.6]) * self.size
+        for (x, y), (base_temperature, climate_type) in (climate or {}).items():
+            if 0 <= x < width and 0 <= y < height:
+                index = y * width + x
+                self.climate_temperature[index] = (
+                    base_temperature + CLIMATE_TEMPERATURE_ADJUSTMENTS.get(climate_type, 0))
+                self.climate_humidity[index] = 0.4 + 0.5 * PRECIPITATION_CHANCE.get(climate_type, 0.4)
+
+        self.pressure = array("d", [BASE_PRESSURE]) * self.size
+        self.temperature = array("d", self.climate_temperature)
+        self.humidity = array("d", self.climate_humidity)
+        self.wind_u = array("d", [PREVAILING_WIND]) * self.size
+        self.wind_v = array("d", [0.0]) * self.size
+        self.precipitation = array("d", [0.0]) * self.size
+
+        for _ in range(self.rng.randint(1, MAX_FRONTS)):
+            self.fronts.append(self._new_front(self.rng.uniform(0, width)))
+
+    def _new_front(self, x: float) -> WeatherFront:
+        return WeatherFront(
+            x=x,
+            y=self.rng.uniform(0, self.height),
+            dx=self.rng.uniform(0.3, 0.8),
+            dy=self.rng.uniform(-0.3, 0.3),
+            radius=self.rng.uniform(3.0, 6.0),
+            depth=self.rng.uniform(8.0, 25.0)
+        )
+
+    def advance_to(self, hours: float, season: str = "spring") -> int:
+        """
+        Simulate forward to a game time in whole steps.
+
+        Args:
+            hours: Total game hours (see PlayerState.get_total_hours)
+            season: Current season for climate temperatures
+
+        Returns:
+            Number of steps simulated
+        """
+        steps = int((hours - self.hours) / STEP_HOURS)
+        if steps <= 0:
+            return 0
+        if steps > MAX_CATCHUP_STEPS:
+            # Weather forgets quickly - only the last few days matter
+            self.hours += (steps - MAX_CATCHUP_STEPS) * STEP_HOURS
+            steps = MAX_CATCHUP_STEPS
+
+        seasonal = SEASONAL_TEMPERATURE_ADJUSTMENTS.get(season, 0)
+        for _ in range(steps):
+            self.hours += STEP_HOURS
+            self._step(seasonal, self.hours % 24)
+        return steps
+
+    def _step(self, seasonal: float, hour_of_day: float):
+        """Advance the whole grid by one time step"""
+        width, height, size = self.width, self.height, self.size
+        rng = self.rng
+
+        # Move fronts, retire those that left the map and spawn new ones upwind
+        for front in self.fronts:
+            front.x += front.dx * STEP_HOURS
+            front.y += front.dy * STEP_HOURS
+        self.fronts = [f for f in self.fronts
+                       if f.x - 2 * f.radius < width and -2 * f.radius < f.y < height + 2 * f.radius]
+        if len(self.fronts) < MAX_FRONTS and rng.random() < FRONT_SPAWN_CHANCE:
+            self.fronts.append(self._new_front(-rng.uniform(0.0, 3.0)))
+
+        # Pressure from the fronts
+        pressure = array("d", [BASE_PRESSURE]) * size
+        for front in self.fronts:
+            spread = 2.0 * front.radius * front.radius
+            reach = int(front.radius * 3) + 1
+            x0, x1 = max(0, int(front.x) - reach), min(width, int(front.x) + reach + 1)
+            y0, y1 = max(0, int(front.y) - reach), min(height, int(front.y) + reach + 1)
+            for y in range(y0, y1):
+                dy2 = (y - front.y) ** 2
+                row = y * width
+                for x in range(x0, x1):
+                    pressure[row + x] -= front.depth * math.exp(-((x - front.x) ** 2 + dy2) / spread)
+        self.pressure = pressure
+
+        # Wind: prevailing westerlies plus flow down the pressure gradient
+        wind_u = array("d", [0.0]) * size
+        wind_v = array("d", [0.0]) * size
+        for y in range(height):
+            row = y * width
+            up = max(0, y - 1) * width
+            down = min(height - 1, y + 1) * width
+            for x in range(width):
+                left, right = max(0, x - 1), min(width - 1, x + 1)
+                grad_x = (pressure[row + right] - pressure[row + left]) / max(1, right - left)
+                grad_y = (pressure[down + x] - pressure[up + x]) / max(1, (down - up) // width)
+                wind_u[row + x] = PREVAILING_WIND - WIND_GAIN * grad_x
+                wind_v[row + x] = -WIND_GAIN * grad_y
+        self.wind_u, self.wind_v = wind_u, wind_v
+
+        # Carry temperature and humidity downwind, then relax toward climate
+        temperature = self._advect(self.temperature)
+        humidity = self._advect(self.humidity)
+        diurnal = DIURNAL_SWING * math.sin(2 * math.pi * (hour_of_day - 9) / 24)
+        precipitation = array("d", [0.0]) * size
+        climate_temperature, climate_humidity = self.climate_temperature, self.climate_humidity
+
+        for i in range(size):
+            target = climate_temperature[i] + seasonal + diurnal
+            temperature[i] += (target - temperature[i]) * TEMPERATURE_RELAX
+
+            # Low pressure lifts and moistens the air; saturated air rains out
+            lift = max(0.0, (BASE_PRESSURE - pressure[i]) / 20.0)
+            moisture = humidity[i] + (climate_humidity[i] - humidity[i]) * HUMIDITY_RELAX + 0.02 * lift
+            rain = max(0.0, moisture - 0.75 + 0.25 * lift)
+            if rain > 0:
+                precipitation[i] = min(100.0, rain * 250.0)
+                moisture -= rain * 0.2
+            humidity[i] = min(1.0, max(0.05, moisture))
+
+        self.temperature, self.humidity, self.precipitation = temperature, humidity, precipitation
+
+    def _advect(self, values: array) -> array:
+        """Semi-Lagrangian advection: sample each hex from upwind (bilinear)"""
+        width, height = self.width, self.height
+        wind_u, wind_v = self.wind_u, self.wind_v
+        scale = STEP_HOURS / HEX_MILES
+        result = array("d", values)
+
+        for y in range(height):
+            row = y * width
+            for x in range(width):
+                i = row + x
+                sx = min(width - 1.0, max(0.0, x - wind_u[i] * scale))
+                sy = min(height - 1.0, max(0.0, y - wind_v[i] * scale))
+                x0, y0 = int(sx), int(sy)
+                x1, y1 = min(width - 1, x0 + 1), min(height - 1, y0 + 1)
+                fx, fy = sx - x0, sy - y0
+                top = values[y0 * width + x0] * (1 - fx) + values[y0 * width + x1] * fx
+                bottom = values[y1 * width + x0] * (1 - fx) + values[y1 * width + x1] * fx
+                result[i] = top * (1 - fy) + bottom * fy
+        return result
+
+    def get_weather(self, x: int, y: int) -> WeatherState:
+        """
+        Weather at a hex as of the last simulated step.
+
+        Args:
+            x: Hex column
+            y: Hex row
+
+        Returns:
+            WeatherState built from the field arrays
+        """
+        x = min(self.width - 1, max(0, x))
+        y = min(self.height - 1, max(0, y))
+        i = y * self.width + x
+
+        temperature = self.temperature[i]
+        u, v = self.wind_u[i], self.wind_v[i]
+        wind_speed = int(round(math.hypot(u, v)))
+        # Compass direction the wind blows *from* (rows grow southward)
+        sector = int(round(math.degrees(math.atan2(v, -u)) / 45.0)) % 8
+        wind_direction = WIND_DIRECTIONS[sector]
+
+        precipitation = int(round(self.precipitation[i]))
+        if precipitation <= 0:
+            precipitation_type = "none"
+        elif temperature < 32:
+            precipitation_type = "snow"
+        elif temperature < 35 and wind_speed > 15:
+            precipitation_type = "sleet"
+        else:
+            precipitation_type = "rain"
+
+        cloud_cover = int(min(100, max(0, (self.humidity[i] - 0.3) * 140 + precipitation * 0.5)))
+        if precipitation > 50:
+            visibility = 500
+        elif precipitation > 20:
+            visibility = 1400
+        elif cloud_cover > 80:
+            visibility = 3000
+        else:
+            visibility = 5000
+
+        return WeatherState(
+            temperature=temperature,
+            wind_speed=wind_speed,
+            wind_direction=wind_direction,
+            precipitation=precipitation,
+            precipitation_type=precipitation_type,
+            cloud_cover=cloud_cover,
+            visibility=visibility,
+            feels_like=0.0,  # Will be calculated in __post_init__
+            is_storm=False,  # Will be calculated in __post_init__
+            lightning_risk=0.0  # Will be calculated in __post_init__
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the simulated state (climate arrays are rebuilt on load)"""
+        data = {
+            "width": self.width,
+            "height": self.height,
+            "hours": self.hours,
+            "fronts": [asdict(front) for front in self.fronts],
+            "rng": self.rng.state_dict()  # New fronts continue where they left off
+        }
+        for name in FIELD_ARRAYS:
+            data[name] = list(getattr(self, name))
+        return data
+
+    def load_dict(self, data: Dict[str, Any]):
+        """Restore state saved with to_dict(); ignored if the grid size differs"""
+        if data.get("width") != self.width or data.get("height") != self.height:
+            return
+        self.hours = data.get("hours", 0.0)
+        self.fronts = [WeatherFront(**front) for front in data.get("fronts", [])]
+        if data.get("rng"):
+            self.rng.load_state_dict(data["rng"])
+        for name in FIELD_ARRAYS:
+            if len(data.get(name, ())) == self.size:
+                setattr(self, name, array("d", data[name]))
@@ -10,16 +10,30 @@ from typing import Dict, List, Optional, Any, Tuple
 import json
 import os
 
+try:
+    from ..utils.tracing import traced
+except ImportError:
+    from fantasy_rpg.utils.tracing import traced
+
+try:
+    from .spatial_index import Feature, SpatialIndex, compass_direction
+    from .exploration_map import ExplorationMap, sight_radius
+except ImportError:
+    from fantasy_rpg.world.spatial_index import Feature, SpatialIndex, compass_direction
+    from fantasy_rpg.world.exploration_map import ExplorationMap, sight_radius
+
 # Import world generation systems (avoiding circular imports)
 try:
     from .climate import ClimateSystem, ClimateZone
     from .terrain_generation import TerrainGenerator
     from .enhanced_biomes import EnhancedBiomeSystem
+    from .weather_field import WeatherField
 except ImportError:
     try:
         from climate import ClimateSystem, ClimateZone
         from terrain_generation import TerrainGenerator
         from enhanced_biomes import EnhancedBiomeSystem
+        from weather_field import WeatherField
     except ImportError:
         # Create minimal stubs if imports fail
         class ClimateSystem:
@@ -41,6 +55,17 @@ except ImportError:
                 return "temperate_grassland"
             def get_biome(self, *args, **kwargs):
                 return None
+        WeatherField = None
+
+
+# Furthest features (in hex moves) mentioned in hex descriptions, per hint
+DIRECTION_HINT_RANGE = {
+    "water": 8,
+    "shelter": 8,
+    "settlement": 20,
+    "landmark": 12,
+    "biome": 4
+}
 
 
 class WorldCoordinator:
@@ -61,16 +86,32 @@ class WorldCoordinator:
         self.hex_data = {}
         self.location_data = {}
         self.loaded_locations = {}
+        self._hex_location_index = {}  # hex_id -> {location_id: location}, rebuilt on demand
+        self.spatial_index = None  # Built with the world, or from hex_data on first query
+        
+        # Fog of war: explored, visited and visible hexes (restored by load_game)
+        self.exploration = ExplorationMap(*world_size)
+        
+        # Optional pager keeping cold hexes' location contents on disk
+        # (see game/location_cache.py); told about every hex whose locations are used
+        self.location_pager = None
         
         # World generation systems
         self.terrain_generator = None
         self.enhanced_biomes = None
         self.climate_system = None
         self.climate_zones = {}
+        self.weather_field = None
         
         # Generate world unless explicitly skipped
         if not skip_generation:
             self.generate_world()
+        else:
+            # Loaded worlds still need biome data for travel times and
+            # climate zones for weather (both are deterministic)
+            self.enhanced_biomes = EnhancedBiomeSystem()
+            self._initialize_climate_system()
+            self._initialize_weather_field()
     
     def generate_world(self):
         """Generate the complete world (terrain, biomes, climate, locations)"""
@@ -104,6 +145,9 @@ class WorldCoordinator:
         # Initialize climate system
         self._initialize_climate_system()
         
+        # Initialize weather simulation on top of the climate zones
+        self._initialize_weather_field()
+        
         print("World systems initialized successfully")
     
     def _generate_world(self):
@@ -173,25 +217,59 @@ class WorldCoordinator:
                     "elevation_raw": elevation
                 }
         
+        # Rivers and lakes follow the drainage of the heightmap
+        self._add_water_features(heightmap)
+        
         print(f"Generated world with {len(self.hex_data)} hexes")
         print("Locations will be generated on-demand when hexes are first visited")
         
         # Add some special locations to interesting hexes
         self._add_special_locations()
+        
+        self.build_spatial_index()
+    
+    def _add_water_features(self, heightmap: Dict[Tuple[int, int], float]):
+        """Mark river and lake hexes ("river": width, "lake": lake type)"""
+        if not hasattr(self.terrain_generator, 'calculate_drainage_patterns'):
+            return
+        
+        width, height = self.world_size
+        try:
+            flow_directions = self.terrain_generator.calculate_drainage_patterns(heightmap, width, height)
+            flow_accumulation = self.terrain_generator.calculate_flow_accumulation(flow_directions, width, height)
+            watersheds = self.terrain_generator.identify_watersheds(flow_directions, width, height)
+            rivers = self.terrain_generator.generate_river_systems(
+                heightmap, flow_directions, flow_accumulation, width, height)
+            lakes = self.terrain_generator.place_lakes_in_depressions(
+                heightmap, flow_directions, flow_accumulation, watersheds, width, height)
+        except Exception as e:
+            print(f"Warning: Could not generate rivers and lakes: {e}")
+            return
+        
+        for (x, y), river in rivers.items():
+            hex_info = self.hex_data.get(f"{x:02d}{y:02d}")
+            if hex_info is not None:
+                hex_info["river"] = river.get("river_width", "stream")
+        for (x, y), lake in lakes.items():
+            hex_info = self.hex_data.get(f"{x:02d}{y:02d}")
+            if hex_info is not None:
+                hex_info["lake"] = lake.get("lake_type", "lake")
     
     def _add_special_locations(self):
         """Add special locations to interesting hexes"""
         # Add a few special locations for gameplay
         special_locations = [
-            ("0847", ["forest_clearing_01", "old_oak_grove"]),
-            ("0746", ["ruined_temple", "collapsed_tower"]),
-            ("0848", ["narrow_pass", "cave_entrance"]),
-            ("0948", ["village_center", "merchant_quarter", "inn"])
+            ("0847", ["forest_clearing_01", "old_oak_grove"], "landmark"),
+            ("0746", ["ruined_temple", "collapsed_tower"], "landmark"),
+            ("0848", ["narrow_pass", "cave_entrance"], "landmark"),
+            ("0948", ["village_center", "merchant_quarter", "inn"], "settlement")
         ]
         
-        for hex_id, locations in special_locations:
+        for hex_id, locations, feature in special_locations:
             if hex_id in self.hex_data:
                 self.hex_data[hex_id]["locations"] = locations
+                self.hex_data[hex_id]["location_graph"] = self._build_location_graph(locations)
+                self.hex_data[hex_id]["feature"] = feature
                 # Update the name to be more interesting
                 if hex_id == "0847":
                     self.hex_data[hex_id]["name"] = "Forest Clearing"
@@ -619,6 +697,7 @@ class WorldCoordinator:
         
         return nearby
     
+    @traced("world.get_hex_locations")
     def get_hex_locations(self, hex_id: str) -> List[Dict[str, Any]]:
         """Get locations available in a hex (generate on-demand)"""
         hex_info = self.get_hex_info(hex_id)
@@ -633,17 +712,229 @@ class WorldCoordinator:
             # Generate locations for this hex
             generated_locations = self._generate_hex_locations(coords, biome, elevation)
             
-            # Update hex data with generated locations
+            # Update hex data with generated locations and their adjacency
             hex_info["locations"] = generated_locations
+            hex_info["location_graph"] = self._build_location_graph(generated_locations)
             hex_info["locations_generated"] = True
+            self._hex_location_index.pop(hex_id, None)
             
             # Update the stored hex data
             self.hex_data[hex_id] = hex_info
+            if self.spatial_index is not None:
+                self._index_shelters(self.spatial_index, hex_id, generated_locations)
             
             print(f"Generated {len(generated_locations)} locations for hex {hex_id}")
         
+        if self.location_pager is not None:
+            self.location_pager.touch(hex_id, hex_info)
+        
         return hex_info.get("locations", [])
     
+    def _build_location_graph(self, locations: List[Any]) -> Dict[str, Dict[str, str]]:
+        """
+        Build the intra-hex adjacency table for a hex's locations.
+        
+        Locations are laid out on a grid ordered by ID, so the same locations
+        are always in the same directions from each other.
+        
+        Args:
+            locations: Location dicts (or bare location IDs)
+        
+        Returns:
+            Dictionary mapping location_id -> {direction: neighbour location_id}
+        """
+        location_ids = sorted(self._get_location_id(loc) for loc in locations)
+        grid_size = max(2, int(len(location_ids) ** 0.5) + 1)
+        
+        positions = {}
+        for i, location_id in enumerate(location_ids):
+            positions[(i // grid_size, i % grid_size)] = location_id
+        
+        directions = {
+            "north": (-1, 0),
+            "south": (1, 0),
+            "east": (0, 1),
+            "west": (0, -1)
+        }
+        
+        graph = {}
+        for (row, col), location_id in positions.items():
+            connections = {}
+            for direction, (row_offset, col_offset) in directions.items():
+                neighbour_id = positions.get((row + row_offset, col + col_offset))
+                if neighbour_id is not None:
+                    connections[direction] = neighbour_id
+            graph[location_id] = connections
+        
+        return graph
+    
+    def _get_location_id(self, location: Any) -> str:
+        """Get the ID of a location dict or bare location ID"""
+        if isinstance(location, dict):
+            return location.get("id", "")
+        return str(location)
+    
+    def get_location_neighbors(self, hex_id: str, location_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the locations adjacent to a location within the same hex.
+        
+        Args:
+            hex_id: Hex containing the location
+            location_id: ID of the current location
+        
+        Returns:
+            Dictionary mapping direction -> neighbouring location
+        """
+        hex_info = self.get_hex_info(hex_id)
+        locations = hex_info.get("locations", [])
+        
+        graph = hex_info.get("location_graph")
+        if graph is None:
+            # Hex from an older save - build its adjacency once and keep it
+            graph = self._build_location_graph(locations)
+            hex_info["location_graph"] = graph
+        
+        index = self._hex_location_index.get(hex_id)
+        if index is None or len(index) != len(locations):
+            index = {self._get_location_id(loc): loc for loc in locations}
+            self._hex_location_index[hex_id] = index
+        
+        return {
+            direction: index[neighbour_id]
+            for direction, neighbour_id in graph.get(location_id, {}).items()
+            if neighbour_id in index
+        }
+    
+    def build_spatial_index(self) -> SpatialIndex:
+        """
+        Index the world's features for nearest-feature queries.
+        
+        Reads only hex_data, so a world restored from a save indexes the
+        same rivers, lakes, settlements, landmarks, biomes and known
+        shelters as when it was generated.
+        """
+        index = SpatialIndex()
+        for hex_id, hex_info in self.hex_data.items():
+            coords = self._hex_coords(hex_id)
+            if coords is None:
+                continue  # Tuple-keyed alias of a string-keyed hex
+            
+            biome = hex_info.get("biome")
+            if biome:
+                index.add(Feature("biome", coords, biome.replace("_", " "), biome))
+            if hex_info.get("river"):
+                index.add(Feature("river", coords, hex_info["river"], hex_info["river"]))
+            if hex_info.get("lake"):
+                index.add(Feature("lake", coords, hex_info["lake"].replace("_", " "), hex_info["lake"]))
+            if hex_info.get("feature"):
+                index.add(Feature(hex_info["feature"], coords, hex_info.get("name", hex_id), hex_id))
+            if hex_info.get("locations_generated"):
+                self._index_shelters(index, hex_id, hex_info.get("locations", []))
+        
+        self.spatial_index = index
+        return index
+    
+    def _index_shelters(self, index: SpatialIndex, hex_id: str, locations: List[Any]):
+        """Add a hex's locations that give good or excellent shelter"""
+        coords = self._hex_coords(hex_id)
+        for location in locations:
+            if isinstance(location, dict) and (location.get("provides_good_shelter") or
+                                               location.get("provides_excellent_shelter")):
+                index.add(Feature("shelter", coords, location.get("name", "a shelter"), location.get("id", "")))
+    
+    def _get_spatial_index(self) -> SpatialIndex:
+        if self.spatial_index is None:
+            self.build_spatial_index()
+        return self.spatial_index
+    
+    @staticmethod
+    def _hex_coords(hex_id: Any) -> Optional[Tuple[int, int]]:
+        """(x, y) of a "XXYY" hex id, or None for other keys"""
+        if not isinstance(hex_id, str) or len(hex_id) != 4 or not hex_id.isdigit():
+            return None
+        return (int(hex_id[:2]), int(hex_id[2:]))
+    
+    def nearest_features(self, hex_id: str, kinds, k: int = 1, max_distance: Optional[int] = None,
+                         where=None) -> List[Tuple[int, Feature]]:
+        """
+        Find the k features of the given kinds nearest to a hex.
+        
+        Args:
+            hex_id: Hex to search from
+            kinds: Feature kind or kinds ("river", "lake", "shelter",
+                "settlement", "landmark", "biome")
+            k: Number of features to return
+            max_distance: Furthest distance in hex moves
+            where: Optional filter on features
+        
+        Returns:
+            (distance, feature) pairs, nearest first
+        """
+        coords = self._hex_coords(hex_id)
+        if coords is None:
+            return []
+        return self._get_spatial_index().nearest(coords, kinds, k, max_distance, where)
+    
+    def features_within(self, hex_id: str, radius: int, kinds=None) -> List[Tuple[int, Feature]]:
+        """
+        Find every feature within a number of hex moves.
+        
+        Returns:
+            (distance, feature) pairs, nearest first
+        """
+        coords = self._hex_coords(hex_id)
+        if coords is None:
+            return []
+        return self._get_spatial_index().within(coords, radius, kinds)
+    
+    @traced("world.direction_hints")
+    def get_direction_hints(self, hex_id: str) -> List[str]:
+        """
+        Sentences pointing the way to the nearest water, shelter,
+        settlement, landmark and change of land around a hex.
+        """
+        coords = self._hex_coords(hex_id)
+        if coords is None:
+            return []
+        hex_info = self.hex_data.get(hex_id, {})
+        hints = []
+        
+        water = self.nearest_features(hex_id, ("river", "lake"), max_distance=DIRECTION_HINT_RANGE["water"])
+        if water:
+            distance, feature = water[0]
+            if distance == 0:
+                hints.append(f"A {feature.name} runs through here." if feature.kind == "river"
+                             else f"There is a {feature.name} here.")
+            else:
+                hints.append(f"The nearest water is a {feature.name} {_hex_moves(distance)} to the "
+                             f"{compass_direction(coords, feature.coords)}.")
+        
+        shelter = self.nearest_features(hex_id, "shelter", max_distance=DIRECTION_HINT_RANGE["shelter"],
+                                        where=lambda feature: feature.coords != coords)
+        if shelter:
+            distance, feature = shelter[0]
+            hints.append(f"You know of shelter at {feature.name}, {_hex_moves(distance)} to the "
+                         f"{compass_direction(coords, feature.coords)}.")
+        
+        for kind in ("settlement", "landmark"):
+            found = self.nearest_features(hex_id, kind, max_distance=DIRECTION_HINT_RANGE[kind],
+                                          where=lambda feature: feature.coords != coords)
+            if found:
+                distance, feature = found[0]
+                hints.append(f"{feature.name} lies {_hex_moves(distance)} to the "
+                             f"{compass_direction(coords, feature.coords)}.")
+        
+        biome = hex_info.get("biome")
+        if biome:
+            change = self.nearest_features(hex_id, "biome", max_distance=DIRECTION_HINT_RANGE["biome"],
+                                           where=lambda feature: feature.detail != biome)
+            if change:
+                distance, feature = change[0]
+                hints.append(f"The land turns to {feature.name} {_hex_moves(distance)} to the "
+                             f"{compass_direction(coords, feature.coords)}.")
+        
+        return hints
+    
     def get_location_by_id(self, location_id: str) -> Optional[Dict[str, Any]]:
         """Get location data by ID"""
         return self.location_data.get(location_id)
@@ -706,6 +997,46 @@ class WorldCoordinator:
             self.climate_system = None
             self.climate_zones = {}
     
+    def _initialize_weather_field(self):
+        """Initialize the world-level weather field from the climate zones"""
+        if WeatherField is None:
+            return
+        
+        width, height = self.world_size
+        climate = {
+            coords: (zone.base_temperature, zone.zone_type)
+            for coords, zone in self.climate_zones.items()
+            if isinstance(coords, tuple)
+        }
+        self.weather_field = WeatherField(width, height, self.seed, climate)
+    
+    def get_weather(self, hex_id: str, total_hours: float, season: str = "spring"):
+        """
+        Get the current weather at a hex from the weather field.
+        
+        The field is first brought up to the given game time, so a long rest
+        is simulated in one batch on the next read.
+        
+        Args:
+            hex_id: Hex identifier string (e.g., "0510")
+            total_hours: Game hours elapsed (PlayerState.get_total_hours())
+            season: Current season
+        
+        Returns:
+            WeatherState, or None if the weather field is unavailable
+        """
+        if not self.weather_field:
+            return None
+        
+        try:
+            col = int(hex_id[:2])
+            row = int(hex_id[2:])
+        except (TypeError, ValueError):
+            return None
+        
+        self.weather_field.advance_to(total_hours, season)
+        return self.weather_field.get_weather(col, row)
+    
     def _generate_basic_heightmap(self) -> Dict[Tuple[int, int], float]:
         """Generate a basic heightmap for climate calculations"""
         import math
@@ -732,6 +1063,19 @@ class WorldCoordinator:
         
         return heightmap
     
+    def reveal_from(self, coords: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Update the fog of war for the player standing at a hex.
+
+        Sight reaches further from higher ground (see exploration_map.py).
+
+        Returns:
+            Hexes explored for the first time, as (x, y)
+        """
+        x, y = coords
+        hex_info = self.hex_data.get(f"{x:02d}{y:02d}") or {}
+        return self.exploration.reveal(x, y, sight_radius(hex_info.get("elevation_raw", 0.0)))
+
     def get_climate_info(self, hex_id: str) -> Optional[Dict[str, Any]]:
         """Get climate information for a hex"""
         try:
@@ -788,4 +1132,8 @@ class WorldCoordinator:
             pass
         
         # Default temperature
-        return 65.0
\ No newline at end of file
+        return 65.0
+
+
+def _hex_moves(distance: int) -> str:
+    return "1 hex" if distance == 1 else f"{distance} hexes"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Fantasy RPG - Replay Launcher
+
+Replays a recorded command journal headless and checks that it reproduces
+the recorded game state.
+
+Usage:
+    python replay.py [journal_file] [--session N] [--perf] [--profile N]
+
+Commands are only journaled when the game runs with FRPG_JOURNAL set, e.g.
+    FRPG_JOURNAL=1 python play.py
+"""
+
+import sys
+
+
+def main():
+    """Replay a command journal"""
+    try:
+        from fantasy_rpg.game.command_journal import main as replay_main
+    except ImportError as e:
+        print("❌ Error: Could not import game modules!")
+        print(f"Details: {e}")
+        sys.exit(1)
+
+    sys.exit(replay_main(sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
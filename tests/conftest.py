@@ -0,0 +1,27 @@
+"""Shared fixtures for the test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game.game_engine import GameEngine
+
+
+@pytest.fixture
+def played_game(tmp_path, monkeypatch):
+    """A small seeded game with the player inside a location, run from tmp_path.
+
+    Returns:
+        Tuple of (game_engine, game_state); saves land in tmp_path
+    """
+    monkeypatch.chdir(tmp_path)
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(8, 8))
+    game_state = game_engine.new_game(character, world_seed=4242)
+    assert game_engine.enter_location()[0]
+    return game_engine, game_state
@@ -12,8 +12,6 @@ To enable shortkey debugging:
 
 The debug log will show:
 - Object shortkey assignments from JSON data
-- Command parsing with shortkey expansion
-- Argument resolution (shortkey -> object name)
 
 Example output:
 ```
@@ -21,18 +19,11 @@ Example output:
 Object: Stone Fireplace
 Shortkey: 'f'
 ...
-
-=== PARSE COMMAND DEBUG ===
-Original command: 'ex f'
-Action: 'ex' -> 'examine'
-Arguments: ['f']
-  Arg 'f' -> lookup 'f' -> result: Stone Fireplace
-Final expanded: examine ['Stone Fireplace']
 ```
 """
 
 # DEBUG FLAGS - Set to True to enable debug logging
-ENABLE_SHORTKEY_DEBUG = False  # Set to True to log shortkey parsing to shortkey_debug.txt
+ENABLE_SHORTKEY_DEBUG = False  # Set to True to log object shortkeys to shortkey_debug.txt
 
 def log_shortkey_debug(message: str, mode: str = "a"):
     """
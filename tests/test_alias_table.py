@@ -0,0 +1,58 @@
+"""Unit tests for alias-table sampling.
+
+Tests that picks follow the weights, that zero weights are never picked,
+and that LocationGenerator samples from its precomputed tables.
+"""
+
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.utils.alias_table import AliasTable
+from fantasy_rpg.locations.location_generator import LocationGenerator
+
+
+def test_picks_follow_weights():
+    """Test that pick frequencies match the relative weights."""
+    table = AliasTable(["a", "b", "c", "d"], [1, 2, 3, 4])
+    rng = random.Random(7)
+    counts = Counter(table.pick(rng) for _ in range(40000))
+
+    assert table.total_weight == 10
+    for item, weight in zip("abcd", [1, 2, 3, 4]):
+        assert abs(counts[item] / 40000 - weight / 10) < 0.01
+
+
+def test_zero_weights_and_empty_table():
+    """Test that zero-weight entries are dropped and empty tables pick None."""
+    table = AliasTable(["never", "always"], [0, 5])
+    rng = random.Random(1)
+    assert len(table) == 1
+    assert {table.pick(rng) for _ in range(100)} == {"always"}
+
+    assert AliasTable([], []).pick(rng) is None
+    assert AliasTable(["x"], [0]).pick(rng) is None
+
+
+def test_location_generator_uses_precomputed_tables():
+    """Test the type index and pool tables built at load time."""
+    generator = LocationGenerator(seed=11)
+
+    forest = generator._get_locations_by_type("forest")
+    assert forest and all(loc["type"] == "forest" and "id" in loc for loc in forest)
+
+    pool_name = next(iter(generator.object_pools))
+    count, table = generator._get_pool_table("objects", [pool_name])
+    assert count == len(generator.object_pools[pool_name])
+    assert ("objects", (pool_name,)) in generator._pool_tables
+
+    # Combined pools are cached on first use
+    pools = list(generator.object_pools)[:2]
+    assert generator._get_pool_table("objects", pools) is generator._get_pool_table("objects", pools)
+
+    locations = generator.generate_locations_for_hex((3, 4), "forest")
+    assert locations and locations[0].exit_flag
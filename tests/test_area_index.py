@@ -0,0 +1,124 @@
+"""Unit tests for the per-area object lookup index.
+
+Tests exact, alias, prefix and typo-tolerant lookups, keeping the index in
+sync on rename, staleness when the area changes, and routing through
+interact_with_object.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.area_index import AreaIndex
+from fantasy_rpg.game.object_interaction_system import ObjectInteractionSystem
+
+
+def _area():
+    return {"objects": [
+        {"id": "treasure_chest", "name": "Treasure Chest", "shortkey": "tc"},
+        {"id": "berry_bush", "name": "Berry Bush", "shortkey": "bb"},
+        {"id": "berry_bush", "name": "Berry Bush", "shortkey": "bb", "depleted": True},
+        {"id": "fireplace", "name": "Stone Fireplace", "shortkey": "fp"},
+        {"id": "stone_altar", "name": "Stone Altar", "shortkey": "sa"},
+        {"id": "old_furniture", "name": "Dusty Armchair"}
+    ]}
+
+
+def test_lookup_tiers():
+    """Test exact, alias, id, word prefix and one-typo matches."""
+    area = _area()
+    index = AreaIndex(area)
+
+    assert index.find_objects("treasure chest") == [area["objects"][0]]
+    assert index.find_objects("TC") == [area["objects"][0]]
+    assert index.find_objects("old_furniture") == [area["objects"][5]]
+    assert index.find_objects("chest") == [area["objects"][0]]
+    assert index.find_objects("fire") == [area["objects"][3]]
+    assert index.find_objects("armchiar") == [area["objects"][5]]
+    assert index.find_objects("berry") == area["objects"][1:3]
+
+    # Ambiguous prefixes match nothing but are offered as suggestions
+    assert index.find_objects("b") == area["objects"][1:3]
+    assert index.find_objects("stone") == []
+    assert index.objects.suggest("stone") == ["stone altar", "stone fireplace"]
+    assert index.find_objects("dragon") == []
+
+
+def test_index_stays_in_sync():
+    """Test rename and removal, and that a large area is indexed correctly."""
+    area = _area()
+    index = AreaIndex(area)
+    fireplace = area["objects"][3]
+
+    fireplace["name"] = "Lit Stone Fireplace"
+    index.update_object(fireplace)
+    assert index.find_objects("lit stone fireplace") == [fireplace]
+    assert index.find_objects("stone fireplace") == [fireplace]  # Word suffix
+    assert index.is_current(area)
+
+    # Objects added or removed behind the index's back make it stale
+    area["objects"].append({"id": "x", "name": "Crate"})
+    assert not index.is_current(area)
+    area["objects"].remove(fireplace)
+    area["objects"].remove(area["objects"][-1])
+    assert not index.is_current(area)
+    assert AreaIndex(area).find_objects("stone") == [area["objects"][3]]
+
+    # Unindexing every object leaves nothing behind in the shared word trie
+    fresh = AreaIndex(_area())
+    for obj in fresh._objects_list:
+        assert fresh.objects.remove(obj)
+    assert len(fresh.objects) == 0 and not fresh.objects._trie
+
+    big = {"objects": [{"id": f"crate_{i}", "name": f"Crate {i:03d}"} for i in range(500)]}
+    big_index = AreaIndex(big)
+    assert big_index.find_objects("crate 250") == [big["objects"][250]]
+    assert big_index.find_objects("crate") == []
+    assert len(big_index.objects.suggest("crate")) == 5
+
+
+class _Position:
+    current_location_id = "camp"
+    current_area_id = "entrance"
+
+    def __init__(self, area):
+        self.current_location_data = {"areas": {"entrance": area}}
+
+
+class _State:
+    def __init__(self, area):
+        self.world_position = _Position(area)
+
+
+class _Engine:
+    is_initialized = True
+
+    def __init__(self, area):
+        self.game_state = _State(area)
+
+
+def test_interact_uses_index_and_dispatch():
+    """Test target choice, suggestions and unknown actions."""
+    area = _area()
+    system = ObjectInteractionSystem(_Engine(area))
+    calls = []
+    system._handlers["forage"] = lambda obj, properties: calls.append(obj) or {"success": True}
+
+    system.interact_with_object("berry", "forage")
+    assert calls == [area["objects"][1]]
+
+    area["objects"][1]["depleted"] = True
+    area["objects"][2]["depleted"] = False
+    system.interact_with_object("berry bush", "forage")
+    assert calls[-1] is area["objects"][2]
+
+    result = system.interact_with_object("berri bush", "forage")
+    assert calls[-1] is area["objects"][2] and result["success"]
+
+    result = system.interact_with_object("stone", "examine")
+    assert "Did you mean: stone altar, stone fireplace?" in result["message"]
+
+    result = system.interact_with_object("chest", "juggle")
+    assert result["message"] == "You can't juggle the Treasure Chest."
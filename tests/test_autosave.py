@@ -0,0 +1,115 @@
+"""Unit tests for background autosave.
+
+Tests that autosaves write a snapshot taken before later changes without
+blocking the caller, that interval and hex-change triggers rotate through
+the slots, and that a slot the game still reads from is never overwritten.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.game_engine import GameEngine
+from fantasy_rpg.game.save_codec import SaveFile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_autosave_writes_snapshot_without_blocking(tmp_path, monkeypatch, played_game):
+    """Test that the write happens off-thread and ignores changes made after the snapshot."""
+    game_engine, game_state = played_game
+    autosave = game_engine.enable_autosave(interval_seconds=None, slots=2)
+
+    # Hold the worker inside the write until the test lets it go
+    release = threading.Event()
+    write_snapshot = game_engine.saves.write_snapshot
+
+    def gated_write(filename, sections):
+        assert threading.current_thread() is not threading.main_thread()
+        release.wait(5)
+        write_snapshot(filename, sections)
+
+    monkeypatch.setattr(game_engine.saves, "write_snapshot", gated_write)
+
+    location = game_state.world_position.current_location_data
+    name = location["name"]
+    assert autosave.autosave()
+
+    # The caller is free while the worker waits; later changes stay out of the snapshot
+    location["name"] = "Changed After Snapshot"
+    game_state.character.name = "Changed"
+    release.set()
+    assert autosave.wait(5)
+    assert autosave.pop_results() == [(True, "Autosaved to autosave_1.sav")]
+
+    slot = SaveFile("autosave_1.sav")
+    assert slot.read("character")["name"] == "Aldric"
+    key = slot.read("world_position")["current_location_key"]
+    assert slot.read(f"loc:{key}")["name"] == name
+    assert not (tmp_path / "autosave_1.sav.tmp").exists()
+    autosave.shutdown(5)
+
+
+def test_interval_and_hex_change_rotate_slots(played_game):
+    """Test both triggers and that slots are written in turn."""
+    game_engine, game_state = played_game
+    clock = FakeClock()
+    autosave = game_engine.enable_autosave(interval_seconds=60, slots=2, clock=clock)
+
+    assert not autosave.check()
+    clock.now = 59
+    assert not autosave.check()
+    clock.now = 60
+    assert autosave.check()
+    assert autosave.wait(5)
+
+    # Entering another hex autosaves at once
+    position = game_state.world_position
+    position.hex_id = next(h for h in game_engine.world_coordinator.hex_data if h != position.hex_id)
+    assert autosave.check()
+    assert autosave.wait(5)
+    assert not autosave.check()
+
+    clock.now = 200
+    assert autosave.check()
+    assert autosave.wait(5)
+    assert [message for _, message in autosave.pop_results()] == [
+        "Autosaved to autosave_1.sav", "Autosaved to autosave_2.sav", "Autosaved to autosave_1.sav"]
+
+    # A new service continues the rotation after the newest slot
+    assert game_engine.enable_autosave(slots=2).slot_filename(0) == "autosave_1.sav"
+    assert game_engine.autosave._next_slot == 1
+    game_engine.autosave.shutdown(5)
+
+
+def test_slot_in_use_is_skipped(played_game):
+    """Test that the slot a game was loaded from is not overwritten while it reads from it."""
+    game_engine, game_state = played_game
+    game_state.persistent_locations["0000_elsewhere"] = {"name": "Elsewhere", "areas": {}}
+    autosave = game_engine.enable_autosave(interval_seconds=None, slots=2)
+    assert autosave.autosave() and autosave.wait(5)
+    autosave.shutdown(5)
+
+    loaded = GameEngine(skip_world_gen=True)
+    assert loaded.load_game("autosave_1")[0]
+    autosave = loaded.enable_autosave(interval_seconds=None, slots=2)
+    assert autosave.autosave() and autosave.wait(5)
+    assert autosave.autosave() and autosave.wait(5)
+    assert [message for _, message in autosave.pop_results()] == [
+        "Autosaved to autosave_2.sav", "Autosaved to autosave_2.sav"]
+
+    # The unloaded location was copied from the slot the game reads from
+    visited = loaded.game_state.persistent_locations
+    assert "0000_elsewhere" in visited.unloaded()
+    assert SaveFile("autosave_2.sav").read("loc:0000_elsewhere") == {"name": "Elsewhere", "areas": {}}
+    assert visited["0000_elsewhere"] == {"name": "Elsewhere", "areas": {}}
+    autosave.shutdown(5)
@@ -0,0 +1,65 @@
+"""Unit tests for the benchmark runner.
+
+Tests timing rounds and per-round setup, error capture, and the baseline
+comparison used to flag slowdowns.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.runner import (
+    Benchmark, compare_results, load_benchmarks, load_results, run_benchmark, write_results
+)
+
+
+def test_rounds_setup_and_errors():
+    """Test warmup and timed rounds, per-round setup and failing benchmarks."""
+    setups = []
+
+    def setup():
+        setups.append(1)
+        print("game output is discarded")
+        return lambda: 10
+
+    result = run_benchmark(Benchmark("case.once", "case", setup, rounds=3, warmup=1))
+    assert len(result.times) == 3 and len(setups) == 1
+    assert result.operations == 10 and result.error is None
+    assert result.to_dict()["ops_per_sec"] > 0
+
+    setups.clear()
+    run_benchmark(Benchmark("case.each", "case", setup, rounds=2, warmup=1, per_round=True))
+    assert len(setups) == 3
+
+    def broken():
+        raise ValueError("no world")
+
+    result = run_benchmark(Benchmark("case.broken", "case", broken))
+    assert result.error == "ValueError: no world" and result.times == []
+
+
+def test_compare_flags_slowdowns(tmp_path):
+    """Test regression, improvement, new, missing and error statuses."""
+    good = Benchmark("case.good", "case", lambda: lambda: None, rounds=2)
+    path = str(tmp_path / "results.json")
+    write_results(path, [run_benchmark(good)])
+    assert json.loads(Path(path).read_text())["results"]["case.good"]["median"] >= 0
+    assert set(load_results(path)) == {"case.good"}
+
+    baseline = {"same": {"median": 1.0}, "slow": {"median": 1.0}, "fast": {"median": 1.0},
+                "gone": {"median": 1.0}, "broken": {"median": 1.0}}
+    current = {"same": {"median": 1.2}, "slow": {"median": 1.3}, "fast": {"median": 0.7},
+               "added": {"median": 1.0}, "broken": {"error": "ValueError: x"}}
+    statuses = {c.name: c.status for c in compare_results(current, baseline, threshold=0.25)}
+    assert statuses == {"same": "ok", "slow": "slower", "fast": "faster", "added": "new",
+                        "gone": "missing", "broken": "error"}
+
+
+def test_suite_names_are_unique():
+    """Test that every benchmark module registers uniquely named benchmarks."""
+    names = [bench.name for bench in load_benchmarks()]
+    assert len(names) == len(set(names))
+    assert {bench.group for bench in load_benchmarks()} == {"world", "conditions", "time", "saves", "ui", "survival", "map"}
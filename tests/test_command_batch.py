@@ -0,0 +1,143 @@
+"""Unit tests for macros and batched commands.
+
+Tests expanding repeat/queue/macro commands, stopping a batch early on
+failures, critical conditions, fainting and low HP, and running a batch
+through the input controller as one command with one event batch.
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from fantasy_rpg.actions.base_handler import ActionResult
+from fantasy_rpg.actions.command_batch import MAX_BATCH_STEPS, MacroBook, expand_batch, run_batch
+from fantasy_rpg.actions.input_controller import InputController
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game.events import ConditionGained, EventBus, Fainted
+from fantasy_rpg.game.game_engine import GameEngine
+
+
+def test_expand_batches_and_macros(tmp_path):
+    """Test repeat, queue and nested macros, and the errors for bad batches."""
+    macros = MacroBook(str(tmp_path / "macros.json"))
+    macros.define("Water", ["drink we", "wait quick"])
+    macros.define("chores", ["repeat 2 water", "rest"])
+
+    assert expand_batch("repeat 3  forage  bb", macros) == ["forage bb"] * 3
+    assert expand_batch("queue look; ; wait short;", macros) == ["look", "wait short"]
+    assert expand_batch("chores", macros) == ["drink we", "wait quick", "drink we", "wait quick", "rest"]
+    assert expand_batch("repeat 2 queue look; water", macros) == ["look", "drink we", "wait quick"] * 2
+
+    # Macros are kept in their file
+    assert MacroBook(macros.path).get("WATER") == ["drink we", "wait quick"]
+    assert macros.delete("water") and not macros.delete("water")
+    assert MacroBook(macros.path).get("water") is None
+
+    for bad in ("repeat 0 look", "repeat x look", "repeat 3", "queue ;", "queue macro x look",
+                f"repeat {MAX_BATCH_STEPS + 1} look", "queue look; save"):
+        with pytest.raises(ValueError):
+            expand_batch(bad, macros, reserved=("save",))
+    # Huge counts are refused before the steps are built
+    for huge in ("repeat 100000000 look", "repeat " + "9" * 5000 + " look", "repeat 30 queue look; rest"):
+        started = time.perf_counter()
+        with pytest.raises(ValueError, match=f"more than {MAX_BATCH_STEPS} actions"):
+            expand_batch(huge, macros)
+        assert time.perf_counter() - started < 0.1
+    with pytest.raises(ValueError, match="nests too deeply"):
+        expand_batch("loop", macros.with_macro("loop", ["look", "loop"]))
+    assert MacroBook(macros.path).get("loop") is None
+
+
+def _engine(hp=20):
+    inventory = SimpleNamespace(items=[])
+    character = SimpleNamespace(hp=hp, max_hp=20, inventory=inventory)
+    return SimpleNamespace(events=EventBus(), game_state=SimpleNamespace(character=character))
+
+
+def test_batch_stops_on_interrupts():
+    """Test failures, critical conditions, fainting and HP stop a batch before its last step."""
+    def run(effects, steps=4):
+        game_engine = _engine()
+        effects = iter(effects)
+
+        def dispatch(command):
+            effect = next(effects, None)
+            if callable(effect):
+                return effect(game_engine)
+            return ActionResult(True, "ok", 0.5)
+
+        with game_engine.events.command():
+            return run_batch([f"step {i}" for i in range(steps)], dispatch, game_engine)
+
+    def publish(event):
+        def effect(game_engine):
+            game_engine.events.publish(event)
+            return ActionResult(True, "ok", 0.5)
+        return effect
+
+    def lose_hp(amount):
+        def effect(game_engine):
+            game_engine.game_state.character.hp -= amount
+            return ActionResult(True, "ok", 0.5)
+        return effect
+
+    def find_berries(game_engine):
+        game_engine.game_state.character.inventory.items.append(SimpleNamespace(name="Berries", quantity=3))
+        return ActionResult(True, "ok", 1.0)
+
+    summary = run([find_berries])
+    assert len(summary.results) == 4 and summary.stop_reason == "" and summary.time_passed == 2.5
+    assert summary.items_gained == {"Berries": 3}
+    result = summary.to_result()
+    assert result.success and result.get("action_type") == "batch" and "Gained: 3x Berries." in result.message
+
+    summary = run([None, lambda _: ActionResult(False, "Nothing left to forage.")])
+    assert len(summary.results) == 2 and "Nothing left to forage." in summary.stop_reason
+    assert not summary.to_result().success
+
+    # Moderate conditions don't stop a batch, critical ones do
+    assert run([publish(ConditionGained("Hungry"))]).stop_reason == ""
+    assert run([None, publish(ConditionGained("Starving"))]).stop_reason == "you are now Starving."
+    assert run([publish(Fainted(45))]).stop_reason == "you fainted."
+
+    # HP: a small loss goes on, falling to half stops, and nothing is left to stop on the last step
+    assert run([lose_hp(5)]).stop_reason == ""
+    assert run([lose_hp(5), lose_hp(5)]).stop_reason == "HP is down to 10/20."
+    summary = run([None, lose_hp(15)], steps=2)
+    assert len(summary.results) == 2 and summary.stop_reason == ""
+
+
+def test_batch_runs_as_one_command(tmp_path, monkeypatch):
+    """Test a batch through the input controller: one event batch, one summary, replayable."""
+    monkeypatch.chdir(tmp_path)
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(8, 8))
+    game_engine.new_game(character, world_seed=4242)
+    assert game_engine.enter_location()[0]
+    controller = InputController(character=character, player_state=game_engine.game_state.player_state,
+                                 game_engine=game_engine)
+
+    batches = []
+    game_engine.events.subscribe_batch(lambda events: batches.append([e.event_type for e in events]))
+
+    response = controller.process_input("repeat 4 wait short")
+    assert response["type"] == "action_result" and response["success"]
+    assert response["time_passed"] == pytest.approx(2.0)
+    assert response["message"].startswith("Batch: wait short x4 (4 of 4 actions, 4 succeeded).")
+    assert response["replay_command"] == "queue " + "; ".join(["wait short"] * 4)
+    assert len(batches) == 1 and batches[0].count("TimeAdvanced") == 1
+
+    assert controller.process_input("macro rounds look; wait quick")["success"]
+    assert (tmp_path / "macros.json").exists()
+    response = controller.process_input("rounds")
+    assert response["message"].startswith("Batch: look, wait quick (2 of 2 actions")
+    assert response["replay_command"] == "queue look; wait quick"
+
+    assert not controller.process_input("macro look wait quick")["success"]
+    assert "cannot be used in a batch" in controller.process_input("queue look; save")["message"]
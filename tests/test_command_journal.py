@@ -0,0 +1,116 @@
+"""Unit tests for the command journal and deterministic replay.
+
+Tests that a recorded session replays to the same state, that a tampered
+journal is reported as diverged, and that journaling is opt-in, rotated and
+cheap to start after a load.
+"""
+
+import base64
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.actions.input_controller import InputController
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game import command_journal
+from fantasy_rpg.game.command_journal import (
+    JOURNAL_ENV_VAR, JOURNAL_FILE, _apply_ui_response, compute_state_hash, read_sessions, replay_journal
+)
+from fantasy_rpg.game.game_engine import GameEngine
+
+
+COMMANDS = ["look", "n", "e", "damage", "enter", "search", "forage", "exit", "rest", "s"]
+
+
+def _record_session(journal_path):
+    """Play a short session with the journal enabled; return the final state hash."""
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(8, 8))
+    game_state = game_engine.new_game(character, world_seed=4242)
+
+    controller = InputController(
+        character=game_state.character,
+        player_state=game_state.player_state,
+        time_system=game_state.game_time,
+        game_engine=game_engine
+    )
+    assert controller.start_journal(str(journal_path))
+    controller.journal.checkpoint_interval = 3
+
+    for command in COMMANDS:
+        # Apply UI-side changes (debug damage) the way the app does
+        _apply_ui_response(game_engine, controller.process_input(command))
+
+    return compute_state_hash(game_engine)
+
+
+def test_replay_reproduces_session(tmp_path):
+    """Test that replaying a journal reaches the recorded final state."""
+    journal_path = tmp_path / "journal.jsonl"
+    final_hash = _record_session(journal_path)
+
+    sessions = read_sessions(str(journal_path))
+    assert len(sessions) == 1
+    assert [entry["command"] for entry in sessions[0][1:]] == COMMANDS
+
+    result = replay_journal(str(journal_path))
+    assert result.success, result.reason
+    assert result.commands == len(COMMANDS)
+    assert result.checkpoints == len(COMMANDS) // 3
+    assert result.final_hash == final_hash
+
+
+def test_replay_detects_divergence(tmp_path):
+    """Test that an edited command is caught at the next checkpoint."""
+    journal_path = tmp_path / "journal.jsonl"
+    _record_session(journal_path)
+
+    lines = journal_path.read_text().splitlines()
+    entry = json.loads(lines[2])
+    entry["command"] = "s"  # Was "n"
+    lines[2] = json.dumps(entry)
+    journal_path.write_text("\n".join(lines) + "\n")
+
+    result = replay_journal(str(journal_path))
+    assert not result.success
+    assert result.diverged_at == 3
+
+
+def test_journal_is_opt_in_rotated_and_lazy(tmp_path, monkeypatch):
+    """Test FRPG_JOURNAL, rotation of a large journal and a snapshot that decodes nothing."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(JOURNAL_ENV_VAR, raising=False)
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(8, 8))
+    game_state = game_engine.new_game(character, world_seed=4242)
+    assert game_engine.enter_location()[0]
+    game_state.persistent_locations["0000_elsewhere"] = {"name": "Elsewhere", "areas": {}}
+    assert game_engine.save_game("save")[0]
+
+    controller = InputController(character=game_state.character, player_state=game_state.player_state,
+                                 game_engine=game_engine)
+    assert not controller.start_journal() and not os.path.exists(JOURNAL_FILE)
+
+    # After a load the snapshot copies unloaded sections instead of decoding them
+    loaded = GameEngine(skip_world_gen=True)
+    assert loaded.load_game("save")[0]
+    controller = InputController(character=loaded.game_state.character,
+                                 player_state=loaded.game_state.player_state, game_engine=loaded)
+    monkeypatch.setenv(JOURNAL_ENV_VAR, "1")
+    assert controller.start_journal()
+    assert loaded.game_state.persistent_locations.unloaded() == {"0000_elsewhere": "loc:0000_elsewhere"}
+    assert base64.b64decode(read_sessions(JOURNAL_FILE)[0][0]["save"]).startswith(b"FRPGSAVE")
+    controller.process_input("look")
+    assert replay_journal(JOURNAL_FILE).success
+
+    # A journal past the size limit is moved aside by the next session
+    monkeypatch.setattr(command_journal, "MAX_JOURNAL_SIZE", os.path.getsize(JOURNAL_FILE))
+    monkeypatch.setenv(JOURNAL_ENV_VAR, str(tmp_path / "custom.jsonl"))
+    assert controller.start_journal() and not os.path.exists(JOURNAL_FILE + ".1")
+    monkeypatch.setenv(JOURNAL_ENV_VAR, "true")
+    assert controller.start_journal()
+    assert len(read_sessions(JOURNAL_FILE + ".1")) == 1 and len(read_sessions(JOURNAL_FILE)) == 1
@@ -0,0 +1,112 @@
+"""Unit tests for the command trie and the shortkey manager built on it.
+
+Tests trie lookups, completion and typo suggestions, command parsing with
+alias and shortkey expansion, incremental object updates as the area
+changes, and tab completion of whole command lines.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.actions.action_handler import ActionHandler
+from fantasy_rpg.actions.command_trie import CommandTrie
+from fantasy_rpg.actions.shortkey_manager import ShortkeyManager
+from fantasy_rpg.game.area_index import AreaIndex
+
+
+def _manager():
+    manager = ShortkeyManager()
+    manager.add_commands(ActionHandler().registry.get_all_commands())
+    return manager
+
+
+def test_trie_lookup_completion_and_suggestions():
+    """Test expansions, prefix completion, one-typo suggestions and removal."""
+    trie = CommandTrie()
+    for word in ("look", "load", "light", "drink"):
+        trie.add(word)
+    trie.add("l", "look")
+
+    assert trie.get("L") == "look" and trie.get("look") == "look" and trie.get("lo") is None
+    assert len(trie) == 5 and "drink" in trie
+    assert trie.complete("lo") == ["load", "look"]
+    assert trie.complete("l") == ["light", "load", "look"]  # "l" itself is too short to offer
+    assert trie.complete("x") == []
+
+    assert trie.suggest("lok") == ["look"]
+    assert trie.suggest("drnik") == ["drink"]  # a swap is one deletion from both
+    assert trie.suggest("dread") == []
+    assert trie.suggest("dirnk") == ["drink"]
+    assert trie.suggest("lo") == []
+
+    assert trie.remove("load") and not trie.remove("load")
+    assert trie.complete("lo") == ["look"] and trie.suggest("laod") == []
+    for word in ("look", "light", "drink", "l"):
+        trie.remove(word)
+    assert len(trie) == 0 and trie.complete("") == []
+    assert not trie._words  # every branch and typo variant pruned
+
+
+def test_parse_and_incremental_objects():
+    """Test alias and shortkey expansion while objects come and go."""
+    manager = _manager()
+    assert manager.parse_command("EN") == ("enter", [])
+    assert manager.parse_command("x tc") == ("examine", ["tc"])
+    assert manager.parse_command("unknownword arg") == ("unknownword", ["arg"])
+    assert manager.parse_command("   ") == ("", [])
+
+    area = [
+        {"name": "Treasure Chest", "shortkey": "tc"},
+        {"name": "Farm Well", "shortkey": "we"},
+        {"name": "Old Well", "shortkey": "we"},
+        {"name": "Stone Altar"}
+    ]
+    assert manager.assign_object_shortcuts_from_data(area) == {"Treasure Chest": "tc", "Farm Well": "we", "Old Well": "we"}
+    assert manager.parse_command("x tc Stuff") == ("examine", ["Treasure Chest", "Stuff"])
+    assert manager.get_object_from_shortkey("we") == "Old Well"  # last object with a shortkey wins
+    assert manager.complete("x ") == ["x farm well", "x old well", "x stone altar", "x treasure chest"]
+
+    # The last well leaving hands its shortkey back to the other one
+    area = [obj for obj in area if obj["name"] != "Old Well"]
+    area[0] = {"name": "Open Chest", "shortkey": "tc"}
+    manager.assign_object_shortcuts_from_data(area)
+    assert manager.parse_command("b we") == ("drink", ["Farm Well"])
+    assert manager.parse_command("x tc") == ("examine", ["Open Chest"])
+    assert manager.complete("x ") == ["x farm well", "x open chest", "x stone altar"]
+
+    manager.assign_object_shortcuts_from_data([])
+    assert manager.complete("x ") == [] and manager.parse_command("x tc") == ("examine", ["tc"])
+
+    # An area's own index is used as is, not indexed a second time
+    area = {"objects": [{"name": "Berry Bush", "shortkey": "bb"}]}
+    index = AreaIndex(area)
+    manager.assign_object_shortcuts_from_data(area["objects"], index)
+    assert manager.area_index is index and manager.complete("g be") == ["g berry bush"]
+
+
+def test_tab_completion_and_unknown_commands():
+    """Test completing command lines and "did you mean" for unknown commands."""
+    manager = _manager()
+    manager.assign_object_shortcuts_from_data([
+        {"name": "Stone Fireplace", "shortkey": "fp"},
+        {"name": "Stone Altar", "shortkey": "sa"},
+        {"name": "Berry Bush", "shortkey": "bb"}
+    ])
+
+    assert manager.tab_complete("exa") == ("examine ", [])
+    assert manager.tab_complete("dump_l") == ("dump_lo", ["dump_location", "dump_log"])
+    assert manager.tab_complete("examine be") == ("examine berry bush", [])
+    assert manager.tab_complete("x st") == ("x stone ", ["x stone altar", "x stone fireplace"])
+    assert manager.tab_complete("x stone ") == ("x stone ", ["x stone altar", "x stone fireplace"])
+    assert manager.tab_complete("zzz") == ("zzz", [])
+    assert manager.complete("") == []
+
+    assert manager.suggest_commands("lok") == ["look"]
+    assert manager.suggest_commands("serach") == ["search"]
+
+    handler = ActionHandler()
+    assert "Did you mean: look?" in handler.process_command("lok").message
+    assert "Type 'help'" in handler.process_command("qqqq").message
@@ -0,0 +1,83 @@
+"""Unit tests for the cached effective-stat sheet on Character.
+
+Tests that condition effects are evaluated once per state version and that
+the sheet is rebuilt when vitals, equipment or ability scores change.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.core.character import Character
+from fantasy_rpg.game.conditions import get_conditions_manager
+from fantasy_rpg.game.player_state import PlayerState
+
+
+def _make_character():
+    """Create a character attached to a fresh player state."""
+    character = Character(
+        strength=16, dexterity=14, constitution=13, intelligence=10,
+        wisdom=12, charisma=8, level=1, hp=12, max_hp=12,
+        armor_class=12, proficiency_bonus=2, experience_points=0,
+        name="Tester"
+    )
+    character.player_state = PlayerState(character=character)
+    return character
+
+
+def _count_evaluations(monkeypatch):
+    """Count calls to ConditionsManager.evaluate_conditions."""
+    manager = get_conditions_manager()
+    original = manager.evaluate_conditions
+    calls = []
+
+    def counting(player_state):
+        calls.append(1)
+        return original(player_state)
+
+    monkeypatch.setattr(manager, "evaluate_conditions", counting)
+    return calls
+
+
+def test_accessors_share_one_evaluation(monkeypatch):
+    """Test that repeated modifier lookups evaluate conditions only once."""
+    character = _make_character()
+    calls = _count_evaluations(monkeypatch)
+
+    for ability in ("strength", "dexterity", "constitution", "wisdom"):
+        character.ability_modifier(ability)
+    character.get_effective_speed()
+    character.get_skill_modifier("Survival")
+    character.calculate_ac()
+
+    assert len(calls) == 1
+    assert character.ability_modifier("strength") == 3
+    assert character.get_skill_modifier("Survival") == character.ability_modifier("wisdom")
+
+
+def test_vitals_change_rebuilds_sheet(monkeypatch):
+    """Test that changing survival vitals produces a new sheet."""
+    character = _make_character()
+    calls = _count_evaluations(monkeypatch)
+
+    before = character.get_effective_stats()
+    assert character.get_effective_stats() is before
+
+    character.player_state.survival.fatigue -= 100
+    after = character.get_effective_stats()
+    assert after is not before
+    assert len(calls) == 2
+
+
+def test_ability_score_and_proficiency_changes():
+    """Test that score and proficiency changes are reflected immediately."""
+    character = _make_character()
+    assert character.ability_modifier("charisma") == -1
+
+    character.charisma = 14
+    assert character.ability_modifier("charisma") == 2
+
+    character.add_skill_proficiency("Persuasion")
+    assert character.get_skill_modifier("Persuasion") == 4
@@ -0,0 +1,88 @@
+"""Unit tests for the game event bus.
+
+Tests per-command coalescing of state-change events and batch delivery
+to subscribers.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.events import (
+    EventBus, ConditionGained, ConditionLost, HpChanged, HexEntered,
+    ItemAdded, TimeAdvanced, coalesce_events
+)
+
+
+def test_time_and_hp_events_coalesce():
+    """Test that repeated time and HP events merge into their net effect."""
+    events = coalesce_events([
+        TimeAdvanced(1.0, "travel"),
+        HpChanged(20, 18, "Freezing"),
+        TimeAdvanced(0.5, "travel"),
+        HpChanged(18, 15, "Freezing"),
+    ])
+    assert events == [TimeAdvanced(1.5, "travel"), HpChanged(20, 15, "Freezing")]
+
+
+def test_condition_gained_then_lost_cancels():
+    """Test that a condition gained and lost in one command produces no event."""
+    events = coalesce_events([
+        ConditionGained("Wet", "You are wet."),
+        ConditionLost("Wet"),
+        ConditionGained("Cold", "You feel cold."),
+    ])
+    assert events == [ConditionGained("Cold", "You feel cold.")]
+
+
+def test_hp_change_that_nets_to_zero_is_dropped():
+    """Test that HP changes cancelling each other out are dropped."""
+    events = coalesce_events([HpChanged(10, 8), HpChanged(8, 10)])
+    assert events == []
+
+
+def test_items_summed_and_hexes_kept():
+    """Test that items merge by id while every hex arrival is kept."""
+    events = coalesce_events([
+        ItemAdded("berries", 2),
+        HexEntered("0102", "0101"),
+        ItemAdded("berries", 3),
+        HexEntered("0103", "0102"),
+    ])
+    assert events == [ItemAdded("berries", 5), HexEntered("0102", "0101"), HexEntered("0103", "0102")]
+
+
+def test_bus_delivers_one_batch_per_command():
+    """Test that events published during a command arrive in a single batch."""
+    bus = EventBus()
+    batches = []
+    gained = []
+    bus.subscribe_batch(batches.append)
+    bus.subscribe(ConditionGained, gained.append)
+
+    with bus.command():
+        bus.publish(TimeAdvanced(1.0))
+        bus.publish(ConditionGained("Tired", "You feel tired."))
+        bus.publish(TimeAdvanced(1.0))
+        assert batches == []
+
+    assert len(batches) == 1
+    assert batches[0] == [TimeAdvanced(2.0), ConditionGained("Tired", "You feel tired.")]
+    assert gained == [ConditionGained("Tired", "You feel tired.")]
+
+
+def test_bus_publishes_immediately_outside_command():
+    """Test that events outside a command are delivered right away."""
+    bus = EventBus()
+    batches = []
+    bus.subscribe_batch(batches.append)
+    bus.publish(HexEntered("0505"))
+    assert batches == [[HexEntered("0505")]]
+
+
+def test_event_to_dict():
+    """Test that events serialize with their type name for the journal."""
+    data = HpChanged(10, 7, "trap").to_dict()
+    assert data == {"event": "HpChanged", "old_hp": 10, "new_hp": 7, "source": "trap"}
@@ -0,0 +1,113 @@
+"""Unit tests for the fog of war exploration map.
+
+Tests revealing hexes with terrain-dependent sight, the run-length encoded
+bitsets, and the fog of war following the player through moves and saves.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game.game_engine import GameEngine
+from fantasy_rpg.world.exploration_map import (
+    BASE_SIGHT_RADIUS, ExplorationMap, rle_decode, rle_encode, sight_radius
+)
+
+
+def test_reveal_tracks_explored_visited_and_visible():
+    """Test sight radius, the three bitsets and their counts."""
+    assert sight_radius(0.2) == BASE_SIGHT_RADIUS == 1
+    assert sight_radius(0.5) == 2 and sight_radius(0.9) == 3
+
+    fog = ExplorationMap(10, 8)
+    assert fog.reveal(0, 0) == [(0, 0), (1, 0), (0, 1), (1, 1)]  # clipped at the corner
+    assert fog.is_visited(0, 0) and not fog.is_visited(1, 1)
+
+    newly = fog.reveal(5, 4, radius=2)
+    assert len(newly) == 25 and (7, 6) in newly and not fog.is_explored(8, 4)
+    assert fog.is_visible(3, 2) and not fog.is_visible(0, 0) and fog.is_explored(0, 0)
+
+    # A step within sight visits a hex but explores nothing new
+    assert fog.reveal(4, 4) == []
+    assert fog.is_visible(5, 5) and not fog.is_visible(6, 6)
+    assert fog.stats() == {"explored": 29, "visited": 3, "total": 80, "explored_percent": 36.25}
+    assert not fog.is_explored(-1, 0) and fog.reveal(10, 0) == []
+
+
+def test_bitsets_round_trip_run_length_encoded():
+    """Test the RLE format, text and bytes round trips, and rejected data."""
+    data = bytes(1000) + b"\xff\x01\x01" + bytes(200)
+    encoded = rle_encode(data)
+    assert encoded == b"\xe8\x07\x00\x01\xff\x02\x01\xc8\x01\x00"
+    assert rle_decode(encoded, len(data)) == data
+    assert rle_encode(b"") == b""
+    for bad in (b"\x80", b"\x05", b"\x05\x00\x05\x00"):
+        with pytest.raises(ValueError):
+            rle_decode(bad, 5)
+
+    fog = ExplorationMap(300, 200)
+    fog.reveal(150, 100, radius=3)
+    fog.reveal(151, 100)
+    for text in (False, True):
+        saved = fog.to_dict(text=text)
+        assert len(saved["explored"]) < 100
+        restored = ExplorationMap(300, 200)
+        assert restored.load_dict(json.loads(json.dumps(saved)) if text else saved)
+        assert restored.stats() == fog.stats() and restored.visible == fog.visible
+        assert restored.is_explored(147, 97) and restored.is_visited(150, 100)
+        assert restored.reveal(0, 0) and not restored.is_visible(151, 100)
+
+    assert not ExplorationMap(200, 300).load_dict(fog.to_dict())
+    assert not restored.load_dict(dict(fog.to_dict(), explored=b"\x01\x00"))
+    assert restored.is_explored(0, 0)  # left unchanged
+
+
+def test_fog_of_war_follows_moves_and_saves(tmp_path, monkeypatch):
+    """Test moving reveals hexes, binary and legacy JSON saves, and older saves."""
+    monkeypatch.chdir(tmp_path)
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(20, 20))
+    game_engine.new_game(character, world_seed=4242)
+    world = game_engine.world_coordinator
+    x, y = game_engine.game_state.world_position.coords
+    assert world.exploration.is_visited(x, y) and world.exploration.is_visible(x, y)
+
+    revealed = []
+    game_engine.events.subscribe("HexesRevealed", lambda event: revealed.extend(event.hexes))
+    direction = "south" if y < 10 else "north"
+    assert game_engine.move_player(direction)[0]
+    nx, ny = game_engine.game_state.world_position.coords
+    assert (nx, ny) != (x, y) and revealed
+    assert all(world.exploration.is_explored(*coords) for coords in revealed)
+    stats = world.exploration.stats()
+
+    assert game_engine.save_game("save")[0]
+    loaded = GameEngine(skip_world_gen=True)
+    assert loaded.load_game("save")[0]
+    fog = loaded.world_coordinator.exploration
+    assert fog.stats() == stats and fog.visible == world.exploration.visible
+
+    # Legacy JSON saves keep the fog of war; ones from before it was tracked
+    # rebuild it around the hexes stopped in
+    os.remove("save.sav")
+    save_data = game_engine.saves.build_save_data()
+    for has_fog in (True, False):
+        if not has_fog:
+            del save_data["world_data"]["exploration"]
+        with open("save.json", "w") as f:
+            json.dump(save_data, f, default=str)
+        legacy = GameEngine(skip_world_gen=True)
+        assert legacy.load_game("save")[0]
+        fog = legacy.world_coordinator.exploration
+        assert fog.is_visible(nx, ny) and fog.is_visited(nx, ny) and fog.is_explored(x, y)
+        if has_fog:
+            assert fog.stats() == stats
+        else:
+            assert 0 < fog.explored_count <= stats["explored"]
@@ -0,0 +1,123 @@
+"""Unit tests for the bounded location caches.
+
+Tests that visited locations beyond the capacity are spilled to disk with
+their changes and paged back in on use, that hexes the player left have
+their location areas paged out, and that saves include everything that was
+spilled.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.game_engine import GameEngine
+from fantasy_rpg.game.location_cache import LocationCache
+from fantasy_rpg.game.save_codec import SaveFile, SectionRef, copy_tree
+
+
+def _location(name):
+    return {"name": name, "areas": {"entrance": {"name": "Entrance", "objects": [{"name": "Stone"}]}}}
+
+
+def test_cache_spills_and_pages_in_with_changes():
+    """Test LRU eviction, mutations surviving a spill and pinned values staying put."""
+    pinned = _location("Pinned")
+    cache = LocationCache(capacity=2, keep=lambda value: value is pinned)
+    cache["pinned"] = pinned
+    for key in ("a", "b", "c"):
+        cache[key] = _location(key)
+        cache[key]["areas"]["entrance"]["objects"].append({"name": f"Dropped in {key}"})
+
+    # Only the capacity stays in memory, and never the pinned location
+    assert len(cache) == 4 and set(cache) == {"pinned", "a", "b", "c"}
+    assert [key for key, _ in cache.loaded_items()] == ["pinned", "c"]
+    assert set(cache.spilled()) == {"a", "b"}
+    assert os.path.exists(cache.spill.path)
+
+    # A reference taken for a save still reads the spilled record after it is paged in
+    ref = SectionRef(cache.spill, cache.spilled()["a"])
+    location = cache["a"]
+    assert location["areas"]["entrance"]["objects"][-1] == {"name": "Dropped in a"}
+    assert "a" not in cache.spilled() and "c" in cache.spilled()
+    assert ref.save_file.read(ref.name) == location
+
+    assert dict(cache.items_uncached())["b"]["name"] == "b"
+    assert "b" in cache.spilled()
+    del cache["b"]
+    assert "b" not in cache and len(cache) == 3
+
+    path = cache.spill.path
+    cache.spill.close()
+    assert not os.path.exists(path)
+
+
+def test_hexes_left_behind_are_paged_out(played_game):
+    """Test that old hexes lose their location areas in memory and get them back on use."""
+    game_engine, game_state = played_game
+    world = game_engine.world_coordinator
+    pager = world.location_pager
+    pager.capacity = 2
+    current = game_state.world_position.hex_id
+
+    others = [hex_id for hex_id in world.hex_data if isinstance(hex_id, str) and hex_id != current][:4]
+    # Areas come back as saved (enum values become strings, as after loading a save)
+    originals = {hex_id: copy_tree([loc.get("areas", {}) for loc in world.get_hex_locations(hex_id)])
+                 for hex_id in others}
+
+    # The current hex stays in memory however many others are used
+    assert all("areas" in loc for loc in world.hex_data[current]["locations"])
+    paged_out = pager.paged_out()
+    assert others[0] in paged_out and others[1] in paged_out and current not in paged_out
+    assert all("areas" not in loc for loc in world.hex_data[others[0]]["locations"])
+
+    # A saved copy has the areas, the hex in memory does not
+    complete = pager.complete_hex_info(others[0], world.hex_data[others[0]])
+    assert [loc["areas"] for loc in complete["locations"]] == originals[others[0]]
+    assert all("areas" not in loc for loc in world.hex_data[others[0]]["locations"])
+
+    # Using the hex again restores its areas
+    assert [loc["areas"] for loc in world.get_hex_locations(others[0])] == originals[others[0]]
+    assert others[0] not in pager.paged_out()
+
+
+def test_save_and_load_include_spilled_locations(played_game):
+    """Test that evicted locations and paged-out hexes are written into saves."""
+    game_engine, game_state = played_game
+    world = game_engine.world_coordinator
+    world.location_pager.capacity = 1
+    current = game_state.world_position.hex_id
+    other = next(hex_id for hex_id in world.hex_data if isinstance(hex_id, str) and hex_id != current)
+    areas = copy_tree([loc["areas"] for loc in world.get_hex_locations(other)])
+    world.get_hex_locations(current)
+    assert other in world.location_pager.paged_out()
+
+    visited = game_state.persistent_locations
+    visited.capacity = 2
+    for index in range(5):
+        visited[f"9999_extra{index}"] = _location(f"Extra {index}")
+    visited["9999_extra0"]["name"] = "Changed"
+    assert len(visited.spilled()) == 4
+
+    # The current location stayed in memory and is still shared with the position
+    location = game_state.world_position.current_location_data
+    assert any(value is location for _, value in visited.loaded_items())
+
+    assert game_engine.save_game("save")[0]
+    assert visited.spilled() == {} and visited.spill is None
+    save_file = SaveFile("save.sav")
+    assert save_file.read("loc:9999_extra0")["name"] == "Changed"
+    assert save_file.read("loc:9999_extra4")["name"] == "Extra 4"
+    assert [loc["areas"] for loc in save_file.read(f"hex:{other}")["locations"]] == areas
+
+    loaded = GameEngine(skip_world_gen=True)
+    assert loaded.load_game("save")[0]
+    loaded_visited = loaded.game_state.persistent_locations
+    assert type(loaded_visited).__name__ == "LocationCache"
+    assert loaded_visited["9999_extra3"]["name"] == "Extra 3"
+    assert [loc["areas"] for loc in loaded.world_coordinator.get_hex_locations(other)] == areas
+
+    # Snapshots for the command journal see every location
+    assert len(loaded.saves.build_save_data()["visited_locations"]) == len(loaded_visited)
@@ -0,0 +1,61 @@
+"""Unit tests for the per-hex location graph in WorldCoordinator.
+
+Tests that intra-hex adjacency is built once, is bidirectional, and is
+stored on the hex so it is saved with the world data.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.world.world_coordinator import WorldCoordinator
+
+
+def _make_coordinator(locations):
+    """Create a coordinator with a single hex holding the given locations."""
+    coordinator = WorldCoordinator(world_size=(2, 2), skip_generation=True)
+    coordinator.hex_data["0000"] = {
+        "name": "Test Hex",
+        "locations": locations,
+        "locations_generated": True,
+        "coords": (0, 0),
+    }
+    return coordinator
+
+
+def test_location_graph_is_bidirectional():
+    """Test that every connection has a matching reverse connection."""
+    coordinator = _make_coordinator([])
+    locations = [{"id": f"loc_{i}"} for i in range(7)]
+    graph = coordinator._build_location_graph(locations)
+    
+    opposite = {"north": "south", "south": "north", "east": "west", "west": "east"}
+    assert set(graph) == {loc["id"] for loc in locations}
+    for location_id, connections in graph.items():
+        for direction, neighbour_id in connections.items():
+            assert graph[neighbour_id][opposite[direction]] == location_id
+
+
+def test_location_graph_grid_layout():
+    """Test that locations are laid out on a grid ordered by ID."""
+    coordinator = _make_coordinator([])
+    graph = coordinator._build_location_graph([{"id": "b"}, {"id": "a"}, {"id": "c"}])
+    
+    # Three locations form a 2-wide grid: a b / c
+    assert graph["a"] == {"south": "c", "east": "b"}
+    assert graph["b"] == {"west": "a"}
+    assert graph["c"] == {"north": "a"}
+
+
+def test_get_location_neighbors_returns_locations():
+    """Test that neighbour lookups return the location dicts."""
+    locations = [{"id": "a", "name": "Cave"}, {"id": "b", "name": "Grove"}]
+    coordinator = _make_coordinator(locations)
+    
+    neighbours = coordinator.get_location_neighbors("0000", "a")
+    assert neighbours == {"east": locations[1]}
+    
+    # Graph built on demand is stored on the hex for saving
+    assert coordinator.hex_data["0000"]["location_graph"] == {"a": {"east": "b"}, "b": {"west": "a"}}
@@ -0,0 +1,81 @@
+"""Unit tests for compiled loot tables.
+
+Tests weighted drop rates in bulk, margin conditions, nested tables,
+and that every loot table declared in objects.json compiles.
+"""
+
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.loot_tables import LootTable, compile_loot, get_object_loot, roll_loot
+from fantasy_rpg.utils.data_loader import DataLoader
+
+
+def test_drop_rates_follow_weights_and_chance():
+    """Test chance and weights over many rolls, including a nested table."""
+    table = LootTable({
+        "chance": 50,
+        "entries": [
+            {"item": "gold_coins", "weight": 3},
+            {"weight": 1},
+            {"table": "gems", "weight": 1}
+        ]
+    }, shared={"gems": {"entries": [{"item": "cave_crystals", "count": [2, 4]}]}})
+
+    rng = random.Random(3)
+    trials = 20000
+    drops = Counter()
+    crystals = 0
+    for _ in range(trials):
+        items = table.roll(rng)
+        drops.update(items.keys())
+        crystals += items.get("cave_crystals", 0)
+
+    assert abs(drops["gold_coins"] / trials - 0.5 * 3 / 5) < 0.015
+    assert abs(drops["cave_crystals"] / trials - 0.5 * 1 / 5) < 0.01
+    assert abs(crystals / drops["cave_crystals"] - 3.0) < 0.1
+
+
+def test_margin_conditions_and_counts():
+    """Test that entries switch on by margin and counts grow with margin."""
+    table = LootTable({"entries": [
+        {"item": "wild_berries", "count": 1, "per_margin": 5, "max_count": 3, "conditions": {"min_margin": 0}},
+        {"item": "wild_berries", "count": 1, "conditions": {"min_margin": -3, "max_margin": -1}}
+    ]})
+    rng = random.Random(1)
+
+    assert table.roll(rng, margin=-4) == {}
+    assert table.roll(rng, margin=-2) == {"wild_berries": 1}
+    assert table.roll(rng, margin=0) == {"wild_berries": 1}
+    assert table.roll(rng, margin=7) == {"wild_berries": 2}
+    assert table.roll(rng, margin=30) == {"wild_berries": 3}
+
+    gated = LootTable({"conditions": {"min_margin": 10}, "entries": [{"item": "gold_coins"}]})
+    assert roll_loot((table, gated), rng, margin=12) == {"wild_berries": 3, "gold_coins": 1}
+
+
+def test_objects_json_loot_compiles():
+    """Test that all declared loot compiles and references known items."""
+    objects_data = DataLoader().load_json("objects.json")
+    items = DataLoader().load_json("items.json")["items"]
+    compiled = compile_loot(objects_data)
+
+    assert set(compiled) == {oid for oid, data in objects_data["objects"].items() if "loot" in data}
+    assert get_object_loot()["berry_bush"]["forage"]
+
+    def check(table):
+        for item_id, subtable in zip(table.item_ids, table.subtables):
+            if subtable is not None:
+                check(subtable)
+            elif item_id:
+                assert item_id in items
+
+    for interactions in compiled.values():
+        for tables in interactions.values():
+            for table in tables:
+                check(table)
@@ -4,6 +4,7 @@ Tests message loading, retrieval, template interpolation, variance,
 and fallback behavior for the MessageManager.
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -273,6 +274,81 @@ def test_action_message_variance():
     assert len(messages) >= 3, "Action message variance not working"
 
 
+def _write_library(tmp_path, library):
+    path = tmp_path / "messages.json"
+    path.write_text(json.dumps(library), encoding='utf-8')
+    return MessageManager(str(path))
+
+
+def test_templates_are_checked_at_load(tmp_path, capsys):
+    """Test that broken templates are reported once at load and skipped."""
+    manager = _write_library(tmp_path, {
+        "template_variables": {"actions": ["object_name", "quantity"]},
+        "actions": {"chop_success": [
+            "You chop the {object_name} into {quantity} logs.",
+            "You chop the {objcet_name}.",
+            "Unbalanced {object_name",
+            {"text": "Logs!", "when": {"mood": ["happy"]}},
+            {"text": "Hot work.", "when": {"temperature": "hot"}}
+        ]}
+    })
+    output = capsys.readouterr().out
+    assert "undeclared variable {objcet_name}" in output
+    assert "message 2 of 'actions.chop_success'" in output
+    assert "unknown predicate 'mood'" in output
+
+    templates = manager.templates['actions']['chop_success'].templates
+    assert [t.text for t in templates] == ["You chop the {object_name} into {quantity} logs.", "Hot work."]
+    assert templates[0].fields == {"object_name", "quantity"}
+    assert templates[1].when == {"temperature": {"hot"}}
+
+    # Nothing is re-checked when messages are shown
+    assert manager.get_action_message('chop_success', object_name="oak", quantity=4) == "You chop the oak into 4 logs."
+    assert capsys.readouterr().out == ""
+
+
+def test_context_selects_matching_variants(tmp_path):
+    """Test severity, temperature band and biome predicates."""
+    manager = _write_library(tmp_path, {"survival_effects": {"COLD_triggered": [
+        "Plain cold.",
+        {"text": "Forest cold.", "when": {"biome": ["forest"]}},
+        {"text": "Tundra cold.", "when": {"biome": "arctic_tundra"}},
+        {"text": "Freezing cold.", "when": {"temperature": ["freezing"]}},
+        {"text": "Critical forest freeze.", "when": {"severity": "critical", "biome": "forest",
+                                                       "temperature": ["freezing", "cold"]}}
+    ]}})
+
+    def seen(context):
+        return {manager.get_survival_message('COLD_triggered', context) for _ in range(200)}
+
+    assert seen(None) == {"Plain cold."}
+    assert seen({'biome': 'boreal_forest'}) == {"Plain cold.", "Forest cold."}
+    assert seen({'biome': 'arctic_tundra', 'temperature': 10}) == {"Plain cold.", "Tundra cold.", "Freezing cold."}
+    assert seen({'biome': 'temperate_forest', 'temperature': 45, 'severity': 'critical'}) == \
+        {"Plain cold.", "Forest cold.", "Critical forest freeze."}
+    assert seen({'temperature_band': 'freezing', 'severity': 'mild'}) == {"Plain cold.", "Freezing cold."}
+
+
+def test_variants_need_their_variables(tmp_path, capsys):
+    """Test that variants are only used when their variables are provided."""
+    manager = _write_library(tmp_path, {"actions": {"forage_success": [
+        "You gather {quantity} {item_name} from the {object_name}.",
+        "You gather {items}."
+    ]}})
+    messages = {manager.get_action_message('forage_success', items="3 berries") for _ in range(50)}
+    assert messages == {"You gather 3 berries."}
+
+    # The same context reuses its selection
+    event_templates = manager.templates['actions']['forage_success']
+    first = event_templates.candidates(None, None, (), frozenset(["items"]))
+    assert event_templates.candidates(None, None, (), frozenset(["items"])) is first
+
+    # With no usable variant, the message shows what is missing
+    capsys.readouterr()
+    message = manager.get_action_message('forage_success', quantity=2)
+    assert "{" in message and "Missing template variable" in capsys.readouterr().out
+
+
 if __name__ == '__main__':
     # Run all tests manually
     print("Running MessageManager unit tests...\n")
@@ -0,0 +1,60 @@
+"""Unit tests for the central RNG service.
+
+Tests that named streams are independent and reproducible from the master
+seed, and that recorded draws replay exactly.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.utils.rng import RngService
+from fantasy_rpg.utils.utils import Dice
+
+
+def test_streams_are_reproducible_and_independent():
+    """Test that streams depend only on the master seed and their name."""
+    first = RngService(seed=42)
+    second = RngService(seed=42)
+
+    # Extra draws on one stream must not shift another stream
+    first.stream("loot").random()
+    first.stream("loot").random()
+    assert first.stream("weather").random() == second.stream("weather").random()
+    assert first.stream("weather").random() != first.stream("combat").random()
+
+
+def test_reseed_restarts_existing_streams_in_place():
+    """Test that reseeding keeps stream objects held by other systems valid."""
+    service = RngService(seed=1)
+    weather = service.stream("weather")
+    expected = RngService(seed=2).stream("weather").randint(1, 100)
+
+    weather.random()
+    service.reseed(2)
+    assert service.stream("weather") is weather
+    assert weather.randint(1, 100) == expected
+    assert service.get_state()["streams"]["weather"][1] == 1
+
+
+def test_recorded_draws_replay_exactly():
+    """Test that a JSON round-tripped draw log reproduces every result."""
+    service = RngService(seed=7)
+    service.start_recording()
+    rng = service.stream("loot")
+    original = [rng.randint(1, 20), rng.uniform(0, 1), rng.choice(["a", "b", "c"]), rng.random()]
+    log = json.loads(json.dumps(service.get_log()))
+
+    # A service with a different seed replays the recorded values
+    replayer = RngService(seed=999)
+    replayer.replay(log)
+    rng = replayer.stream("loot")
+    assert [rng.randint(1, 20), rng.uniform(0, 1), rng.choice(["a", "b", "c"]), rng.random()] == original
+
+
+def test_seeded_dice_are_deterministic():
+    """Test that dice with the same seed roll the same results."""
+    assert [Dice(seed=5).d20() for _ in range(3)] == [Dice(seed=5).d20() for _ in range(3)]
@@ -0,0 +1,83 @@
+"""Unit tests for the overworld route planner.
+
+Tests that A* with landmark heuristics finds the fastest route over
+per-hex travel costs and handles blocked or out-of-bounds destinations, and
+that travelling a route stops when the character faints.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.events import Fainted
+from fantasy_rpg.world.route_planner import RoutePlanner, INFINITY
+
+
+def test_route_avoids_slow_terrain():
+    """Test that the planner detours around expensive hexes."""
+    # A wall of mountains (cost 10) across the middle column, except the top row
+    costs = {(2, y): 10.0 for y in range(1, 5)}
+    planner = RoutePlanner(5, 5, lambda x, y: costs.get((x, y), 1.0))
+
+    route = planner.plan((0, 4), (4, 4))
+    assert route.path[0] == (0, 4) and route.path[-1] == (4, 4)
+    assert (2, 0) in route.path
+    assert route.total_hours == route.steps * 1.0
+
+
+def test_route_matches_dijkstra():
+    """Test that landmark-guided A* returns optimal travel times."""
+    rng = random.Random(7)
+    width, height = 15, 12
+    values = [rng.choice([0.5, 1.0, 2.0, 4.0, INFINITY]) for _ in range(width * height)]
+    planner = RoutePlanner(width, height, lambda x, y: values[y * width + x], landmark_count=4)
+
+    for _ in range(25):
+        start = (rng.randrange(width), rng.randrange(height))
+        goal = (rng.randrange(width), rng.randrange(height))
+        expected = planner._dijkstra(planner._index(start))[planner._index(goal)]
+        route = planner.plan(start, goal)
+
+        if start == goal:
+            assert route.total_hours == 0.0
+        elif expected == INFINITY:
+            assert route is None
+        else:
+            assert abs(route.total_hours - expected) < 1e-9
+
+
+def test_cost_multiplier_and_bounds():
+    """Test weather scaling and rejection of invalid destinations."""
+    planner = RoutePlanner(4, 4, lambda x, y: 2.0)
+
+    assert planner.plan((0, 0), (3, 3), cost_multiplier=1.5).total_hours == 9.0
+    assert planner.plan((0, 0), (4, 0)) is None
+
+
+def test_travel_stops_when_the_character_faints(played_game):
+    """Test that a faint partway along a route ends the journey in that hex."""
+    game_engine, game_state = played_game
+    x, y = game_state.world_position.coords
+    goal = (7 if x < 4 else 0, y)
+
+    # Faint on the second hex of the journey
+    perform_activity = game_engine.time_system.perform_activity
+    steps = []
+
+    def fainting_activity(*args, **kwargs):
+        result = perform_activity(*args, **kwargs)
+        steps.append(result)
+        if len(steps) == 2:
+            game_engine.events.publish(Fainted(60, "You collapse."))
+        return result
+
+    game_engine.time_system.perform_activity = fainting_activity
+    route = game_engine.movement.plan_route((x, y), goal)
+    assert route.steps > 2
+
+    success, message = game_engine.movement.travel_to(f"{goal[0]},{goal[1]}")
+    assert success and "You collapsed on the way" in message
+    assert len(steps) == 2 and tuple(game_state.world_position.coords) == route.path[2]
@@ -0,0 +1,108 @@
+"""Unit tests for the binary save codec and sectioned save files.
+
+Tests that encoding matches a JSON round trip, that damaged sections are
+detected, and that saves load lazily and re-save unloaded sections as stored.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.game_engine import GameEngine
+from fantasy_rpg.game.save_codec import (
+    LazySectionMap, LazySectionList, SaveFile, SaveFormatError, pack, unpack, write_save_file
+)
+
+
+def test_pack_matches_json_round_trip():
+    """Test that decoding gives what json.load would for the same data."""
+    value = {
+        "small": [0, 1, 127, 128, 255, 256, 65536, 2 ** 32, 2 ** 63, -1, -32, -33, -200, -40000, -2 ** 40],
+        "floats": [0.5, -1.25, 1e300],
+        "text": ["", "x" * 31, "y" * 32, "z" * 300, "é" * 40000, "snow ❄"],
+        "flags": [True, False, None],
+        "nested": {"tuple": (1, (2, 3)), "list": list(range(20)), "map": {str(i): i for i in range(20)}},
+        1: "int key",
+        None: "none key",
+        "object": ValueError("stored as text")
+    }
+    assert unpack(pack(value)) == json.loads(json.dumps(value, default=str))
+
+
+def test_container_sections_and_corruption(tmp_path):
+    """Test section table reads, lazy containers and checksum failures."""
+    path = str(tmp_path / "test.sav")
+    write_save_file(path, [
+        ("meta", {"version": "1.0"}),
+        ("loc:a", {"name": "Cave", "objects": ["x"] * 200}),
+        ("loc:b", {"name": "Ruins"}),
+        ("log", [{"event": "hp"}])
+    ])
+
+    save_file = SaveFile(path)
+    assert save_file.names("loc:") == ["loc:a", "loc:b"]
+    assert save_file.read("meta") == {"version": "1.0"}
+
+    visited = LazySectionMap(save_file, {"a": "loc:a", "b": "loc:b"})
+    assert len(visited) == 2 and "b" in visited
+    assert visited["b"] == {"name": "Ruins"}
+    assert visited.unloaded() == {"a": "loc:a"}
+
+    log = LazySectionList(save_file, "log")
+    assert not log.loaded
+    log.append({"event": "xp"})
+    assert log.loaded and len(log) == 2
+
+    data = bytearray(open(path, "rb").read())
+    data[-3] ^= 0xff
+    open(path, "wb").write(bytes(data))
+    with pytest.raises(SaveFormatError):
+        SaveFile(path).read("log")
+
+    open(path, "wb").write(b"not a save")
+    with pytest.raises(SaveFormatError):
+        SaveFile(path)
+
+
+def test_save_load_is_lazy_and_keeps_state(played_game):
+    """Test lazy loading, shared current location and legacy JSON saves."""
+    game_engine, game_state = played_game
+
+    # An extra visited location that the loaded game does not touch
+    game_state.persistent_locations["0000_elsewhere"] = {"name": "Elsewhere", "areas": {}}
+    assert game_engine.save_game("save")[0]
+
+    loaded = GameEngine(skip_world_gen=True)
+    assert loaded.load_game("save") == (True, "Game loaded from save.sav")
+    gs = loaded.game_state
+    position = gs.world_position
+
+    # The engine imports the codec as a top-level module, so compare by name
+    visited = gs.persistent_locations
+    assert "LazySectionMap" in [cls.__name__ for cls in type(visited).__mro__]
+    assert visited.unloaded() == {"0000_elsewhere": "loc:0000_elsewhere"}
+    assert position.current_location_data is visited[f"{position.hex_id}_{position.current_location_id}"]
+    assert position.hex_data is loaded.world_coordinator.hex_data[position.hex_id]
+    assert position.current_location_data == json.loads(
+        json.dumps(game_state.world_position.current_location_data, default=str))
+    assert not gs.event_journal.loaded
+
+    # Re-saving copies the unloaded sections without decoding them
+    assert loaded.save_game("save")[0]
+    assert visited.unloaded() == {"0000_elsewhere": "loc:0000_elsewhere"}
+    assert visited["0000_elsewhere"] == {"name": "Elsewhere", "areas": {}}
+    assert list(gs.event_journal) == list(game_state.event_journal)
+
+    # Legacy JSON saves still load
+    os.remove("save.sav")
+    with open("save.json", "w") as f:
+        json.dump(game_engine.saves.build_save_data(), f, default=str)
+    legacy = GameEngine(skip_world_gen=True)
+    assert legacy.load_game("save") == (True, "Game loaded from save.json")
+    assert "0000_elsewhere" in legacy.game_state.persistent_locations
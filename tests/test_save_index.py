@@ -0,0 +1,137 @@
+"""Unit tests for the save-slot index.
+
+Tests that saves are listed from the index without opening them, that a
+damaged save is caught by its checksum before it is decoded, that an intact
+save replaced behind the index is re-indexed instead, and that the index
+rebuilds itself from the saves' summary sections when it is missing.
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.game_engine import GameEngine
+from fantasy_rpg.game.save_codec import SaveFile, file_checksum, write_save_file
+from fantasy_rpg.game.save_index import SAVE_INDEX_FILE, SaveIndex
+
+
+def _saved_game(played_game, *save_names):
+    game_engine, _ = played_game
+    for save_name in save_names:
+        assert game_engine.save_game(save_name)[0]
+    return game_engine
+
+
+def test_listing_reads_only_the_index(monkeypatch, played_game):
+    """Test slot metadata and thumbnails come from the index, updated on every save."""
+    game_engine = _saved_game(played_game, "first", "second")
+
+    with open(SAVE_INDEX_FILE) as f:
+        entries = json.load(f)["slots"]
+    assert set(entries) == {"first.sav", "second.sav"}
+    assert entries["first.sav"]["checksum"] == file_checksum("first.sav")
+    assert not os.path.exists(f"{SAVE_INDEX_FILE}.tmp")
+
+    # Listing must not open a single save
+    def no_reads(*args, **kwargs):
+        raise AssertionError("save file opened while listing")
+    with monkeypatch.context() as patch:
+        patch.setattr(SaveFile, "__init__", no_reads)
+        slots = game_engine.list_saves()
+
+    assert [slot.name for slot in slots] == ["second", "first"]
+    summary = slots[0].summary
+    assert summary["character"] == "Aldric" and summary["level"] == 1
+    assert summary["hex_id"] == game_engine.game_state.world_position.hex_id
+    assert slots[0].headline.startswith("Aldric, level 1 Human Fighter - ")
+    thumbnail = summary["thumbnail"]
+    assert len(thumbnail) == 5 and all(len(row) == 5 for row in thumbnail) and thumbnail[2][2] == "@"
+
+    # The summary section is in the save too, and a new save replaces its entry
+    assert SaveFile("first.sav").read("summary")["headline"] == slots[1].headline
+    game_engine.game_state.character.level = 2
+    assert game_engine.save_game("first")[0]
+    assert game_engine.describe_save("first").summary["level"] == 2
+    assert game_engine.list_saves(verify=True)[0].name == "first"
+
+
+def test_damaged_save_is_detected_by_checksum(played_game):
+    """Test a flipped byte is reported by listing and refused by loading."""
+    game_engine = _saved_game(played_game, "good", "bad")
+
+    with open("bad.sav", "r+b") as f:
+        f.seek(os.path.getsize("bad.sav") - 10)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    assert game_engine.saves.index.verify("bad.sav")[0] is False
+    statuses = {slot.name: slot.status for slot in game_engine.list_saves(verify=True)}
+    assert statuses == {"good": "ok", "bad": "damaged"}
+    # Even without verify, a file that changed behind the index is checked
+    assert {slot.name: slot.status for slot in game_engine.list_saves()}["bad"] == "damaged"
+
+    loaded = GameEngine(skip_world_gen=True)
+    success, message = loaded.load_game("bad")
+    assert not success and "damaged" in message and "checksum" in message
+    assert loaded.load_game("good")[0]
+
+
+def test_save_copied_over_another_slot_is_reindexed(monkeypatch, played_game):
+    """Test intact saves that no longer match their index entry still list and load."""
+    game_engine = _saved_game(played_game, "save")
+    game_engine.game_state.character.level = 4
+    assert game_engine.save_game("backup")[0]
+
+    shutil.copyfile("backup.sav", "save.sav")
+    assert SaveIndex().verify("save.sav") == (True, "Sections intact, re-indexed")
+    with open(SAVE_INDEX_FILE) as f:
+        assert json.load(f)["slots"]["save.sav"]["checksum"] == file_checksum("save.sav")
+    loaded = GameEngine(skip_world_gen=True)
+    assert loaded.load_game("save")[0] and loaded.game_state.character.level == 4
+
+    # Saved, then stopped before the index was updated
+    game_engine.game_state.character.level = 5
+    monkeypatch.setattr(game_engine.saves, "_record_slot", lambda *args: None)
+    assert game_engine.save_game("save")[0]
+    slots = {slot.name: slot for slot in game_engine.list_saves(verify=True)}
+    assert slots["save"].status == "ok" and slots["save"].summary["level"] == 5
+    assert slots["save"].checksum == file_checksum("save.sav")
+    assert GameEngine(skip_world_gen=True).load_game("save")[0]
+
+
+def test_index_is_rebuilt_from_saves(played_game):
+    """Test a missing index, unknown saves and old saves without a summary section."""
+    game_engine = _saved_game(played_game, "save")
+    headline = game_engine.describe_save("save").headline
+    os.remove(SAVE_INDEX_FILE)
+
+    # A save from before summaries existed still gets a slot
+    write_save_file("old.sav", [
+        ("meta", {"version": "1.0", "saved_at": "2000-01-01T00:00:00"}),
+        ("character", {"name": "Mira", "level": 3})
+    ])
+    with open("notes.txt", "w") as f:
+        f.write("not a save")
+    with open("broken.sav", "wb") as f:
+        f.write(b"garbage")
+
+    slots = {slot.name: slot for slot in SaveIndex().list_slots()}
+    assert set(slots) == {"save", "old", "broken"}
+    assert slots["save"].headline == headline
+    assert slots["old"].headline == "Mira, level 3"
+    assert slots["broken"].status == "damaged"
+
+    # Rebuilt entries have no checksum to trust, and deleted saves are dropped
+    assert SaveIndex().verify("save.sav") == (True, "No checksum recorded")
+    os.remove("old.sav")
+    with open(SAVE_INDEX_FILE) as f:
+        assert "old.sav" in json.load(f)["slots"]
+    SaveIndex().list_slots()
+    with open(SAVE_INDEX_FILE) as f:
+        assert set(json.load(f)["slots"]) == {"save.sav"}
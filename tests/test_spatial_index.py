@@ -0,0 +1,113 @@
+"""Unit tests for the overworld spatial index.
+
+Tests that grid-bucket nearest and radius queries agree with a full scan,
+that compass directions point the right way, and that the world indexes
+its water, settlements and shelters and uses them in hex descriptions.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game.game_engine import GameEngine
+from fantasy_rpg.world.spatial_index import Feature, SpatialIndex, compass_direction, hex_distance
+
+
+def _scan(features, coords, kinds, max_distance=None):
+    """Reference answer: every matching feature sorted the way the index sorts"""
+    found = []
+    for feature in features:
+        distance = hex_distance(coords, feature.coords)
+        if feature.kind in kinds and (max_distance is None or distance <= max_distance):
+            squared = (feature.coords[0] - coords[0]) ** 2 + (feature.coords[1] - coords[1]) ** 2
+            found.append((distance, squared, feature.coords, feature))
+    found.sort(key=lambda entry: (entry[:3], entry[3].kind, entry[3].name))
+    return [(entry[0], entry[3]) for entry in found]
+
+
+def test_queries_match_full_scan():
+    """Test k-nearest and radius queries against a brute-force scan."""
+    rng = random.Random(11)
+    features = [Feature(rng.choice(["river", "lake", "shelter"]), (rng.randrange(40), rng.randrange(30)), f"f{i}")
+                for i in range(150)]
+
+    for cell_size in (1, 3, 8):
+        index = SpatialIndex(cell_size)
+        for feature in features:
+            index.add(feature)
+        assert index.count() == 150
+
+        for _ in range(40):
+            coords = (rng.randrange(-5, 45), rng.randrange(-5, 35))
+            kinds = rng.choice([("river",), ("river", "lake"), ("shelter",)])
+            k = rng.choice([1, 3, 10])
+            max_distance = rng.choice([None, 2, 6])
+
+            expected = _scan(features, coords, kinds, max_distance)
+            assert index.nearest(coords, kinds, k, max_distance) == expected[:k]
+            assert index.within(coords, 5, kinds) == _scan(features, coords, kinds, 5)
+
+    # Filters, removal and kinds without features
+    index.add(Feature("settlement", (3, 3), "Village"))
+    assert index.nearest((0, 0), "settlement", where=lambda f: f.name != "Village") == []
+    assert index.remove("settlement", (3, 3)) == 1
+    assert index.nearest((0, 0), "settlement") == [] and "settlement" not in index.kinds()
+    assert index.nearest((0, 0), "volcano") == []
+
+
+def test_compass_directions():
+    """Test eight-way directions with north towards lower y."""
+    assert compass_direction((5, 5), (5, 5)) == "here"
+    assert compass_direction((5, 5), (5, 0)) == "north"
+    assert compass_direction((5, 5), (9, 5)) == "east"
+    assert compass_direction((5, 5), (8, 8)) == "southeast"
+    assert compass_direction((5, 5), (1, 2)) == "northwest"
+    assert compass_direction((5, 5), (4, 9)) == "south"
+    assert hex_distance((0, 0), (3, -7)) == 7
+
+
+def test_world_indexes_features_and_hints(tmp_path, monkeypatch):
+    """Test the world's index, direction hints and rebuilding it after loading a save."""
+    monkeypatch.chdir(tmp_path)
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(20, 20))
+    game_state = game_engine.new_game(character, world_seed=4242)
+    world = game_engine.world_coordinator
+    hex_id = game_state.world_position.hex_id
+
+    # Water comes from the generated drainage and is tagged on its hexes
+    water_hexes = [key for key, info in world.hex_data.items() if info.get("river") or info.get("lake")]
+    assert water_hexes
+    assert world.spatial_index.count("river") == sum(1 for info in world.hex_data.values() if info.get("river"))
+    assert world.spatial_index.count("lake") == sum(1 for info in world.hex_data.values() if info.get("lake"))
+    assert world.spatial_index.count("biome") == 400
+
+    nearest = world.nearest_features(hex_id, ("river", "lake"), k=3)
+    assert len(nearest) == 3
+    assert [distance for distance, _ in nearest] == sorted(distance for distance, _ in nearest)
+    closest = min(hex_distance(world._hex_coords(hex_id), world._hex_coords(key)) for key in water_hexes)
+    assert nearest[0][0] == closest
+    assert all(distance <= 3 for distance, _ in world.features_within(hex_id, 3, "lake"))
+
+    # Locations generated later add the shelters they offer
+    assert game_engine.enter_location()[0]
+    shelters = world.nearest_features(hex_id, "shelter", k=10)
+    locations = world.get_hex_locations(hex_id)
+    assert len(shelters) == sum(1 for loc in locations
+                                if loc.get("provides_good_shelter") or loc.get("provides_excellent_shelter"))
+
+    description = game_engine.get_hex_description()
+    assert any(hint in description for hint in world.get_direction_hints(hex_id))
+    assert "water" in description or " here." in description
+
+    # A loaded world rebuilds the same index from its saved hexes
+    assert game_engine.save_game("save")[0]
+    loaded = GameEngine(skip_world_gen=True)
+    assert loaded.load_game("save")[0]
+    assert loaded.world_coordinator.spatial_index is None
+    assert loaded.world_coordinator.nearest_features(hex_id, ("river", "lake"), k=3) == nearest
+    assert loaded.world_coordinator.get_direction_hints(hex_id) == world.get_direction_hints(hex_id)
@@ -0,0 +1,154 @@
+"""Unit tests for batched survival needs.
+
+Tests that a SurvivalBatch step gives exactly the numbers PlayerState gives
+for the same needs, activity, weather and conditions, and the batch's
+bookkeeping (adding, removing, reading and overwriting actors), and that the
+Wet/Soaked thresholds match their conditions.json triggers.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.game.player_state import PlayerState, SurvivalNeeds
+from fantasy_rpg.game.conditions import ConditionsManager
+from fantasy_rpg.game.survival_batch import NEED_COLUMNS, SurvivalBatch, wetness_thresholds
+from fantasy_rpg.world.character_weather import CharacterWeatherResistance
+from fantasy_rpg.world.weather_core import WeatherState
+
+
+def _weather(rng):
+    return WeatherState(temperature=rng.uniform(-10, 100), wind_speed=rng.randrange(0, 40), wind_direction="N",
+                        precipitation=rng.choice([0, 0, 5, 30, 80]), precipitation_type="rain",
+                        cloud_cover=rng.randrange(0, 100), visibility=1000, feels_like=0.0, is_storm=False,
+                        lightning_risk=0.0)
+
+
+def _random_needs(rng):
+    return SurvivalNeeds(hunger=rng.randrange(0, 1001), thirst=rng.randrange(0, 1001),
+                         fatigue=rng.randrange(0, 1001), body_temperature=rng.randrange(0, 1001),
+                         wetness=rng.randrange(0, 401), wind_chill=rng.randrange(0, 201))
+
+
+class _Actor:
+    def __init__(self, cold_resistance):
+        self.weather_resistance = CharacterWeatherResistance(cold_resistance=cold_resistance)
+
+
+def _player_step(player, hours, activity):
+    """The survival part of PlayerState.advance_time, with conditions kept as set"""
+    survival = player.survival
+    wet_threshold, soaked_threshold = wetness_thresholds()
+    wetness_conditions = ["Soaked"] if survival.wetness >= soaked_threshold else \
+        ["Wet"] if survival.wetness >= wet_threshold else []
+    player.active_conditions = [c for c in player.active_conditions if c not in ("Wet", "Soaked")] + wetness_conditions
+    player._update_hunger(hours, activity)
+    player._update_thirst(hours, activity)
+    player._update_fatigue(hours, activity)
+    if player.current_weather:
+        player._update_temperature_regulation(hours)
+        player._update_environmental_exposure(hours)
+
+
+def test_batch_matches_player_state():
+    """Test random actors, weather, activities and conditions against PlayerState."""
+    rng = random.Random(45)
+    condition_choices = [[], ["Natural Shelter"], ["Good Shelter", "Lit Fire"], ["Excellent Shelter"],
+                         ["Lit Fire"], ["Wind Chilled"], ["Natural Shelter", "Wind Chilled", "Lit Fire"]]
+    activities = ["normal", "resting", "active", "strenuous", "unconscious", "sneaking"]
+
+    for _ in range(20):
+        batch = SurvivalBatch()
+        players = []
+        for _ in range(12):
+            actor = _Actor(rng.randrange(0, 8))
+            needs = _random_needs(rng)
+            conditions = rng.choice(condition_choices)
+            activity = rng.choice(activities)
+            index = batch.add(actor, SurvivalNeeds(**{name: getattr(needs, name) for name in NEED_COLUMNS}),
+                              activity=activity)
+            batch.set_conditions(index, conditions)
+            players.append((PlayerState(character=actor, survival=needs, debug_survival=False,
+                                        active_conditions=list(conditions)), activity))
+
+        for _ in range(4):
+            hours = rng.choice([0.1, 0.5, 1.0, 2.75, 8.0])
+            weather = rng.choice([None, _weather(rng)])
+            batch.advance(hours, weather)
+            for player, activity in players:
+                player.current_weather = weather
+                _player_step(player, hours, activity)
+
+            for index, (player, _) in enumerate(players):
+                assert batch.needs(index) == player.survival
+
+
+def test_batch_bookkeeping():
+    """Test adding, finding, removing, reading and overwriting actors."""
+    batch = SurvivalBatch()
+    wolf, horse, dog = object(), object(), object()
+    batch.add(wolf, SurvivalNeeds(hunger=100))
+    batch.add(horse, SurvivalNeeds(hunger=200), activity="strenuous", cold_resistance=4)
+    batch.add(dog)
+    assert len(batch) == 3 and batch.index_of(horse) == 1
+
+    batch.remove(0)
+    assert len(batch) == 2 and batch.index_of(horse) == 0 and batch.index_of(dog) == 1
+    assert batch.needs(0).hunger == 200 and batch.cold_resistance[0] == 4
+    assert all(len(getattr(batch, name)) == 2 for name in NEED_COLUMNS)
+    try:
+        batch.index_of(wolf)
+        assert False, "removed actor still found"
+    except ValueError:
+        pass
+
+    # A feeding is written back with store()
+    needs = batch.needs(1)
+    needs.hunger = 900
+    batch.store(1, needs)
+    assert batch.hunger[1] == 900
+
+    batch.set_environment(1, shelter="good", lit_fire=True)
+    assert batch.shelter[1] == 2 and batch.flags[1] == 1
+    batch.set_conditions(1, ["Natural Shelter", "Excellent Shelter"])
+    assert batch.shelter[1] == 3 and batch.flags[1] == 0
+
+    assert batch.summary()["hunger"] == (200 + 900) / 2
+    assert SurvivalBatch().summary() == {}
+
+
+def test_activity_override_and_limits():
+    """Test a batch-wide activity, no weather and values staying in range."""
+    batch = SurvivalBatch()
+    for hunger in (0, 3, 500):
+        batch.add(object(), SurvivalNeeds(hunger=hunger, fatigue=995, body_temperature=990), activity="strenuous")
+
+    # Resting for everyone overrides the stored activities, without changing them
+    batch.advance(1.0, activity="resting")
+    assert list(batch.hunger) == [0, 2, 499]
+    assert list(batch.fatigue) == [1000, 1000, 1000]
+    assert list(batch.activity) == [3, 3, 3]
+
+    # Without weather, temperature and exposure are left alone
+    assert list(batch.body_temperature) == [990, 990, 990]
+    assert list(batch.wetness) == [0, 0, 0]
+
+    batch.advance(100.0)
+    assert list(batch.hunger) == [0, 0, 0] and list(batch.thirst) == [0, 0, 0] and list(batch.fatigue) == [0, 0, 0]
+
+
+def test_wetness_thresholds_follow_conditions_json():
+    """Test the Wet and Soaked thresholds are where their conditions.json triggers switch."""
+    manager = ConditionsManager()
+    triggers = {name: manager.conditions_data[name]["trigger"] for name in ("Wet", "Soaked")}
+    wet, soaked = wetness_thresholds()
+    assert 0 < wet < soaked
+
+    def active(name, wetness):
+        return manager._safe_eval_trigger(triggers[name], {"wetness": wetness})
+
+    assert not active("Wet", wet - 1) and active("Wet", wet) and active("Wet", soaked - 1)
+    assert not active("Wet", soaked) and not active("Soaked", soaked - 1) and active("Soaked", soaked)
@@ -0,0 +1,93 @@
+"""Unit tests for span tracing.
+
+Tests the ring buffer and percentiles, that disabled tracing records
+nothing, and the perf command with profiling of the slowest commands.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.utils.tracing import Tracer, get_tracer, traced
+from fantasy_rpg.actions.input_controller import InputController
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game.game_engine import GameEngine
+
+
+def test_ring_buffer_and_percentiles():
+    """Test that only the newest spans are kept and percentiles use nearest rank."""
+    tracer = Tracer(capacity=100)
+    tracer.record("old", 5.0)
+    for i in range(1, 101):
+        tracer.record("step", i / 1000.0)
+
+    assert len(tracer) == 100
+    stats = tracer.stats()
+    assert "old" not in stats
+    assert stats["step"]["count"] == 100
+    assert stats["step"]["p50"] == 0.050
+    assert stats["step"]["p95"] == 0.095
+    assert stats["step"]["p99"] == 0.099
+    assert stats["step"]["max"] == 0.100
+    assert tracer.spans()[0][1] == 0.001
+
+
+def test_disabled_tracing_records_nothing():
+    """Test that spans and @traced functions are free of records while off."""
+    tracer = get_tracer()
+    tracer.disable()
+    tracer.reset()
+
+    @traced("test.work")
+    def work(x):
+        return x * 2
+
+    with tracer.span("test.block"):
+        assert work(21) == 42
+    with tracer.command("look"):
+        pass
+    assert len(tracer) == 0 and tracer.command_count == 0
+
+    tracer.enable()
+    try:
+        with tracer.command("look"):
+            work(1)
+        assert [name for name, _, _ in tracer.spans()] == ["test.work", "command"]
+        assert tracer.spans()[0][2] == 1
+    finally:
+        tracer.disable()
+        tracer.reset()
+
+
+def test_perf_command_reports_pipeline_spans():
+    """Test perf on/report/profile through the input controller."""
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(8, 8))
+    gs = game_engine.new_game(character, world_seed=4242)
+    controller = InputController(character=gs.character, player_state=gs.player_state,
+                                 time_system=gs.game_time, game_engine=game_engine)
+    tracer = get_tracer()
+    try:
+        controller.process_input("perf profile 2")
+        for command in ("look", "wait short", "n", "wait short"):
+            controller.process_input(command)
+
+        stats = tracer.stats()
+        for name in ("command", "action.look", "action.wait", "time.perform_activity", "conditions.evaluate"):
+            assert stats[name]["count"] >= 1, name
+        # The "perf profile" command itself ran before tracing was on
+        assert stats["command"]["count"] == 4
+
+        slowest = tracer.slowest_commands()
+        assert len(slowest) == 2 and slowest[0][0] >= slowest[1][0]
+
+        report = controller.process_input("perf")["message"]
+        assert "p95" in report and "time.perform_activity" in report
+        assert "took" in report and "cumulative" in report
+    finally:
+        tracer.disable()
+        tracer.enable(profile_keep=0)
+        tracer.disable()
+        tracer.reset()
@@ -0,0 +1,58 @@
+"""Unit tests for the world weather field.
+
+Tests determinism and save round-trips, catch-up batching, and that
+weather is carried downwind between neighbouring hexes.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.world.weather_field import WeatherField, WeatherFront, MAX_CATCHUP_STEPS
+
+
+def test_same_seed_same_weather_and_save_round_trip():
+    """Test that the field is reproducible and restores from to_dict()."""
+    first = WeatherField(12, 10, seed=99)
+    second = WeatherField(12, 10, seed=99)
+    first.advance_to(30)
+    second.advance_to(30)
+    assert first.to_dict() == second.to_dict()
+
+    restored = WeatherField(12, 10, seed=1)
+    restored.load_dict(first.to_dict())
+    first.advance_to(200)
+    restored.advance_to(200)
+    assert restored.get_weather(4, 7) == first.get_weather(4, 7)
+    assert restored.to_dict() == first.to_dict()
+
+
+def test_catch_up_is_batched_and_capped():
+    """Test that reads between steps are free and long gaps are capped."""
+    field = WeatherField(8, 8, seed=5)
+
+    assert field.advance_to(0.5) == 0
+    assert field.advance_to(6.5) == 6
+    assert field.hours == 6.0
+    assert field.advance_to(6.9) == 0
+
+    assert field.advance_to(6.0 + 24 * 30) == MAX_CATCHUP_STEPS
+    assert field.hours == 6.0 + 24 * 30
+
+
+def test_front_brings_rain_downwind():
+    """Test that a front's rain moves east with it and fair weather returns behind it."""
+    field = WeatherField(20, 5, seed=3)
+    field.fronts = [WeatherFront(x=2.0, y=2.0, dx=1.0, dy=0.0, radius=2.0, depth=30.0)]
+    field.rng.random = lambda: 1.0  # No new fronts
+
+    field.advance_to(4)
+    assert field.get_weather(6, 2).precipitation > 0
+    assert field.get_weather(16, 2).precipitation == 0
+
+    field.advance_to(14)
+    assert field.get_weather(16, 2).precipitation > 0
+    assert field.get_weather(6, 2).precipitation == 0
+    assert field.pressure[2 * 20 + 16] < field.pressure[2 * 20 + 6]
@@ -0,0 +1,134 @@
+"""Unit tests for the tile-cached world map renderer.
+
+Tests rendering map rows at each zoom level, rendering only the tiles in
+view, dropping tiles when exploration or weather changes under them, and
+opening the map from a real game.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fantasy_rpg.actions.input_controller import InputController
+from fantasy_rpg.core.character_creation import create_character_quick
+from fantasy_rpg.game.events import HexesRevealed
+from fantasy_rpg.game.game_engine import GameEngine
+from fantasy_rpg.ui.world_map import CELL_WIDTH, CHUNK_SIZE, WorldMapRenderer, WorldMapSource
+
+
+class GridWorld:
+    """Small map source: grassland, a river down column 5, a mountain at (20, 10)"""
+
+    def __init__(self, width=40, height=20):
+        self.width, self.height = width, height
+        self.explored = set()
+        self.rain = {}
+        self.hours = 0.0
+
+    def hex_info(self, x, y):
+        if x == 5:
+            return {"biome": "temperate_grassland", "river": "stream"}
+        if (x, y) == (20, 10):
+            return {"biome": "alpine_mountains", "elevation_raw": 0.9}
+        return {"biome": "temperate_grassland", "elevation_raw": 0.2}
+
+    def is_explored(self, x, y):
+        return (x, y) in self.explored
+
+    def precipitation(self, x, y):
+        return self.rain.get((x, y), 0.0)
+
+    @property
+    def weather_version(self):
+        return self.hours
+
+
+def _text(segments):
+    return "".join(segment.text for segment in segments)
+
+
+def test_rows_render_from_tiles_in_view():
+    """Test glyphs, blanks past the edge, the player marker, and zoomed-out cells."""
+    world = GridWorld()
+    world.explored.add((20, 10))
+    renderer = WorldMapRenderer(world)
+    assert renderer.size(1) == (40, 20) and renderer.size(8) == (5, 3)
+
+    row = renderer.render_row(10, 0, 42, zoom=1, player=(1, 10))
+    assert len(row) == 42 and len(_text(row)) == 42 * CELL_WIDTH
+    assert _text(row[:6]) == '" @ " " " ~ '
+    assert row[20].text == "^ " and not row[20].style.dim and row[19].style.dim
+    assert _text(row[40:]) == "    "  # past the east edge
+    assert renderer.render_row(-1, 0, 3, zoom=1) == [renderer._blank] * 3
+
+    # Only the tiles crossed were rendered, and drawing again renders none
+    assert renderer.tiles_rendered == 3
+    renderer.render_row(11, 10, 20, zoom=1)
+    assert renderer.tiles_rendered == 3
+
+    # Zoomed out, a cell shows any river or explored hex inside it
+    row = renderer.render_row(2, 0, 10, zoom=4)
+    assert row[1].text == "~ " and row[5].text == '" ' and not row[5].style.dim and row[4].style.dim
+
+
+def test_tiles_invalidated_by_exploration_and_weather():
+    """Test that only tiles whose exploration or rain band changed are re-rendered."""
+    world = GridWorld(width=64, height=32)
+    renderer = WorldMapRenderer(world)
+    for row in range(32):
+        renderer.render_row(row, 0, 64, zoom=1, layer="weather")
+        renderer.render_row(row, 0, 64, zoom=1)
+    renderer.render_row(0, 0, 8, zoom=8)
+    assert len(renderer.tiles) == 17  # 4x2 tiles per layer at zoom 1, one at zoom 8
+
+    world.explored.add((40, 20))
+    assert renderer.invalidate_hex(40, 20) == 3  # both zoom 1 layers and zoom 8
+    assert not renderer.render_row(20, 40, 1, zoom=1)[0].style.dim
+    assert renderer.invalidate_hex(40, 20) == 1  # terrain re-rendered, weather not yet
+
+    # Weather moving on without changing any band keeps every tile
+    world.rain[(3, 3)] = 2.0
+    world.hours = 1.0
+    assert renderer.refresh_weather() == 0
+    world.rain[(3, 3)] = 80.0
+    world.hours = 2.0
+    rendered = renderer.tiles_rendered
+    assert renderer.render_row(3, 0, 4, zoom=1, layer="weather")[3].text == "# "
+    assert renderer.tiles_rendered == rendered + 1
+    assert renderer.render_row(3, CHUNK_SIZE, 1, zoom=1, layer="weather")[0].text == '" '
+    assert renderer.tiles_rendered == rendered + 1
+
+    # The cache keeps the most recently drawn tiles
+    renderer = WorldMapRenderer(world, max_tiles=2)
+    for x0 in (0, CHUNK_SIZE, 2 * CHUNK_SIZE, 0):
+        renderer.render_row(0, x0, 1, zoom=1)
+    assert list(renderer.tiles) == [(2, 0, 1, "terrain"), (0, 0, 1, "terrain")]
+
+
+def test_map_command_opens_world_map(tmp_path, monkeypatch):
+    """Test the map command and a map of a generated world around the player."""
+    monkeypatch.chdir(tmp_path)
+    character, _, _ = create_character_quick("Aldric", "Human", "Fighter")
+    game_engine = GameEngine(world_size=(20, 20))
+    game_engine.new_game(character, world_seed=4242)
+    controller = InputController(character=character, player_state=game_engine.game_state.player_state,
+                                 game_engine=game_engine)
+
+    for command in ("map", "m"):
+        response = controller.process_input(command)
+        assert response["type"] == "show_modal" and response["modal_type"] == "map"
+
+    world = game_engine.world_coordinator
+    renderer = WorldMapRenderer(WorldMapSource(world))
+    x, y = game_engine.game_state.world_position.coords
+    assert renderer.render_row(y, 0, 20, zoom=1, player=(x, y))[x].text == "@ "
+    assert not renderer.render_row(y, 0, 20, zoom=1)[x].style.dim
+    assert renderer.render_row(y, 0, 20, zoom=1)[(x + 10) % 20].style.dim
+
+    # The map follows the player: newly seen hexes drop the tiles over them
+    renderer.render_row(0, 0, 20, zoom=2)
+    game_engine.events.subscribe(HexesRevealed, lambda event: [renderer.invalidate_hex(*h) for h in event.hexes])
+    game_engine.events.publish(HexesRevealed(hexes=[(0, 0)]))
+    assert (0, 0, 2, "terrain") not in renderer.tiles